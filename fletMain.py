@@ -1,8 +1,7 @@
 import flet as ft
 import os
 import json
-import subprocess
-import sys
+from services import gamehost, supervisor, catalog
 
 # Define configuration file paths
 CONFIG_DIR = os.path.join(os.getcwd(), "config")
@@ -38,21 +37,12 @@ def launch_game(game_file):
     # Launch the game file from the "games" folder using the same Python interpreter.
     game_path = os.path.join(os.getcwd(), "games", game_file)
     if os.path.exists(game_path):
-        subprocess.Popen([sys.executable, game_path])
+        supervisor.launch(game_path)
     else:
         print(f"Game file {game_path} not found.")
 
-# List of games with details (update the "image" key with a valid image path if available)
-games = [
-    {"title": "Edible Game", "file": "edible.py", "description": "Bite edible items while avoiding non-edible ones.", "image": ""},
-    {"title": "Color Smash", "file": "color_smash.py", "description": "Match colors in a fun and fast-paced game.", "image": ""},
-    {"title": "Number Dash", "file": "number_dash.py", "description": "Run through numbers in a challenging dash.", "image": ""},
-    {"title": "Odd One Out", "file": "odd_one_out.py", "description": "Identify the odd item among similar ones.", "image": ""},
-    {"title": "Shape Sorter", "file": "shape-sorter.py", "description": "Sort shapes to boost your visual skills.", "image": ""},
-    {"title": "Spell Drop", "file": "spell_drop.py", "description": "Drop letters to form words correctly.", "image": ""},
-    {"title": "Text Recognition", "file": "text_reco.py", "description": "Recognize text in images and have fun.", "image": ""},
-    {"title": "Word Builder", "file": "word_builder.py", "description": "Construct words from jumbled letters.", "image": ""}
-]
+# List of games with details (see services/catalog.py)
+games = catalog.games()
 
 def main(page: ft.Page):
     # Set app title and background color
@@ -63,6 +53,9 @@ def main(page: ft.Page):
     # Load camera configuration
     camera_index = load_config()
 
+    # Start a pre-warmed game host worker for the first launch.
+    gamehost.start_pool()
+
     # --- Navigation Helper ---
     def go_to_view(view: ft.View):
         page.views.clear()
@@ -88,8 +81,9 @@ def main(page: ft.Page):
     # --- Build Game Items ---
     def create_game_item(game: dict) -> ft.Container:
         # Left side: image or placeholder
-        if game["image"] and os.path.exists(game["image"]):
-            img = ft.Image(src=game["image"], width=100, height=100, fit=ft.ImageFit.CONTAIN)
+        thumbnail = catalog.thumbnail(game)
+        if thumbnail:
+            img = ft.Image(src=thumbnail, width=100, height=100, fit=ft.ImageFit.CONTAIN)
         else:
             img = ft.Container(
                 content=ft.Text("No Image", size=16, color=ft.colors.WHITE),
@@ -3,7 +3,7 @@ import numpy as np
 import pygame
 import os
 from cvzone.HandTrackingModule import HandDetector
-import cvzone
+from services import fonts, assets
 
 # ---------------------- Initialization ---------------------- #
 pygame.init()
@@ -13,8 +13,8 @@ pygame.display.set_caption("Drag & Drop Game")
 clock = pygame.time.Clock()
 
 # Define fonts for text rendering
-font_large = pygame.font.SysFont("Arial", 48)
-font_medium = pygame.font.SysFont("Arial", 36)
+font_large = fonts.get_font("Arial", 48)
+font_medium = fonts.get_font("Arial", 36)
 
 # Initialize webcam
 cap = cv2.VideoCapture(0)
@@ -32,11 +32,11 @@ class DragImg():
         self.imgType = imgType
         self.path = path
 
-        if self.imgType == 'png':
-            self.img = cv2.imread(self.path, cv2.IMREAD_UNCHANGED)
-        else:
-            self.img = cv2.imread(self.path)
-        self.size = self.img.shape[:2]
+        # Loaded once as a sprite and blitted over the camera frame instead of overlaid into it.
+        img = assets.load_image(self.path, alpha=self.imgType == 'png')
+        # The camera frame is shown mirrored (see the upload below), so mirror the sprite too.
+        self.img = pygame.transform.flip(img, True, False)
+        self.size = (self.img.get_height(), self.img.get_width())
 
     def update(self, cursor):
         ox, oy = self.posOrigin
@@ -45,6 +45,12 @@ class DragImg():
         if ox < cursor[0] < ox + w and oy < cursor[1] < oy + h:
             self.posOrigin = (cursor[0] - w // 2, cursor[1] - h // 2)
 
+    def screen_pos(self):
+        """Return where the image lands on screen once the frame is mirrored for display."""
+        ox, oy = self.posOrigin
+        h, w = self.size
+        return screen_width - ox - w, oy
+
 
 # ---------------------- Load Images ---------------------- #
 path_images = "ImagesPNG"
@@ -125,27 +131,19 @@ while running:
                 for imgObj in listImg:
                     imgObj.update(cursor)
 
-        try:
-            # Overlay the draggable images on the frame
-            for imgObj in listImg:
-                h, w = imgObj.size
-                ox, oy = imgObj.posOrigin
-                if imgObj.imgType == "png":
-                    frame = cvzone.overlayPNG(frame, imgObj.img, [ox, oy])
-                else:
-                    frame[oy:oy + h, ox:ox + w] = imgObj.img
-        except Exception as e:
-            print("Overlay error:", e)
-
-        # Display instruction text directly on the frame
-        cv2.putText(frame, "Press 'P' to Pause", (50, 700), cv2.FONT_HERSHEY_SIMPLEX, 1, (0, 255, 0), 2)
-
         # Convert the frame (BGR to RGB) and then to a Pygame surface
         frame = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
         frame = np.rot90(frame)  # Adjust rotation for Pygame's coordinate system
         frame_surface = pygame.surfarray.make_surface(frame)
         screen.blit(frame_surface, (0, 0))
 
+        # Blit the draggable images on top of the uploaded frame
+        for imgObj in listImg:
+            screen.blit(imgObj.img, imgObj.screen_pos())
+
+        # Display instruction text on top of the frame
+        draw_text(screen, "Press 'P' to Pause", font_medium, (0, 255, 0), (50, 665))
+
     pygame.display.update()
     clock.tick(30)
 
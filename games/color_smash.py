@@ -9,15 +9,11 @@ import cvzone
 import sys
 import sqlite3
 import datetime
-from services import sessions, levels, logs, utils
+from services import sessions, levels, logs, utils, highscores, scoreboard, leaderboard, fonts, assets, telemetry, camera, context
+from games.gameloop import GameLoop, GameState, lerp
+telemetry.mark("imports")
 
-current_user_path = os.path.join(os.getcwd(), "config", "current_user.json")
-try:
-    with open(current_user_path, "r") as f:
-        current_user = json.load(f)
-except Exception as e:
-    current_user = {"id": 0, "userName": "Guest", "role": "player", "email": ""}
-    print("No current user found; defaulting to Guest.")
+current_user = context.current_user()
 
 
 # --------------------- Theme Settings ---------------------
@@ -38,9 +34,9 @@ pygame.display.set_caption("Color Catcher")
 clock = pygame.time.Clock()
 
 # Use a playful font for a kid-friendly look.
-font_large = pygame.font.SysFont("Comic Sans MS", 80)
-font_medium = pygame.font.SysFont("Comic Sans MS", 60)
-font_small = pygame.font.SysFont("Comic Sans MS", 40)
+font_large = fonts.get_font("Comic Sans MS", 80)
+font_medium = fonts.get_font("Comic Sans MS", 60)
+font_small = fonts.get_font("Comic Sans MS", 40)
 
 # --------------------- Button Class ---------------------
 class Button:
@@ -97,16 +93,19 @@ def get_posthighscore_buttons():
     return [Button("Return to Game Over", width // 2 - btn_width // 2, height // 2 + 100, btn_width, btn_height, action="return_gameover")]
 
 # --------------------- Load Heart Image for Lives ---------------------
-script_dir = os.path.dirname(os.path.abspath(__file__))
+script_dir = os.path.join(os.getcwd(), "games")
 heart_path = os.path.join(script_dir, "..", "assets", "heart.png")
-heart_image = pygame.image.load(heart_path).convert_alpha()
+heart_image = assets.load_image(heart_path, alpha=True)
 heart_width = heart_image.get_width()
 heart_height = heart_image.get_height()
 
 # --------------------- Difficulty and Game Variables ---------------------
 difficulty = "easy"
 lives = 3
+round_recorded = False  # The round's score goes to the leaderboard once, however it ends.
 score = 0
+# Game over line comparing the round with everyone's earlier rounds.
+beaten_text = ""
 
 target_colors = {
     "Red": (0, 0, 255),
@@ -117,20 +116,21 @@ target_colors = {
 target_color_name, target_color_value = random.choice(list(target_colors.items()))
 
 # --------------------- Camera Setup ---------------------
-config_path = os.path.join(script_dir, "..", "config", "settings.json")
-with open(config_path) as f:
-    config = json.load(f)
-cam_index = config.get('camera_index', 0)
-cap = cv2.VideoCapture(cam_index)
-cap.set(3, width)
-cap.set(4, height)
+cam_index = context.setting("camera_index", 0)
+with telemetry.stage("camera"):
+    cap = camera.open_camera(cam_index, width, height)
 
 # --------------------- FaceMesh Detector ---------------------
-detector = FaceMeshDetector(maxFaces=1)
+with telemetry.stage("detector"):
+    detector = FaceMeshDetector(maxFaces=1)
+# Launch latency runs to the first frame the camera delivers, not to the first round.
+if cap.read()[0]:
+    telemetry.mark("camera_frame")
 idList = [0, 17, 78, 292]
 
 # --------------------- Falling Object Setup ---------------------
 pos = [random.randint(100, width - 100), 0]
+prev_pos = list(pos)  # Position at the previous update, for interpolated drawing.
 radius = 40
 isTarget = True
 currentColor = target_color_value
@@ -139,6 +139,7 @@ def resetObject(current_target_color):
     global pos, isTarget, currentColor
     pos[0] = random.randint(100, width - 100)
     pos[1] = 0
+    prev_pos[:] = pos
     if random.random() < 0.5:
         isTarget = True
         currentColor = current_target_color
@@ -149,33 +150,18 @@ def resetObject(current_target_color):
     return currentColor
 
 currentColor = resetObject(target_color_value)
-speed = 5
+speed = 5  # Pixels per update step (30 per second).
+
+def restart_game():
+    global lives, score, round_recorded
+    resetObject(target_color_value)
+    lives = 3
+    score = 0
+    round_recorded = False
 
 # --------------------- Highscore Handling ---------------------
 def update_highscores(score):
-    config_dir = os.path.join(script_dir, "..", "config")
-    if not os.path.exists(config_dir):
-        os.makedirs(config_dir)
-    filename = os.path.join(config_dir, "highscores.json")
-    if os.path.exists(filename):
-        try:
-            with open(filename, "r") as f:
-                data = json.load(f)
-        except (json.JSONDecodeError, FileNotFoundError):
-            data = {}
-    else:
-        data = {}
-    if GAME_ID not in data or not isinstance(data[GAME_ID], list):
-        data[GAME_ID] = []
-    highscores = data[GAME_ID]
-    qualifies = False
-    if len(highscores) < 10:
-        qualifies = True
-    else:
-        min_score = min(entry["score"] for entry in highscores)
-        if score > min_score:
-            qualifies = True
-    if not qualifies:
+    if not highscores.qualifies(GAME_ID, score):
         return (False, "Score did not qualify for highscore entry.")
     name = ""
     input_active = True
@@ -199,31 +185,14 @@ def update_highscores(score):
         screen.blit(name_text, name_text.get_rect(center=(width // 2, height // 2 + 20)))
         pygame.display.update()
         clock.tick(30)
-    new_entry = {"name": name.strip() if name.strip() != "" else "Anonymous", "score": score}
-    highscores.append(new_entry)
-    highscores = sorted(highscores, key=lambda x: x["score"], reverse=True)[:10]
-    data[GAME_ID] = highscores
-    with open(filename, "w") as f:
-        json.dump(data, f, indent=4)
+    if not highscores.add(GAME_ID, name.strip() if name.strip() != "" else "Anonymous", score):
+        return (False, "Score did not qualify for highscore entry.")
     return (True, "Highscore updated!")
 
-def load_highscores_for_game():
-    config_dir = os.path.join(script_dir, "..", "config")
-    filename = os.path.join(config_dir, "highscores.json")
-    try:
-        with open(filename, "r") as f:
-            data = json.load(f)
-    except (FileNotFoundError, json.JSONDecodeError):
-        data = {}
-    if GAME_ID not in data or not isinstance(data[GAME_ID], list):
-        return [{"name": "Default", "score": 0}]
-    return data[GAME_ID]
-
 # --------------------- Loading Screen ---------------------
 background_path = os.path.join(script_dir, "..", "assets", "background", "color_smash.png")
 if os.path.exists(background_path):
-    loading_background = pygame.image.load(background_path).convert()
-    loading_background = pygame.transform.scale(loading_background, (width, height))
+    loading_background = assets.load_image(background_path, size=(width, height))
     screen.blit(loading_background, (0, 0))
 else:
     screen.fill(THEME_BG)
@@ -236,7 +205,6 @@ pygame.display.flip()
 pygame.time.delay(1000)
 
 # --------------------- Game State Setup ---------------------
-gameState = "landing"
 pause_cooldown = 300
 last_toggle_time = 0
 hs_message = ""
@@ -305,214 +273,152 @@ def draw_flash_effect():
     else:
         flash_active = False
 
-# --------------------- Main Loop ---------------------
-running = True
-while running:
-    current_time = pygame.time.get_ticks()
-    events = pygame.event.get()
-    for event in events:
-        if event.type == pygame.QUIT:
-            running = False
-        if gameState == "playing" and event.type == pygame.KEYDOWN:
-            if event.key in (pygame.K_ESCAPE, pygame.K_SPACE):
-                if current_time - last_toggle_time > pause_cooldown:
-                    gameState = "paused"
-                    last_toggle_time = current_time
-
-    mouse_pos = pygame.mouse.get_pos()
-
-    # --------------------- Landing Screen ---------------------
-    if gameState == "landing":
-        screen.fill(THEME_BG)
-        title_text = font_large.render("Welcome to Color Catcher!", True, THEME_TEXT)
-        instruct_text = font_small.render("Catch objects of the TARGET color and avoid others.", True, THEME_TEXT)
-        diff_text = font_small.render("Select Difficulty:", True, THEME_TEXT)
-        screen.blit(title_text, title_text.get_rect(center=(width // 2, 80)))
-        screen.blit(instruct_text, instruct_text.get_rect(center=(width // 2, 160)))
-        screen.blit(diff_text, diff_text.get_rect(center=(width // 2, 230)))
-        landing_buttons = get_landing_buttons()
-        for button in landing_buttons:
-            button.draw(screen)
-        pygame.display.update()
-        clock.tick(30)
-        for event in events:
-            if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
-                for button in landing_buttons:
-                    if button.is_clicked(mouse_pos):
-                        if button.action == "easy":
-                            difficulty = "easy"
-                            gameState = "playing"
-                            resetObject(target_color_value)
-                            lives = 3
-                            score = 0
-                        elif button.action == "normal":
-                            difficulty = "normal"
-                            gameState = "playing"
-                            resetObject(target_color_value)
-                            lives = 3
-                            score = 0
-                        elif button.action == "start":
-                            gameState = "playing"
-                            resetObject(target_color_value)
-                            lives = 3
-                            score = 0
-                        elif button.action == "highscores":
-                            gameState = "view_highscores"
-                        elif button.action == "quit":
-                            running = False
-        continue
-
-    # --------------------- View Highscores Screen ---------------------
-    if gameState == "view_highscores":
-        screen.fill(THEME_BG)
-        hs_list = load_highscores_for_game()
-        title_text = font_large.render("Highscores", True, THEME_TEXT)
-        screen.blit(title_text, title_text.get_rect(center=(width // 2, 80)))
-        for i, entry in enumerate(hs_list):
-            rank = i + 1
-            line = f"{rank}. {entry['name']} - {entry['score']}"
-            line_text = font_small.render(line, True, THEME_TEXT)
-            screen.blit(line_text, (width // 4, 150 + i * 40))
-        hs_buttons = get_highscore_buttons()
-        for button in hs_buttons:
-            button.draw(screen)
-        pygame.display.update()
-        clock.tick(30)
-        for event in events:
-            if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
-                for button in hs_buttons:
-                    if button.is_clicked(mouse_pos):
-                        if button.action == "return_menu":
-                            gameState = "landing"
-        continue
-
-    # --------------------- Pause Screen ---------------------
-    if gameState == "paused":
-        screen.fill(THEME_BG)
-        pause_text = font_large.render("Paused", True, THEME_TEXT)
-        screen.blit(pause_text, pause_text.get_rect(center=(width // 2, height // 2 - 160)))
-        pause_buttons = get_pause_buttons()
-        for button in pause_buttons:
-            button.draw(screen)
-        pygame.display.update()
-        clock.tick(30)
-        for event in events:
-            if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
-                for button in pause_buttons:
-                    if button.is_clicked(mouse_pos):
-                        if button.action == "resume":
-                            gameState = "playing"
-                            last_toggle_time = current_time
-                        elif button.action == "restart":
-                            resetObject(target_color_value)
-                            gameState = "playing"
-                            score = 0
-                            lives = 3
-                            last_toggle_time = current_time
-                        elif button.action == "quit_menu":
-                            gameState = "landing"
-        continue
-
-    # --------------------- Gameover Screen ---------------------
-    if gameState == "playing" and lives <= 0:
-        gameState = "gameover"
-        continue
-
-    if gameState == "gameover":
-        screen.fill(THEME_BG)
-        gameover_text = font_large.render("Game Over!", True, THEME_TEXT)
-        score_text = font_medium.render(f"Score: {score}", True, THEME_TEXT)
-        screen.blit(gameover_text, gameover_text.get_rect(center=(width // 2, height // 2 - 120)))
-        screen.blit(score_text, score_text.get_rect(center=(width // 2, height // 2 - 40)))
-        gameover_buttons = get_gameover_buttons()
-        for button in gameover_buttons:
-            button.draw(screen)
-        pygame.display.update()
-        clock.tick(30)
-        for event in events:
-            if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
-                for button in gameover_buttons:
-                    if button.is_clicked(mouse_pos):
-                        if button.action == "restart":
-                            resetObject(target_color_value)
-                            gameState = "playing"
-                            score = 0
-                            lives = 3
-                        elif button.action == "quit_menu":
-                            gameState = "landing"
-                        elif button.action == "enter_highscore":
-                            gameState = "enter_highscore"
-        continue
-
-    # --------------------- Post Highscore State ---------------------
-    if gameState == "post_highscore":
-        screen.fill(THEME_BG)
-        msg_text = font_large.render(hs_message, True, THEME_TEXT)
-        posths_buttons = get_posthighscore_buttons()
-        for button in posths_buttons:
-            button.draw(screen)
-        screen.blit(msg_text, msg_text.get_rect(center=(width // 2, height // 2 - 50)))
-        pygame.display.update()
-        clock.tick(30)
-        for event in events:
-            if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
-                for button in posths_buttons:
-                    if button.is_clicked(mouse_pos):
-                        if button.action == "return_gameover":
-                            gameState = "gameover"
-        continue
-
-    # --------------------- Enter Highscore State ---------------------
-    if gameState == "enter_highscore":
-        updated, hs_message = update_highscores(score)
-        gameState = "post_highscore"
-        continue
-
-    # --------------------- Playing State ---------------------
-    for event in events:
-        if gameState == "playing" and not (lives <= 0) and event.type == pygame.KEYDOWN:
-            if event.key in (pygame.K_ESCAPE, pygame.K_SPACE):
-                gameState = "paused"
-            elif event.key == pygame.K_r:
-                resetObject(target_color_value)
-                gameState = "playing"
-                score = 0
-                lives = 3
-
-    # --------------------- Game Screen (Playing State) ---------------------
+# --------------------- Menu Screens ---------------------
+landing_buttons = get_landing_buttons()
+pause_buttons = get_pause_buttons()
+gameover_buttons = get_gameover_buttons()
+hs_buttons = get_highscore_buttons()
+posths_buttons = get_posthighscore_buttons()
+
+def clicked_action(event, buttons):
+    """Return the action of the button hit by a left click, or None."""
+    if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
+        for button in buttons:
+            if button.is_clicked(event.pos):
+                return button.action
+    return None
+
+def render_landing(alpha):
+    screen.fill(THEME_BG)
+    title_text = font_large.render("Welcome to Color Catcher!", True, THEME_TEXT)
+    instruct_text = font_small.render("Catch objects of the TARGET color and avoid others.", True, THEME_TEXT)
+    diff_text = font_small.render("Select Difficulty:", True, THEME_TEXT)
+    screen.blit(title_text, title_text.get_rect(center=(width // 2, 80)))
+    screen.blit(instruct_text, instruct_text.get_rect(center=(width // 2, 160)))
+    screen.blit(diff_text, diff_text.get_rect(center=(width // 2, 230)))
+    for button in landing_buttons:
+        button.draw(screen)
+
+def landing_event(event):
+    global difficulty
+    action = clicked_action(event, landing_buttons)
+    if action in ("easy", "normal", "start"):
+        if action != "start":
+            difficulty = action
+        restart_game()
+        loop.change("playing")
+    elif action == "highscores":
+        loop.change("view_highscores")
+    elif action == "quit":
+        loop.quit()
+
+def draw_highscores(surface, hs_list):
+    surface.fill(THEME_BG)
+    title_text = font_large.render("Highscores", True, THEME_TEXT)
+    surface.blit(title_text, title_text.get_rect(center=(width // 2, 80)))
+    for i, entry in enumerate(hs_list or [{"name": "Default", "score": 0}]):
+        rank = i + 1
+        line = f"{rank}. {entry['name']} - {entry['score']}"
+        line_text = font_small.render(line, True, THEME_TEXT)
+        surface.blit(line_text, (width // 4, 150 + i * 40))
+    for button in hs_buttons:
+        button.draw(surface)
+
+def render_highscores(alpha):
+    # Drawn once and again only when this game's highscores change.
+    screen.blit(scoreboard.board(GAME_ID, (width, height), draw_highscores), (0, 0))
+
+def highscores_event(event):
+    if clicked_action(event, hs_buttons) == "return_menu":
+        loop.change("landing")
+
+def render_paused(alpha):
+    screen.fill(THEME_BG)
+    pause_text = font_large.render("Paused", True, THEME_TEXT)
+    screen.blit(pause_text, pause_text.get_rect(center=(width // 2, height // 2 - 160)))
+    for button in pause_buttons:
+        button.draw(screen)
+
+def paused_event(event):
+    global last_toggle_time
+    action = clicked_action(event, pause_buttons)
+    if action == "resume":
+        loop.change("playing")
+        last_toggle_time = pygame.time.get_ticks()
+    elif action == "restart":
+        restart_game()
+        loop.change("playing")
+        last_toggle_time = pygame.time.get_ticks()
+    elif action == "quit_menu":
+        loop.change("landing")
+
+def render_gameover(alpha):
+    screen.fill(THEME_BG)
+    gameover_text = font_large.render("Game Over!", True, THEME_TEXT)
+    score_text = font_medium.render(f"Score: {score}", True, THEME_TEXT)
+    screen.blit(gameover_text, gameover_text.get_rect(center=(width // 2, height // 2 - 190)))
+    screen.blit(score_text, score_text.get_rect(center=(width // 2, height // 2 - 110)))
+    if beaten_text:
+        beaten_surface = font_small.render(beaten_text, True, THEME_TEXT)
+        screen.blit(beaten_surface, beaten_surface.get_rect(center=(width // 2, height // 2 - 45)))
+    for button in gameover_buttons:
+        button.draw(screen)
+
+def gameover_event(event):
+    action = clicked_action(event, gameover_buttons)
+    if action == "restart":
+        restart_game()
+        loop.change("playing")
+    elif action == "quit_menu":
+        loop.change("landing")
+    elif action == "enter_highscore":
+        loop.change("enter_highscore")
+
+def render_post_highscore(alpha):
+    screen.fill(THEME_BG)
+    msg_text = font_large.render(hs_message, True, THEME_TEXT)
+    for button in posths_buttons:
+        button.draw(screen)
+    screen.blit(msg_text, msg_text.get_rect(center=(width // 2, height // 2 - 50)))
+
+def post_highscore_event(event):
+    if clicked_action(event, posths_buttons) == "return_gameover":
+        loop.change("gameover")
+
+def enter_highscore():
+    global hs_message
+    updated, hs_message = update_highscores(score)
+    loop.change("post_highscore")
+
+# --------------------- Playing State ---------------------
+frame_img = None
+faces = []
+
+def playing_event(event):
+    global last_toggle_time
+    if event.type == pygame.KEYDOWN:
+        current_time = pygame.time.get_ticks()
+        if event.key in (pygame.K_ESCAPE, pygame.K_SPACE):
+            if current_time - last_toggle_time > pause_cooldown:
+                loop.change("paused")
+                last_toggle_time = current_time
+        elif event.key == pygame.K_r:
+            restart_game()
+
+def playing_poll():
+    """Read the camera and find the face once per frame."""
+    global frame_img, faces
     success, img = cap.read()
     if not success:
-        break
+        loop.quit()
+        return
     img = cv2.flip(img, 1)
-    img, faces = detector.findFaceMesh(img, draw=False)
-    center_object = (pos[0] + radius, pos[1] + radius)
-    cv2.circle(img, center_object, radius, currentColor, -1)
-    if difficulty == "easy":
-        outline_color = (0, 255, 0) if isTarget else (0, 0, 255)
-        cv2.circle(img, center_object, radius, outline_color, 3)
-    indicator_width = 70
-    indicator_height = 60
-    indicator_x = width // 2 - indicator_width // 2
-    indicator_y = 10
-    b, g, r = target_color_value
-    pygame_color = (r, g, b)
-    target_color_name_str = list(target_colors.keys())[list(target_colors.values()).index(target_color_value)]
-    text_surface = font_small.render(target_color_name_str, True, pygame_color)
-    text_rect = text_surface.get_rect(center=(indicator_x + indicator_width // 2, indicator_y + indicator_height + 20))
-    imgRGB = cv2.cvtColor(img, cv2.COLOR_BGR2RGB)
-    surface = pygame.image.frombuffer(imgRGB.tobytes(), (imgRGB.shape[1], imgRGB.shape[0]), "RGB")
-    screen.blit(surface, (0, 0))
-    if difficulty == "easy":
-        b, g, r = target_color_value
-        pygame_color_rect = (r, g, b)
-        pygame.draw.rect(screen, pygame_color_rect, (indicator_x, indicator_y, indicator_width, indicator_height))
-        screen.blit(text_surface, (width // 2 - text_surface.get_width() // 2, indicator_y + indicator_height + 10))
-    elif difficulty == "normal":
-        screen.blit(text_surface, (width // 2 - text_surface.get_width() // 2, indicator_y + indicator_height // 2))
-    score_surface = font_medium.render("Score: " + str(score), True, THEME_TEXT)
-    screen.blit(score_surface, (20, 20))
-    for i in range(lives):
-        screen.blit(heart_image, (20 + i * (heart_width + 5), 80))
+    frame_img, faces = detector.findFaceMesh(img, draw=False)
+
+def playing_update(dt):
+    """Advance the falling object and check catches; runs at a fixed rate."""
+    global lives, score, round_recorded, target_color_name, target_color_value, beaten_text
+    prev_pos[:] = pos
     pos[1] += speed
     if pos[1] > height - 200:
         if isTarget and difficulty != "easy":
@@ -542,16 +448,63 @@ while running:
             else:
                 lives -= 1
                 resetObject(target_color_value)
+    if lives <= 0:
+        if not round_recorded:
+            round_recorded = True
+            beaten_text = leaderboard.beaten_message(leaderboard.finish_round(GAME_ID, current_user["id"], score))
+        loop.change("gameover")
+
+def playing_render(alpha):
+    if frame_img is None:
+        return
+    img = frame_img
+    draw_x, draw_y = lerp(prev_pos, pos, alpha)
+    center_object = (int(draw_x) + radius, int(draw_y) + radius)
+    cv2.circle(img, center_object, radius, currentColor, -1)
+    if difficulty == "easy":
+        outline_color = (0, 255, 0) if isTarget else (0, 0, 255)
+        cv2.circle(img, center_object, radius, outline_color, 3)
+    indicator_width = 70
+    indicator_height = 60
+    indicator_x = width // 2 - indicator_width // 2
+    indicator_y = 10
+    b, g, r = target_color_value
+    pygame_color = (r, g, b)
+    target_color_name_str = list(target_colors.keys())[list(target_colors.values()).index(target_color_value)]
+    text_surface = font_small.render(target_color_name_str, True, pygame_color)
+    imgRGB = cv2.cvtColor(img, cv2.COLOR_BGR2RGB)
+    surface = pygame.image.frombuffer(imgRGB.tobytes(), (imgRGB.shape[1], imgRGB.shape[0]), "RGB")
+    screen.blit(surface, (0, 0))
+    if difficulty == "easy":
+        pygame.draw.rect(screen, pygame_color, (indicator_x, indicator_y, indicator_width, indicator_height))
+        screen.blit(text_surface, (width // 2 - text_surface.get_width() // 2, indicator_y + indicator_height + 10))
+    elif difficulty == "normal":
+        screen.blit(text_surface, (width // 2 - text_surface.get_width() // 2, indicator_y + indicator_height // 2))
+    score_surface = font_medium.render("Score: " + str(score), True, THEME_TEXT)
+    screen.blit(score_surface, (20, 20))
+    for i in range(lives):
+        screen.blit(heart_image, (20 + i * (heart_width + 5), 80))
     # --------------------- Draw Level Display ---------------------
     # Calculate current level: here, 1 level per 5 points.
     # current_level = base_level + (score // 5)
     # draw_level_display(current_level)
     if flash_active:
         draw_flash_effect()
-    pygame.display.update()
-    clock.tick(30)
 
-cap.release()
+# --------------------- Main Loop ---------------------
+loop = GameLoop({
+    "landing": GameState(handle_event=landing_event, render=render_landing),
+    "view_highscores": GameState(handle_event=highscores_event, render=render_highscores),
+    "paused": GameState(handle_event=paused_event, render=render_paused),
+    "gameover": GameState(handle_event=gameover_event, render=render_gameover),
+    "enter_highscore": GameState(enter=enter_highscore),
+    "post_highscore": GameState(handle_event=post_highscore_event, render=render_post_highscore),
+    "playing": GameState(handle_event=playing_event, poll=playing_poll, update=playing_update,
+                         render=playing_render),
+}, "landing")
+loop.run()
+
+camera.close_camera(cap)
 pygame.quit()
 
 # --------------------- End Session ---------------------
@@ -3,22 +3,16 @@ import random
 import cv2
 import json
 from cvzone.FaceMeshModule import FaceMeshDetector
-import cvzone
 import pygame
 import numpy as np
 import sys
 import sqlite3
 import datetime
-from services import sessions, levels, logs, utils
+from services import sessions, levels, logs, utils, highscores, scoreboard, leaderboard, fonts, assets, renderer, telemetry, camera, context
+from games.gameloop import GameLoop, GameState, lerp
+telemetry.mark("imports")
 # Add this snippet after your imports
-current_user_path = os.path.join(os.getcwd(), "config", "current_user.json")
-try:
-    with open(current_user_path, "r") as f:
-        current_user = json.load(f)
-except Exception as e:
-    # If there is no current user file, default to a guest.
-    current_user = {"id": 0, "userName": "Guest", "role": "player", "email": ""}
-    print("No current user found; defaulting to Guest.")
+current_user = context.current_user()
 
 # --------------------- Theme Settings ---------------------
 THEME_BG = (255, 235, 59)  # Bright yellow background for menus
@@ -31,14 +25,15 @@ GAME_ID = "EdibleGame"  # Unique identifier for this game
 pygame.init()
 pygame.key.set_repeat(0)  # Disable key repeat.
 width, height = 1280, 720
-screen = pygame.display.set_mode((width, height))
-pygame.display.set_caption("Edible Game")
+# The "renderer" setting picks the software display or the texture renderer.
+display = renderer.create_display((width, height), "Edible Game")
+screen = display.canvas
 clock = pygame.time.Clock()
 
 # Use a playful font for a kid-friendly look.
-font_large = pygame.font.SysFont("Comic Sans MS", 80)
-font_medium = pygame.font.SysFont("Comic Sans MS", 60)
-font_small = pygame.font.SysFont("Comic Sans MS", 40)
+font_large = fonts.get_font("Comic Sans MS", 80)
+font_medium = fonts.get_font("Comic Sans MS", 60)
+font_small = fonts.get_font("Comic Sans MS", 40)
 
 # --------------------- Difficulty ---------------------
 difficulty = "easy"  # Default difficulty.
@@ -113,11 +108,10 @@ def get_posthighscore_buttons():
     return [Button("Return", width // 2 - btn_width // 2, height // 2 + 100, btn_width, btn_height, action="return")]
 
 # --------------------- Loading Screen ---------------------
-script_dir = os.path.dirname(os.path.abspath(__file__))
+script_dir = os.path.join(os.getcwd(), "games")
 background_path = os.path.join(script_dir, "..", "assets", "background", "food.jpg")
 if os.path.exists(background_path):
-    background_img = pygame.image.load(background_path).convert()
-    background_img = pygame.transform.scale(background_img, (width, height))
+    background_img = assets.load_image(background_path, size=(width, height))
     screen.blit(background_img, (0, 0))
 else:
     screen.fill((0, 0, 0))
@@ -126,37 +120,37 @@ loading_title = font_large.render("Edible Game", True, THEME_TEXT)
 loading_message = font_small.render("Loading... Please wait.", True, THEME_TEXT)
 screen.blit(loading_title, loading_title.get_rect(center=(width // 2, height // 2 - 50)))
 screen.blit(loading_message, loading_message.get_rect(center=(width // 2, height // 2 + 20)))
-pygame.display.update()
+display.flip_canvas()
 
 # --------------------- Load Heart Image for Health Feature ---------------------
 lives = 3  # Player starts with 3 lives.
 heart_path = os.path.join(script_dir, "..", "assets", "heart.png")
-heart_image = pygame.image.load(heart_path).convert_alpha()
+heart_image = assets.load_image(heart_path, alpha=True)
 heart_width = heart_image.get_width()
 heart_height = heart_image.get_height()
 
 # --------------------- Camera Setup ---------------------
-# Read camera configuration from file:
-with open(os.path.join(script_dir, "..", "config", "settings.json")) as f:
-    config = json.load(f)
-cam_index = config.get('camera_index', 0)
-cap = cv2.VideoCapture(cam_index)
-cap.set(3, width)
-cap.set(4, height)
+# Camera chosen in the launcher's settings:
+cam_index = context.setting("camera_index", 0)
+with telemetry.stage("camera"):
+    cap = camera.open_camera(cam_index, width, height)
 
 # --------------------- FaceMesh Detector ---------------------
-detector = FaceMeshDetector(maxFaces=1)
+with telemetry.stage("detector"):
+    detector = FaceMeshDetector(maxFaces=1)
+# Launch latency runs to the first frame the camera delivers, not to the first round.
+if cap.read()[0]:
+    telemetry.mark("camera_frame")
 idList = [0, 17, 78, 292]
 
 # --------------------- Helper Function to Load Images ---------------------
 def loadImageWithAlpha(path):
-    img = cv2.imread(path, cv2.IMREAD_UNCHANGED)
-    if img is None:
-        print("Error loading image:", path)
+    # Objects are loaded once as per-pixel-alpha sprites and blitted over the camera frame.
+    try:
+        return assets.load_image(path, alpha=True)
+    except (OSError, pygame.error) as e:
+        print("Error loading image:", path, e)
         return None
-    if len(img.shape) < 3 or img.shape[2] != 4:
-        img = cv2.cvtColor(img, cv2.COLOR_BGR2BGRA)
-    return img
 
 # --------------------- Load Game Object Images ---------------------
 folderEatable = os.path.join(script_dir, "..", "assets", "edible", "objects", "eatable")
@@ -184,26 +178,7 @@ else:
 
 # --------------------- Highscore Handling ---------------------
 def update_highscores(score):
-    filename = os.path.join(script_dir, "..", "config", "highscores.json")
-    if os.path.exists(filename):
-        try:
-            with open(filename, "r") as f:
-                data = json.load(f)
-        except (json.JSONDecodeError, FileNotFoundError):
-            data = {}
-    else:
-        data = {}
-    if GAME_ID not in data or not isinstance(data[GAME_ID], list):
-        data[GAME_ID] = []
-    highscores = data[GAME_ID]
-    qualifies = False
-    if len(highscores) < 10:
-        qualifies = True
-    else:
-        min_score = min(entry["score"] for entry in highscores)
-        if score > min_score:
-            qualifies = True
-    if not qualifies:
+    if not highscores.qualifies(GAME_ID, score):
         return (False, "Score did not qualify for highscore entry.")
     name = ""
     input_active = True
@@ -225,27 +200,12 @@ def update_highscores(score):
         name_text = font_medium.render(name, True, THEME_TEXT)
         screen.blit(prompt_text, prompt_text.get_rect(center=(width // 2, height // 2 - 50)))
         screen.blit(name_text, name_text.get_rect(center=(width // 2, height // 2 + 20)))
-        pygame.display.update()
+        display.flip_canvas()
         clock.tick(30)
-    new_entry = {"name": name.strip() if name.strip() != "" else "Anonymous", "score": score}
-    highscores.append(new_entry)
-    highscores = sorted(highscores, key=lambda x: x["score"], reverse=True)[:10]
-    data[GAME_ID] = highscores
-    with open(filename, "w") as f:
-        json.dump(data, f, indent=4)
+    if not highscores.add(GAME_ID, name.strip() if name.strip() != "" else "Anonymous", score):
+        return (False, "Score did not qualify for highscore entry.")
     return (True, "Highscore updated!")
 
-def load_highscores_for_game():
-    filename = os.path.join(script_dir, "..", "config", "highscores.json")
-    try:
-        with open(filename, "r") as f:
-            data = json.load(f)
-    except (FileNotFoundError, json.JSONDecodeError):
-        data = {}
-    if GAME_ID not in data or not isinstance(data[GAME_ID], list):
-        return [{"name": "Default", "score": 0}]
-    return data[GAME_ID]
-
 # --------------------- Flash Effect Variables and Precomputed Gradients ---------------------
 flash_active = False
 flash_start_time = 0
@@ -266,42 +226,50 @@ def trigger_flash():
     flash_active = True
     flash_start_time = pygame.time.get_ticks()
 
+def create_corner_surf(gradient_array):
+    surf = pygame.Surface((flash_corner_width, flash_corner_height), pygame.SRCALPHA)
+    surf.fill((255, 0, 0))
+    alpha_array = pygame.surfarray.pixels_alpha(surf)
+    alpha_array[:] = (255 * gradient_array).astype(np.uint8)
+    del alpha_array
+    return surf
+
+# The corners are built once at full strength and faded with a surface alpha.
+tl_surf = create_corner_surf(gradient_tl)
+tr_surf = create_corner_surf(gradient_tr)
+bl_surf = create_corner_surf(gradient_bl)
+br_surf = create_corner_surf(gradient_br)
+
 def draw_flash_effect():
     global flash_active
     current_time = pygame.time.get_ticks()
     elapsed = current_time - flash_start_time
     if elapsed < flash_duration:
         overall_alpha = int(255 * (1 - elapsed / flash_duration))
-        def create_corner_surf(gradient_array):
-            surf = pygame.Surface((flash_corner_width, flash_corner_height), pygame.SRCALPHA)
-            surf.fill((255, 0, 0))
-            alpha_array = pygame.surfarray.pixels_alpha(surf)
-            alpha_array[:] = (overall_alpha * gradient_array).astype(np.uint8)
-            del alpha_array
-            return surf
-        tl_surf = create_corner_surf(gradient_tl)
-        tr_surf = create_corner_surf(gradient_tr)
-        bl_surf = create_corner_surf(gradient_bl)
-        br_surf = create_corner_surf(gradient_br)
-        screen.blit(tl_surf, (0, 0))
-        screen.blit(tr_surf, (width - flash_corner_width, 0))
-        screen.blit(bl_surf, (0, height - flash_corner_height))
-        screen.blit(br_surf, (width - flash_corner_width, height - flash_corner_height))
+        display.blit(tl_surf, (0, 0), alpha=overall_alpha)
+        display.blit(tr_surf, (width - flash_corner_width, 0), alpha=overall_alpha)
+        display.blit(bl_surf, (0, height - flash_corner_height), alpha=overall_alpha)
+        display.blit(br_surf, (width - flash_corner_width, height - flash_corner_height), alpha=overall_alpha)
     else:
         flash_active = False
 
 # --------------------- Game Variables ---------------------
 currentObject = eatables[0] if eatables else None
 pos = [300, 0]
-speed = 5
+prev_pos = [300, 0]  # Position at the previous update, for interpolated drawing.
+speed = 5  # Pixels per update step (30 per second).
 count = 0
 isEatable = True
 gameOver = False
+round_recorded = False  # The round's score goes to the leaderboard once, however it ends.
+# Game over line comparing the round with everyone's earlier rounds.
+beaten_text = ""
 
 def resetObject():
     global isEatable
     pos[0] = random.randint(100, 1180)
     pos[1] = 0
+    prev_pos[:] = pos
     randNo = random.randint(0, 2)
     if randNo == 0 and nonEatables:
         currentObject = nonEatables[random.randint(0, len(nonEatables) - 1)]
@@ -313,8 +281,17 @@ def resetObject():
         currentObject = None
     return currentObject
 
+def restart_game():
+    global gameOver, round_recorded, count, currentObject, isEatable, lives
+    resetObject()
+    gameOver = False
+    round_recorded = False
+    count = 0
+    currentObject = eatables[0] if eatables else None
+    isEatable = True
+    lives = 3
+
 # --------------------- Game State ---------------------
-gameState = "landing"
 pause_cooldown = 300
 last_toggle_time = 0
 hs_message = ""
@@ -326,194 +303,151 @@ game_session_id = sessions.start_game_session(current_user["id"], GAME_ID, "game
 logs.log_event(current_user["id"], "game_start", f"Game session {game_session_id} started for {GAME_ID}")
 
 
-# --------------------- Main Loop ---------------------
-running = True
-while running:
-    current_time = pygame.time.get_ticks()
-    events = pygame.event.get()
-
-    for event in events:
-        if event.type == pygame.QUIT:
-            running = False
-
-    # --------------------- Landing Screen ---------------------
-    if gameState == "landing":
-        screen.fill(THEME_BG)
-        title_text = font_large.render("Welcome to the Edible Game!", True, THEME_TEXT)
-        instruct_text = font_small.render("Bite edible objects and avoid non-edible ones.", True, THEME_TEXT)
-        screen.blit(title_text, title_text.get_rect(center=(width // 2, 80)))
-        screen.blit(instruct_text, instruct_text.get_rect(center=(width // 2, 140)))
-        diff_display = font_medium.render(f"Difficulty: {difficulty.capitalize()}", True, THEME_TEXT)
-        screen.blit(diff_display, diff_display.get_rect(center=(width // 2, 220)))
-        landing_buttons = get_landing_buttons()
-        for button in landing_buttons:
-            button.draw(screen)
-        pygame.display.update()
-
-        for event in events:
-            if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
-                for button in landing_buttons:
-                    if button.is_clicked(event.pos):
-                        if button.action == "easy":
-                            difficulty = "easy"
-                        elif button.action == "normal":
-                            difficulty = "normal"
-                        elif button.action == "start":
-                            gameState = "playing"
-                        elif button.action == "highscores":
-                            gameState = "view_highscores"
-                        elif button.action == "quit":
-                            running = False
-        clock.tick(30)
-        continue
-
-    # --------------------- View Highscores Screen ---------------------
-    if gameState == "view_highscores":
-        screen.fill(THEME_BG)
-        hs_list = load_highscores_for_game()
-        title_text = font_large.render("Highscores", True, THEME_TEXT)
-        screen.blit(title_text, title_text.get_rect(center=(width // 2, 80)))
-        for i, entry in enumerate(hs_list):
-            rank = i + 1
-            line = f"{rank}. {entry['name']} - {entry['score']}"
-            line_text = font_small.render(line, True, THEME_TEXT)
-            screen.blit(line_text, (width // 4, 150 + i * 40))
-        hs_buttons = get_highscore_buttons()
-        for button in hs_buttons:
-            button.draw(screen)
-        pygame.display.update()
-
-        for event in events:
-            if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
-                for button in hs_buttons:
-                    if button.is_clicked(event.pos):
-                        if button.action == "return":
-                            gameState = "landing"
-        clock.tick(30)
-        continue
-
-    # --------------------- Pause Screen ---------------------
-    if gameState == "paused":
-        screen.fill(THEME_BG)
-        pause_text = font_large.render("Paused", True, THEME_TEXT)
-        screen.blit(pause_text, pause_text.get_rect(center=(width // 2, 80)))
-        pause_buttons = get_pause_buttons()
-        for button in pause_buttons:
-            button.draw(screen)
-        pygame.display.update()
-
-        for event in events:
-            if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
-                for button in pause_buttons:
-                    if button.is_clicked(event.pos):
-                        if button.action == "resume":
-                            gameState = "playing"
-                        elif button.action == "restart":
-                            resetObject()
-                            gameOver = False
-                            count = 0
-                            currentObject = eatables[0] if eatables else None
-                            isEatable = True
-                            lives = 3
-                            gameState = "playing"
-                        elif button.action == "quit_menu":
-                            gameState = "landing"
-        clock.tick(30)
-        continue
-
-    # --------------------- Gameover Screen ---------------------
-    if gameState == "playing" and gameOver:
-        gameState = "gameover"
-        continue
-
-    if gameState == "gameover":
-        screen.fill(THEME_BG)
-        gameover_text = font_large.render("Game Over!", True, THEME_TEXT)
-        score_text = font_medium.render(f"Score: {count}", True, THEME_TEXT)
-        screen.blit(gameover_text, gameover_text.get_rect(center=(width // 2, 80)))
-        screen.blit(score_text, score_text.get_rect(center=(width // 2, 160)))
-        gameover_buttons = get_gameover_buttons()
-        for button in gameover_buttons:
-            button.draw(screen)
-        pygame.display.update()
-
-        for event in events:
-            if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
-                for button in gameover_buttons:
-                    if button.is_clicked(event.pos):
-                        if button.action == "restart":
-                            resetObject()
-                            gameOver = False
-                            count = 0
-                            currentObject = eatables[0] if eatables else None
-                            isEatable = True
-                            lives = 3
-                            gameState = "playing"
-                        elif button.action == "quit_menu":
-                            gameState = "landing"
-                        elif button.action == "enter_highscore":
-                            gameState = "enter_highscore"
-        clock.tick(30)
-        continue
-
-    # --------------------- Post Highscore Message Screen ---------------------
-    if gameState == "post_highscore":
-        screen.fill(THEME_BG)
-        msg_text = font_large.render(hs_message, True, THEME_TEXT)
-        screen.blit(msg_text, msg_text.get_rect(center=(width // 2, height // 2 - 50)))
-        posths_buttons = get_posthighscore_buttons()
-        for button in posths_buttons:
-            button.draw(screen)
-        pygame.display.update()
-
-        for event in events:
-            if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
-                for button in posths_buttons:
-                    if button.is_clicked(event.pos):
-                        if button.action == "return":
-                            gameState = "gameover"
-        clock.tick(30)
-        continue
-
-    # --------------------- Enter Highscore State ---------------------
-    if gameState == "enter_highscore":
-        updated, hs_message = update_highscores(count)
-        gameState = "post_highscore"
-        continue
-
-    # --------------------- Playing State ---------------------
-    for event in events:
-        if gameState == "playing" and not gameOver and event.type == pygame.KEYDOWN:
-            if event.key in (pygame.K_ESCAPE, pygame.K_SPACE):
-                if current_time - last_toggle_time > pause_cooldown:
-                    gameState = "paused"
-                    last_toggle_time = current_time
-            elif event.key == pygame.K_r:
-                resetObject()
-                gameOver = False
-                count = 0
-                currentObject = eatables[0] if eatables else None
-                isEatable = True
-                lives = 3
-
-    # --------------------- Game Screen (Playing State) ---------------------
+# --------------------- Menu Screens ---------------------
+landing_buttons = get_landing_buttons()
+pause_buttons = get_pause_buttons()
+gameover_buttons = get_gameover_buttons()
+hs_buttons = get_highscore_buttons()
+posths_buttons = get_posthighscore_buttons()
+
+def clicked_action(event, buttons):
+    """Return the action of the button hit by a left click, or None."""
+    if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
+        for button in buttons:
+            if button.is_clicked(event.pos):
+                return button.action
+    return None
+
+def render_landing(alpha):
+    screen.fill(THEME_BG)
+    title_text = font_large.render("Welcome to the Edible Game!", True, THEME_TEXT)
+    instruct_text = font_small.render("Bite edible objects and avoid non-edible ones.", True, THEME_TEXT)
+    screen.blit(title_text, title_text.get_rect(center=(width // 2, 80)))
+    screen.blit(instruct_text, instruct_text.get_rect(center=(width // 2, 140)))
+    diff_display = font_medium.render(f"Difficulty: {difficulty.capitalize()}", True, THEME_TEXT)
+    screen.blit(diff_display, diff_display.get_rect(center=(width // 2, 220)))
+    for button in landing_buttons:
+        button.draw(screen)
+
+def landing_event(event):
+    global difficulty
+    action = clicked_action(event, landing_buttons)
+    if action == "easy":
+        difficulty = "easy"
+    elif action == "normal":
+        difficulty = "normal"
+    elif action == "start":
+        restart_game()
+        loop.change("playing")
+    elif action == "highscores":
+        loop.change("view_highscores")
+    elif action == "quit":
+        loop.quit()
+
+def draw_highscores(surface, hs_list):
+    surface.fill(THEME_BG)
+    title_text = font_large.render("Highscores", True, THEME_TEXT)
+    surface.blit(title_text, title_text.get_rect(center=(width // 2, 80)))
+    for i, entry in enumerate(hs_list or [{"name": "Default", "score": 0}]):
+        rank = i + 1
+        line = f"{rank}. {entry['name']} - {entry['score']}"
+        line_text = font_small.render(line, True, THEME_TEXT)
+        surface.blit(line_text, (width // 4, 150 + i * 40))
+    for button in hs_buttons:
+        button.draw(surface)
+
+def render_highscores(alpha):
+    # Drawn once and again only when this game's highscores change.
+    screen.blit(scoreboard.board(GAME_ID, (width, height), draw_highscores), (0, 0))
+
+def highscores_event(event):
+    if clicked_action(event, hs_buttons) == "return":
+        loop.change("landing")
+
+def render_paused(alpha):
+    screen.fill(THEME_BG)
+    pause_text = font_large.render("Paused", True, THEME_TEXT)
+    screen.blit(pause_text, pause_text.get_rect(center=(width // 2, 80)))
+    for button in pause_buttons:
+        button.draw(screen)
+
+def paused_event(event):
+    action = clicked_action(event, pause_buttons)
+    if action == "resume":
+        loop.change("playing")
+    elif action == "restart":
+        restart_game()
+        loop.change("playing")
+    elif action == "quit_menu":
+        loop.change("landing")
+
+def render_gameover(alpha):
+    screen.fill(THEME_BG)
+    gameover_text = font_large.render("Game Over!", True, THEME_TEXT)
+    score_text = font_medium.render(f"Score: {count}", True, THEME_TEXT)
+    screen.blit(gameover_text, gameover_text.get_rect(center=(width // 2, 80)))
+    screen.blit(score_text, score_text.get_rect(center=(width // 2, 160)))
+    if beaten_text:
+        beaten_surface = font_small.render(beaten_text, True, THEME_TEXT)
+        screen.blit(beaten_surface, beaten_surface.get_rect(center=(width // 2, 240)))
+    for button in gameover_buttons:
+        button.draw(screen)
+
+def gameover_event(event):
+    action = clicked_action(event, gameover_buttons)
+    if action == "restart":
+        restart_game()
+        loop.change("playing")
+    elif action == "quit_menu":
+        loop.change("landing")
+    elif action == "enter_highscore":
+        loop.change("enter_highscore")
+
+def enter_highscore():
+    global hs_message
+    updated, hs_message = update_highscores(count)
+    loop.change("post_highscore")
+
+def render_post_highscore(alpha):
+    screen.fill(THEME_BG)
+    msg_text = font_large.render(hs_message, True, THEME_TEXT)
+    screen.blit(msg_text, msg_text.get_rect(center=(width // 2, height // 2 - 50)))
+    for button in posths_buttons:
+        button.draw(screen)
+
+def post_highscore_event(event):
+    if clicked_action(event, posths_buttons) == "return":
+        loop.change("gameover")
+
+# --------------------- Playing State ---------------------
+frame_img = None
+faces = []
+
+def playing_event(event):
+    global last_toggle_time
+    if event.type == pygame.KEYDOWN:
+        current_time = pygame.time.get_ticks()
+        if event.key in (pygame.K_ESCAPE, pygame.K_SPACE):
+            if current_time - last_toggle_time > pause_cooldown:
+                loop.change("paused")
+                last_toggle_time = current_time
+        elif event.key == pygame.K_r:
+            restart_game()
+
+def playing_poll():
+    """Read the camera and find the face once per frame."""
+    global frame_img, faces
     success, img = cap.read()
     if not success:
-        break
+        loop.quit()
+        return
     img = cv2.flip(img, 1)
-    img, faces = detector.findFaceMesh(img, draw=False)
-    drawPos = (pos[0], pos[1])
-    img = cvzone.overlayPNG(img, currentObject, pos)
-    if difficulty == "easy":
-        height_obj, width_obj = currentObject.shape[:2]
-        outline_color = (0, 255, 0) if isEatable else (0, 0, 255)
-        cv2.rectangle(img, drawPos, (drawPos[0] + width_obj, drawPos[1] + height_obj), outline_color, thickness=3)
-        if faces:
-            face = faces[0]
-            up = face[idList[0]]
-            down = face[idList[1]]
-            cx, cy = (up[0] + down[0]) // 2, (up[1] + down[1]) // 2
-            cv2.line(img, (cx, cy), (pos[0] + 50, pos[1] + 50), (0, 255, 0), 3)
+    frame_img, faces = detector.findFaceMesh(img, draw=False)
+
+def playing_update(dt):
+    """Advance the falling object and check bites; runs at a fixed rate."""
+    global currentObject, count, lives, gameOver, round_recorded, beaten_text
+    prev_pos[:] = pos
     pos[1] += speed
     if pos[1] > 520:
         if isEatable and difficulty == "normal":
@@ -548,21 +482,52 @@ while running:
                 currentObject = resetObject()
                 if lives <= 0:
                     gameOver = True
-    imgRGB = cv2.cvtColor(img, cv2.COLOR_BGR2RGB)
-    surface = pygame.image.frombuffer(imgRGB.tobytes(), (imgRGB.shape[1], imgRGB.shape[0]), "RGB")
-    screen.blit(surface, (0, 0))
-    score_surface = font_medium.render("Score: " + str(count), True, THEME_TEXT)
-    screen.blit(score_surface, (width - score_surface.get_width() - 20, 20))
+    if gameOver:
+        if not round_recorded:
+            round_recorded = True
+            beaten_text = leaderboard.beaten_message(leaderboard.finish_round(GAME_ID, current_user["id"], count))
+        loop.change("gameover")
+
+def playing_render(alpha):
+    if frame_img is None:
+        return
+    drawPos = lerp(prev_pos, pos, alpha)
+    display.frame(frame_img)
+    display.blit(currentObject, drawPos)
+    if difficulty == "easy":
+        width_obj, height_obj = currentObject.get_size()
+        outline_color = (0, 255, 0) if isEatable else (255, 0, 0)
+        display.draw_rect(outline_color, (drawPos[0], drawPos[1], width_obj, height_obj), 3)
+        if faces:
+            face = faces[0]
+            up = face[idList[0]]
+            down = face[idList[1]]
+            cx, cy = (up[0] + down[0]) // 2, (up[1] + down[1]) // 2
+            display.draw_line((0, 255, 0), (cx, cy), (drawPos[0] + 50, drawPos[1] + 50), 3)
+    display.text(font_medium, "Score: " + str(count), THEME_TEXT, topright=(width - 20, 20))
     for i in range(lives):
-        screen.blit(heart_image, (10 + i * (heart_width + 5), 10))
+        display.blit(heart_image, (10 + i * (heart_width + 5), 10))
     if flash_active:
         draw_flash_effect()
-    pygame.display.update()
-    clock.tick(30)
 
-cap.release()
+# --------------------- Main Loop ---------------------
+loop = GameLoop({
+    "landing": GameState(handle_event=landing_event, render=render_landing, present=display.flip_canvas),
+    "view_highscores": GameState(handle_event=highscores_event, render=render_highscores,
+                                 present=display.flip_canvas),
+    "paused": GameState(handle_event=paused_event, render=render_paused, present=display.flip_canvas),
+    "gameover": GameState(handle_event=gameover_event, render=render_gameover, present=display.flip_canvas),
+    "enter_highscore": GameState(enter=enter_highscore, present=display.flip_canvas),
+    "post_highscore": GameState(handle_event=post_highscore_event, render=render_post_highscore,
+                                present=display.flip_canvas),
+    "playing": GameState(handle_event=playing_event, poll=playing_poll, update=playing_update,
+                         render=playing_render, present=display.flip),
+}, "landing")
+loop.run()
+
+camera.close_camera(cap)
 # At game over, end the session and log the final score.
 sessions.end_game_session(game_session_id, current_user["id"], GAME_ID, level_increment=0)
 logs.log_event(current_user["id"], "game_over", f"Game session {game_session_id} ended with score {count}")
 
-pygame.quit()
\ No newline at end of file
+pygame.quit()
@@ -0,0 +1,175 @@
+import os
+import time
+import signal
+from contextlib import contextmanager
+
+# -------------------- Configuration --------------------
+# Simulation steps per second; game speeds are given per step.
+TICK_RATE = 30
+# Frames a slow machine may fall behind before the simulation stops catching up.
+MAX_CATCH_UP_STEPS = 5
+# PLAYFUL_MINDS_HEADLESS=1 runs a game without a window or frame limit, with a fixed
+# step per frame; PLAYFUL_MINDS_FRAMES stops it after that many frames.
+HEADLESS = os.environ.get("PLAYFUL_MINDS_HEADLESS") == "1"
+HEADLESS_FRAMES = int(os.environ.get("PLAYFUL_MINDS_FRAMES", "0"))
+STAGES = ("events", "input", "update", "render", "present")
+
+if HEADLESS:
+    # Must happen before pygame opens a window, so it is done when a game imports this module.
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import pygame
+from services import telemetry
+
+
+def lerp(previous, current, alpha):
+    """Interpolate between the last two simulation values (numbers or sequences)."""
+    if isinstance(current, (int, float)):
+        return previous + (current - previous) * alpha
+    return type(current)(p + (c - p) * alpha for p, c in zip(previous, current))
+
+
+# -------------------- Game State --------------------
+class GameState:
+    """
+    One screen of a game (landing, playing, paused, ...).
+    Override the hooks, or pass them as functions for script-style games:
+      handle_event(event)  for every pygame event
+      poll()               once per frame, e.g. reading the camera
+      update(dt)           at a fixed TICK_RATE, however fast frames are drawn
+      render(alpha)        once per frame; alpha is how far we are into the next step
+      present()            show the frame (pygame.display.update by default)
+      enter()              when the loop switches to this state
+    """
+
+    def __init__(self, handle_event=None, poll=None, update=None, render=None, present=None, enter=None):
+        for name, hook in (("handle_event", handle_event), ("poll", poll), ("update", update),
+                           ("render", render), ("present", present), ("enter", enter)):
+            if hook is not None:
+                setattr(self, name, hook)
+
+    def enter(self):
+        pass
+
+    def handle_event(self, event):
+        pass
+
+    def poll(self):
+        pass
+
+    def update(self, dt):
+        pass
+
+    def render(self, alpha):
+        pass
+
+    def present(self):
+        pygame.display.update()
+
+
+# -------------------- Game Loop --------------------
+class GameLoop:
+    """
+    Runs the current GameState: events, input, fixed-step updates, then an
+    interpolated render. Every stage is timed and reported to the timing hooks.
+    """
+
+    def __init__(self, states, initial, fps=30, tick_rate=TICK_RATE, headless=HEADLESS):
+        self.states = states
+        self.state_name = initial
+        self.fps = fps
+        self.dt = 1.0 / tick_rate
+        self.headless = headless
+        self.running = False
+        self.frames = 0
+        self.ticks = 0
+        self.clock = pygame.time.Clock()
+        self.stage_totals = {stage: 0.0 for stage in STAGES}
+        self._timing_hooks = []
+
+    @property
+    def state(self):
+        return self.states[self.state_name]
+
+    def change(self, name):
+        """Switch to another state; it takes effect with the next hook that runs."""
+        self.state_name = name
+        self.state.enter()
+
+    def quit(self):
+        self.running = False
+
+    def add_timing_hook(self, hook):
+        """Call hook(stage, seconds) after each timed stage of every frame."""
+        self._timing_hooks.append(hook)
+
+    @contextmanager
+    def stage(self, name):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - start
+            self.stage_totals[name] = self.stage_totals.get(name, 0.0) + elapsed
+            for hook in self._timing_hooks:
+                hook(name, elapsed)
+
+    def _request_quit(self, signum, frame):
+        # The launcher's supervisor asks a game to close with SIGTERM; quitting through the
+        # event queue lets the game release the camera for the next one.
+        pygame.event.post(pygame.event.Event(pygame.QUIT))
+
+    def run(self, max_frames=None):
+        """Run until a state calls quit() (or max_frames frames in headless mode)."""
+        if max_frames is None and self.headless:
+            max_frames = HEADLESS_FRAMES or None
+        signal.signal(signal.SIGTERM, self._request_quit)
+        self.running = True
+        self.state.enter()
+        accumulator = 0.0
+        previous = time.perf_counter()
+        while self.running:
+            now = time.perf_counter()
+            # Headless runs are deterministic: exactly one step per frame.
+            accumulator += self.dt if self.headless else min(now - previous, self.dt * MAX_CATCH_UP_STEPS)
+            previous = now
+
+            with self.stage("events"):
+                for event in pygame.event.get():
+                    if event.type == pygame.QUIT:
+                        self.running = False
+                    else:
+                        self.state.handle_event(event)
+            if not self.running:
+                break
+            with self.stage("input"):
+                self.state.poll()
+            with self.stage("update"):
+                while accumulator >= self.dt and self.running:
+                    self.state.update(self.dt)
+                    accumulator -= self.dt
+                    self.ticks += 1
+            if not self.running:
+                break
+            with self.stage("render"):
+                self.state.render(accumulator / self.dt)
+            with self.stage("present"):
+                self.state.present()
+            if self.frames == 0:
+                telemetry.mark("first_frame")
+
+            self.frames += 1
+            if max_frames and self.frames >= max_frames:
+                break
+            if not self.headless:
+                self.clock.tick(self.fps)
+        if self.headless:
+            self.report()
+
+    def report(self):
+        """Print the average time spent in each stage per frame."""
+        frames = max(self.frames, 1)
+        print(f"{self.frames} frames, {self.ticks} updates")
+        for stage in STAGES:
+            print(f"  {stage:<8} {self.stage_totals[stage] * 1000 / frames:8.2f} ms/frame")
@@ -8,16 +8,12 @@ import json
 import sys
 import sqlite3
 import datetime
-from services import sessions, levels, logs, utils
+from services import sessions, levels, logs, utils, leaderboard, fonts, assets, telemetry, camera, context
+from games.gameloop import GameLoop, GameState
+telemetry.mark("imports")
 
 # Load current user info from the shared JSON file
-current_user_path = os.path.join(os.getcwd(), "config", "current_user.json")
-try:
-    with open(current_user_path, "r") as f:
-        current_user = json.load(f)
-except Exception as e:
-    current_user = {"id": 0, "firstName": "Guest", "userName": "Guest", "role": "player", "email": ""}
-    print("No current user found; defaulting to Guest.")
+current_user = context.current_user()
 
 # Define USER_ID for convenience
 USER_ID = current_user["id"]
@@ -42,10 +38,10 @@ pygame.display.set_caption("Math Quest")
 clock = pygame.time.Clock()
 
 # Define fonts for text rendering
-font_large = pygame.font.SysFont("Arial", 60)
-font_medium = pygame.font.SysFont("Arial", 40)
-font_small = pygame.font.SysFont("Arial", 28)
-font_feedback = pygame.font.SysFont("Arial", 72, bold=True)
+font_large = fonts.get_font("Arial", 60)
+font_medium = fonts.get_font("Arial", 40)
+font_small = fonts.get_font("Arial", 28)
+font_feedback = fonts.get_font("Arial", 72, bold=True)
 
 # Colors
 WHITE = (255, 255, 255)
@@ -65,6 +61,8 @@ detector = None
 
 # ---------------------- Game Variables ----------------------
 score = 0
+# Game over line comparing the round with everyone's earlier rounds.
+beaten_text = ""
 attempts = 0
 current_category = ""
 current_question = ""
@@ -91,13 +89,11 @@ new_question_flag = False  # if True, a new question will be loaded
 
 # ---------------------- Load Heart Image ----------------------
 try:
-    script_dir = os.path.dirname(os.path.abspath(__file__))
+    script_dir = os.path.join(os.getcwd(), "games")
     heart_path = os.path.join(os.path.dirname(script_dir), 'assets', 'heart.png')
-    original_heart = pygame.image.load(heart_path).convert_alpha()
-    heart_width = int(original_heart.get_width() * heart_scale)
-    heart_height = int(original_heart.get_height() * heart_scale)
-    heart_image = pygame.transform.scale(original_heart, (heart_width, heart_height))
-except pygame.error as e:
+    heart_image = assets.load_image(heart_path, alpha=True, scale=heart_scale)
+    heart_width, heart_height = heart_image.get_size()
+except (OSError, pygame.error) as e:
     print(f"Error loading heart image: {e}")
     heart_image = pygame.Surface((50, 50))
     heart_image.fill(INCORRECT_COLOR)
@@ -105,11 +101,10 @@ except pygame.error as e:
 # ---------------------- Background Image ----------------------
 loading_bg_image = None
 try:
-    script_dir = os.path.dirname(os.path.abspath(__file__))
+    script_dir = os.path.join(os.getcwd(), "games")
     image_path = os.path.join(os.path.dirname(script_dir), 'assets', 'background', 'maths.png')
-    loading_bg_image = pygame.image.load(image_path)
-    loading_bg_image = pygame.transform.scale(loading_bg_image, (screen_width, screen_height))
-except pygame.error as e:
+    loading_bg_image = assets.load_image(image_path, size=(screen_width, screen_height))
+except (OSError, pygame.error) as e:
     print(f"Error loading background image: {e}")
     loading_bg_image = pygame.Surface((screen_width, screen_height))
     loading_bg_image.fill(THEME_BG)
@@ -281,13 +276,14 @@ game_items = generate_game_items()
 
 # ---------------------- Levels & Session Integration ----------------------
 GAME_ID_MATH = "MathQuest"  # Unique identifier for Math Quest
-levels.init_player_progress(USER_ID, GAME_ID_MATH)
-base_progress = levels.get_player_progress(USER_ID, GAME_ID_MATH)
+base_progress = context.progress(GAME_ID_MATH)
 base_level = base_progress["level"] if base_progress and "level" in base_progress else 0
+# Kept up to date from update_player_progress instead of reading the database every frame.
+current_level = base_level
 session_id = sessions.start_game_session(USER_ID, GAME_ID_MATH, "math_quest")
 logs.log_event(USER_ID, "game_start", f"Game session {session_id} started for {GAME_ID_MATH}")
 # ---------------------- Game States ----------------------
-state = "loading"  # "loading", "landing", "game", "pause", "game_over"
+# States: "loading", "landing", "game", "pause", "game_over"
 loading_start_time = pygame.time.get_ticks()
 loading_duration = 2000
 
@@ -322,290 +318,286 @@ quit_button_gameover = Button("Quit to Menu", quit_button_gameover_x, 450, butto
                                BUTTON_TEXT_COLOR, font_medium, action="quit_menu")
 
 def player_quit():
-    global running
     sessions.end_game_session(session_id, USER_ID, GAME_ID_MATH, level_increment=0)
     logs.log_event(USER_ID, "quit", f"Game session {session_id} ended by player quit with score {score}")
-    running = False  # This will break the main loop
-
-
-# ---------------------- Main Loop ----------------------
-running = True
-while running:
-    current_time = pygame.time.get_ticks()
-    events = pygame.event.get()
-    for event in events:
-        if event.type == pygame.QUIT:
-            running = False
-
-    # Default cursor and pinch state.
+    loop.quit()  # This will break the main loop
+
+def start_game():
+    global game_items, score, attempts, feedback_active, feedback_timer, lives
+    global camera_initialized, detector_initialized, questions_answered, correct_answers, total_response_time
+    game_items = generate_game_items()
+    score = 0
+    attempts = 0
+    feedback_active = False
+    feedback_timer = 0
+    lives = 3
+    camera_initialized = False
+    detector_initialized = False
+    questions_answered = 0
+    correct_answers = 0
+    total_response_time = 0
+    loop.change("game")
+
+
+# ---------------------- State: Loading ----------------------
+def loading_update(dt):
+    if pygame.time.get_ticks() - loading_start_time > loading_duration:
+        # The camera only opens once a round starts, so the launch ends at the landing screen.
+        telemetry.finish()
+        loop.change("landing")
+
+def render_loading(alpha):
+    screen.fill(THEME_BG)
+    screen.blit(loading_bg_image, (0, 0))
+
+# ---------------------- State: Landing ----------------------
+def landing_event(event):
+    if event.type == pygame.KEYDOWN:
+        if event.key == pygame.K_s:
+            start_game()
+        elif event.key == pygame.K_q:
+            loop.quit()
+    elif event.type in [pygame.MOUSEBUTTONDOWN, pygame.MOUSEBUTTONUP, pygame.MOUSEMOTION]:
+        mouse_cursor = pygame.mouse.get_pos()
+        clicked = start_button.handle_input(event, mouse_cursor)
+        if clicked == "start" and event.type == pygame.MOUSEBUTTONUP:
+            start_game()
+        clicked = quit_button_main.handle_input(event, mouse_cursor)
+        if clicked == "quit_app" and event.type == pygame.MOUSEBUTTONUP:
+            player_quit()
+
+def render_landing(alpha):
+    screen.fill(THEME_BG)
+    draw_text(screen, "Welcome to Maths Quest!", font_large, THEME_TEXT, (screen_width//2 - 400, 200))
+    start_button.draw(screen)
+    quit_button_main.draw(screen)
+
+# ---------------------- State: Game ----------------------
+# Cursor and pinch state from the latest camera frame.
+cursor = (0, 0)
+pinch_active = False
+frame_surface = None
+success = False
+
+def game_event(event):
+    if event.type == pygame.KEYDOWN:
+        if event.key == pygame.K_ESCAPE:
+            loop.change("pause")
+
+def game_poll():
+    """Initialize the camera and detector if needed, then track the hand once per frame."""
+    global cap, detector, camera_initialized, detector_initialized, cursor, pinch_active, frame_surface
     cursor = (0, 0)
     pinch_active = False
-
-    # ---------------------- State: Loading ----------------------
-    if state == "loading":
-        screen.fill(THEME_BG)
-        screen.blit(loading_bg_image, (0, 0))
-        if current_time - loading_start_time > loading_duration:
-            state = "landing"
-        pygame.display.flip()
-        clock.tick(30)
-        continue
-
-    # ---------------------- State: Landing ----------------------
-    if state == "landing":
-        screen.fill(THEME_BG)
-        draw_text(screen, "Welcome to Maths Quest!", font_large, THEME_TEXT, (screen_width//2 - 400, 200))
-        start_button.draw(screen)
-        quit_button_main.draw(screen)
-        for event in events:
-            if event.type == pygame.KEYDOWN:
-                if event.key == pygame.K_s:
-                    state = "game"
-                    game_items = generate_game_items()
-                    score = 0
-                    feedback_active = False
-                    feedback_timer = 0
-                    lives = 3
-                    camera_initialized = False
-                    detector_initialized = False
-                    questions_answered = 0
-                    correct_answers = 0
-                    total_response_time = 0
-                elif event.key == pygame.K_q:
-                    running = False
-            elif event.type in [pygame.MOUSEBUTTONDOWN, pygame.MOUSEBUTTONUP, pygame.MOUSEMOTION]:
-                mouse_cursor = pygame.mouse.get_pos()
-                clicked = start_button.handle_input(event, mouse_cursor)
-                if clicked == "start" and event.type == pygame.MOUSEBUTTONUP:
-                    state = "game"
-                    game_items = generate_game_items()
-                    score = 0
-                    feedback_active = False
-                    feedback_timer = 0
-                    lives = 3
-                    camera_initialized = False
-                    detector_initialized = False
-                    questions_answered = 0
-                    correct_answers = 0
-                    total_response_time = 0
-                clicked = quit_button_main.handle_input(event, mouse_cursor)
-                if clicked == "quit_app" and event.type == pygame.MOUSEBUTTONUP:
-                    player_quit()
-                    running = False
-        pygame.display.update()
-        clock.tick(30)
-
-    # ---------------------- State: Game ----------------------
-    elif state == "game":
-        if not camera_initialized:
-            try:
-                cap = cv2.VideoCapture(0)
-                cap.set(3, screen_width)
-                cap.set(4, screen_height)
-                camera_initialized = True
-            except Exception as e:
-                print(f"Error initializing camera: {e}")
-                state = "landing"
-        if camera_initialized and not detector_initialized:
-            try:
+    frame_surface = None
+    if not camera_initialized:
+        try:
+            with telemetry.stage("camera"):
+                cap = camera.open_camera(context.setting("camera_index", 0), screen_width, screen_height)
+            camera_initialized = True
+        except Exception as e:
+            print(f"Error initializing camera: {e}")
+            loop.change("landing")
+    if camera_initialized and not detector_initialized:
+        try:
+            with telemetry.stage("detector"):
                 detector = HandDetector(detectionCon=0.8)
-                detector_initialized = True
-            except Exception as e:
-                print(f"Error initializing hand detector: {e}")
-                state = "landing"
-        if camera_initialized and detector_initialized:
-            ret, frame = cap.read()
-            if ret:
-                hands, frame = detector.findHands(frame, flipType=False)
-                if hands:
-                    lmList = hands[0]['lmList']
-                    pinch_distance, info, frame = detector.findDistance(lmList[4][:2], lmList[8][:2], frame)
-                    if pinch_distance < 50:
-                        pinch_active = True
-                    cursor_x, cursor_y = lmList[8][:2]
-                    cursor = (screen_width - cursor_x, cursor_y)
-                frame = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-                frame = np.rot90(frame)
-                frame_surface = pygame.surfarray.make_surface(frame)
-                screen.blit(frame_surface, (0, 0))
-            else:
-                print("Error reading frame")
-                state = "landing"
+            detector_initialized = True
+        except Exception as e:
+            print(f"Error initializing hand detector: {e}")
+            loop.change("landing")
+    if camera_initialized and detector_initialized:
+        ret, frame = cap.read()
+        if ret:
+            hands, frame = detector.findHands(frame, flipType=False)
+            if hands:
+                lmList = hands[0]['lmList']
+                pinch_distance, info, frame = detector.findDistance(lmList[4][:2], lmList[8][:2], frame)
+                if pinch_distance < 50:
+                    pinch_active = True
+                cursor_x, cursor_y = lmList[8][:2]
+                cursor = (screen_width - cursor_x, cursor_y)
+            frame = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
+            frame = np.rot90(frame)
+            frame_surface = pygame.surfarray.make_surface(frame)
         else:
-            screen.fill(THEME_BG)
-            draw_text(screen, "Camera/Hand Tracking Error", font_large, INCORRECT_COLOR, (screen_width//2 - 300, screen_height//2 - 50))
-            pygame.display.update()
-            clock.tick(30)
-            continue
-
-        pygame.draw.rect(screen, DROP_ZONE_COLOR, drop_zone_left)
-        pygame.draw.rect(screen, DROP_ZONE_COLOR, drop_zone_right)
-        draw_question_box(screen, f"{current_category}: {current_question}", font_medium, (screen_width//2, 100))
-        draw_text(screen, "Drag the CORRECT answer into the green zones!", font_medium, THEME_TEXT, (50, screen_height - 50))
-        draw_hearts_and_score(screen, lives, score)
-
-        if detector_initialized:
-            if pinch_active:
-                for obj in game_items:
-                    if obj.rect.collidepoint(cursor):
-                        if dragging_item is None:
-                            dragging_item = obj
-                            drag_offset = (cursor[0] - obj.rect.centerx, cursor[1] - obj.rect.centery)
-                        break
-                if dragging_item:
-                    new_center_x = cursor[0] - drag_offset[0]
-                    new_center_y = cursor[1] - drag_offset[1]
-                    dragging_item.pos = [new_center_x, new_center_y]
-                    dragging_item.rect.center = dragging_item.pos
-            else:
-                if dragging_item:
-                    collides_left = dragging_item.rect.colliderect(drop_zone_left)
-                    collides_right = dragging_item.rect.colliderect(drop_zone_right)
-                    in_drop_zone = collides_left or collides_right
-                    if in_drop_zone:
-                        if not answer_submitted:
-                            answer_submitted = True
-                            questions_answered += 1
-                            response_time = current_time - question_start_time
-                            total_response_time += response_time
-                            if dragging_item.is_correct:
-                                success = True
-                                correct_answers += 1
-                                score += 1
-                                # --- LEVEL UPDATE & LOGGING SNIPPET ---
-                                # (Assumes USER_ID and GAME_ID_SPELL are defined earlier in the file.)
-                                if USER_ID != 0:
-                                    try:
-                                        levels.update_player_progress(USER_ID, GAME_ID_MATH, additional_points=1)
-                                    except Exception as e:
-                                        print("Level update error:", e)
-                                    logs.log_event(USER_ID, "score", f"Score incremented to {score}")
-                                else:
-                                    logs.log_event(0, "score", f"Guest score incremented to {score}")
-                                # --- END LEVEL UPDATE & LOGGING SNIPPET ---
-
-                                flash_color = CORRECT_COLOR
-                                new_question_flag = True
+            print("Error reading frame")
+            loop.change("landing")
+
+def game_update(dt):
+    """Dragging, answer checks, feedback and the flash fade; runs at a fixed rate."""
+    global dragging_item, drag_offset, answer_submitted, questions_answered, total_response_time
+    global success, correct_answers, score, lives, flash_color, flash_alpha, new_question_flag
+    global feedback_timer, feedback_active, game_items, current_level, beaten_text
+    if not (camera_initialized and detector_initialized):
+        return
+    current_time = pygame.time.get_ticks()
+
+    if detector_initialized:
+        if pinch_active:
+            for obj in game_items:
+                if obj.rect.collidepoint(cursor):
+                    if dragging_item is None:
+                        dragging_item = obj
+                        drag_offset = (cursor[0] - obj.rect.centerx, cursor[1] - obj.rect.centery)
+                    break
+            if dragging_item:
+                new_center_x = cursor[0] - drag_offset[0]
+                new_center_y = cursor[1] - drag_offset[1]
+                dragging_item.pos = [new_center_x, new_center_y]
+                dragging_item.rect.center = dragging_item.pos
+        else:
+            if dragging_item:
+                collides_left = dragging_item.rect.colliderect(drop_zone_left)
+                collides_right = dragging_item.rect.colliderect(drop_zone_right)
+                in_drop_zone = collides_left or collides_right
+                if in_drop_zone:
+                    if not answer_submitted:
+                        answer_submitted = True
+                        questions_answered += 1
+                        response_time = current_time - question_start_time
+                        total_response_time += response_time
+                        if dragging_item.is_correct:
+                            success = True
+                            correct_answers += 1
+                            score += 1
+                            # --- LEVEL UPDATE & LOGGING SNIPPET ---
+                            if USER_ID != 0:
+                                try:
+                                    progress = levels.update_player_progress(USER_ID, GAME_ID_MATH, additional_points=1)
+                                    if progress:
+                                        current_level = progress["level"]
+                                except Exception as e:
+                                    print("Level update error:", e)
+                                logs.log_event(USER_ID, "score", f"Score incremented to {score}")
                             else:
-                                success = False
-                                lives -= 1
-                                flash_color = INCORRECT_COLOR
-                                new_question_flag = False
-                            feedback_timer = current_time
-                            feedback_active = True
-                            dragging_item = None
+                                logs.log_event(0, "score", f"Guest score incremented to {score}")
+                            # --- END LEVEL UPDATE & LOGGING SNIPPET ---
+
+                            flash_color = CORRECT_COLOR
+                            new_question_flag = True
                         else:
-                            pass
-                    else:
-                        dragging_item.reset_position()
+                            success = False
+                            lives -= 1
+                            flash_color = INCORRECT_COLOR
+                            new_question_flag = False
+                        feedback_timer = current_time
+                        feedback_active = True
                         dragging_item = None
                 else:
+                    dragging_item.reset_position()
                     dragging_item = None
-        else:
-            dragging_item = None
-
-        for obj in game_items:
-            obj.draw(screen)
-
-        if feedback_active:
-            feedback_text_pos = (screen_width//2 - 200, screen_height//2 - 80)
-            if success:
-                feedback_text = "Correct! Well done."
             else:
-                feedback_text = "Oops! That's incorrect. Try again."
-            draw_text(screen, feedback_text, font_feedback, flash_color, feedback_text_pos)
-            if current_time - feedback_timer > flash_duration:
-                feedback_active = False
-                if new_question_flag:
-                    game_items = generate_game_items()
-                else:
-                    for obj in game_items:
-                        obj.reset_position()
-                flash_alpha = 200
-                answer_submitted = False
-
-        if feedback_active:
-            flash_surface = pygame.Surface((screen_width, screen_height))
-            flash_surface.fill(flash_color)
-            flash_surface.set_alpha(flash_alpha)
-            screen.blit(flash_surface, (0, 0))
-            alpha_reduction_rate = 255 / (flash_duration / (1000 / 30))
+                dragging_item = None
+    else:
+        dragging_item = None
+
+    if feedback_active:
+        if current_time - feedback_timer > flash_duration:
+            feedback_active = False
+            if new_question_flag:
+                game_items = generate_game_items()
+            else:
+                for obj in game_items:
+                    obj.reset_position()
+            flash_alpha = 200
+            answer_submitted = False
+        else:
+            # The flash fades out over flash_duration at the fixed update rate.
+            alpha_reduction_rate = 255 / (flash_duration / (1000 * dt))
             flash_alpha = max(0, flash_alpha - alpha_reduction_rate)
-            if flash_alpha <= 0:
-                flash_alpha = 0
-
-        if detector_initialized and pinch_active:
-            pygame.draw.circle(screen, HIGHLIGHT_COLOR, cursor, 15)
 
-        # --------------------- Draw Level Display ---------------------
-        # Get current progress for Math Quest.
-        current_progress = levels.get_player_progress(current_user["id"], GAME_ID_MATH)
-        current_level = current_progress["level"] if current_progress else base_level
-        draw_level_display(current_level)
+    if lives <= 0:
+        beaten_text = leaderboard.beaten_message(leaderboard.finish_round(GAME_ID_MATH, USER_ID, score))
+        loop.change("game_over")
 
-        if lives <= 0:
-            state = "game_over"
-
-        for event in events:
-            if event.type == pygame.KEYDOWN:
-                if event.key == pygame.K_ESCAPE:
-                    state = "pause"
-
-        pygame.display.update()
-        clock.tick(30)
-
-    # ---------------------- State: Pause ----------------------
-    elif state == "pause":
-        screen.fill(THEME_BG)
-        draw_text(screen, "Game Paused", font_large, THEME_TEXT, (screen_width//2 - 150, 250))
-        resume_button.draw(screen)
-        quit_button_pause.draw(screen)
-        for event in events:
-            if event.type == pygame.KEYDOWN:
-                if event.key == pygame.K_r:
-                    state = "game"
-                elif event.key == pygame.K_q:
-                    state = "landing"
-            elif event.type in [pygame.MOUSEBUTTONDOWN, pygame.MOUSEBUTTONUP, pygame.MOUSEMOTION]:
-                mouse_cursor = pygame.mouse.get_pos()
-                clicked = resume_button.handle_input(event, mouse_cursor)
-                if clicked == "resume" and event.type == pygame.MOUSEBUTTONUP:
-                    state = "game"
-                clicked = quit_button_pause.handle_input(event, mouse_cursor)
-                if clicked == "quit_menu" and event.type == pygame.MOUSEBUTTONUP:
-                    state = "landing"
-
-    # ---------------------- State: Game Over ----------------------
-    elif state == "game_over":
+def render_game(alpha):
+    if not (camera_initialized and detector_initialized):
         screen.fill(THEME_BG)
-        draw_text(screen, "Game Over!", font_large, THEME_TEXT, (screen_width//2 - 150, 200))
-        draw_text(screen, f"Final Score: {score}", font_medium, THEME_TEXT, (screen_width//2 - 150, 280))
-        restart_button.draw(screen)
-        quit_button_gameover.draw(screen)
-        for event in events:
-            if event.type in [pygame.MOUSEBUTTONDOWN, pygame.MOUSEBUTTONUP, pygame.MOUSEMOTION]:
-                mouse_cursor = pygame.mouse.get_pos()
-                clicked_restart = restart_button.handle_input(event, mouse_cursor)
-                if clicked_restart == "restart" and event.type == pygame.MOUSEBUTTONUP:
-                    state = "game"
-                    game_items = generate_game_items()
-                    score = 0
-                    attempts = 0
-                    lives = 3
-                    feedback_active = False
-                    feedback_timer = 0
-                    camera_initialized = False
-                    detector_initialized = False
-                    questions_answered = 0
-                    correct_answers = 0
-                    total_response_time = 0
-                clicked_quit = quit_button_gameover.handle_input(event, mouse_cursor)
-                if clicked_quit == "quit_menu" and event.type == pygame.MOUSEBUTTONUP:
-                    state = "landing"
-
-    pygame.display.update()
-    clock.tick(30)
-
-if cap and cap.isOpened():
-    cap.release()
+        draw_text(screen, "Camera/Hand Tracking Error", font_large, INCORRECT_COLOR, (screen_width//2 - 300, screen_height//2 - 50))
+        return
+    if frame_surface is not None:
+        screen.blit(frame_surface, (0, 0))
+
+    pygame.draw.rect(screen, DROP_ZONE_COLOR, drop_zone_left)
+    pygame.draw.rect(screen, DROP_ZONE_COLOR, drop_zone_right)
+    draw_question_box(screen, f"{current_category}: {current_question}", font_medium, (screen_width//2, 100))
+    draw_text(screen, "Drag the CORRECT answer into the green zones!", font_medium, THEME_TEXT, (50, screen_height - 50))
+    draw_hearts_and_score(screen, lives, score)
+
+    for obj in game_items:
+        obj.draw(screen)
+
+    if feedback_active:
+        feedback_text_pos = (screen_width//2 - 200, screen_height//2 - 80)
+        if success:
+            feedback_text = "Correct! Well done."
+        else:
+            feedback_text = "Oops! That's incorrect. Try again."
+        draw_text(screen, feedback_text, font_feedback, flash_color, feedback_text_pos)
+
+        flash_surface = pygame.Surface((screen_width, screen_height))
+        flash_surface.fill(flash_color)
+        flash_surface.set_alpha(flash_alpha)
+        screen.blit(flash_surface, (0, 0))
+
+    if detector_initialized and pinch_active:
+        pygame.draw.circle(screen, HIGHLIGHT_COLOR, cursor, 15)
+
+    # --------------------- Draw Level Display ---------------------
+    draw_level_display(current_level)
+
+# ---------------------- State: Pause ----------------------
+def pause_event(event):
+    if event.type == pygame.KEYDOWN:
+        if event.key == pygame.K_r:
+            loop.change("game")
+        elif event.key == pygame.K_q:
+            loop.change("landing")
+    elif event.type in [pygame.MOUSEBUTTONDOWN, pygame.MOUSEBUTTONUP, pygame.MOUSEMOTION]:
+        mouse_cursor = pygame.mouse.get_pos()
+        clicked = resume_button.handle_input(event, mouse_cursor)
+        if clicked == "resume" and event.type == pygame.MOUSEBUTTONUP:
+            loop.change("game")
+        clicked = quit_button_pause.handle_input(event, mouse_cursor)
+        if clicked == "quit_menu" and event.type == pygame.MOUSEBUTTONUP:
+            loop.change("landing")
+
+def render_pause(alpha):
+    screen.fill(THEME_BG)
+    draw_text(screen, "Game Paused", font_large, THEME_TEXT, (screen_width//2 - 150, 250))
+    resume_button.draw(screen)
+    quit_button_pause.draw(screen)
+
+# ---------------------- State: Game Over ----------------------
+def game_over_event(event):
+    if event.type in [pygame.MOUSEBUTTONDOWN, pygame.MOUSEBUTTONUP, pygame.MOUSEMOTION]:
+        mouse_cursor = pygame.mouse.get_pos()
+        clicked_restart = restart_button.handle_input(event, mouse_cursor)
+        if clicked_restart == "restart" and event.type == pygame.MOUSEBUTTONUP:
+            start_game()
+        clicked_quit = quit_button_gameover.handle_input(event, mouse_cursor)
+        if clicked_quit == "quit_menu" and event.type == pygame.MOUSEBUTTONUP:
+            loop.change("landing")
+
+def render_game_over(alpha):
+    screen.fill(THEME_BG)
+    draw_text(screen, "Game Over!", font_large, THEME_TEXT, (screen_width//2 - 150, 200))
+    draw_text(screen, f"Final Score: {score}", font_medium, THEME_TEXT, (screen_width//2 - 150, 280))
+    restart_button.draw(screen)
+    quit_button_gameover.draw(screen)
+    if beaten_text:
+        draw_text(screen, beaten_text, font_small, THEME_TEXT, (screen_width//2 - 150, 560))
+
+# ---------------------- Main Loop ----------------------
+loop = GameLoop({
+    "loading": GameState(update=loading_update, render=render_loading),
+    "landing": GameState(handle_event=landing_event, render=render_landing),
+    "game": GameState(handle_event=game_event, poll=game_poll, update=game_update, render=render_game),
+    "pause": GameState(handle_event=pause_event, render=render_pause),
+    "game_over": GameState(handle_event=game_over_event, render=render_game_over),
+}, "loading")
+loop.run()
+
+camera.close_camera(cap)
 pygame.quit()
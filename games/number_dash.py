@@ -8,16 +8,11 @@ import numpy as np
 from cvzone.FaceMeshModule import FaceMeshDetector
 import sqlite3
 import datetime
-from services import sessions, levels, logs, utils
+from services import sessions, levels, logs, utils, highscores, scoreboard, leaderboard, fonts, assets, telemetry, camera, context
+from games.gameloop import GameLoop, GameState, lerp
+telemetry.mark("imports")
 
-current_user_path = os.path.join(os.getcwd(), "config", "current_user.json")
-try:
-    with open(current_user_path, "r") as f:
-        current_user = json.load(f)
-except Exception as e:
-    # If no user data is found, default to a guest.
-    current_user = {"id": 0, "userName": "Guest", "role": "player", "email": ""}
-    print("No current user found; defaulting to Guest.")
+current_user = context.current_user()
 
 USER_ID = current_user["id"]
 
@@ -34,15 +29,14 @@ pygame.display.set_caption("Number Dash")
 clock = pygame.time.Clock()
 
 # Pre-load the background image so it appears immediately.
-script_dir = os.path.dirname(os.path.abspath(__file__))
+script_dir = os.path.join(os.getcwd(), "games")
 bg_path = os.path.join(script_dir, "..", "assets", "background", "number_dash.jpeg")
-bg_image = pygame.image.load(bg_path).convert()
-bg_image = pygame.transform.scale(bg_image, (width, height))
+bg_image = assets.load_image(bg_path, size=(width, height))
 
 # Playful fonts for a kid-friendly look.
-font_large = pygame.font.SysFont("Comic Sans MS", 80)
-font_medium = pygame.font.SysFont("Comic Sans MS", 60)
-font_small = pygame.font.SysFont("Comic Sans MS", 40)
+font_large = fonts.get_font("Comic Sans MS", 80)
+font_medium = fonts.get_font("Comic Sans MS", 60)
+font_small = fonts.get_font("Comic Sans MS", 40)
 
 # --------------------- Button Class ---------------------
 class Button:
@@ -97,35 +91,10 @@ def draw_loading_screen():
     loading_message = font_small.render("Loading... Please wait.", True, THEME_TEXT)
     screen.blit(loading_title, loading_title.get_rect(center=(width // 2, height // 2 - 50)))
     screen.blit(loading_message, loading_message.get_rect(center=(width // 2, height // 2 + 20)))
-    pygame.display.update()
 
 # --------------------- Highscore Functions ---------------------
-HIGHSCORE_FILE = os.path.join(script_dir, "..", "config", "number_dash_highscores.json")
-
-def load_highscores():
-    highscores = []
-    if os.path.exists(HIGHSCORE_FILE):
-        try:
-            with open(HIGHSCORE_FILE, "r") as f:
-                data = json.load(f)
-                if isinstance(data, list):
-                    highscores = data
-        except (FileNotFoundError, json.JSONDecodeError):
-            highscores = []
-    return highscores
-
-def save_highscores(highscores):
-    config_dir = os.path.dirname(HIGHSCORE_FILE)
-    if not os.path.exists(config_dir):
-        os.makedirs(config_dir)
-    with open(HIGHSCORE_FILE, "w") as f:
-        json.dump(highscores, f, indent=4)
-
 def add_highscore(name, score_val):
-    highscores = load_highscores()
-    highscores.append({"name": name, "score": score_val})
-    highscores.sort(key=lambda x: x["score"], reverse=True)
-    save_highscores(highscores[:10])
+    highscores.add(GAME_ID_NUMDASH, name, score_val)
 
 # --------------------- Level Display Function ---------------------
 def draw_level_display(surface, level):
@@ -147,16 +116,21 @@ difficulty = "easy"  # "easy" or "normal" (set via main menu toggle)
 lives = 3
 score = 0
 speed = 5
+# Game over line comparing the round with everyone's earlier rounds.
+beaten_text = ""
 
 heart_path = os.path.join(script_dir, "..", "assets", "heart.png")
-heart_image = pygame.image.load(heart_path).convert_alpha()
+heart_image = assets.load_image(heart_path, alpha=True)
 heart_width = heart_image.get_width()
 
 # --------------------- Camera Setup ---------------------
-cap = cv2.VideoCapture(0)
-cap.set(3, width)
-cap.set(4, height)
-detector = FaceMeshDetector(maxFaces=1)
+with telemetry.stage("camera"):
+    cap = camera.open_camera(context.setting("camera_index", 0), width, height)
+with telemetry.stage("detector"):
+    detector = FaceMeshDetector(maxFaces=1)
+# Launch latency runs to the first frame the camera delivers, not to the first round.
+if cap.read()[0]:
+    telemetry.mark("camera_frame")
 idList = [0, 17, 78, 292]
 
 # --------------------- Number Generation ---------------------
@@ -170,236 +144,260 @@ def generate_number_object():
     return number, is_odd, num_surface, rect
 
 def reset_number_object():
-    global currentNumber, currentIsOdd, currentNumSurface, currentRect, current_prompt
+    global currentNumber, currentIsOdd, currentNumSurface, currentRect, current_prompt, prev_y
     currentNumber, currentIsOdd, currentNumSurface, currentRect = generate_number_object()
     current_prompt = random.choice(["Odd", "Even"])
+    prev_y = currentRect.y  # Height at the previous update, for interpolated drawing.
+
+def restart_game():
+    global lives, score, speed
+    lives = 3
+    score = 0
+    speed = 5
+    reset_number_object()
 
 reset_number_object()
 highscore_name_input = ""
 
 # --------------------- Levels and Session Integration ---------------------
 GAME_ID_NUMDASH = "NumberDash"  # Unique identifier for Number Dash
-levels.init_player_progress(USER_ID, GAME_ID_NUMDASH)
-base_progress = levels.get_player_progress(USER_ID, GAME_ID_NUMDASH)
+base_progress = context.progress(GAME_ID_NUMDASH)
 base_level = base_progress["level"] if base_progress else 0
+# Kept up to date from update_player_progress instead of reading the database every frame.
+current_level = base_level
 session_id = sessions.start_game_session(USER_ID, GAME_ID_NUMDASH, "NumberDash")
 logs.log_event(USER_ID, "game_start", f"Game session {session_id} started for {GAME_ID_NUMDASH}")
 
 # --------------------- State Management ---------------------
-game_state = "loading"  # Allowed states: "loading", "main_menu", "playing", "paused", "gameover", "enter_highscore", "highscore"
+# States: "loading", "main_menu", "playing", "paused", "gameover", "enter_highscore", "highscore"
 loading_start_time = pygame.time.get_ticks()
 
-# --------------------- Main Loop ---------------------
-while True:
-    for event in pygame.event.get():
-        if event.type == pygame.QUIT:
-            pygame.quit()
-            sys.exit()
-
-        if game_state == "main_menu":
-            if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
-                pos_mouse = pygame.mouse.get_pos()
-                for button in get_main_menu_buttons():
-                    if button.is_clicked(pos_mouse):
-                        if button.action == "toggle_difficulty":
-                            difficulty = "normal" if difficulty == "easy" else "easy"
-                        elif button.action == "start":
-                            game_state = "playing"
-                            lives = 3
-                            score = 0
-                            speed = 5
-                            reset_number_object()
-                        elif button.action == "highscores":
-                            game_state = "highscore"
-                        elif button.action == "quit":
-                            pygame.quit()
-                            sys.exit()
-
-        elif game_state == "paused":
-            if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
-                pos_mouse = pygame.mouse.get_pos()
-                for button in get_pause_menu_buttons():
-                    if button.is_clicked(pos_mouse):
-                        if button.action == "resume":
-                            game_state = "playing"
-                        elif button.action == "quit_menu":
-                            game_state = "main_menu"
-            if event.type == pygame.KEYDOWN:
-                if event.key in (pygame.K_ESCAPE, pygame.K_SPACE):
-                    game_state = "playing"
-
-        elif game_state == "gameover":
-            if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
-                pos_mouse = pygame.mouse.get_pos()
-                for button in get_gameover_menu_buttons():
-                    if button.is_clicked(pos_mouse):
-                        if button.action == "restart":
-                            game_state = "playing"
-                            lives = 3
-                            score = 0
-                            speed = 5
-                            reset_number_object()
-                        elif button.action == "quit_menu":
-                            game_state = "main_menu"
-            if event.type == pygame.KEYDOWN:
-                if event.key == pygame.K_ESCAPE:
-                    game_state = "gameover"
-
-        elif game_state == "enter_highscore":
-            if event.type == pygame.KEYDOWN:
-                if event.key == pygame.K_ESCAPE:
-                    game_state = "gameover"
-                    highscore_name_input = ""
-                elif event.key == pygame.K_BACKSPACE:
-                    highscore_name_input = highscore_name_input[:-1]
-                elif event.key == pygame.K_RETURN:
-                    if highscore_name_input.strip() != "":
-                        add_highscore(highscore_name_input.strip(), score)
-                    highscore_name_input = ""
-                    game_state = "gameover"
-                else:
-                    if event.unicode.isalnum() or event.unicode in " _-":
-                        highscore_name_input += event.unicode
-
-        elif game_state == "highscore":
-            if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
-                pos_mouse = pygame.mouse.get_pos()
-                for button in get_highscore_menu_buttons():
-                    if button.is_clicked(pos_mouse):
-                        if button.action == "back":
-                            game_state = "main_menu"
-            if event.type == pygame.KEYDOWN:
-                if event.key == pygame.K_ESCAPE:
-                    game_state = "main_menu"
-
-        elif game_state == "playing":
-            if event.type == pygame.KEYDOWN:
-                if event.key in (pygame.K_ESCAPE, pygame.K_SPACE, pygame.K_p):
-                    game_state = "paused"
-
-    # --------------------- State-based Drawing ---------------------
-    if game_state == "loading":
-        draw_loading_screen()
-        if pygame.time.get_ticks() - loading_start_time > 2000:
-            game_state = "main_menu"
-
-    elif game_state == "main_menu":
-        screen.fill(THEME_BG)
-        title_text = font_large.render("Main Menu", True, THEME_TEXT)
-        screen.blit(title_text, title_text.get_rect(center=(width // 2, 80)))
-        for button in get_main_menu_buttons():
-            button.draw(screen)
-
-    elif game_state == "highscore":
-        screen.fill(THEME_BG)
-        title_text = font_large.render("Highscores", True, THEME_TEXT)
-        screen.blit(title_text, title_text.get_rect(center=(width // 2, 80)))
-        highscores = load_highscores()
-        y_offset = 160
-        for idx, entry in enumerate(highscores[:10], start=1):
-            hs_text = font_medium.render(f"{idx}. {entry['name']} - {entry['score']}", True, THEME_TEXT)
-            screen.blit(hs_text, (width // 2 - hs_text.get_width() // 2, y_offset))
-            y_offset += 60
-        for button in get_highscore_menu_buttons():
-            button.draw(screen)
-
-    elif game_state == "playing":
-        screen.fill((0, 0, 0))
-        success, img = cap.read()
-        if not success:
-            break
-        img = cv2.flip(img, 1)
-        img, faces = detector.findFaceMesh(img, draw=False)
-        frameRGB = cv2.cvtColor(img, cv2.COLOR_BGR2RGB)
-        frame_surface = pygame.image.frombuffer(frameRGB.tobytes(), (frameRGB.shape[1], frameRGB.shape[0]), "RGB")
-        screen.blit(frame_surface, (0, 0))
-
-        currentRect.y += speed
-        screen.blit(currentNumSurface, currentRect)
-
-        if difficulty == "easy":
-            correct = (currentIsOdd and current_prompt == "Odd") or (not currentIsOdd and current_prompt == "Even")
-            if correct:
-                outline_color = (0, 255, 0)
-                if faces:
-                    face = faces[0]
-                    face_x, face_y = np.mean([face[i][0:2] for i in idList], axis=0)
-                    pygame.draw.line(screen, (0, 255, 0), (face_x, face_y), currentRect.center, 3)
+def clicked_action(event, buttons):
+    """Return the action of the button hit by a left click, or None."""
+    if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
+        for button in buttons:
+            if button.is_clicked(event.pos):
+                return button.action
+    return None
+
+def loading_update(dt):
+    if pygame.time.get_ticks() - loading_start_time > 2000:
+        loop.change("main_menu")
+
+def render_loading(alpha):
+    draw_loading_screen()
+
+def main_menu_event(event):
+    global difficulty
+    action = clicked_action(event, get_main_menu_buttons())
+    if action == "toggle_difficulty":
+        difficulty = "normal" if difficulty == "easy" else "easy"
+    elif action == "start":
+        restart_game()
+        loop.change("playing")
+    elif action == "highscores":
+        loop.change("highscore")
+    elif action == "quit":
+        loop.quit()
+
+def render_main_menu(alpha):
+    screen.fill(THEME_BG)
+    title_text = font_large.render("Main Menu", True, THEME_TEXT)
+    screen.blit(title_text, title_text.get_rect(center=(width // 2, 80)))
+    for button in get_main_menu_buttons():
+        button.draw(screen)
+
+def paused_event(event):
+    action = clicked_action(event, get_pause_menu_buttons())
+    if action == "resume":
+        loop.change("playing")
+    elif action == "quit_menu":
+        loop.change("main_menu")
+    if event.type == pygame.KEYDOWN:
+        if event.key in (pygame.K_ESCAPE, pygame.K_SPACE):
+            loop.change("playing")
+
+def render_paused(alpha):
+    screen.fill(THEME_BG)
+    pause_text = font_large.render("Paused", True, THEME_TEXT)
+    screen.blit(pause_text, pause_text.get_rect(center=(width // 2, 100)))
+    for button in get_pause_menu_buttons():
+        button.draw(screen)
+
+def gameover_event(event):
+    action = clicked_action(event, get_gameover_menu_buttons())
+    if action == "restart":
+        restart_game()
+        loop.change("playing")
+    elif action == "quit_menu":
+        loop.change("main_menu")
+
+def render_gameover(alpha):
+    screen.fill(THEME_BG)
+    gameover_text = font_large.render("Game Over", True, THEME_TEXT)
+    final_score_text = font_medium.render(f"Final Score: {score}", True, THEME_TEXT)
+    screen.blit(gameover_text, gameover_text.get_rect(center=(width // 2, 80)))
+    screen.blit(final_score_text, final_score_text.get_rect(center=(width // 2, 170)))
+    if beaten_text:
+        beaten_surface = font_small.render(beaten_text, True, THEME_TEXT)
+        screen.blit(beaten_surface, beaten_surface.get_rect(center=(width // 2, 245)))
+    for button in get_gameover_menu_buttons():
+        button.draw(screen)
+
+def enter_highscore_event(event):
+    global highscore_name_input
+    if event.type == pygame.KEYDOWN:
+        if event.key == pygame.K_ESCAPE:
+            loop.change("gameover")
+            highscore_name_input = ""
+        elif event.key == pygame.K_BACKSPACE:
+            highscore_name_input = highscore_name_input[:-1]
+        elif event.key == pygame.K_RETURN:
+            if highscore_name_input.strip() != "":
+                add_highscore(highscore_name_input.strip(), score)
+            highscore_name_input = ""
+            loop.change("gameover")
+        else:
+            if event.unicode.isalnum() or event.unicode in " _-":
+                highscore_name_input += event.unicode
+
+def render_enter_highscore(alpha):
+    screen.fill(THEME_BG)
+    prompt_text = font_medium.render("Enter your name:", True, THEME_TEXT)
+    screen.blit(prompt_text, prompt_text.get_rect(center=(width // 2, 200)))
+    input_box = pygame.Rect(width // 2 - 200, 260, 400, 60)
+    pygame.draw.rect(screen, THEME_TEXT, input_box, 3)
+    name_surface = font_medium.render(highscore_name_input, True, THEME_TEXT)
+    screen.blit(name_surface, (input_box.x + 10, input_box.y + 10))
+    instructions = font_small.render("Press Enter to submit, Esc to cancel", True, THEME_TEXT)
+    screen.blit(instructions, instructions.get_rect(center=(width // 2, 350)))
+
+def highscore_event(event):
+    if clicked_action(event, get_highscore_menu_buttons()) == "back":
+        loop.change("main_menu")
+    if event.type == pygame.KEYDOWN:
+        if event.key == pygame.K_ESCAPE:
+            loop.change("main_menu")
+
+def draw_highscore(surface, hs_list):
+    surface.fill(THEME_BG)
+    title_text = font_large.render("Highscores", True, THEME_TEXT)
+    surface.blit(title_text, title_text.get_rect(center=(width // 2, 80)))
+    y_offset = 160
+    for idx, entry in enumerate(hs_list, start=1):
+        hs_text = font_medium.render(f"{idx}. {entry['name']} - {entry['score']}", True, THEME_TEXT)
+        surface.blit(hs_text, (width // 2 - hs_text.get_width() // 2, y_offset))
+        y_offset += 60
+    for button in get_highscore_menu_buttons():
+        button.draw(surface)
+
+def render_highscore(alpha):
+    # Drawn once and again only when the highscores change.
+    screen.blit(scoreboard.board(GAME_ID_NUMDASH, (width, height), draw_highscore), (0, 0))
+
+# --------------------- Playing State ---------------------
+frame_img = None
+faces = []
+
+def playing_event(event):
+    if event.type == pygame.KEYDOWN:
+        if event.key in (pygame.K_ESCAPE, pygame.K_SPACE, pygame.K_p):
+            loop.change("paused")
+
+def playing_poll():
+    """Read the camera and find the face once per frame."""
+    global frame_img, faces
+    success, img = cap.read()
+    if not success:
+        loop.quit()
+        return
+    img = cv2.flip(img, 1)
+    frame_img, faces = detector.findFaceMesh(img, draw=False)
+
+def playing_update(dt):
+    """Move the number down and check answers; runs at a fixed rate."""
+    global score, lives, prev_y, current_level, beaten_text
+    prev_y = currentRect.y
+    currentRect.y += speed
+
+    if faces:
+        face = faces[0]
+        face_x, face_y = np.mean([face[i][0:2] for i in idList], axis=0)
+        if currentRect.collidepoint(face_x, face_y):
+            if (currentIsOdd and current_prompt == "Odd") or (not currentIsOdd and current_prompt == "Even"):
+                score += 1
+                # Update level progress: add 5 points per correct answer.
+                progress = levels.update_player_progress(USER_ID, GAME_ID_NUMDASH, 5)
+                if progress:
+                    current_level = progress["level"]
+                logs.log_event(USER_ID, "score", f"Score incremented to {score}")
             else:
-                outline_color = (255, 0, 0)
-            pygame.draw.rect(screen, outline_color, currentRect, 3)
-
-        for i in range(lives):
-            screen.blit(heart_image, (10 + i * (heart_width + 5), 10))
-
-        score_display = font_medium.render(f"Score: {score}", True, (240, 240, 255))
-        screen.blit(score_display, (width - 250, 10))
-        prompt_display = font_medium.render(current_prompt, True, (0, 191, 255))
-        screen.blit(prompt_display, (width // 2 - 50, 10))
-
-        if faces:
-            face = faces[0]
-            face_x, face_y = np.mean([face[i][0:2] for i in idList], axis=0)
-            if currentRect.collidepoint(face_x, face_y):
-                if (currentIsOdd and current_prompt == "Odd") or (not currentIsOdd and current_prompt == "Even"):
-                    score += 1
-                    # Update level progress: add 5 points per correct answer.
-                    levels.update_player_progress(USER_ID, GAME_ID_NUMDASH, 5)
-                    logs.log_event(USER_ID, "score", f"Score incremented to {score}")
-                else:
-                    lives -= 1
-                reset_number_object()
-
-        if currentRect.y > height:
-            if difficulty == "normal":
-                if (currentIsOdd and current_prompt == "Odd") or (not currentIsOdd and current_prompt == "Even"):
-                    lives -= 1
+                lives -= 1
             reset_number_object()
 
-        if lives <= 0:
-            if score > 0:
-                highs = load_highscores()
-                if len(highs) < 10 or score > highs[-1]["score"]:
-                    game_state = "enter_highscore"
-                else:
-                    game_state = "gameover"
+    if currentRect.y > height:
+        if difficulty == "normal":
+            if (currentIsOdd and current_prompt == "Odd") or (not currentIsOdd and current_prompt == "Even"):
+                lives -= 1
+        reset_number_object()
+
+    if lives <= 0:
+        beaten_text = leaderboard.beaten_message(leaderboard.finish_round(GAME_ID_NUMDASH, USER_ID, score))
+        if score > 0:
+            if highscores.qualifies(GAME_ID_NUMDASH, score):
+                loop.change("enter_highscore")
             else:
-                game_state = "gameover"
-
-        # --------------------- Draw Level Display ---------------------
-        current_progress = levels.get_player_progress(USER_ID, GAME_ID_NUMDASH)
-        current_level = current_progress["level"] if current_progress else base_level
-        draw_level_display(screen, current_level)
-
-    elif game_state == "paused":
-        screen.fill(THEME_BG)
-        pause_text = font_large.render("Paused", True, THEME_TEXT)
-        screen.blit(pause_text, pause_text.get_rect(center=(width // 2, 100)))
-        for button in get_pause_menu_buttons():
-            button.draw(screen)
-
-    elif game_state == "gameover":
-        screen.fill(THEME_BG)
-        gameover_text = font_large.render("Game Over", True, THEME_TEXT)
-        final_score_text = font_medium.render(f"Final Score: {score}", True, THEME_TEXT)
-        screen.blit(gameover_text, gameover_text.get_rect(center=(width // 2, 100)))
-        screen.blit(final_score_text, final_score_text.get_rect(center=(width // 2, 200)))
-        for button in get_gameover_menu_buttons():
-            button.draw(screen)
-
-    elif game_state == "enter_highscore":
-        screen.fill(THEME_BG)
-        prompt_text = font_medium.render("Enter your name:", True, THEME_TEXT)
-        screen.blit(prompt_text, prompt_text.get_rect(center=(width // 2, 200)))
-        input_box = pygame.Rect(width // 2 - 200, 260, 400, 60)
-        pygame.draw.rect(screen, THEME_TEXT, input_box, 3)
-        name_surface = font_medium.render(highscore_name_input, True, THEME_TEXT)
-        screen.blit(name_surface, (input_box.x + 10, input_box.y + 10))
-        instructions = font_small.render("Press Enter to submit, Esc to cancel", True, THEME_TEXT)
-        screen.blit(instructions, instructions.get_rect(center=(width // 2, 350)))
-
-    pygame.display.update()
-    clock.tick(30)
+                loop.change("gameover")
+        else:
+            loop.change("gameover")
+
+def playing_render(alpha):
+    if frame_img is None:
+        return
+    screen.fill((0, 0, 0))
+    frameRGB = cv2.cvtColor(frame_img, cv2.COLOR_BGR2RGB)
+    frame_surface = pygame.image.frombuffer(frameRGB.tobytes(), (frameRGB.shape[1], frameRGB.shape[0]), "RGB")
+    screen.blit(frame_surface, (0, 0))
+
+    drawRect = currentRect.copy()
+    drawRect.y = int(lerp(prev_y, currentRect.y, alpha))
+    screen.blit(currentNumSurface, drawRect)
+
+    if difficulty == "easy":
+        correct = (currentIsOdd and current_prompt == "Odd") or (not currentIsOdd and current_prompt == "Even")
+        if correct:
+            outline_color = (0, 255, 0)
+            if faces:
+                face = faces[0]
+                face_x, face_y = np.mean([face[i][0:2] for i in idList], axis=0)
+                pygame.draw.line(screen, (0, 255, 0), (face_x, face_y), drawRect.center, 3)
+        else:
+            outline_color = (255, 0, 0)
+        pygame.draw.rect(screen, outline_color, drawRect, 3)
+
+    for i in range(lives):
+        screen.blit(heart_image, (10 + i * (heart_width + 5), 10))
+
+    score_display = font_medium.render(f"Score: {score}", True, (240, 240, 255))
+    screen.blit(score_display, (width - 250, 10))
+    prompt_display = font_medium.render(current_prompt, True, (0, 191, 255))
+    screen.blit(prompt_display, (width // 2 - 50, 10))
+
+    # --------------------- Draw Level Display ---------------------
+    draw_level_display(screen, current_level)
+
+# --------------------- Main Loop ---------------------
+loop = GameLoop({
+    "loading": GameState(update=loading_update, render=render_loading),
+    "main_menu": GameState(handle_event=main_menu_event, render=render_main_menu),
+    "highscore": GameState(handle_event=highscore_event, render=render_highscore),
+    "paused": GameState(handle_event=paused_event, render=render_paused),
+    "gameover": GameState(handle_event=gameover_event, render=render_gameover),
+    "enter_highscore": GameState(handle_event=enter_highscore_event, render=render_enter_highscore),
+    "playing": GameState(handle_event=playing_event, poll=playing_poll, update=playing_update,
+                         render=playing_render),
+}, "loading")
+loop.run()
 
 pygame.quit()
-cap.release()
+camera.close_camera(cap)
@@ -8,17 +8,13 @@ import json
 import sys
 import sqlite3
 import datetime
-from services import sessions, levels, logs, utils
+from services import sessions, levels, logs, utils, leaderboard, fonts, assets, telemetry, camera, context
+from games.gameloop import GameLoop, GameState
+telemetry.mark("imports")
 
 
 # Load current user info from the shared JSON file
-current_user_path = os.path.join(os.getcwd(), "config", "current_user.json")
-try:
-    with open(current_user_path, "r") as f:
-        current_user = json.load(f)
-except Exception as e:
-    current_user = {"id": 0, "firstName": "Guest", "userName": "Guest", "role": "player", "email": ""}
-    print("No current user found; defaulting to Guest.")
+current_user = context.current_user()
 
 # Define USER_ID based on the loaded current_user
 USER_ID = current_user["id"]
@@ -43,10 +39,10 @@ pygame.display.set_caption("Odd One Out Game")
 clock = pygame.time.Clock()
 
 # Define fonts for text rendering
-font_large = pygame.font.SysFont("Arial", 60)
-font_medium = pygame.font.SysFont("Arial", 40)
-font_small = pygame.font.SysFont("Arial", 28)
-font_feedback = pygame.font.SysFont("Arial", 72, bold=True)
+font_large = fonts.get_font("Arial", 60)
+font_medium = fonts.get_font("Arial", 40)
+font_small = fonts.get_font("Arial", 28)
+font_feedback = fonts.get_font("Arial", 72, bold=True)
 
 # Colors
 WHITE = (255, 255, 255)
@@ -71,6 +67,8 @@ detector = None
 
 # ---------------------- Game Variables ----------------------
 score = 0
+# Game over line comparing the round with everyone's earlier rounds.
+beaten_text = ""
 attempts = 0
 current_category = None
 dragging_item = None
@@ -88,13 +86,11 @@ is_flashing = False
 
 # Load heart image
 try:
-    script_dir = os.path.dirname(os.path.abspath(__file__))
+    script_dir = os.path.join(os.getcwd(), "games")
     heart_path = os.path.join(os.path.dirname(script_dir), 'assets', 'heart.png')
-    original_heart = pygame.image.load(heart_path).convert_alpha()
-    heart_width = int(original_heart.get_width() * heart_scale)
-    heart_height = int(original_heart.get_height() * heart_scale)
-    heart_image = pygame.transform.scale(original_heart, (heart_width, heart_height))
-except pygame.error as e:
+    heart_image = assets.load_image(heart_path, alpha=True, scale=heart_scale)
+    heart_width, heart_height = heart_image.get_size()
+except (OSError, pygame.error) as e:
     print(f"Error loading heart image: {e}")
     heart_image = pygame.Surface((50, 50))
     heart_image.fill(INCORRECT_COLOR)
@@ -312,8 +308,7 @@ game_items = generate_game_items()
 GAME_ID_ODD = "OddOneOut"  # Unique game ID for Odd One Out
 
 # Initialize the player's progress record (creates one if it doesn't exist)
-levels.init_player_progress(USER_ID, GAME_ID_ODD)
-base_progress = levels.get_player_progress(USER_ID, GAME_ID_ODD)
+base_progress = context.progress(GAME_ID_ODD)
 base_level = base_progress["level"] if base_progress and "level" in base_progress else 0
 
 # Start a game session and log the event.
@@ -322,16 +317,15 @@ logs.log_event(USER_ID, "game_start", f"Game session {session_id} started for {G
 
 
 # ---------------------- Game States ----------------------
-state = "loading"  # "loading", "landing", "game", "pause", "game_over"
+# States: "loading", "landing", "game", "pause", "game_over"
 loading_start_time = pygame.time.get_ticks()
 loading_duration = 2000  # 2 seconds
 loading_bg_image = None
 try:
-    script_dir = os.path.dirname(os.path.abspath(__file__))
+    script_dir = os.path.join(os.getcwd(), "games")
     image_path = os.path.join(os.path.dirname(script_dir), 'assets', 'background', 'odd_one_out.png')
-    loading_bg_image = pygame.image.load(image_path)
-    loading_bg_image = pygame.transform.scale(loading_bg_image, (screen_width, screen_height))
-except pygame.error as e:
+    loading_bg_image = assets.load_image(image_path, size=(screen_width, screen_height))
+except (OSError, pygame.error) as e:
     print(f"Error loading background image: {e}")
     loading_bg_image = pygame.Surface((screen_width, screen_height))
     loading_bg_image.fill(THEME_BG)
@@ -373,278 +367,286 @@ quit_button_gameover = Button("Quit to Menu", quit_button_gameover_x, 450, butto
 
 
 def player_quit():
-    global running
     sessions.end_game_session(session_id, USER_ID, GAME_ID_ODD, level_increment=0)
     # Log the quit event – adjust the log call as needed.
     logs.log_event(USER_ID, "quit", f"Game session {session_id} ended by player quit with score {score}")
-    running = False  # This will break the main loop.
-
-
-# ---------------------- Main Loop ----------------------
-running = True
-while running:
-    current_time = pygame.time.get_ticks()
-    events = pygame.event.get()  # Get all events once per frame
-    for event in events:
-        if event.type == pygame.QUIT:
-            running = False
+    loop.quit()  # This will break the main loop.
 
-    # Default cursor and pinch state for game mode
+def start_game():
+    global game_items, score, attempts, success, feedback_active, feedback_timer, lives
+    global camera_initialized, detector_initialized
+    game_items = generate_game_items()
+    score = 0
+    attempts = 0
+    success = False
+    feedback_active = False
+    feedback_timer = 0
+    lives = 3
+    camera_initialized = False
+    detector_initialized = False
+    loop.change("game")
+
+
+# ---------------------- State: Loading ----------------------
+def loading_update(dt):
+    if pygame.time.get_ticks() - loading_start_time > loading_duration:
+        # The camera only opens once a round starts, so the launch ends at the landing screen.
+        telemetry.finish()
+        loop.change("landing")
+
+def render_loading(alpha):
+    screen.fill(THEME_BG)
+    screen.blit(loading_bg_image, (0, 0))
+
+# ---------------------- State: Landing ----------------------
+def landing_event(event):
+    if event.type == pygame.KEYDOWN:
+        if event.key == pygame.K_s:
+            start_game()
+        elif event.key == pygame.K_q:
+            loop.quit()
+    elif event.type in [pygame.MOUSEBUTTONDOWN, pygame.MOUSEBUTTONUP, pygame.MOUSEMOTION]:
+        mouse_cursor = pygame.mouse.get_pos()
+        clicked = start_button.handle_input(event, mouse_cursor)
+        if clicked == "start" and event.type == pygame.MOUSEBUTTONUP:
+            start_game()
+        clicked = quit_button_main.handle_input(event, mouse_cursor)
+        if clicked == "quit_app" and event.type == pygame.MOUSEBUTTONUP:
+            player_quit()
+
+def render_landing(alpha):
+    screen.fill(THEME_BG)
+    draw_text(screen, "Welcome to Odd One Out!", font_large, THEME_TEXT, (screen_width // 2 - 320, 200))
+    start_button.draw(screen)
+    quit_button_main.draw(screen)
+
+# ---------------------- State: Game ----------------------
+# Cursor and pinch state from the latest camera frame.
+cursor = (0, 0)
+pinch_active = False
+frame_surface = None
+
+def game_poll():
+    """Initialize the camera and detector if needed, then track the hand once per frame."""
+    global cap, detector, camera_initialized, detector_initialized, cursor, pinch_active, frame_surface
     cursor = (0, 0)
     pinch_active = False
-
-    # ---------------------- State: Loading ----------------------
-    if state == "loading":
-        screen.fill(THEME_BG)
-        screen.blit(loading_bg_image, (0, 0))
-        if current_time - loading_start_time > loading_duration:
-            state = "landing"
-        pygame.display.flip()
-        clock.tick(30)
-        continue  # Skip the rest of the loop for this frame
-
-    # ---------------------- State: Landing ----------------------
-    if state == "landing":
-        screen.fill(THEME_BG)
-        draw_text(screen, "Welcome to Odd One Out!", font_large, THEME_TEXT, (screen_width // 2 - 320, 200))
-        start_button.draw(screen)
-        quit_button_main.draw(screen)
-        for event in events:
-            if event.type == pygame.KEYDOWN:
-                if event.key == pygame.K_s:
-                    state = "game"
-                    game_items = generate_game_items()
-                    score = 0
-                    attempts = 0
-                    success = False
-                    feedback_active = False
-                    feedback_timer = 0
-                    lives = 3
-                    camera_initialized = False
-                    detector_initialized = False
-                elif event.key == pygame.K_q:
-                    running = False
-            elif event.type in [pygame.MOUSEBUTTONDOWN, pygame.MOUSEBUTTONUP, pygame.MOUSEMOTION]:
-                mouse_cursor = pygame.mouse.get_pos()
-                clicked = start_button.handle_input(event, mouse_cursor)
-                if clicked == "start" and event.type == pygame.MOUSEBUTTONUP:
-                    state = "game"
-                    game_items = generate_game_items()
-                    score = 0
-                    attempts = 0
-                    success = False
-                    feedback_active = False
-                    feedback_timer = 0
-                    lives = 3
-                    camera_initialized = False
-                    detector_initialized = False
-                clicked = quit_button_main.handle_input(event, mouse_cursor)
-                if clicked == "quit_app" and event.type == pygame.MOUSEBUTTONUP:
-                    player_quit()
-                    #running = False
-
-    # ---------------------- State: Game ----------------------
-    elif state == "game":
-        # Initialize camera and detector if needed
-        if not camera_initialized:
-            try:
-                cap = cv2.VideoCapture(0)
-                cap.set(3, screen_width)
-                cap.set(4, screen_height)
-                camera_initialized = True
-            except Exception as e:
-                print(f"Error initializing camera: {e}")
-                state = "landing"
-
-        if camera_initialized and not detector_initialized:
-            try:
+    frame_surface = None
+    if not camera_initialized:
+        try:
+            with telemetry.stage("camera"):
+                cap = camera.open_camera(context.setting("camera_index", 0), screen_width, screen_height)
+            camera_initialized = True
+        except Exception as e:
+            print(f"Error initializing camera: {e}")
+            loop.change("landing")
+
+    if camera_initialized and not detector_initialized:
+        try:
+            with telemetry.stage("detector"):
                 detector = HandDetector(detectionCon=0.8)
-                detector_initialized = True
-            except Exception as e:
-                print(f"Error initializing hand detector: {e}")
-                state = "landing"
-
-        if camera_initialized and detector_initialized:
-            ret, frame = cap.read()
-            if ret:
-                hands, frame = detector.findHands(frame, flipType=False)
-                if hands:
-                    lmList = hands[0]['lmList']
-                    pinch_distance, info, frame = detector.findDistance(lmList[4][:2], lmList[8][:2], frame)
-                    if pinch_distance < 50:
-                        pinch_active = True
-                    cursor_x, cursor_y = lmList[8][:2]
-                    cursor = (screen_width - cursor_x, cursor_y)
-                frame = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-                frame = np.rot90(frame)
-                frame_surface = pygame.surfarray.make_surface(frame)
-                screen.blit(frame_surface, (0, 0))
-            else:
-                print("Error reading frame")
-                state = "landing"
-        else:
-            screen.fill(THEME_BG)
-            draw_text(screen, "Camera/Hand Tracking Error", font_large, INCORRECT_COLOR, (screen_width // 2 - 300, screen_height // 2 - 50))
-            pygame.display.flip()
-            clock.tick(30)
-            continue
-
-        # Draw drop-off zones and instructions
-        pygame.draw.rect(screen, DROP_ZONE_COLOR, drop_zone_left)
-        pygame.draw.rect(screen, DROP_ZONE_COLOR, drop_zone_right)
-        draw_text(screen, "Drag Here", font_small, THEME_TEXT, (drop_zone_left.centerx - 50, drop_zone_left.centery - 15))
-        draw_text(screen, "Drag Here", font_small, THEME_TEXT, (drop_zone_right.centerx - 50, drop_zone_right.centery - 15))
-        draw_text(screen, "Pinch the odd one out and drag it to the green zones.", font_medium, THEME_TEXT, (50, screen_height - 50))
-
-        if current_category:
-            draw_category_box(screen, current_category, font_medium, (screen_width // 2, 70))
-        draw_hearts_and_score(screen, lives, score)
-
-        # Dragging logic with offset
-        if detector_initialized and pinch_active:
-            for obj in game_items:
-                if obj.rect.collidepoint(cursor):
-                    if dragging_item is None:
-                        dragging_item = obj
-                        drag_offset = (cursor[0] - obj.rect.centerx, cursor[1] - obj.rect.centery)
-                    break
-            if dragging_item:
-                new_center_x = cursor[0] - drag_offset[0]
-                new_center_y = cursor[1] - drag_offset[1]
-                dragging_item.pos = [new_center_x, new_center_y]
-                dragging_item.rect.center = dragging_item.pos
+            detector_initialized = True
+        except Exception as e:
+            print(f"Error initializing hand detector: {e}")
+            loop.change("landing")
+
+    if camera_initialized and detector_initialized:
+        ret, frame = cap.read()
+        if ret:
+            hands, frame = detector.findHands(frame, flipType=False)
+            if hands:
+                lmList = hands[0]['lmList']
+                pinch_distance, info, frame = detector.findDistance(lmList[4][:2], lmList[8][:2], frame)
+                if pinch_distance < 50:
+                    pinch_active = True
+                cursor_x, cursor_y = lmList[8][:2]
+                cursor = (screen_width - cursor_x, cursor_y)
+            frame = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
+            frame = np.rot90(frame)
+            frame_surface = pygame.surfarray.make_surface(frame)
         else:
-            dragging_item = None
-
-        for obj in game_items:
-            obj.draw(screen)
+            print("Error reading frame")
+            loop.change("landing")
+
+def game_update(dt):
+    """Dragging, drop zones, feedback and the flash fade; runs at a fixed rate."""
+    global dragging_item, drag_offset, success, feedback_timer, feedback_active
+    global flash_color, flash_alpha, is_flashing, attempts, score, lives, game_items, beaten_text
+    if not (camera_initialized and detector_initialized):
+        return
+    current_time = pygame.time.get_ticks()
 
-        # Check drop zones for odd one out
+    # Dragging logic with offset
+    if detector_initialized and pinch_active:
         for obj in game_items:
-            if obj.is_wrong:
-                if obj.rect.colliderect(drop_zone_left) or obj.rect.colliderect(drop_zone_right):
-                    success = True
-                    if not feedback_active:
-                        feedback_timer = pygame.time.get_ticks()
-                        feedback_active = True
-                        flash_color = CORRECT_COLOR
-                        flash_alpha = 200
-                        is_flashing = True
-                        attempts += 1
-                        score += 1
-                        # --- LEVEL UPDATE & SCORE LOGGING SNIPPET ---
-                        if USER_ID != 0:
-                            try:
-                                levels.update_player_progress(USER_ID, GAME_ID_ODD, additional_points=5)
-                            except Exception as e:
-                                print("Level update error:", e)
-                            # Log the score event (using your logs module if available)
-                            logs.log_event(USER_ID, "score", f"Score incremented to {score}")
-                        else:
-                            # For guest users, log with user id 0.
-                            logs.log_event(0, "score", f"Guest score incremented to {score}")
-                            pass
-                        # --- END SNIPPET ---
-                    break
-            elif obj.rect.colliderect(drop_zone_left) or obj.rect.colliderect(drop_zone_right):
-                success = False
+            if obj.rect.collidepoint(cursor):
+                if dragging_item is None:
+                    dragging_item = obj
+                    drag_offset = (cursor[0] - obj.rect.centerx, cursor[1] - obj.rect.centery)
+                break
+        if dragging_item:
+            new_center_x = cursor[0] - drag_offset[0]
+            new_center_y = cursor[1] - drag_offset[1]
+            dragging_item.pos = [new_center_x, new_center_y]
+            dragging_item.rect.center = dragging_item.pos
+    else:
+        dragging_item = None
+
+    # Check drop zones for odd one out
+    for obj in game_items:
+        if obj.is_wrong:
+            if obj.rect.colliderect(drop_zone_left) or obj.rect.colliderect(drop_zone_right):
+                success = True
                 if not feedback_active:
                     feedback_timer = pygame.time.get_ticks()
                     feedback_active = True
-                    flash_color = INCORRECT_COLOR
+                    flash_color = CORRECT_COLOR
                     flash_alpha = 200
                     is_flashing = True
                     attempts += 1
-                    lives -= 1
+                    score += 1
+                    # --- LEVEL UPDATE & SCORE LOGGING SNIPPET ---
+                    if USER_ID != 0:
+                        try:
+                            levels.update_player_progress(USER_ID, GAME_ID_ODD, additional_points=5)
+                        except Exception as e:
+                            print("Level update error:", e)
+                        # Log the score event (using your logs module if available)
+                        logs.log_event(USER_ID, "score", f"Score incremented to {score}")
+                    else:
+                        # For guest users, log with user id 0.
+                        logs.log_event(0, "score", f"Guest score incremented to {score}")
+                    # --- END SNIPPET ---
                 break
-
-        if feedback_active:
-            feedback_text_pos = (screen_width // 2 - 200, screen_height // 2 - 80)
-            if success:
-                feedback_text = "Correct! Well done."
-                feedback_color = CORRECT_COLOR
-                if current_time - feedback_timer > feedback_duration:
-                    success = False
-                    feedback_active = False
-                    feedback_timer = 0
-                    game_items = generate_game_items()
-            else:
-                feedback_text = "Oops! That's not it."
-                feedback_color = INCORRECT_COLOR
-                for obj in game_items:
-                    if obj.rect.colliderect(drop_zone_left) or obj.rect.colliderect(drop_zone_right):
-                        obj.reset_position()
-                if current_time - feedback_timer > feedback_duration:
-                    feedback_active = False
-                    feedback_timer = 0
-                    success = False
-                    if lives <= 0:
-                        state = "game_over"
-            draw_text(screen, feedback_text, font_feedback, feedback_color, feedback_text_pos)
-
-        if is_flashing:
-            flash_surface = pygame.Surface((screen_width, screen_height))
-            flash_surface.fill(flash_color)
-            flash_surface.set_alpha(flash_alpha)
-            screen.blit(flash_surface, (0, 0))
-            alpha_reduction_rate = 255 / (flash_duration / (1000 / 30))
-            flash_alpha = max(0, flash_alpha - alpha_reduction_rate)
-            if flash_alpha <= 0:
-                is_flashing = False
-
-        if detector_initialized and pinch_active:
-            pygame.draw.circle(screen, HIGHLIGHT_COLOR, cursor, 15)
-
-    # ---------------------- State: Pause ----------------------
-    elif state == "pause":
-        screen.fill(THEME_BG)
-        draw_text(screen, "Game Paused", font_large, THEME_TEXT, (screen_width // 2 - 150, 250))
-        resume_button.draw(screen)
-        quit_button_pause.draw(screen)
-        for event in events:
-            if event.type == pygame.KEYDOWN:
-                if event.key == pygame.K_r:
-                    state = "game"
-                elif event.key == pygame.K_q:
-                    state = "landing"
-            elif event.type in [pygame.MOUSEBUTTONDOWN, pygame.MOUSEBUTTONUP, pygame.MOUSEMOTION]:
-                mouse_cursor = pygame.mouse.get_pos()
-                clicked = resume_button.handle_input(event, mouse_cursor)
-                if clicked == "resume" and event.type == pygame.MOUSEBUTTONUP:
-                    state = "game"
-                clicked = quit_button_pause.handle_input(event, mouse_cursor)
-                if clicked == "quit_menu" and event.type == pygame.MOUSEBUTTONUP:
-                    state = "landing"
-
-    # ---------------------- State: Game Over ----------------------
-    elif state == "game_over":
+        elif obj.rect.colliderect(drop_zone_left) or obj.rect.colliderect(drop_zone_right):
+            success = False
+            if not feedback_active:
+                feedback_timer = pygame.time.get_ticks()
+                feedback_active = True
+                flash_color = INCORRECT_COLOR
+                flash_alpha = 200
+                is_flashing = True
+                attempts += 1
+                lives -= 1
+            break
+
+    if feedback_active:
+        if success:
+            if current_time - feedback_timer > feedback_duration:
+                success = False
+                feedback_active = False
+                feedback_timer = 0
+                game_items = generate_game_items()
+        else:
+            for obj in game_items:
+                if obj.rect.colliderect(drop_zone_left) or obj.rect.colliderect(drop_zone_right):
+                    obj.reset_position()
+            if current_time - feedback_timer > feedback_duration:
+                feedback_active = False
+                feedback_timer = 0
+                success = False
+                if lives <= 0:
+                    beaten_text = leaderboard.beaten_message(leaderboard.finish_round(GAME_ID_ODD, USER_ID, score))
+                    loop.change("game_over")
+
+    if is_flashing:
+        # The flash fades out over flash_duration at the fixed update rate.
+        alpha_reduction_rate = 255 / (flash_duration / (1000 * dt))
+        flash_alpha = max(0, flash_alpha - alpha_reduction_rate)
+        if flash_alpha <= 0:
+            is_flashing = False
+
+def render_game(alpha):
+    if not (camera_initialized and detector_initialized):
         screen.fill(THEME_BG)
-        draw_text(screen, "Game Over!", font_large, THEME_TEXT, (screen_width // 2 - 150, 200))
-        draw_text(screen, f"Final Score: {score}", font_medium, THEME_TEXT, (screen_width // 2 - 150, 280))
-        restart_button.draw(screen)
-        quit_button_gameover.draw(screen)
-        for event in events:
-            if event.type in [pygame.MOUSEBUTTONDOWN, pygame.MOUSEBUTTONUP, pygame.MOUSEMOTION]:
-                mouse_cursor = pygame.mouse.get_pos()
-                clicked_restart = restart_button.handle_input(event, mouse_cursor)
-                if clicked_restart == "restart" and event.type == pygame.MOUSEBUTTONUP:
-                    state = "game"
-                    game_items = generate_game_items()
-                    score = 0
-                    attempts = 0
-                    lives = 3
-                    success = False
-                    feedback_active = False
-                    feedback_timer = 0
-                    camera_initialized = False
-                    detector_initialized = False
-                clicked_quit = quit_button_gameover.handle_input(event, mouse_cursor)
-                if clicked_quit == "quit_menu" and event.type == pygame.MOUSEBUTTONUP:
-                    state = "landing"
-
-    pygame.display.update()
-    clock.tick(30)
-
-if cap and cap.isOpened():
-    cap.release()
-pygame.quit()
\ No newline at end of file
+        draw_text(screen, "Camera/Hand Tracking Error", font_large, INCORRECT_COLOR, (screen_width // 2 - 300, screen_height // 2 - 50))
+        return
+    if frame_surface is not None:
+        screen.blit(frame_surface, (0, 0))
+
+    # Draw drop-off zones and instructions
+    pygame.draw.rect(screen, DROP_ZONE_COLOR, drop_zone_left)
+    pygame.draw.rect(screen, DROP_ZONE_COLOR, drop_zone_right)
+    draw_text(screen, "Drag Here", font_small, THEME_TEXT, (drop_zone_left.centerx - 50, drop_zone_left.centery - 15))
+    draw_text(screen, "Drag Here", font_small, THEME_TEXT, (drop_zone_right.centerx - 50, drop_zone_right.centery - 15))
+    draw_text(screen, "Pinch the odd one out and drag it to the green zones.", font_medium, THEME_TEXT, (50, screen_height - 50))
+
+    if current_category:
+        draw_category_box(screen, current_category, font_medium, (screen_width // 2, 70))
+    draw_hearts_and_score(screen, lives, score)
+
+    for obj in game_items:
+        obj.draw(screen)
+
+    if feedback_active:
+        feedback_text_pos = (screen_width // 2 - 200, screen_height // 2 - 80)
+        if success:
+            feedback_text = "Correct! Well done."
+            feedback_color = CORRECT_COLOR
+        else:
+            feedback_text = "Oops! That's not it."
+            feedback_color = INCORRECT_COLOR
+        draw_text(screen, feedback_text, font_feedback, feedback_color, feedback_text_pos)
+
+    if is_flashing:
+        flash_surface = pygame.Surface((screen_width, screen_height))
+        flash_surface.fill(flash_color)
+        flash_surface.set_alpha(flash_alpha)
+        screen.blit(flash_surface, (0, 0))
+
+    if detector_initialized and pinch_active:
+        pygame.draw.circle(screen, HIGHLIGHT_COLOR, cursor, 15)
+
+# ---------------------- State: Pause ----------------------
+def pause_event(event):
+    if event.type == pygame.KEYDOWN:
+        if event.key == pygame.K_r:
+            loop.change("game")
+        elif event.key == pygame.K_q:
+            loop.change("landing")
+    elif event.type in [pygame.MOUSEBUTTONDOWN, pygame.MOUSEBUTTONUP, pygame.MOUSEMOTION]:
+        mouse_cursor = pygame.mouse.get_pos()
+        clicked = resume_button.handle_input(event, mouse_cursor)
+        if clicked == "resume" and event.type == pygame.MOUSEBUTTONUP:
+            loop.change("game")
+        clicked = quit_button_pause.handle_input(event, mouse_cursor)
+        if clicked == "quit_menu" and event.type == pygame.MOUSEBUTTONUP:
+            loop.change("landing")
+
+def render_pause(alpha):
+    screen.fill(THEME_BG)
+    draw_text(screen, "Game Paused", font_large, THEME_TEXT, (screen_width // 2 - 150, 250))
+    resume_button.draw(screen)
+    quit_button_pause.draw(screen)
+
+# ---------------------- State: Game Over ----------------------
+def game_over_event(event):
+    if event.type in [pygame.MOUSEBUTTONDOWN, pygame.MOUSEBUTTONUP, pygame.MOUSEMOTION]:
+        mouse_cursor = pygame.mouse.get_pos()
+        clicked_restart = restart_button.handle_input(event, mouse_cursor)
+        if clicked_restart == "restart" and event.type == pygame.MOUSEBUTTONUP:
+            start_game()
+        clicked_quit = quit_button_gameover.handle_input(event, mouse_cursor)
+        if clicked_quit == "quit_menu" and event.type == pygame.MOUSEBUTTONUP:
+            loop.change("landing")
+
+def render_game_over(alpha):
+    screen.fill(THEME_BG)
+    draw_text(screen, "Game Over!", font_large, THEME_TEXT, (screen_width // 2 - 150, 200))
+    draw_text(screen, f"Final Score: {score}", font_medium, THEME_TEXT, (screen_width // 2 - 150, 280))
+    restart_button.draw(screen)
+    quit_button_gameover.draw(screen)
+    if beaten_text:
+        draw_text(screen, beaten_text, font_small, THEME_TEXT, (screen_width // 2 - 150, 560))
+
+# ---------------------- Main Loop ----------------------
+loop = GameLoop({
+    "loading": GameState(update=loading_update, render=render_loading),
+    "landing": GameState(handle_event=landing_event, render=render_landing),
+    "game": GameState(poll=game_poll, update=game_update, render=render_game),
+    "pause": GameState(handle_event=pause_event, render=render_pause),
+    "game_over": GameState(handle_event=game_over_event, render=render_game_over),
+}, "loading")
+loop.run()
+
+camera.close_camera(cap)
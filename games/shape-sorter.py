@@ -12,16 +12,12 @@ import os
 import sqlite3
 import datetime
 import json
-from services import sessions, levels, logs, utils
+from services import sessions, levels, logs, utils, leaderboard, fonts, telemetry, camera, context
+from games.gameloop import GameLoop, GameState
+telemetry.mark("imports")
 
 # Load current user info from the shared JSON file
-current_user_path = os.path.join(os.getcwd(), "config", "current_user.json")
-try:
-    with open(current_user_path, "r") as f:
-        current_user = json.load(f)
-except Exception as e:
-    current_user = {"id": 0, "firstName": "Guest", "userName": "Guest", "role": "player", "email": ""}
-    print("No current user found; defaulting to Guest.")
+current_user = context.current_user()
 
 # Define USER_ID based on the loaded current_user
 USER_ID = current_user["id"]
@@ -51,9 +47,9 @@ pygame.display.set_caption("Shape Sorter Game")
 clock = pygame.time.Clock()
 
 # Use playful fonts for a kid-friendly look.
-font_large = pygame.font.SysFont("Comic Sans MS", 80)
-font_medium = pygame.font.SysFont("Comic Sans MS", 60)
-font_small = pygame.font.SysFont("Comic Sans MS", 40)
+font_large = fonts.get_font("Comic Sans MS", 80)
+font_medium = fonts.get_font("Comic Sans MS", 60)
+font_small = fonts.get_font("Comic Sans MS", 40)
 
 # --------------------- Button Class (Template) ---------------------
 class Button:
@@ -401,29 +397,33 @@ game_mode = "shape_only"
 draggable_shapes, outline_shapes = generate_shapes(game_mode)
 
 # ---------------------- Webcam & Hand Detector Setup ---------------------
-cap = cv2.VideoCapture(0)
-cap.set(3, width)
-cap.set(4, height)
-detector = HandDetector(detectionCon=0.8)
+with telemetry.stage("camera"):
+    cap = camera.open_camera(context.setting("camera_index", 0), width, height)
+with telemetry.stage("detector"):
+    detector = HandDetector(detectionCon=0.8)
+# Launch latency runs to the first frame the camera delivers, not to the first round.
+if cap.read()[0]:
+    telemetry.mark("camera_frame")
 
 # --------------------- Game Variables ---------------------
 score = 0
 lives = 3
+# Game over line comparing the round with everyone's earlier rounds.
+beaten_text = ""
 dragging_shape = None
 try_again_message = ""
 try_again_timer = 0
 shapes_in_round = 0 # To track the initial number of shapes in the round
 
 # --------------------- Game States ---------------------
-game_state = "main_menu"
+# States: "main_menu", "game", "paused", "game_over"
 
 
 # Levels & Session Integration for Odd One Out
 GAME_ID_ODD = "ShapeSorter"  # Unique game ID for Odd One Out
 
 # Initialize the player's progress record (creates one if it doesn't exist)
-levels.init_player_progress(USER_ID, GAME_ID_ODD)
-base_progress = levels.get_player_progress(USER_ID, GAME_ID_ODD)
+base_progress = context.progress(GAME_ID_ODD)
 base_level = base_progress["level"] if base_progress and "level" in base_progress else 0
 
 # Start a game session and log the event.
@@ -433,308 +433,313 @@ logs.log_event(USER_ID, "game_start", f"Game session {session_id} started for {G
 
 
 def player_quit():
-    global running
     sessions.end_game_session(session_id, USER_ID, GAME_ID_ODD, level_increment=0)
     # Log the quit event – adjust the log call as needed.
     # logs.log_event(USER_ID, "quit", f"Game session {session_id} ended by player quit with score {score}")
-    running = False  # This will break the main loop.
-
-
-# --------------------- Main Loop ---------------------
-running = True
-while running:
-    elapsed_time = clock.tick(30) / 1000
+    loop.quit()  # This will break the main loop.
+
+
+def clear_round():
+    """Drop the current shapes; they are generated again when the game state runs."""
+    global try_again_message, try_again_timer, shapes_in_round
+    draggable_shapes.clear()
+    outline_shapes.clear()
+    try_again_message = ""
+    try_again_timer = 0
+    shapes_in_round = 0
+
+
+def start_game():
+    global score, lives
+    score = 0
+    lives = 3
+    clear_round()
+    loop.change("game")
+
+
+def clicked_action(event, buttons):
+    """Return the action of the button under a left click, or None."""
+    if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
+        pos = pygame.mouse.get_pos()
+        for button in buttons:
+            if button.is_clicked(pos):
+                return button.action
+    return None
+
+
+# --------------------- State: Main Menu ---------------------
+main_menu_buttons = get_main_menu_buttons()
+pause_menu_buttons = get_pause_menu_buttons()
+game_over_buttons = get_game_over_buttons()
+
+
+def main_menu_event(event):
+    action = clicked_action(event, main_menu_buttons)
+    if action == "start":
+        start_game()
+    elif action == "quit":
+        loop.quit()
+
+
+def render_main_menu(alpha):
+    screen.fill(THEME_BG)
+    title_text = font_large.render("Shape Sorter", True, THEME_TEXT)
+    screen.blit(title_text, title_text.get_rect(center=(width // 2, 100)))
+    instructions = [
+        "Instructions:",
+        "1. Use pinch gesture (index & middle finger) to select a shape.",
+        "2. Drag the shape to its outline.",
+        "3. Correct matches earn points.",
+        "4. Press SPACE or ESC to pause the game."
+    ]
+    for idx, line in enumerate(instructions):
+        inst_text = font_small.render(line, True, THEME_TEXT)
+        screen.blit(inst_text, (50, 180 + idx * 35))
+    for button in main_menu_buttons:
+        button.draw(screen)
+
+
+# --------------------- State: Paused ---------------------
+def paused_event(event):
+    action = clicked_action(event, pause_menu_buttons)
+    if action == "resume":
+        loop.change("game")
+    elif action == "quit_menu":
+        # Clear shapes when returning to the main menu
+        clear_round()
+        loop.change("main_menu")
+
+
+def render_paused(alpha):
+    screen.fill(THEME_BG)
+    pause_text = font_large.render("Paused", True, THEME_TEXT)
+    screen.blit(pause_text, pause_text.get_rect(center=(width // 2, 100)))
+    for button in pause_menu_buttons:
+        button.draw(screen)
+
+
+# --------------------- State: Game Over ---------------------
+def game_over_event(event):
+    action = clicked_action(event, game_over_buttons)
+    if action == "start":
+        start_game()
+    elif action == "main_menu":
+        clear_round()
+        loop.change("main_menu")
+    elif action == "quit":
+        player_quit()
+
+
+def render_game_over(alpha):
+    screen.fill(THEME_BG)
+    game_over_text = font_large.render("Game Over!", True, THEME_TEXT)
+    final_score_text = font_medium.render(f"Your final score: {score}", True, THEME_TEXT)
+    lives_over_text = font_medium.render(f"You ran out of lives!", True, THEME_TEXT)
+    screen.blit(game_over_text, game_over_text.get_rect(center=(width // 2, 130)))
+    screen.blit(final_score_text, final_score_text.get_rect(center=(width // 2, 220)))
+    screen.blit(lives_over_text, lives_over_text.get_rect(center=(width // 2, 280)))
+    if beaten_text:
+        beaten_surface = font_small.render(beaten_text, True, THEME_TEXT)
+        screen.blit(beaten_surface, beaten_surface.get_rect(center=(width // 2, 345)))
+    for button in game_over_buttons:
+        button.draw(screen)
+
+
+# --------------------- State: Game ---------------------
+# Cursor and pinch from the latest camera frame, and that frame for drawing.
+cursor = None
+pinch = False
+frame_surface = None
+
+
+def game_event(event):
+    if event.type == pygame.KEYDOWN:
+        # Pressing Escape or Space pauses the game.
+        if event.key in (pygame.K_ESCAPE, pygame.K_SPACE):
+            loop.change("paused")
+        elif event.key == pygame.K_q:
+            loop.quit()
+
+
+def game_poll():
+    """Read the camera and track the hand once per frame."""
+    global cursor, pinch, frame_surface
     cursor = None
     pinch = False
-
-    for event in pygame.event.get():
-        if event.type == pygame.QUIT:
-            running = False
-            cap.release()
-            pygame.quit()
-            sys.exit()
-
-        # --- Main Menu Events ---
-        if game_state == "main_menu":
-            if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
-                pos = pygame.mouse.get_pos()
-                for button in get_main_menu_buttons():
-                    if button.is_clicked(pos):
-                        if button.action == "start":
-                            game_state = "game"
-                            score = 0
-                            lives = 3
-                            draggable_shapes.clear()
-                            outline_shapes.clear()
-                            try_again_message = ""
-                            try_again_timer = 0
-                            shapes_in_round = 0 # Reset for a new game
-                            # Shapes will be generated when the game state is entered
-                        elif button.action == "quit":
-                            running = False
-                            cap.release()
-                            pygame.quit()
-                            sys.exit()
-
-        # --- Paused Menu Events ---
-        elif game_state == "paused":
-            if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
-                pos = pygame.mouse.get_pos()
-                for button in get_pause_menu_buttons():
-                    if button.is_clicked(pos):
-                        if button.action == "resume":
-                            game_state = "game"
-                        elif button.action == "quit_menu":
-                            game_state = "main_menu"
-                            # Clear shapes when returning to the main menu
-                            draggable_shapes.clear()
-                            outline_shapes.clear()
-                            try_again_message = ""
-                            try_again_timer = 0
-                            shapes_in_round = 0 # Reset if returning to menu
-
-        # --- Game Over Menu Events ---
-        elif game_state == "game_over":
-            if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
-                pos = pygame.mouse.get_pos()
-                for button in get_game_over_buttons():
-                    if button.is_clicked(pos):
-                        if button.action == "start":
-                            game_state = "game"
-                            score = 0
-                            lives = 3
-                            draggable_shapes.clear()
-                            outline_shapes.clear()
-                            try_again_message = ""
-                            try_again_timer = 0
-                            shapes_in_round = 0 # Reset for a new game
-                            # Shapes will be generated when the game state is entered
-                        elif button.action == "main_menu":
-                            game_state = "main_menu"
-                            # Clear shapes when returning to the main menu
-                            draggable_shapes.clear()
-                            outline_shapes.clear()
-                            try_again_message = ""
-                            try_again_timer = 0
-                            shapes_in_round = 0 # Reset if returning to menu
-                        elif button.action == "quit":
-                            player_quit()
-                            running = False
-                            cap.release()
-                            pygame.quit()
-                            sys.exit()
-
-        # --- Game State Key Handling ---
-        if game_state == "game":
-            if event.type == pygame.KEYDOWN:
-                # Pressing Escape or Space pauses the game.
-                if event.key in (pygame.K_ESCAPE, pygame.K_SPACE):
-                    game_state = "paused"
-                elif event.key == pygame.K_q:
-                    running = False
-                    cap.release()
-                    pygame.quit()
-                    sys.exit()
-
-    # --------------------- State-Based Drawing ---------------------
-    if game_state == "main_menu":
-        screen.fill(THEME_BG)
-        title_text = font_large.render("Shape Sorter", True, THEME_TEXT)
-        screen.blit(title_text, title_text.get_rect(center=(width // 2, 100)))
-        instructions = [
-            "Instructions:",
-            "1. Use pinch gesture (index & middle finger) to select a shape.",
-            "2. Drag the shape to its outline.",
-            "3. Correct matches earn points.",
-            "4. Press SPACE or ESC to pause the game."
-        ]
-        for idx, line in enumerate(instructions):
-            inst_text = font_small.render(line, True, THEME_TEXT)
-            screen.blit(inst_text, (50, 180 + idx * 35))
-        for button in get_main_menu_buttons():
-            button.draw(screen)
-
-    elif game_state == "paused":
-        screen.fill(THEME_BG)
-        pause_text = font_large.render("Paused", True, THEME_TEXT)
-        screen.blit(pause_text, pause_text.get_rect(center=(width // 2, 100)))
-        for button in get_pause_menu_buttons():
-            button.draw(screen)
-
-    elif game_state == "game_over":
-        screen.fill(THEME_BG)
-        game_over_text = font_large.render("Game Over!", True, THEME_TEXT)
-        final_score_text = font_medium.render(f"Your final score: {score}", True, THEME_TEXT)
-        lives_over_text = font_medium.render(f"You ran out of lives!", True, THEME_TEXT)
-        screen.blit(game_over_text, game_over_text.get_rect(center=(width // 2, 200)))
-        screen.blit(final_score_text, final_score_text.get_rect(center=(width // 2, 300)))
-        screen.blit(lives_over_text, lives_over_text.get_rect(center=(width // 2, 360)))
-        for button in get_game_over_buttons():
-            button.draw(screen)
-
-    elif game_state == "game":
-        screen.fill(THEME_BG) # Fill background with theme color
-
-        if try_again_timer > 0:
-            try_again_timer -= elapsed_time
-        else:
-            try_again_message = ""
-
-        # Generate shapes only when the game state is entered or after a correct match/incorrect drag in mode 2
-        if not draggable_shapes and round_active: # Check if a round was active
-            # Randomly select game mode for each new round
-            game_mode = random.choice(["shape_only", "shape_color"])
-            print(f"Current Game Mode: {game_mode}") # Debugging
-            draggable_shapes, outline_shapes = generate_shapes(game_mode)
-            shapes_in_round = len(draggable_shapes) # Store the initial number of shapes
-            round_active = False # Reset round_active after generating new shapes
-
-        ret, frame = cap.read()
-        if not ret:
-            continue
-        frame = cv2.flip(frame, 1)
-        hands, frame = detector.findHands(frame, flipType=False)
-        if hands:
-            lmList = hands[0]['lmList']
-            length, info, _ = detector.findDistance(lmList[8][:2], lmList[12][:2], frame)
-            pinch = length < 60
-            cursor = lmList[8][:2]
-
-            if pinch and cursor is not None:
-                if dragging_shape is None:
-                    for shape in draggable_shapes:
-                        if shape.target is not None and not shape.matched:
-                            center_x, center_y = shape.get_center()
-                            if (cursor[0] - center_x)**2 + (cursor[1] - center_y)**2 < shape.size**2 * 2: # Increased touch area
-                                dragging_shape = shape
-                                break
-                elif dragging_shape:
-                    dragging_shape.update(cursor)
+    ret, frame = cap.read()
+    if not ret:
+        return
+    frame = cv2.flip(frame, 1)
+    hands, frame = detector.findHands(frame, flipType=False)
+    if hands:
+        lmList = hands[0]['lmList']
+        length, info, _ = detector.findDistance(lmList[8][:2], lmList[12][:2], frame)
+        pinch = length < 60
+        cursor = lmList[8][:2]
+    # Convert webcam frame for display (no rotation)
+    frame = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
+    frame_surface = pygame.image.frombuffer(frame.tobytes(), (width, height), "RGB")
+
+
+def release_shape():
+    """Check the dragged shape against the closest outline when the pinch ends."""
+    global dragging_shape, score, lives, round_active, correct_match_made, try_again_message, try_again_timer
+    # Check if the dragged shape is close to any outline upon release
+    closest_outline = None
+    min_distance = float('inf')
+    for outline in outline_shapes:
+        distance = math.sqrt((dragging_shape.get_center()[0] - outline.get_center()[0])**2 +
+                             (dragging_shape.get_center()[1] - outline.get_center()[1])**2)
+        if distance < min_distance:
+            min_distance = distance
+            closest_outline = outline
+
+    if closest_outline and is_close(dragging_shape, closest_outline):
+        if game_mode == "shape_only":
+            if dragging_shape.shape_type == closest_outline.shape_type and not dragging_shape.matched: # Check if not already matched
+                dragging_shape.matched = True
+                dragging_shape.pos = closest_outline.pos
+                score += 1
+                # --- LEVEL UPDATE & SCORE LOGGING SNIPPET ---
+                if USER_ID != 0:
+                    try:
+                        levels.update_player_progress(USER_ID, GAME_ID_ODD, additional_points=1)
+                    except Exception as e:
+                        print("Level update error:", e)
+                    # Log the score event (using your logs module if available)
+                    # logs.log_event(USER_ID, "score", f"Score incremented to {score}")
+                else:
+                    # For guest users, log with user id 0.
+                    # logs.log_event(0, "score", f"Guest score incremented to {score}")
+                    pass
+                # --- END SNIPPET ---
+                dragging_shape = None # Release the shape
+                if all(shape.matched for shape in draggable_shapes if shape.target is not None) and draggable_shapes:
+                    draggable_shapes.clear()
+                    outline_shapes.clear()
+                    round_active = True # Set round_active to trigger next round
+            else:
+                lives -= 1
+                dragging_shape.pos = dragging_shape.original_position # Reset position
+                dragging_shape = None # Release the shape
+        elif game_mode == "shape_color":
+            is_correct = (dragging_shape.shape_type == closest_outline.shape_type and
+                          dragging_shape.color == closest_outline.color)
+            if is_correct and not correct_match_made: # Check if the correct match hasn't been made yet
+                dragging_shape.matched = True
+                dragging_shape.pos = closest_outline.pos
+                score += 2
+                dragging_shape = None # Reset dragging shape
+                correct_match_made = True # Set the flag
+                draggable_shapes.clear() # Clear shapes to load the next set
+                outline_shapes.clear()
+                round_active = True # Set round_active to trigger next round
             else:
-                if dragging_shape:
-                    # Check if the pinch has ended
-                    if not pinch:
-                        # Check if the dragged shape is close to any outline upon release
-                        closest_outline = None
-                        min_distance = float('inf')
-                        for outline in outline_shapes:
-                            distance = math.sqrt((dragging_shape.get_center()[0] - outline.get_center()[0])**2 +
-                                                 (dragging_shape.get_center()[1] - outline.get_center()[1])**2)
-                            if distance < min_distance:
-                                min_distance = distance
-                                closest_outline = outline
-
-                        if closest_outline and is_close(dragging_shape, closest_outline):
-                            if game_mode == "shape_only":
-                                if dragging_shape.shape_type == closest_outline.shape_type and not dragging_shape.matched: # Check if not already matched
-                                    dragging_shape.matched = True
-                                    dragging_shape.pos = closest_outline.pos
-                                    score += 1
-                                    # --- LEVEL UPDATE & SCORE LOGGING SNIPPET ---
-                                    if USER_ID != 0:
-                                        try:
-                                            levels.update_player_progress(USER_ID, GAME_ID_ODD, additional_points=1)
-                                        except Exception as e:
-                                            print("Level update error:", e)
-                                        # Log the score event (using your logs module if available)
-                                        # logs.log_event(USER_ID, "score", f"Score incremented to {score}")
-                                    else:
-                                        # For guest users, log with user id 0.
-                                        # logs.log_event(0, "score", f"Guest score incremented to {score}")
-                                        pass
-                                    # --- END SNIPPET ---
-                                    dragging_shape = None # Release the shape
-                                    if all(shape.matched for shape in draggable_shapes if shape.target is not None) and draggable_shapes:
-                                        draggable_shapes.clear()
-                                        outline_shapes.clear()
-                                        round_active = True # Set round_active to trigger next round
-                                else:
-                                    lives -= 1
-                                    if lives <= 0:
-                                        game_state = "game_over"
-                                    dragging_shape.pos = dragging_shape.original_position # Reset position
-                                    dragging_shape = None # Release the shape
-                            elif game_mode == "shape_color":
-                                is_correct = (dragging_shape.shape_type == closest_outline.shape_type and
-                                              dragging_shape.color == closest_outline.color)
-                                if is_correct and not correct_match_made: # Check if the correct match hasn't been made yet
-                                    dragging_shape.matched = True
-                                    dragging_shape.pos = closest_outline.pos
-                                    score += 2
-                                    dragging_shape = None # Reset dragging shape
-                                    correct_match_made = True # Set the flag
-                                    draggable_shapes.clear() # Clear shapes to load the next set
-                                    outline_shapes.clear()
-                                    round_active = True # Set round_active to trigger next round
-                                else:
-                                    # Only process incorrect choices if the correct one hasn't been made
-                                    if not correct_match_made:
-                                        lives -= 1
-                                        if lives <= 0:
-                                            game_state = "game_over"
-                                        try_again_message = "Try Again!"
-                                        try_again_timer = 1.5 # Show message for 1.5 seconds
-                                        dragging_shape.pos = dragging_shape.original_position # Reset position on incorrect placement in shape_color
-                                        dragging_shape = None # Release the shape after incorrect attempt
-
-                        else:
-                            dragging_shape.pos = dragging_shape.original_position # Reset position if not close to any outline
-                            dragging_shape = None # Release the shape
-
-        # Convert webcam frame for display (no rotation)
-        frame = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-        frame_surface = pygame.image.frombuffer(frame.tobytes(), (width, height), "RGB")
+                # Only process incorrect choices if the correct one hasn't been made
+                if not correct_match_made:
+                    lives -= 1
+                    try_again_message = "Try Again!"
+                    try_again_timer = 1.5 # Show message for 1.5 seconds
+                    dragging_shape.pos = dragging_shape.original_position # Reset position on incorrect placement in shape_color
+                    dragging_shape = None # Release the shape after incorrect attempt
+    else:
+        dragging_shape.pos = dragging_shape.original_position # Reset position if not close to any outline
+        dragging_shape = None # Release the shape
+
+
+def game_update(dt):
+    """Rounds, dragging and matching; runs at a fixed rate."""
+    global try_again_timer, try_again_message, game_mode, draggable_shapes, outline_shapes
+    global shapes_in_round, round_active, dragging_shape, beaten_text
+    if try_again_timer > 0:
+        try_again_timer -= dt
+    else:
+        try_again_message = ""
+
+    # Generate shapes only when the game state is entered or after a correct match/incorrect drag in mode 2
+    if not draggable_shapes and round_active: # Check if a round was active
+        # Randomly select game mode for each new round
+        game_mode = random.choice(["shape_only", "shape_color"])
+        print(f"Current Game Mode: {game_mode}") # Debugging
+        draggable_shapes, outline_shapes = generate_shapes(game_mode)
+        shapes_in_round = len(draggable_shapes) # Store the initial number of shapes
+        round_active = False # Reset round_active after generating new shapes
+
+    if pinch and cursor is not None:
+        if dragging_shape is None:
+            for shape in draggable_shapes:
+                if shape.target is not None and not shape.matched:
+                    center_x, center_y = shape.get_center()
+                    if (cursor[0] - center_x)**2 + (cursor[1] - center_y)**2 < shape.size**2 * 2: # Increased touch area
+                        dragging_shape = shape
+                        break
+        else:
+            dragging_shape.update(cursor)
+    elif cursor is not None and dragging_shape:
+        release_shape()
+
+    # Game over condition
+    if lives <= 0:
+        beaten_text = leaderboard.beaten_message(leaderboard.finish_round(GAME_ID_ODD, USER_ID, score))
+        loop.change("game_over")
+
+
+def render_game(alpha):
+    screen.fill(THEME_BG) # Fill background with theme color
+    if frame_surface is not None:
         screen.blit(frame_surface, (0, 0))
 
-        # Draw outlines and draggable shapes
-        for outline in outline_shapes:
-            outline.draw()
-        for shape in draggable_shapes:
-            shape.draw()
+    # Draw outlines and draggable shapes
+    for outline in outline_shapes:
+        outline.draw()
+    for shape in draggable_shapes:
+        shape.draw()
+
+    # Draw Instructions with a background box
+    instruction_text = ""
+    if game_mode == "shape_only":
+        instruction_text = "Match the shapes to their outlines."
+    elif game_mode == "shape_color":
+        instruction_text = f"Sort the {target_color_name} {target_shape_name} to its position."
+    instruction_surface = font_medium.render(instruction_text, True, THEME_TEXT)
+    instruction_rect = instruction_surface.get_rect(center=(width // 2, 50)) # Centered at the top
+
+    # Background color for the text box (slightly darker than THEME_BG)
+    textbox_bg_color = (190, 160, 120)
+    padding = 10
+    textbox_rect = pygame.Rect(instruction_rect.left - padding,
+                                 instruction_rect.top - padding,
+                                 instruction_rect.width + 2 * padding,
+                                 instruction_rect.height + 2 * padding)
+    pygame.draw.rect(screen, textbox_bg_color, textbox_rect, border_radius=5)
+    screen.blit(instruction_surface, instruction_rect)
+
+    # Draw Score, Lives, and Mode below the instruction box
+    info_y_start = textbox_rect.bottom + 20 # Position below the text box
+    score_text = font_small.render(f"Score: {score}", True, THEME_TEXT)
+    screen.blit(score_text, (20, info_y_start))
+    lives_text = font_small.render(f"Lives: {lives}", True, THEME_TEXT)
+    screen.blit(lives_text, (20, info_y_start + 40))
+    mode_text = font_small.render(f"Mode: {game_mode.replace('_', ' ').title()}", True, THEME_TEXT)
+    screen.blit(mode_text, (20, info_y_start + 80))
+
+    # Display "Try Again" message
+    if try_again_message:
+        try_again_surface = font_medium.render(try_again_message, True, HINT_COLOR)
+        try_again_rect = try_again_surface.get_rect(center=(width // 2, height // 2 + 50))
+        screen.blit(try_again_surface, try_again_rect)
 
-        # Draw Instructions with a background box
-        instruction_text = ""
-        if game_mode == "shape_only":
-            instruction_text = "Match the shapes to their outlines."
-        elif game_mode == "shape_color":
-            instruction_text = f"Sort the {target_color_name} {target_shape_name} to its position."
-        instruction_surface = font_medium.render(instruction_text, True, THEME_TEXT)
-        instruction_rect = instruction_surface.get_rect(center=(width // 2, 50)) # Centered at the top
-
-        # Background color for the text box (slightly darker than THEME_BG)
-        textbox_bg_color = (190, 160, 120)
-        padding = 10
-        textbox_rect = pygame.Rect(instruction_rect.left - padding,
-                                     instruction_rect.top - padding,
-                                     instruction_rect.width + 2 * padding,
-                                     instruction_rect.height + 2 * padding)
-        pygame.draw.rect(screen, textbox_bg_color, textbox_rect, border_radius=5)
-        screen.blit(instruction_surface, instruction_rect)
-
-        # Draw Score, Lives, and Mode below the instruction box
-        info_y_start = textbox_rect.bottom + 20 # Position below the text box
-        score_text = font_small.render(f"Score: {score}", True, THEME_TEXT)
-        screen.blit(score_text, (20, info_y_start))
-        lives_text = font_small.render(f"Lives: {lives}", True, THEME_TEXT)
-        screen.blit(lives_text, (20, info_y_start + 40))
-        mode_text = font_small.render(f"Mode: {game_mode.replace('_', ' ').title()}", True, THEME_TEXT)
-        screen.blit(mode_text, (20, info_y_start + 80))
-
-        # Display "Try Again" message
-        if try_again_message:
-            try_again_surface = font_medium.render(try_again_message, True, HINT_COLOR)
-            try_again_rect = try_again_surface.get_rect(center=(width // 2, height // 2 + 50))
-            screen.blit(try_again_surface, try_again_rect)
-
-        # Check if all shapes are matched (for shape_only mode)
-        # This check is now done within the pinch release logic for shape_only
-
-        # Game over condition
-        if lives <= 0:
-            game_state = "game_over"
-
-    pygame.display.flip()
-
-cap.release()
+
+# --------------------- Main Loop ---------------------
+present = pygame.display.flip
+loop = GameLoop({
+    "main_menu": GameState(handle_event=main_menu_event, render=render_main_menu, present=present),
+    "paused": GameState(handle_event=paused_event, render=render_paused, present=present),
+    "game_over": GameState(handle_event=game_over_event, render=render_game_over, present=present),
+    "game": GameState(handle_event=game_event, poll=game_poll, update=game_update, render=render_game,
+                      present=present),
+}, "main_menu")
+loop.run()
+
+camera.close_camera(cap)
 pygame.quit()
-sys.exit()
\ No newline at end of file
@@ -9,17 +9,13 @@ import numpy as np
 import sys
 import sqlite3
 import datetime
-from services import sessions, levels, logs, utils
+from services import sessions, levels, logs, utils, highscores, leaderboard, glyphs, fonts, assets, telemetry, camera, context
+from games.gameloop import GameLoop, GameState, lerp
+telemetry.mark("imports")
 
 # --------------------- Global Game Identifier ---------------------
 GAME_ID = "SpellDrop"  # Unique identifier for this game
-current_user_path = os.path.join(os.getcwd(), "config", "current_user.json")
-try:
-    with open(current_user_path, "r") as f:
-        current_user = json.load(f)
-except Exception as e:
-    current_user = {"id": 0, "userName": "Guest", "role": "player", "email": ""}
-    print("No current user found; defaulting to Guest.")
+current_user = context.current_user()
 
 # Define USER_ID based on the loaded user.
 USER_ID = current_user["id"]
@@ -39,9 +35,9 @@ pygame.display.set_caption("Spell Drop")
 clock = pygame.time.Clock()
 
 # Playful fonts for a kid-friendly look.
-font_large = pygame.font.SysFont("Comic Sans MS", 80)
-font_medium = pygame.font.SysFont("Comic Sans MS", 60)
-font_small = pygame.font.SysFont("Comic Sans MS", 40)
+font_large = fonts.get_font("Comic Sans MS", 80)
+font_medium = fonts.get_font("Comic Sans MS", 60)
+font_small = fonts.get_font("Comic Sans MS", 40)
 
 
 # --------------------- Button and Menu Classes ---------------------
@@ -74,7 +70,6 @@ class Menu:
             surface.blit(title_text, title_text.get_rect(center=(width // 2, 80)))
         for button in self.buttons:
             button.draw(surface)
-        pygame.display.update()
 
     def handle_event(self, event):
         if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
@@ -124,11 +119,10 @@ def create_highscore_menu():
 
 
 # --------------------- Loading Screen ---------------------
-script_dir = os.path.dirname(os.path.abspath(__file__))
+script_dir = os.path.join(os.getcwd(), "games")
 loading_bg_path = os.path.join(script_dir, "..", "assets", "background", "spell_drop.png")
 if os.path.exists(loading_bg_path):
-    loading_bg = pygame.image.load(loading_bg_path).convert()
-    loading_bg = pygame.transform.scale(loading_bg, (width, height))
+    loading_bg = assets.load_image(loading_bg_path, size=(width, height))
 else:
     loading_bg = None
 
@@ -146,85 +140,38 @@ pygame.time.delay(1000)
 # --------------------- Load Heart Image ---------------------
 lives = 3
 heart_path = os.path.join(script_dir, "..", "assets", "heart.png")
-heart_image = pygame.image.load(heart_path).convert_alpha()
+heart_image = assets.load_image(heart_path, alpha=True)
 heart_width = heart_image.get_width()
 heart_height = heart_image.get_height()
 
 # --------------------- Camera and FaceMesh ---------------------
-cap = cv2.VideoCapture(0)
-cap.set(3, width)
-cap.set(4, height)
-detector = FaceMeshDetector(maxFaces=1)
+with telemetry.stage("camera"):
+    cap = camera.open_camera(context.setting("camera_index", 0), width, height)
+with telemetry.stage("detector"):
+    detector = FaceMeshDetector(maxFaces=1)
+# Launch latency runs to the first frame the camera delivers, not to the first round.
+if cap.read()[0]:
+    telemetry.mark("camera_frame")
 idList = [0, 17, 78, 292]
 
 
 # --------------------- Highscore Handling ---------------------
 # (Highscore functions remain here, but note that Spell Drop now uses an "enter_highscore" state.)
 def update_highscores(score):
-    config_dir = os.path.join(script_dir, "..", "config")
-    if not os.path.exists(config_dir):
-        os.makedirs(config_dir)
-    filename = os.path.join(config_dir, "highscores.json")
-    if os.path.exists(filename):
-        try:
-            with open(filename, "r") as f:
-                data = json.load(f)
-        except (json.JSONDecodeError, FileNotFoundError):
-            data = {}
-    else:
-        data = {}
-    if GAME_ID not in data or not isinstance(data[GAME_ID], list):
-        data[GAME_ID] = []
-    highscores = data[GAME_ID]
-    qualifies = False
-    if len(highscores) < 10:
-        qualifies = True
-    else:
-        min_score = min(entry["score"] for entry in highscores)
-        if score > min_score:
-            qualifies = True
-    if not qualifies:
+    name = highscore_name_input.strip() if highscore_name_input.strip() != "" else "Anonymous"
+    if not highscores.add(GAME_ID, name, score):
         return (False, "Score did not qualify for highscore entry.")
-    new_entry = {"name": highscore_name_input.strip() if highscore_name_input.strip() != "" else "Anonymous",
-                 "score": score}
-    highscores.append(new_entry)
-    highscores = sorted(highscores, key=lambda x: x["score"], reverse=True)[:10]
-    data[GAME_ID] = highscores
-    with open(filename, "w") as f:
-        json.dump(data, f, indent=4)
     return (True, "Highscore updated!")
 
 
 def load_highscores_for_game():
-    filename = os.path.join(script_dir, "..", "config", "highscores.json")
-    try:
-        with open(filename, "r") as f:
-            data = json.load(f)
-    except (FileNotFoundError, json.JSONDecodeError):
-        data = {}
-    if GAME_ID not in data or not isinstance(data[GAME_ID], list):
-        return [{"name": "Default", "score": 0}]
-    return data[GAME_ID]
+    return highscores.top(GAME_ID) or [{"name": "Default", "score": 0}]
 
 
 def qualifies_for_highscore(score):
     if score == 0:
         return False
-    filename = os.path.join(script_dir, "..", "config", "highscores.json")
-    if not os.path.exists(filename):
-        return True
-    try:
-        with open(filename, "r") as f:
-            data = json.load(f)
-    except (json.JSONDecodeError, FileNotFoundError):
-        data = {}
-    if GAME_ID not in data or not isinstance(data[GAME_ID], list):
-        return True
-    highscores = data[GAME_ID]
-    if len(highscores) < 10:
-        return True
-    min_score = min(entry["score"] for entry in highscores)
-    return score > min_score
+    return highscores.qualifies(GAME_ID, score)
 
 
 # --------------------- Word and Letter Setup ---------------------
@@ -234,19 +181,13 @@ collected_positions = [False] * len(target_word)
 score = 0
 word_complete = False
 word_complete_time = 0
+# Game over line comparing the round with everyone's earlier rounds.
+beaten_text = ""
 
 
 # --------------------- Letter Generation ---------------------
-def generate_letter_image(letter, width_img=100, height_img=100, font_scale=2, thickness=3, color=THEME_TEXT_BGR):
-    img = np.zeros((height_img, width_img, 4), dtype=np.uint8)
-    text_size, _ = cv2.getTextSize(letter, cv2.FONT_HERSHEY_SIMPLEX, font_scale, thickness)
-    text_width, text_height = text_size
-    text_x = (width_img - text_width) // 2
-    text_y = (height_img + text_height) // 2
-    cv2.putText(img, letter, (text_x, text_y), cv2.FONT_HERSHEY_SIMPLEX, font_scale, color, thickness, cv2.LINE_AA)
-    mask = (img[:, :, 0] > 0) | (img[:, :, 1] > 0) | (img[:, :, 2] > 0)
-    img[:, :, 3] = np.where(mask, 255, 0)
-    return img
+# All A-Z letter images come from one prebuilt atlas; each letter is a view into it.
+letter_images = glyphs.letter_images(color=THEME_TEXT_BGR)
 
 
 def resetLetter():
@@ -268,11 +209,13 @@ def resetLetter():
         else:
             letter = random.choice(alphabet)
         isCorrect = False
-    letter_img = generate_letter_image(letter)
+    letter_img = letter_images[letter]
     return {"letter": letter, "image": letter_img, "pos": pos_letter, "isCorrect": isCorrect}
 
 
 currentLetter = resetLetter()
+# Letter height before the last update, for drawing between updates.
+prev_letter_y = currentLetter["pos"][1]
 speed = 5
 
 
@@ -298,9 +241,10 @@ def draw_target_word():
 
 # --------------------- LEVELS & SESSIONS INTEGRATION (ADDED) ---------------------
 GAME_ID_SPELL = "SpellDrop"  # Unique game ID for Spell Drop
-levels.init_player_progress(USER_ID, GAME_ID_SPELL)
-base_progress = levels.get_player_progress(USER_ID, GAME_ID_SPELL)
+base_progress = context.progress(GAME_ID_SPELL)
 base_level = base_progress["level"] if base_progress and "level" in base_progress else 0
+# Kept up to date from update_player_progress instead of reading the database every frame.
+current_level = base_level
 session_id = sessions.start_game_session(USER_ID, GAME_ID_SPELL, "SpellDrop")
 logs.log_event(USER_ID, "game_start", f"Game session {session_id} started for {GAME_ID_SPELL}")
 
@@ -325,10 +269,27 @@ def draw_level_display(surface, level):
 
 # --------------------- END LEVEL DISPLAY HELPER ---------------------
 def player_quit():
-    global running
     sessions.end_game_session(session_id, USER_ID, GAME_ID_SPELL, level_increment=0)
     logs.log_event(USER_ID, "quit", f"Game session {session_id} ended by player quit with score {score}")
-    running = False  # This will break out of the main loop
+    loop.quit()  # This will break out of the main loop
+
+
+def next_letter():
+    global currentLetter, prev_letter_y
+    currentLetter = resetLetter()
+    prev_letter_y = currentLetter["pos"][1]
+
+
+def start_game():
+    global target_word, collected_positions, score, lives, word_complete, gameOver
+    target_word = random.choice(word_list).upper()
+    collected_positions = [False] * len(target_word)
+    score = 0
+    lives = 3
+    next_letter()
+    word_complete = False
+    gameOver = False  # Ensure gameOver is reset when starting a new game
+    loop.change("playing")
 
 
 # --------------------- Highscore Input State Variables (NEW) ---------------------
@@ -338,224 +299,215 @@ enter_highscore_prompt = "Enter your name for highscore (Press ENTER to submit o
 
 # --------------------- Game State ---------------------
 # States: "main_menu", "playing", "paused", "game_over", "enter_highscore"
-state = "main_menu"
 current_difficulty = "easy"
 current_menu = create_main_menu(current_difficulty)
-
-# --------------------- Main Loop ---------------------
-running = True
 gameOver = False
-while running:
+
+
+# --------------------- State: Menus ---------------------
+def menu_event(event):
+    global current_difficulty, current_menu
+    action = current_menu.handle_event(event)
+    if not action:
+        return
+    if loop.state_name == "main_menu":
+        if action == "toggle_difficulty":
+            current_difficulty = "normal" if current_difficulty == "easy" else "easy"
+            current_menu = create_main_menu(current_difficulty)
+        elif action == "start":
+            start_game()
+        elif action == "highscores":
+            # For Spell Drop, highscore menu is not normally used.
+            pass
+        elif action == "quit":
+            player_quit()
+    elif loop.state_name == "paused":
+        if action == "resume":
+            loop.change("playing")
+        elif action == "quit_menu":
+            current_menu = create_main_menu(current_difficulty)
+            loop.change("main_menu")
+    elif loop.state_name == "game_over":
+        if action == "restart":
+            start_game()
+        elif action == "quit_menu":
+            current_menu = create_main_menu(current_difficulty)
+            loop.change("main_menu")
+
+
+def render_menu(alpha):
+    current_menu.draw(screen)
+
+
+def render_game_over(alpha):
+    current_menu.draw(screen)
+    if beaten_text:
+        beaten_surface = font_small.render(beaten_text, True, THEME_TEXT)
+        screen.blit(beaten_surface, beaten_surface.get_rect(center=(width // 2, 200)))
+
+
+# --------------------- State: Enter Highscore ---------------------
+def enter_highscore():
+    global highscore_name_input
+    highscore_name_input = ""  # Reset input
+
+
+def enter_highscore_event(event):
+    global current_menu, highscore_name_input
+    if event.type == pygame.KEYDOWN:
+        if event.key == pygame.K_RETURN:
+            # Update highscore using the input string and then go to game over menu.
+            try:
+                updated, hs_message = update_highscores(score)
+                print(hs_message)
+            except Exception as e:
+                print("Highscore update error:", e)
+            current_menu = create_gameover_menu()
+            loop.change("game_over")
+        elif event.key == pygame.K_ESCAPE:
+            # Cancel highscore entry and go to game over menu.
+            current_menu = create_gameover_menu()
+            loop.change("game_over")
+        else:
+            highscore_name_input += event.unicode
+
+
+def render_enter_highscore(alpha):
+    # Display an input box with the name typed so far.
+    screen.fill(THEME_BG)
+    prompt_surface = font_medium.render("Enter your name for highscore:", True, THEME_TEXT)
+    instruction_surface = font_small.render("Press ENTER to submit or ESC to cancel", True, THEME_TEXT)
+    input_surface = font_medium.render(highscore_name_input, True, THEME_TEXT)
+    prompt_rect = prompt_surface.get_rect(center=(width // 2, height // 2 - 50))
+    instruction_rect = instruction_surface.get_rect(center=(width // 2, height // 2 + 20))
+    input_rect = input_surface.get_rect(center=(width // 2, height // 2 + 80))
+    screen.blit(prompt_surface, prompt_rect)
+    screen.blit(instruction_surface, instruction_rect)
+    screen.blit(input_surface, input_rect)
+
+
+# --------------------- State: Playing ---------------------
+# The latest camera frame and the face found in it.
+frame_img = None
+faces = None
+
+
+def playing_poll():
+    """Read the camera and find the face once per frame."""
+    global frame_img, faces
+    success, img = cap.read()
+    if not success:
+        loop.quit()
+        return
+    img = cv2.flip(img, 1)
+    frame_img, faces = detector.findFaceMesh(img, draw=False)
+
+
+def playing_update(dt):
+    """Drop the letter, check catches and finish words; runs at a fixed rate."""
+    global prev_letter_y, lives, gameOver, score, word_complete, word_complete_time
+    global target_word, collected_positions, current_menu, current_level, beaten_text
+    if frame_img is None:
+        return
     current_time = pygame.time.get_ticks()
-    for event in pygame.event.get():
-        if event.type == pygame.QUIT:
-            running = False
-
-        if state in ("main_menu", "paused", "game_over"):
-            action = current_menu.handle_event(event)
-            if action:
-                if state == "main_menu":
-                    if action == "toggle_difficulty":
-                        current_difficulty = "normal" if current_difficulty == "easy" else "easy"
-                        current_menu = create_main_menu(current_difficulty)
-                    elif action == "start":
-                        target_word = random.choice(word_list).upper()
-                        collected_positions = [False] * len(target_word)
-                        score = 0
-                        lives = 3
-                        currentLetter = resetLetter()
-                        word_complete = False
-                        state = "playing"
-                        gameOver = False  # Ensure gameOver is reset when starting a new game
-                    elif action == "highscores":
-                        # For Spell Drop, highscore menu is not normally used.
-                        pass
-                    elif action == "quit":
-                        player_quit()
-                        running = False
-                elif state == "paused":
-                    if action == "resume":
-                        state = "playing"
-                    elif action == "quit_menu":
-                        current_menu = create_main_menu(current_difficulty)
-                        state = "main_menu"
-                elif state == "game_over":
-                    if action == "restart":
-                        target_word = random.choice(word_list).upper()
-                        collected_positions = [False] * len(target_word)
-                        score = 0
-                        lives = 3
-                        currentLetter = resetLetter()
-                        word_complete = False
-                        state = "playing"
-                        gameOver = False  # Reset gameOver when restarting
-                    elif action == "quit_menu":
-                        current_menu = create_main_menu(current_difficulty)
-                        state = "main_menu"
-        elif state == "enter_highscore":
-            if event.type == pygame.KEYDOWN:
-                if event.key == pygame.K_RETURN:
-                    # Update highscore using the input string and then go to game over menu.
-                    try:
-                        updated, hs_message = update_highscores(score)
-                        print(hs_message)
-                    except Exception as e:
-                        print("Highscore update error:", e)
-                    current_menu = create_gameover_menu()
-                    state = "game_over"
-                elif event.key == pygame.K_ESCAPE:
-                    # Cancel highscore entry and go to game over menu.
-                    current_menu = create_gameover_menu()
-                    state = "game_over"
-                else:
-                    highscore_name_input += event.unicode
-
-    # --------------------- State-Based Drawing ---------------------
-    if state in ("main_menu", "paused", "game_over"):
-        current_menu.draw(screen)
-        clock.tick(30)
-        continue
-
-    if state == "enter_highscore":
-        screen.fill(THEME_BG)
-        prompt_surface = font_medium.render(enter_highscore_prompt, True, THEME_TEXT)
-        input_surface = font_medium.render(highscore_name_input, True, THEME_TEXT)
-        prompt_rect = prompt_surface.get_rect(center=(width // 2, height // 2 - 50))
-        input_rect = input_surface.get_rect(center=(width // 2, height // 2 + 20))
-        screen.blit(prompt_surface, prompt_rect)
-        screen.blit(input_surface, input_rect)
-        pygame.display.update()
-        clock.tick(30)
-        continue
-
-    if state == "playing":
-        success, img = cap.read()
-        if not success:
-            break
-        img = cv2.flip(img, 1)
-        img, faces = detector.findFaceMesh(img, draw=False)
+    letter_pos = currentLetter["pos"]
+    prev_letter_y = letter_pos[1]
+    letter_pos[1] += speed
+    if letter_pos[1] > height - 200:
+        if currentLetter["isCorrect"] and current_difficulty == "normal":
+            lives -= 1
+            if lives <= 0:
+                gameOver = True
+        next_letter()
         letter_pos = currentLetter["pos"]
-        img = cvzone.overlayPNG(img, currentLetter["image"], letter_pos)
-        if current_difficulty == "easy":
-            h_img, w_img = currentLetter["image"].shape[:2]
-            outline_color = (0, 255, 0) if currentLetter["isCorrect"] else (0, 0, 255)
-            cv2.rectangle(img, (letter_pos[0], letter_pos[1]), (letter_pos[0] + w_img, letter_pos[1] + h_img),
-                          outline_color, thickness=3)
-            if faces:
-                face = faces[0]
-                up = face[idList[0]]
-                down = face[idList[1]]
-                cx, cy = (up[0] + down[0]) // 2, (up[1] + down[1]) // 2
-                cv2.line(img, (cx, cy), (letter_pos[0] + w_img // 2, letter_pos[1] + h_img // 2), (0, 255, 0), 3)
-        letter_pos[1] += speed
-        if letter_pos[1] > height - 200:
-            if currentLetter["isCorrect"] and current_difficulty == "normal":
+    if faces:
+        face = faces[0]
+        up = face[idList[0]]
+        down = face[idList[1]]
+        upDown, _ = detector.findDistance(face[idList[0]], face[idList[1]])
+        leftRight, _ = detector.findDistance(face[idList[2]], face[idList[3]])
+        cx, cy = (up[0] + down[0]) // 2, (up[1] + down[1]) // 2
+        ratio = int((upDown / leftRight) * 100)
+        center_letter = (letter_pos[0] + currentLetter["image"].shape[1] // 2,
+                         letter_pos[1] + currentLetter["image"].shape[0] // 2)
+        distMouthLetter, _ = detector.findDistance((cx, cy), center_letter)
+        if distMouthLetter < 100 and ratio > 60:
+            caught = currentLetter["letter"].upper()
+            if caught in target_word:
+                for i, char in enumerate(target_word):
+                    if char == caught and not collected_positions[i]:
+                        collected_positions[i] = True
+                        score += 1
+                        # Update level progress: add 5 points per correct catch.
+                        if USER_ID != 0:
+                            progress = levels.update_player_progress(USER_ID, GAME_ID_SPELL, 5)
+                            if progress:
+                                current_level = progress["level"]
+                            logs.log_event(USER_ID, "score", f"Score incremented to {score}")
+                        else:
+                            logs.log_event(0, "score", f"Guest score incremented to {score}")
+                        break
+            else:
                 lives -= 1
                 if lives <= 0:
                     gameOver = True
-            currentLetter = resetLetter()
+            next_letter()
+    if all(collected_positions) and not word_complete:
+        word_complete = True
+        word_complete_time = current_time
+    if word_complete:
+        if current_time - word_complete_time > 1000:
+            target_word = random.choice(word_list).upper()
+            collected_positions = [False] * len(target_word)
+            word_complete = False
+    if gameOver:
+        # Transition to enter_highscore state if score qualifies; otherwise, go directly to game_over.
+        current_menu = create_gameover_menu()
+        beaten_text = leaderboard.beaten_message(leaderboard.finish_round(GAME_ID, USER_ID, score))
+        loop.change("enter_highscore" if qualifies_for_highscore(score) else "game_over")
+
+
+def render_playing(alpha):
+    if frame_img is None:
+        return
+    img = frame_img.copy()
+    letter_pos = [currentLetter["pos"][0], int(lerp(prev_letter_y, currentLetter["pos"][1], alpha))]
+    img = cvzone.overlayPNG(img, currentLetter["image"], letter_pos)
+    if current_difficulty == "easy":
+        h_img, w_img = currentLetter["image"].shape[:2]
+        outline_color = (0, 255, 0) if currentLetter["isCorrect"] else (0, 0, 255)
+        cv2.rectangle(img, (letter_pos[0], letter_pos[1]), (letter_pos[0] + w_img, letter_pos[1] + h_img),
+                      outline_color, thickness=3)
         if faces:
             face = faces[0]
             up = face[idList[0]]
             down = face[idList[1]]
-            upDown, _ = detector.findDistance(face[idList[0]], face[idList[1]])
-            leftRight, _ = detector.findDistance(face[idList[2]], face[idList[3]])
             cx, cy = (up[0] + down[0]) // 2, (up[1] + down[1]) // 2
-            ratio = int((upDown / leftRight) * 100)
-            center_letter = (letter_pos[0] + currentLetter["image"].shape[1] // 2,
-                             letter_pos[1] + currentLetter["image"].shape[0] // 2)
-            distMouthLetter, _ = detector.findDistance((cx, cy), center_letter)
-            if distMouthLetter < 100 and ratio > 60:
-                caught = currentLetter["letter"].upper()
-                if caught in target_word:
-                    for i, char in enumerate(target_word):
-                        if char == caught and not collected_positions[i]:
-                            collected_positions[i] = True
-                            score += 1
-                            # Update level progress: add 5 points per correct catch.
-                            if USER_ID != 0:
-                                levels.update_player_progress(USER_ID, GAME_ID_SPELL, 5)
-                                logs.log_event(USER_ID, "score", f"Score incremented to {score}")
-                            else:
-                                logs.log_event(0, "score", f"Guest score incremented to {score}")
-                            break
-                else:
-                    lives -= 1
-                    if lives <= 0:
-                        gameOver = True
-                currentLetter = resetLetter()
-        if all(collected_positions) and not word_complete:
-            word_complete = True
-            word_complete_time = current_time
-        if word_complete:
-            if current_time - word_complete_time > 1000:
-                target_word = random.choice(word_list).upper()
-                collected_positions = [False] * len(target_word)
-                word_complete = False
-        imgRGB = cv2.cvtColor(img, cv2.COLOR_BGR2RGB)
-        surface = pygame.image.frombuffer(imgRGB.tobytes(), (imgRGB.shape[1], imgRGB.shape[0]), "RGB")
-        screen.blit(surface, (0, 0))
-        draw_target_word()
-        score_surface = font_medium.render("Score: " + str(score), True, THEME_TEXT)
-        screen.blit(score_surface, (width - score_surface.get_width() - 20, 20))
-        for i in range(lives):
-            screen.blit(heart_image, (10 + i * (heart_width + 5), 10))
-
-        # --------------------- LEVEL DISPLAY (ADDED) ---------------------
-        current_progress = levels.get_player_progress(USER_ID, GAME_ID_SPELL)
-        current_level = current_progress["level"] if current_progress and "level" in current_progress else base_level
-        draw_level_display(screen, current_level)
-        # --------------------- END LEVEL DISPLAY ---------------------
-
-        pygame.display.update()
-        clock.tick(30)
-        if gameOver:
-            # Transition to enter_highscore state if score qualifies; otherwise, go directly to game_over.
-            if qualifies_for_highscore(score):
-                state = "enter_highscore"
-                highscore_name_input = ""  # Reset input
-            else:
-                state = "game_over"
-
-    if state == "enter_highscore":
-        # In this state, display an input box and capture keystrokes.
-        screen.fill(THEME_BG)
-        prompt_surface = font_medium.render("Enter your name for highscore:", True, THEME_TEXT)
-        instruction_surface = font_small.render("Press ENTER to submit or ESC to cancel", True, THEME_TEXT)
-        input_surface = font_medium.render(highscore_name_input, True, THEME_TEXT)
-        prompt_rect = prompt_surface.get_rect(center=(width // 2, height // 2 - 50))
-        instruction_rect = instruction_surface.get_rect(center=(width // 2, height // 2 + 20))
-        input_rect = input_surface.get_rect(center=(width // 2, height // 2 + 80))
-        screen.blit(prompt_surface, prompt_rect)
-        screen.blit(instruction_surface, instruction_rect)
-        screen.blit(input_surface, input_rect)
-        pygame.display.update()
-
-
-
-
-        # Process key events for input in the main loop below.
-        for event in pygame.event.get():
-            if event.type == pygame.KEYDOWN:
-                if event.key == pygame.K_RETURN:
-                    # Submit input and update highscore.
-                    try:
-                        updated, hs_message = update_highscores(score)
-                        print(hs_message)
-                    except Exception as e:
-                        print("Highscore update error:", e)
-                    current_menu = create_gameover_menu()
-                    state = "game_over"
-                elif event.key == pygame.K_ESCAPE:
-                    # Cancel highscore entry.
-                    current_menu = create_gameover_menu()
-                    state = "game_over"
-                else:
-                    highscore_name_input += event.unicode
-
-    pygame.display.flip()
-    clock.tick(30)
-
-cap.release()
+            cv2.line(img, (cx, cy), (letter_pos[0] + w_img // 2, letter_pos[1] + h_img // 2), (0, 255, 0), 3)
+    imgRGB = cv2.cvtColor(img, cv2.COLOR_BGR2RGB)
+    surface = pygame.image.frombuffer(imgRGB.tobytes(), (imgRGB.shape[1], imgRGB.shape[0]), "RGB")
+    screen.blit(surface, (0, 0))
+    draw_target_word()
+    score_surface = font_medium.render("Score: " + str(score), True, THEME_TEXT)
+    screen.blit(score_surface, (width - score_surface.get_width() - 20, 20))
+    for i in range(lives):
+        screen.blit(heart_image, (10 + i * (heart_width + 5), 10))
+
+    # --------------------- LEVEL DISPLAY (ADDED) ---------------------
+    draw_level_display(screen, current_level)
+    # --------------------- END LEVEL DISPLAY ---------------------
+
+
+# --------------------- Main Loop ---------------------
+loop = GameLoop({
+    "main_menu": GameState(handle_event=menu_event, render=render_menu),
+    "paused": GameState(handle_event=menu_event, render=render_menu),
+    "game_over": GameState(handle_event=menu_event, render=render_game_over),
+    "enter_highscore": GameState(handle_event=enter_highscore_event, render=render_enter_highscore,
+                                 enter=enter_highscore),
+    "playing": GameState(poll=playing_poll, update=playing_update, render=render_playing),
+}, "main_menu")
+loop.run()
+
+camera.close_camera(cap)
 pygame.quit()
-sys.exit()
\ No newline at end of file
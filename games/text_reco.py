@@ -4,6 +4,7 @@ pytesseract.pytesseract.tesseract_cmd = r'C:\Program Files\Tesseract-OCR\tessera
 import pygame
 import sys
 import numpy as np
+from services import fonts
 
 # --- Configuration ---
 expected_text = "hello"  # Change this to any expected word or phrase
@@ -13,7 +14,7 @@ pygame.init()
 window_width, window_height = 800, 600
 screen = pygame.display.set_mode((window_width, window_height))
 pygame.display.set_caption("Interactive Writing Game")
-font = pygame.font.SysFont(None, 36)
+font = fonts.get_font(None, 36)
 clock = pygame.time.Clock()
 
 # --- OpenCV Video Capture ---
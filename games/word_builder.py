@@ -11,16 +11,12 @@ import sys
 import os
 import sqlite3
 import datetime
-from services import sessions, levels, logs, utils
+from services import sessions, levels, logs, utils, leaderboard, glyphs, fonts, assets, telemetry, camera, context
+from games.gameloop import GameLoop, GameState
+telemetry.mark("imports")
 
 # Load current user info from a shared JSON file
-current_user_path = os.path.join(os.getcwd(), "config", "current_user.json")
-try:
-    with open(current_user_path, "r") as f:
-        current_user = json.load(f)
-except Exception as e:
-    current_user = {"id": 0, "userName": "Guest", "role": "player", "email": ""}
-    print("No current user found; defaulting to Guest.")
+current_user = context.current_user()
 
 # Define USER_ID based on the loaded current_user
 USER_ID = current_user["id"]
@@ -41,24 +37,22 @@ pygame.display.set_caption("World Builder")
 clock = pygame.time.Clock()
 
 # Use playful fonts for a kid-friendly look.
-font_large = pygame.font.SysFont("Comic Sans MS", 80)
-font_medium = pygame.font.SysFont("Comic Sans MS", 60)
-font_small = pygame.font.SysFont("Comic Sans MS", 40)
+font_large = fonts.get_font("Comic Sans MS", 80)
+font_medium = fonts.get_font("Comic Sans MS", 60)
+font_small = fonts.get_font("Comic Sans MS", 40)
 
 # --------------------- Load Background Image ---------------------
 # This image will be used on the loading screen.
-script_dir = os.path.dirname(os.path.abspath(__file__))
+script_dir = os.path.join(os.getcwd(), "games")
 loading_bg_path = os.path.join(script_dir, "..", "assets", "background", "word_builder.png") # Updated path
-loading_bg_img = pygame.image.load(loading_bg_path)
-loading_bg_img = pygame.transform.scale(loading_bg_img, (width, height))
+loading_bg_img = assets.load_image(loading_bg_path, size=(width, height))
 
 
 # --------------------- Load Heart Image ---------------------
 heart_img_path = os.path.join(script_dir, "..", "assets", "heart.png")
 try:
-    heart_img = pygame.image.load(heart_img_path).convert_alpha()
-    heart_img = pygame.transform.scale(heart_img, (50, 50))  # Adjust size as needed
-except pygame.error as e:
+    heart_img = assets.load_image(heart_img_path, size=(50, 50), alpha=True)  # Adjust size as needed
+except (OSError, pygame.error) as e:
     print(f"Error loading heart image: {e}")
     heart_img = None
 
@@ -112,7 +106,6 @@ def draw_loading_screen():
     loading_message = font_small.render("Loading... Please wait.", True, THEME_TEXT)
     screen.blit(loading_title, loading_title.get_rect(center=(width // 2, height // 2 - 50)))
     screen.blit(loading_message, loading_message.get_rect(center=(width // 2, height // 2 + 20)))
-    pygame.display.update()
 
 
 # --------------------- Word & Letter Settings ---------------------
@@ -130,6 +123,10 @@ current_word = ""
 def is_valid_word(word):
     return word.upper() == current_word.upper()
 
+# All A-Z letter buttons are prebuilt once as subsurfaces of a single glyph atlas.
+letter_tiles = glyphs.letter_tiles("Comic Sans MS", LETTER_FONT_SIZE, LETTER_BUTTON_SIZE, BUTTON_TEXT, BUTTON_BG,
+                                   THEME_BG, border_width=3)
+
 # --------------------- Letter Class ---------------------
 class Letter:
     def __init__(self, char, pos):
@@ -137,14 +134,8 @@ class Letter:
         self.pos = pos  # Top-left position as a tuple (x, y)
         self.original_pos = pos # Store the original position
         self.button_size = LETTER_BUTTON_SIZE
-        # Render the letter using Comic Sans (light beige text on medium brown background)
-        self.text_surface = pygame.font.SysFont("Comic Sans MS", LETTER_FONT_SIZE).render(char, True, BUTTON_TEXT)
-        # Create a surface for the letter button.
-        self.surface = pygame.Surface((self.button_size, self.button_size))
-        self.surface.fill(BUTTON_BG)
-        pygame.draw.rect(self.surface, THEME_BG, (0, 0, self.button_size, self.button_size), 3)
-        text_rect = self.text_surface.get_rect(center=(self.button_size // 2, self.button_size // 2))
-        self.surface.blit(self.text_surface, text_rect)
+        # The letter button (light beige Comic Sans on medium brown) is a tile of the shared atlas.
+        self.surface = letter_tiles[char]
         self.rect = self.surface.get_rect(topleft=pos)
         self.draw_hint = False # Flag to indicate if this letter should have a hint
 
@@ -192,14 +183,19 @@ def resolve_collisions(dragged, letters):
             letter.rect.topleft = letter.pos
 
 # --------------------- Webcam & Hand Detector Setup ---------------------
-cap = cv2.VideoCapture(0)
-cap.set(3, width)
-cap.set(4, height)
-detector = HandDetector(detectionCon=0.8)
+with telemetry.stage("camera"):
+    cap = camera.open_camera(context.setting("camera_index", 0), width, height)
+with telemetry.stage("detector"):
+    detector = HandDetector(detectionCon=0.8)
+# Launch latency runs to the first frame the camera delivers, not to the first round.
+if cap.read()[0]:
+    telemetry.mark("camera_frame")
 
 # --------------------- Game Variables ---------------------
 score = 0
 lives = 3
+# Game over line comparing the round with everyone's earlier rounds.
+beaten_text = ""
 letters = []  # Current set of draggable letters
 message = ""  # Message to display after word submission
 message_timer = 0
@@ -214,7 +210,6 @@ hint_index = 0
 
 # --------------------- Game States ---------------------
 # Allowed states: "loading", "main_menu", "game", "paused", "game_over"
-game_state = "loading"
 loading_start_time = pygame.time.get_ticks()
 
 # --------------------- Draw Lives Function ---------------------
@@ -225,262 +220,280 @@ def draw_lives(surface, current_lives, position):
             surface.blit(heart_img, (x, position[1]))
 
 
-GAME_ID_SPELL = "SpellDrop"  # Unique game ID for Spell Drop
+# Sessions, progress and scores are all recorded under Word Builder's own id (see services/catalog.py).
+GAME_ID_WORD = "WordBuilder"
 
 # Initialize the player's progress record (creates one if it doesn't exist)
-levels.init_player_progress(USER_ID, GAME_ID_SPELL)
-base_progress = levels.get_player_progress(USER_ID, GAME_ID_SPELL)
+base_progress = context.progress(GAME_ID_WORD)
 base_level = base_progress["level"] if base_progress and "level" in base_progress else 0
 
 # Start a game session and log the event.
-session_id = sessions.start_game_session(USER_ID, GAME_ID_SPELL, "SpellDrop")
-logs.log_event(USER_ID, "game_start", f"Game session {session_id} started for {GAME_ID_SPELL}")
+session_id = sessions.start_game_session(USER_ID, GAME_ID_WORD, "WordBuilder")
+logs.log_event(USER_ID, "game_start", f"Game session {session_id} started for {GAME_ID_WORD}")
 
 def player_quit():
-    global running
-    sessions.end_game_session(session_id, USER_ID, GAME_ID_SPELL, level_increment=0)
+    sessions.end_game_session(session_id, USER_ID, GAME_ID_WORD, level_increment=0)
     logs.log_event(USER_ID, "quit", f"Game session {session_id} ended by player quit with score {score}")
-    running = False  # Exit the main loop
+    loop.quit()  # Exit the main loop
+
+
+def start_game():
+    global score, lives, letters, hint_timer, hint_index
+    score = 0 # Reset score on new game
+    lives = 3 # Reset lives on new game
+    letters = generate_letters()
+    hint_timer = 0
+    hint_index = 0
+    loop.change("game")
+
+
+def clicked_action(event, buttons):
+    """Return the action of the button under a left click, or None."""
+    if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
+        pos = pygame.mouse.get_pos()
+        for button in buttons:
+            if button.is_clicked(pos):
+                return button.action
+    return None
+
+
+main_menu_buttons = get_main_menu_buttons()
+pause_menu_buttons = get_pause_menu_buttons()
+game_over_buttons = get_game_over_buttons()
+
+
+# --------------------- State: Loading ---------------------
+def loading_update(dt):
+    if pygame.time.get_ticks() - loading_start_time > 2000:
+        loop.change("main_menu")
+
+
+def render_loading(alpha):
+    draw_loading_screen()
+
+
+# --------------------- State: Main Menu ---------------------
+def main_menu_event(event):
+    action = clicked_action(event, main_menu_buttons)
+    if action == "start":
+        start_game()
+    elif action == "quit":
+        player_quit()
+
+
+def render_main_menu(alpha):
+    screen.fill(THEME_BG)
+    title_text = font_large.render("Main Menu", True, THEME_TEXT)
+    screen.blit(title_text, title_text.get_rect(center=(width // 2, 100)))
+    # Display instructions for how to play.
+    instructions = [
+        "Instructions:",
+        "1. Use pinch gesture (index & middle finger) to select a letter.",
+        "2. Drag the letter into the box at the bottom to form the word.",
+        "3. Valid words earn points.",
+        "4. Press SPACE or ESC to pause the game."
+    ]
+    for idx, line in enumerate(instructions):
+        inst_text = font_small.render(line, True, THEME_TEXT)
+        screen.blit(inst_text, (50, 180 + idx * 35))
+    for button in main_menu_buttons:
+        button.draw(screen)
+
+
+# --------------------- State: Paused ---------------------
+def paused_event(event):
+    action = clicked_action(event, pause_menu_buttons)
+    if action == "resume":
+        loop.change("game")
+    elif action == "quit_menu":
+        loop.change("main_menu")
+
+
+def render_paused(alpha):
+    screen.fill(THEME_BG)
+    pause_text = font_large.render("Paused", True, THEME_TEXT)
+    screen.blit(pause_text, pause_text.get_rect(center=(width // 2, 100)))
+    for button in pause_menu_buttons:
+        button.draw(screen)
+
+
+# --------------------- State: Game Over ---------------------
+def game_over_event(event):
+    action = clicked_action(event, game_over_buttons)
+    if action == "start":
+        start_game()
+    elif action == "main_menu":
+        loop.change("main_menu")
+    elif action == "quit":
+        loop.quit()
+
+
+def render_game_over(alpha):
+    screen.fill(THEME_BG)
+    game_over_text = font_large.render("Game Over!", True, THEME_TEXT)
+    final_score_text = font_medium.render(f"Your final score: {score}", True, THEME_TEXT)
+    screen.blit(game_over_text, game_over_text.get_rect(center=(width // 2, 200)))
+    screen.blit(final_score_text, final_score_text.get_rect(center=(width // 2, 300)))
+    if beaten_text:
+        beaten_surface = font_small.render(beaten_text, True, THEME_TEXT)
+        screen.blit(beaten_surface, beaten_surface.get_rect(center=(width // 2, 360)))
+    for button in game_over_buttons:
+        button.draw(screen)
+
+
+# --------------------- State: Game ---------------------
+# Cursor and pinch from the latest camera frame, and that frame for drawing.
+cursor = None
+pinch = False
+frame_surface = None
+
+
+def game_event(event):
+    if event.type == pygame.KEYDOWN:
+        # Pressing Escape or Space pauses the game.
+        if event.key in (pygame.K_ESCAPE, pygame.K_SPACE):
+            loop.change("paused")
+        elif event.key == pygame.K_q:
+            loop.quit()
+
+
+def game_poll():
+    """Read the camera and track the hand once per frame."""
+    global cursor, pinch, frame_surface
+    ret, frame = cap.read()
+    if not ret:
+        return
+    frame = cv2.flip(frame, 1)
+    hands, frame = detector.findHands(frame, flipType=True)
+    pinch = False
+    cursor = None
+    if hands:
+        lmList = hands[0]['lmList']
+        length, info, _ = detector.findDistance(lmList[8][:2], lmList[12][:2], frame)
+        pinch = length < 60
+        cursor = lmList[8][:2]
+    # Convert webcam frame for display.
+    frame = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
+    frame_surface = pygame.image.frombuffer(frame.tobytes(), (width, height), "RGB")
+
+
+def game_update(dt):
+    """Dragging, word checks and hints; runs at a fixed rate."""
+    global dragging_letter, score, message, letters, hint_timer, hint_index, lives, message_timer
+    global beaten_text
+    # Handle dragging with a selected letter.
+    if pinch and cursor is not None:
+        if dragging_letter is None:
+            # Check if any letter is under the cursor to select it.
+            for letter_obj in letters:
+                if letter_obj.rect.collidepoint(cursor):
+                    dragging_letter = letter_obj
+                    break
+        else:
+            # Update the selected letter's position.
+            dragging_letter.update(cursor)
+            resolve_collisions(dragging_letter, letters)
+    else:
+        if dragging_letter:
+            # Check if a significant portion of the letter is within the target rect
+            if TARGET_RECT.colliderect(dragging_letter.rect):
+                # Snap the letter into the target rect (aligning the top)
+                dragging_letter.pos = (dragging_letter.pos[0], TARGET_RECT.top)
+                dragging_letter.rect.topleft = dragging_letter.pos
+            dragging_letter = None
+
+    # Check for letters inside target zone.
+    selected_letters = [letter_obj for letter_obj in letters if TARGET_RECT.colliderect(letter_obj.rect)]
+    selected_letters.sort(key=lambda l: l.pos[0])
+    formed_word = "".join(letter_obj.char for letter_obj in selected_letters)
+
+    if formed_word:
+        if is_valid_word(formed_word):
+            score += 1
+            message = f"'{formed_word}' is correct! +3 points"
+            # --- LEVEL UPDATE & LOGGING SNIPPET ---
+            # (Assumes USER_ID and GAME_ID_WORD are defined earlier in the file.)
+            if USER_ID != 0:
+                try:
+                    levels.update_player_progress(USER_ID, GAME_ID_WORD, additional_points=5)
+                except Exception as e:
+                    print("Level update error:", e)
+                logs.log_event(USER_ID, "score", f"Score incremented to {score}")
+            else:
+                logs.log_event(0, "score", f"Guest score incremented to {score}")
+            # --- END LEVEL UPDATE & LOGGING SNIPPET ---
 
+            letters = generate_letters()
+            hint_timer = 0
+            hint_index = 0
+            for letter in letters:
+                letter.draw_hint = False # Reset hints for the new word
+        elif len(formed_word) == len(current_word): # Only show incorrect message if word length matches
+            message = f"'{formed_word}' is not the word. Try again!"
+            for letter in selected_letters:
+                letter.reset_position()
+            lives -= 1
+            if lives <= 0:
+                beaten_text = leaderboard.beaten_message(leaderboard.finish_round(GAME_ID_WORD, USER_ID, score))
+                loop.change("game_over")
+        message_timer = pygame.time.get_ticks()
+        hint_timer = 0 # Reset hint timer on any word attempt
+
+    elif not formed_word:
+        message = "" # Clear the message when no word is formed
+
+    # Hint System
+    if not formed_word and pygame.time.get_ticks() - (pygame.time.get_ticks() - hint_timer) > hint_interval:
+        letters_in_target = [letter for letter in letters if TARGET_RECT.colliderect(letter.rect)]
+
+        # Find the first correctly placed letter that hasn't been hinted yet
+        hinted = False
+        for i in range(len(current_word)):
+            for letter in letters_in_target:
+                index_in_target = letters_in_target.index(letter)
+                if index_in_target == i and letter.char.upper() == current_word[i].upper() and not letter.draw_hint and not hinted:
+                    letter.draw_hint = True
+                    hinted = True
+                    break
+            if hinted:
+                break
+        hint_timer = pygame.time.get_ticks() # Reset the hint timer
 
-# --------------------- Main Loop ---------------------
-while True:
-    elapsed_time = clock.tick(30)
-    for event in pygame.event.get():
-        if event.type == pygame.QUIT:
-            cap.release()
-            pygame.quit()
-            sys.exit()
-
-        # --- Main Menu Events ---
-        if game_state == "main_menu":
-            if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
-                pos = pygame.mouse.get_pos()
-                for button in get_main_menu_buttons():
-                    if button.is_clicked(pos):
-                        if button.action == "start":
-                            game_state = "game"
-                            score = 0 # Reset score on new game
-                            lives = 3 # Reset lives on new game
-                            letters = generate_letters()
-                            hint_timer = 0
-                            hint_index = 0
-                        elif button.action == "quit":
-                            player_quit()
-                            cap.release()
-                            pygame.quit()
-                            sys.exit()
-
-        # --- Paused Menu Events ---
-        elif game_state == "paused":
-            if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
-                pos = pygame.mouse.get_pos()
-                for button in get_pause_menu_buttons():
-                    if button.is_clicked(pos):
-                        if button.action == "resume":
-                            game_state = "game"
-                        elif button.action == "quit_menu":
-                            game_state = "main_menu"
-
-        # --- Game Over Menu Events ---
-        elif game_state == "game_over":
-            if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
-                pos = pygame.mouse.get_pos()
-                for button in get_game_over_buttons():
-                    if button.is_clicked(pos):
-                        if button.action == "start":
-                            game_state = "game"
-                            score = 0
-                            lives = 3
-                            letters = generate_letters()
-                            hint_timer = 0
-                            hint_index = 0
-                        elif button.action == "main_menu":
-                            game_state = "main_menu"
-                        elif button.action == "quit":
-                            cap.release()
-                            pygame.quit()
-                            sys.exit()
-
-        # --- Game State Key Handling ---
-        if game_state == "game":
-            if event.type == pygame.KEYDOWN:
-                # Pressing Escape or Space pauses the game.
-                if event.key in (pygame.K_ESCAPE, pygame.K_SPACE):
-                    game_state = "paused"
-                elif event.key == pygame.K_q:
-                    cap.release()
-                    pygame.quit()
-                    sys.exit()
-
-    # --------------------- State-Based Drawing ---------------------
-    if game_state == "loading":
-        draw_loading_screen()
-        if pygame.time.get_ticks() - loading_start_time > 2000:
-            game_state = "main_menu"
-
-    elif game_state == "main_menu":
-        screen.fill(THEME_BG)
-        title_text = font_large.render("Main Menu", True, THEME_TEXT)
-        screen.blit(title_text, title_text.get_rect(center=(width // 2, 100)))
-        # Display instructions for how to play.
-        instructions = [
-            "Instructions:",
-            "1. Use pinch gesture (index & middle finger) to select a letter.",
-            "2. Drag the letter into the box at the bottom to form the word.",
-            "3. Valid words earn points.",
-            "4. Press SPACE or ESC to pause the game."
-        ]
-        for idx, line in enumerate(instructions):
-            inst_text = font_small.render(line, True, THEME_TEXT)
-            screen.blit(inst_text, (50, 180 + idx * 35))
-        for button in get_main_menu_buttons():
-            button.draw(screen)
-
-    elif game_state == "paused":
-        screen.fill(THEME_BG)
-        pause_text = font_large.render("Paused", True, THEME_TEXT)
-        screen.blit(pause_text, pause_text.get_rect(center=(width // 2, 100)))
-        for button in get_pause_menu_buttons():
-            button.draw(screen)
-
-    elif game_state == "game_over":
-        screen.fill(THEME_BG)
-        game_over_text = font_large.render("Game Over!", True, THEME_TEXT)
-        final_score_text = font_medium.render(f"Your final score: {score}", True, THEME_TEXT)
-        screen.blit(game_over_text, game_over_text.get_rect(center=(width // 2, 200)))
-        screen.blit(final_score_text, final_score_text.get_rect(center=(width // 2, 300)))
-        for button in get_game_over_buttons():
-            button.draw(screen)
-
-    elif game_state == "game":
-        ret, frame = cap.read()
-        if not ret:
-            continue
-        frame = cv2.flip(frame, 1)
-        hands, frame = detector.findHands(frame, flipType=True)
-        pinch = False
-        cursor = None
-        if hands:
-            lmList = hands[0]['lmList']
-            length, info, _ = detector.findDistance(lmList[8][:2], lmList[12][:2], frame)
-            pinch = length < 60
-            cursor = lmList[8][:2]
-
-        # Handle dragging with a selected letter.
-        if pinch and cursor is not None:
-            if dragging_letter is None:
-                # Check if any letter is under the cursor to select it.
-                for letter_obj in letters:
-                    if letter_obj.rect.collidepoint(cursor):
-                        dragging_letter = letter_obj
-                        break
-            else:
-                # Update the selected letter's position.
-                dragging_letter.update(cursor)
-                resolve_collisions(dragging_letter, letters)
-        else:
-            if dragging_letter:
-                # Check if a significant portion of the letter is within the target rect
-                if TARGET_RECT.colliderect(dragging_letter.rect):
-                    # Snap the letter into the target rect (aligning the top)
-                    dragging_letter.pos = (dragging_letter.pos[0], TARGET_RECT.top)
-                    dragging_letter.rect.topleft = dragging_letter.pos
-                dragging_letter = None
-
-        # Convert webcam frame for display.
-        frame = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-        frame_surface = pygame.image.frombuffer(frame.tobytes(), (width, height), "RGB")
+
+def render_game(alpha):
+    if frame_surface is not None:
         screen.blit(frame_surface, (0, 0))
 
-        # Draw target zone for word formation.
-        pygame.draw.rect(screen, TARGET_BG, TARGET_RECT) # Fill the target area
-        pygame.draw.rect(screen, THEME_TEXT, TARGET_RECT, 3) # Draw the border
-        instruction = font_small.render("Form the word below", True, THEME_TEXT)
-        screen.blit(instruction, (TARGET_RECT.x, TARGET_RECT.y - 40))
-
-        # Draw letters.
-        for letter_obj in letters:
-            letter_obj.draw(screen)
-
-        # Display score and lives.
-        score_text = font_small.render(f"Score: {score}", True, THEME_TEXT)
-        screen.blit(score_text, (20, 20))
-        if heart_img:
-            draw_lives(screen, lives, (20, 70))
-
-        # Check for letters inside target zone.
-        selected_letters = [letter_obj for letter_obj in letters if TARGET_RECT.colliderect(letter_obj.rect)]
-        selected_letters.sort(key=lambda l: l.pos[0])
-        formed_word = "".join(letter_obj.char for letter_obj in selected_letters)
-
-
-        if formed_word:
-            if is_valid_word(formed_word):
-                score += 1
-                message = f"'{formed_word}' is correct! +3 points"
-                # --- LEVEL UPDATE & LOGGING SNIPPET ---
-                # (Assumes USER_ID and GAME_ID_SPELL are defined earlier in the file.)
-                if USER_ID != 0:
-                    try:
-                        levels.update_player_progress(USER_ID, GAME_ID_SPELL, additional_points=5)
-                    except Exception as e:
-                        print("Level update error:", e)
-                    logs.log_event(USER_ID, "score", f"Score incremented to {score}")
-                else:
-                    logs.log_event(0, "score", f"Guest score incremented to {score}")
-                # --- END LEVEL UPDATE & LOGGING SNIPPET ---
-
-                letters = generate_letters()
-                hint_timer = 0
-                hint_index = 0
-                for letter in letters:
-                    letter.draw_hint = False # Reset hints for the new word
-            elif len(formed_word) == len(current_word): # Only show incorrect message if word length matches
-                message = f"'{formed_word}' is not the word. Try again!"
-                for letter in selected_letters:
-                    letter.reset_position()
-                lives -= 1
-                if lives <= 0:
-                    game_state = "game_over"
-            message_timer = pygame.time.get_ticks()
-            hint_timer = 0 # Reset hint timer on any word attempt
-
-        elif not formed_word:
-            message = "" # Clear the message when no word is formed
-
-        if message and pygame.time.get_ticks() - message_timer < 3000:
-            msg_surface = font_small.render(message, True, THEME_TEXT)
-            screen.blit(msg_surface, (300, 520))
-
-        # Hint System
-        if game_state == "game" and not formed_word and pygame.time.get_ticks() - (loading_start_time if game_state == "loading" else pygame.time.get_ticks() - hint_timer) > hint_interval:
-            letters_in_target = [letter for letter in letters if TARGET_RECT.colliderect(letter.rect)]
-            correctly_placed = []
-            for i, letter in enumerate(letters_in_target):
-                if i < len(current_word) and letter.char.upper() == current_word[i].upper() and not letter.draw_hint:
-                    correctly_placed.append(letter)
-
-            # Find the first correctly placed letter that hasn't been hinted yet
-            hinted = False
-            for i in range(len(current_word)):
-                for letter in letters_in_target:
-                    index_in_target = letters_in_target.index(letter)
-                    if index_in_target == i and letter.char.upper() == current_word[i].upper() and not letter.draw_hint and not hinted:
-                        letter.draw_hint = True
-                        hinted = True
-                        break
-                if hinted:
-                    break
-            hint_timer = pygame.time.get_ticks() # Reset the hint timer
+    # Draw target zone for word formation.
+    pygame.draw.rect(screen, TARGET_BG, TARGET_RECT) # Fill the target area
+    pygame.draw.rect(screen, THEME_TEXT, TARGET_RECT, 3) # Draw the border
+    instruction = font_small.render("Form the word below", True, THEME_TEXT)
+    screen.blit(instruction, (TARGET_RECT.x, TARGET_RECT.y - 40))
 
-        # Reset hint if a new word is generated
-        if not letters: # Check if the letters list is empty (new word generated)
-            for letter in letters:
-                letter.draw_hint = False
-            hint_index = 0
-            hint_timer = 0
+    # Draw letters.
+    for letter_obj in letters:
+        letter_obj.draw(screen)
+
+    # Display score and lives.
+    score_text = font_small.render(f"Score: {score}", True, THEME_TEXT)
+    screen.blit(score_text, (20, 20))
+    if heart_img:
+        draw_lives(screen, lives, (20, 70))
 
+    if message and pygame.time.get_ticks() - message_timer < 3000:
+        msg_surface = font_small.render(message, True, THEME_TEXT)
+        screen.blit(msg_surface, (300, 520))
 
-    pygame.display.update()
-    clock.tick(30)
\ No newline at end of file
+
+# --------------------- Main Loop ---------------------
+loop = GameLoop({
+    "loading": GameState(update=loading_update, render=render_loading),
+    "main_menu": GameState(handle_event=main_menu_event, render=render_main_menu),
+    "paused": GameState(handle_event=paused_event, render=render_paused),
+    "game_over": GameState(handle_event=game_over_event, render=render_game_over),
+    "game": GameState(handle_event=game_event, poll=game_poll, update=game_update, render=render_game),
+}, "loading")
+loop.run()
+
+camera.close_camera(cap)
+pygame.quit()
@@ -0,0 +1,187 @@
+import os
+import mmap
+import time
+import hashlib
+import pygame
+from services import utils, telemetry, jsonstore
+
+# -------------------- Configuration --------------------
+ASSET_DIR = os.path.join(os.getcwd(), "assets")
+ASSET_CACHE_DIR = os.path.join(utils.CACHE_DIR, "assets")
+ASSET_INDEX_PATH = os.path.join(ASSET_CACHE_DIR, "index.json")
+DISPLAY_SIZE = (1280, 720)
+
+# Images the games load at startup: (path under assets/, target size, per-pixel alpha, scale).
+BUILD_LIST = [
+    ("background/food.jpg", DISPLAY_SIZE, False, None),
+    ("background/color_smash.png", DISPLAY_SIZE, False, None),
+    ("background/spell_drop.png", DISPLAY_SIZE, False, None),
+    ("background/number_dash.jpeg", DISPLAY_SIZE, False, None),
+    ("background/word_builder.png", DISPLAY_SIZE, False, None),
+    ("background/maths.png", DISPLAY_SIZE, False, None),
+    ("background/odd_one_out.png", DISPLAY_SIZE, False, None),
+    ("heart.png", None, True, None),
+    ("heart.png", (50, 50), True, None),
+    ("heart.png", None, True, 0.12),
+]
+# Folders whose images are all loaded as sprites at their own size.
+BUILD_FOLDERS = [
+    os.path.join("edible", "objects", "eatable"),
+    os.path.join("edible", "objects", "noneatable"),
+]
+
+# Source path -> {"mtime", "bytes", "sha1", "width", "height"}, loaded on first use.
+_index = None
+
+
+def asset_path(*parts):
+    """Return the absolute path of a file under the assets folder."""
+    return os.path.join(ASSET_DIR, *parts)
+
+
+def _load_index():
+    global _index
+    _index = jsonstore.load(ASSET_INDEX_PATH, {})
+
+
+def _source_info(path):
+    """
+    Return the index entry for a source image. The file is only hashed again when its
+    modification time or size changed, so a warm start does not read the source at all.
+    """
+    if _index is None:
+        _load_index()
+    stat = os.stat(path)
+    entry = _index.get(path)
+    if entry and entry["mtime"] == stat.st_mtime and entry["bytes"] == stat.st_size:
+        return entry
+    with open(path, "rb") as f:
+        sha1 = hashlib.sha1(f.read()).hexdigest()
+    entry = {"mtime": stat.st_mtime, "bytes": stat.st_size, "sha1": sha1, "width": None, "height": None}
+    _index[path] = entry
+    return entry
+
+
+def _target_size(entry, size, scale):
+    if size is not None:
+        return tuple(size)
+    if scale is not None:
+        return int(entry["width"] * scale), int(entry["height"] * scale)
+    return entry["width"], entry["height"]
+
+
+def _cache_path(sha1, size, alpha):
+    pixel_format = "RGBA" if alpha else "RGB"
+    return os.path.join(ASSET_CACHE_DIR, f"{sha1}_{size[0]}x{size[1]}_{pixel_format}.raw")
+
+
+def _build(path, entry, size, alpha, scale):
+    """Decode and scale a source image, store its raw pixels and return the surface."""
+    image = pygame.image.load(path)
+    entry["width"], entry["height"] = image.get_size()
+    target = _target_size(entry, size, scale)
+    if target != image.get_size():
+        image = pygame.transform.scale(image, target)
+    pixel_format = "RGBA" if alpha else "RGB"
+    pixels = pygame.image.tobytes(image, pixel_format)
+    utils.atomic_save(_cache_path(entry["sha1"], target, alpha), lambda tmp: _write_bytes(tmp, pixels))
+    _save_entry(path, entry)
+    return image
+
+
+def _save_entry(path, entry):
+    """Add one entry to the on-disk index, keeping entries other game processes wrote meanwhile."""
+    def merge(index):
+        index = index if isinstance(index, dict) else {}
+        index[path] = entry
+        return index
+    _index.update(jsonstore.update(ASSET_INDEX_PATH, merge, default={}))
+
+
+def _write_bytes(path, data):
+    with open(path, "wb") as f:
+        f.write(data)
+
+
+def _display_ready(surface, alpha):
+    """Convert to the display's pixel format when a display exists (the surface is copied)."""
+    if pygame.display.get_surface() is None:
+        return surface.copy()
+    return surface.convert_alpha() if alpha else surface.convert()
+
+
+def _read_cached(cache_path, size, alpha):
+    """Memory-map raw pixels and turn them into a display-ready surface."""
+    with open(cache_path, "rb") as f:
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as pixels:
+            raw = pygame.image.frombuffer(pixels, size, "RGBA" if alpha else "RGB")
+            surface = _display_ready(raw, alpha)
+            # The surface borrows the mapping; drop it before the mapping is closed.
+            del raw
+    return surface
+
+
+def load_image(path, size=None, alpha=False, scale=None):
+    """
+    Load an image as a display-ready surface, decoding and scaling it only once.
+    path is absolute or relative to the assets folder; size is the target (width, height)
+    and scale a factor of the source size. The result is cached as raw pixels keyed by
+    the source's hash and target size, so later loads are a memory-mapped copy.
+    """
+    path = os.path.abspath(path if os.path.isabs(path) else asset_path(path))
+    with telemetry.stage("assets"):
+        entry = _source_info(path)
+        if entry["width"] is not None:
+            target = _target_size(entry, size, scale)
+            cache_path = _cache_path(entry["sha1"], target, alpha)
+            if os.path.exists(cache_path) and os.path.getsize(cache_path) == target[0] * target[1] * (4 if alpha else 3):
+                try:
+                    return _read_cached(cache_path, target, alpha)
+                except (OSError, ValueError, pygame.error) as e:
+                    print(f"Error reading cached asset {cache_path}: {e}. Rebuilding it.")
+        return _display_ready(_build(path, entry, size, alpha, scale), alpha)
+
+
+def load_folder(folder, alpha=True):
+    """Load every image in a folder (relative to assets/) as a list of sprites."""
+    folder_path = folder if os.path.isabs(folder) else asset_path(folder)
+    images = []
+    for file in sorted(os.listdir(folder_path)):
+        try:
+            images.append(load_image(os.path.join(folder_path, file), alpha=alpha))
+        except (OSError, pygame.error) as e:
+            print("Error loading image:", os.path.join(folder_path, file), e)
+    return images
+
+
+# -------------------- Build Step --------------------
+def build_cache():
+    """Prebuild the cache for every image in BUILD_LIST and BUILD_FOLDERS."""
+    built = 0
+    for path, size, alpha, scale in BUILD_LIST:
+        load_image(path, size=size, alpha=alpha, scale=scale)
+        built += 1
+    for folder in BUILD_FOLDERS:
+        built += len(load_folder(folder))
+    print(f"Asset cache ready: {built} images in {ASSET_CACHE_DIR}")
+
+
+def benchmark():
+    """Compare decoding and scaling every startup image with loading it from the cache."""
+    start = time.perf_counter()
+    for path, size, alpha, scale in BUILD_LIST:
+        image = pygame.image.load(asset_path(path))
+        target = size or (int(image.get_width() * (scale or 1)), int(image.get_height() * (scale or 1)))
+        pygame.transform.scale(image, target)
+    decode_ms = (time.perf_counter() - start) * 1000
+    build_cache()
+    start = time.perf_counter()
+    for path, size, alpha, scale in BUILD_LIST:
+        load_image(path, size=size, alpha=alpha, scale=scale)
+    cached_ms = (time.perf_counter() - start) * 1000
+    print(f"decode + scale: {decode_ms:8.1f} ms")
+    print(f"asset cache:    {cached_ms:8.1f} ms")
+
+
+if __name__ == "__main__":
+    benchmark()
@@ -0,0 +1,121 @@
+import sys
+import time
+import math
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from services import utils
+
+# -------------------- Configuration --------------------
+# How long one hash or check should take on this machine. The bcrypt work factor is calibrated
+# to it once and stored as "bcrypt_rounds" in config/settings.json.
+TARGET_MS = 250
+# Work factors allowed whatever the calibration says (each one more doubles the cost).
+MIN_ROUNDS = 10
+MAX_ROUNDS = 16
+# Work factor timed during calibration; cheap enough to run before the first hash.
+CALIBRATION_ROUNDS = 8
+SETTING = "bcrypt_rounds"
+# bcrypt releases the GIL, so hashing on these threads leaves the Flet handlers free.
+HASH_THREADS = 2
+
+_pool = ThreadPoolExecutor(max_workers=HASH_THREADS, thread_name_prefix="auth")
+_rounds = {"value": None}
+_rounds_lock = threading.Lock()
+
+
+# -------------------- Work Factor --------------------
+def calibrate(target_ms=TARGET_MS):
+    """
+    Return the largest work factor whose hash takes at most `target_ms` here (within MIN_ROUNDS
+    and MAX_ROUNDS), estimated from the fastest of three hashes at CALIBRATION_ROUNDS.
+    """
+    import bcrypt  # not needed to draw the landing view (see startup.DEFERRED_MODULES)
+    salt = bcrypt.gensalt(CALIBRATION_ROUNDS)
+    timings = []
+    for _ in range(3):
+        started = time.perf_counter()
+        bcrypt.hashpw(b"calibration", salt)
+        timings.append((time.perf_counter() - started) * 1000)
+    rounds = CALIBRATION_ROUNDS + math.floor(math.log2(target_ms / min(timings)))
+    return max(MIN_ROUNDS, min(MAX_ROUNDS, rounds))
+
+
+def work_factor():
+    """The work factor new hashes use: the stored setting, calibrated and saved the first time."""
+    with _rounds_lock:
+        if _rounds["value"] is None:
+            rounds = utils.load_setting(SETTING)
+            if not isinstance(rounds, int):
+                rounds = calibrate()
+                utils.save_setting(SETTING, rounds)
+                print(f"Password hashing calibrated to {rounds} rounds (target {TARGET_MS} ms).")
+            _rounds["value"] = rounds
+        return _rounds["value"]
+
+
+def needs_rehash(hashed):
+    """True if `hashed` was made with a lower work factor than the current one."""
+    try:
+        return int(hashed.split("$")[2]) < work_factor()
+    except (AttributeError, IndexError, ValueError):
+        return False
+
+
+# -------------------- Hashing --------------------
+def hash_password(password):
+    """Hash a password with bcrypt at the current work factor. Blocks; call from a worker."""
+    import bcrypt
+    return bcrypt.hashpw(password.encode("utf-8"), bcrypt.gensalt(work_factor())).decode("utf-8")
+
+
+def check_password(password, hashed):
+    """True if `password` matches the bcrypt hash `hashed`. Blocks; call from a worker."""
+    import bcrypt
+    if not hashed:
+        return False
+    try:
+        return bcrypt.checkpw(password.encode("utf-8"), hashed.encode("utf-8"))
+    except ValueError:
+        # Not a bcrypt hash (e.g. a player account without a password).
+        return False
+
+
+def _submit(name, work, done, failed):
+    def run():
+        try:
+            result = work()
+        except Exception as e:
+            print(f"Error {name}: {e}")
+            result = failed
+        try:
+            done(result)
+        except Exception as e:
+            print(f"Error after {name}: {e}")
+
+    return _pool.submit(run)
+
+
+def hash_async(password, done):
+    """Hash `password` on a worker thread and call `done(hashed)` there (None on error)."""
+    return _submit("hashing password", lambda: hash_password(password), done, None)
+
+
+def check_async(password, hashed, done):
+    """Check `password` against `hashed` on a worker thread and call `done(matches)` there."""
+    return _submit("checking password", lambda: check_password(password, hashed), done, False)
+
+
+# -------------------- Benchmark --------------------
+def benchmark(target_ms=TARGET_MS):
+    """Print the hash time of each work factor around the calibrated one."""
+    import bcrypt
+    rounds = calibrate(target_ms)
+    print(f"Calibrated for {target_ms} ms: {rounds} rounds")
+    for candidate in range(max(4, rounds - 2), min(MAX_ROUNDS, rounds + 1) + 1):
+        started = time.perf_counter()
+        bcrypt.hashpw(b"benchmark", bcrypt.gensalt(candidate))
+        print(f"{candidate:>3} rounds: {(time.perf_counter() - started) * 1000:7.0f} ms")
+
+
+if __name__ == "__main__":
+    benchmark(int(sys.argv[1]) if len(sys.argv) > 1 else TARGET_MS)
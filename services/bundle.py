@@ -0,0 +1,144 @@
+import os
+import sys
+import json
+import time
+import shutil
+import zipfile
+import tempfile
+import py_compile
+import subprocess
+
+# -------------------- Configuration --------------------
+DIST_DIR = os.path.join(os.getcwd(), "dist")
+BUNDLE_PATH = os.path.join(DIST_DIR, "playful_minds.pyz")
+# The launcher script becomes the bundle's __main__; these folders are packed as modules.
+ENTRY_POINT = "main.py"
+PACKAGES = ["services", "games"]
+ASSET_DIR = os.path.join(os.getcwd(), "assets")
+# File inside the bundle listing the assets the app was built with.
+ASSET_MANIFEST = "assets.json"
+INTERPRETER = "/usr/bin/env python3"
+
+
+def bundle_path():
+    """Return the .pyz this code is running from, or None when running from the source tree."""
+    return getattr(__loader__, "archive", None)
+
+
+# -------------------- Build --------------------
+def _compiled(source_path, name, build_dir):
+    """
+    Compile a source file to bytecode that never checks its source, so importing it from
+    the bundle is a single read. `name` is the path shown in tracebacks.
+    """
+    pyc_path = os.path.join(build_dir, name + "c")
+    os.makedirs(os.path.dirname(pyc_path), exist_ok=True)
+    py_compile.compile(source_path, cfile=pyc_path, dfile=name, doraise=True,
+                       invalidation_mode=py_compile.PycInvalidationMode.UNCHECKED_HASH)
+    return pyc_path
+
+
+def _asset_manifest():
+    """List every file under assets/ with its size."""
+    manifest = []
+    for root, _, files in os.walk(ASSET_DIR):
+        for file in sorted(files):
+            path = os.path.join(root, file)
+            manifest.append({"path": os.path.relpath(path, os.getcwd()).replace(os.sep, "/"),
+                             "bytes": os.path.getsize(path)})
+    return sorted(manifest, key=lambda entry: entry["path"])
+
+
+def build(output=BUNDLE_PATH):
+    """
+    Write a zipapp with precompiled bytecode for main.py and every module in PACKAGES,
+    plus the frozen asset list. Run it from the app folder: `python dist/playful_minds.pyz`.
+    Assets, config and the database stay on disk next to it.
+    """
+    build_dir = tempfile.mkdtemp(prefix="playful_minds_build_")
+    try:
+        entries = [(_compiled(ENTRY_POINT, "__main__.py", build_dir), "__main__.pyc")]
+        for package in PACKAGES:
+            files = sorted(file for file in os.listdir(package) if file.endswith(".py"))
+            if "__init__.py" not in files:
+                # zipimport does not find namespace packages, so the bundle gets an empty __init__.
+                init_path = os.path.join(build_dir, package, "__init__.py")
+                os.makedirs(os.path.dirname(init_path), exist_ok=True)
+                open(init_path, "w").close()
+                entries.append((_compiled(init_path, f"{package}/__init__.py", build_dir), f"{package}/__init__.pyc"))
+            for file in files:
+                name = f"{package}/{file}"
+                entries.append((_compiled(os.path.join(package, file), name, build_dir), name + "c"))
+        manifest = _asset_manifest()
+
+        os.makedirs(os.path.dirname(output), exist_ok=True)
+        tmp_output = output + ".tmp"
+        with open(tmp_output, "wb") as f:
+            f.write(f"#!{INTERPRETER}\n".encode("utf-8"))
+            # Bytecode is stored uncompressed so imports do not pay for inflating it.
+            with zipfile.ZipFile(f, "w", compression=zipfile.ZIP_STORED) as bundle:
+                for path, arcname in entries:
+                    bundle.write(path, arcname)
+                bundle.writestr(ASSET_MANIFEST, json.dumps(manifest, indent=4))
+        os.chmod(tmp_output, 0o755)
+        os.replace(tmp_output, output)
+        print(f"Bundle written: {output} ({len(entries)} modules, {len(manifest)} assets)")
+    finally:
+        shutil.rmtree(build_dir, ignore_errors=True)
+    return output
+
+
+# -------------------- Running From a Bundle --------------------
+def frozen_assets():
+    """Return the asset list the running bundle was built with (empty from the source tree)."""
+    archive = bundle_path()
+    if archive is None:
+        return []
+    with zipfile.ZipFile(archive) as bundle:
+        return json.loads(bundle.read(ASSET_MANIFEST))
+
+
+def check_assets():
+    """Report assets the bundle was built with that are missing from the app folder."""
+    missing = [entry["path"] for entry in frozen_assets() if not os.path.exists(entry["path"])]
+    for path in missing:
+        print(f"Error: bundled asset missing from the app folder: {path}")
+    return missing
+
+
+# -------------------- Benchmark --------------------
+def _cold_start_ms(env, cwd, runs):
+    """Median wall time of a fresh interpreter importing the launcher and the game loop."""
+    from services import startup
+    code = "".join(f"import {name}\n" for name in startup.LAUNCHER_MODULES + ["games.gameloop"])
+    timings = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        subprocess.run([sys.executable, "-c", code], env=env, cwd=cwd, check=True)
+        timings.append((time.perf_counter() - start) * 1000)
+    return sorted(timings)[len(timings) // 2]
+
+
+def benchmark(runs=5):
+    """Compare starting from the source tree (without and with __pycache__) and from the bundle."""
+    build()
+    source_dir = os.getcwd()
+    env = dict(os.environ, PYGAME_HIDE_SUPPORT_PROMPT="1")
+    with tempfile.TemporaryDirectory() as empty:
+        # An empty bytecode cache makes every app module compile again, like a fresh checkout.
+        cold_env = dict(env, PYTHONPYCACHEPREFIX=empty, PYTHONDONTWRITEBYTECODE="1")
+        source_cold = _cold_start_ms(cold_env, source_dir, runs)
+        source_cached = _cold_start_ms(env, source_dir, runs)
+        # Run the bundle from a folder without the sources so nothing is imported from them.
+        bundle_env = dict(env, PYTHONPATH=BUNDLE_PATH)
+        bundled = _cold_start_ms(bundle_env, empty, runs)
+    print(f"source, no bytecode cache: {source_cold:8.1f} ms")
+    print(f"source, __pycache__:       {source_cached:8.1f} ms")
+    print(f"bundle:                    {bundled:8.1f} ms")
+
+
+if __name__ == "__main__":
+    if "--benchmark" in sys.argv:
+        benchmark()
+    else:
+        build()
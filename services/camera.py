@@ -0,0 +1,79 @@
+import os
+import time
+import cv2
+from services import utils
+
+# -------------------- Configuration --------------------
+# Held by the game that owns the camera; the next game waits for it instead of
+# failing to read from a device that is still open.
+CAMERA_LOCK_PATH = os.path.join(utils.CACHE_DIR, "camera.lock")
+# How long a game waits for the previous one to release the camera.
+HANDOFF_TIMEOUT = 5.0
+LOCK_POLL_INTERVAL = 0.05
+
+# The open lock file while this process owns the camera.
+_lock_file = None
+
+
+def _try_lock(f):
+    try:
+        if os.name == "nt":
+            import msvcrt
+            msvcrt.locking(f.fileno(), msvcrt.LK_NBLCK, 1)
+        else:
+            import fcntl
+            fcntl.flock(f.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+        return True
+    except OSError:
+        return False
+
+
+def acquire(timeout=HANDOFF_TIMEOUT):
+    """
+    Wait until no other game holds the camera, then hold it for this process.
+    The lock goes away with the process, so a game that crashes cannot keep it.
+    Returns False if the camera was still taken after `timeout` seconds.
+    """
+    global _lock_file
+    if _lock_file is not None:
+        return True
+    os.makedirs(os.path.dirname(CAMERA_LOCK_PATH), exist_ok=True)
+    f = open(CAMERA_LOCK_PATH, "a+")
+    deadline = time.monotonic() + timeout
+    while not _try_lock(f):
+        if time.monotonic() >= deadline:
+            f.close()
+            print(f"Error acquiring camera: still in use after {timeout:.0f} s")
+            return False
+        time.sleep(LOCK_POLL_INTERVAL)
+    _lock_file = f
+    return True
+
+
+def release():
+    """Let the next game take the camera."""
+    global _lock_file
+    if _lock_file is not None:
+        _lock_file.close()
+        _lock_file = None
+
+
+def open_camera(index=0, width=None, height=None, timeout=HANDOFF_TIMEOUT):
+    """
+    Open a camera once the previous game has handed it over and set its frame size.
+    If the handoff times out the camera is opened anyway, as before.
+    """
+    acquire(timeout)
+    cap = cv2.VideoCapture(index)
+    if width is not None:
+        cap.set(3, width)
+    if height is not None:
+        cap.set(4, height)
+    return cap
+
+
+def close_camera(cap):
+    """Release the capture device and the camera lock."""
+    if cap is not None and cap.isOpened():
+        cap.release()
+    release()
@@ -0,0 +1,220 @@
+import os
+import sys
+import time
+import hashlib
+import threading
+from services import db, utils, jsonstore
+
+# -------------------- Configuration --------------------
+LOGO_DIR = os.path.join(os.getcwd(), "assets", "logos")
+THUMBNAIL_DIR = os.path.join(utils.CACHE_DIR, "thumbnails")
+THUMBNAIL_INDEX_PATH = os.path.join(THUMBNAIL_DIR, "index.json")
+# Thumbnails fit inside a square of each size. The game lists show 100 px tiles; the
+# "thumbnail_size" setting picks 200 for high-density screens.
+THUMBNAIL_SIZES = [100, 200]
+DEFAULT_THUMBNAIL_SIZE = 100
+
+# The games of the launcher. game_id is the id each game records its sessions and levels under.
+GAMES = [
+    {
+        "game_id": "EdibleGame",
+        "title": "Edible Game",
+        "file": "edible.py",
+        "description": "Bite edible items while avoiding non-edible ones.",
+        "image": os.path.join(LOGO_DIR, "edible_game.png")
+    },
+    {
+        "game_id": "ColorCatcherGame",
+        "title": "Color Smash",
+        "file": "color_smash.py",
+        "description": "Match colors in a fun, fast-paced game.",
+        "image": os.path.join(LOGO_DIR, "color_smash.png")
+    },
+    {
+        "game_id": "NumberDash",
+        "title": "Number Dash",
+        "file": "number_dash.py",
+        "description": "Run through numbers in a challenging dash.",
+        "image": os.path.join(LOGO_DIR, "number_dash.png")
+    },
+    {
+        "game_id": "OddOneOut",
+        "title": "Odd One Out",
+        "file": "odd_one_out.py",
+        "description": "Identify the odd item among similar ones.",
+        "image": os.path.join(LOGO_DIR, "odd_one_out.png")
+    },
+    {
+        "game_id": "ShapeSorter",
+        "title": "Shape Sorter",
+        "file": "shape-sorter.py",
+        "description": "Sort shapes to boost your visual skills.",
+        "image": os.path.join(LOGO_DIR, "shape_sorter.png")
+    },
+    {
+        "game_id": "SpellDrop",
+        "title": "Spell Drop",
+        "file": "spell_drop.py",
+        "description": "Drop letters to form words correctly.",
+        "image": os.path.join(LOGO_DIR, "spell_drop.png")
+    },
+    {
+        "game_id": "MathQuest",
+        "title": "Maths Quest",
+        "file": "math_quest.py",
+        "description": "Embark on a Maths Quest where you solve challenging maths problems.",
+        "image": os.path.join(LOGO_DIR, "math_quest.png")
+    },
+    {
+        "game_id": "WordBuilder",
+        "title": "Word Builder",
+        "file": "word_builder.py",
+        "description": "Construct words from jumbled letters.",
+        "image": os.path.join(LOGO_DIR, "word_builder.png")
+    },
+]
+
+# (source image, size) -> thumbnail path, or None when the game has no usable logo.
+_thumbnails = {}
+# Source path -> {"mtime", "bytes", "sha1"}, loaded on first use.
+_index = None
+_display_size = {"value": None}
+_lock = threading.Lock()
+
+
+# -------------------- Game List --------------------
+def games():
+    """The game list shared by the launchers and the dashboard."""
+    return GAMES
+
+
+def sync_games_table():
+    """Write GAMES to the games table, only when it differs from what is stored."""
+    stored = sorted((game["game_id"], game["title"], game["file"], game["description"]) for game in db.load_games())
+    wanted = sorted((game["game_id"], game["title"], game["file"], game["description"]) for game in GAMES)
+    if stored != wanted:
+        db.save_games(GAMES)
+
+
+# -------------------- Thumbnails --------------------
+def _source_sha1(path):
+    """
+    Hash of a source image. The file is only read again when its modification time or size
+    changed, so a warm start does not read any logo.
+    """
+    global _index
+    if _index is None:
+        _index = jsonstore.load(THUMBNAIL_INDEX_PATH, {})
+    stat = os.stat(path)
+    entry = _index.get(path)
+    if entry and entry["mtime"] == stat.st_mtime and entry["bytes"] == stat.st_size:
+        return entry["sha1"]
+    with open(path, "rb") as f:
+        sha1 = hashlib.sha1(f.read()).hexdigest()
+    entry = _index[path] = {"mtime": stat.st_mtime, "bytes": stat.st_size, "sha1": sha1}
+
+    def merge(index):
+        index = index if isinstance(index, dict) else {}
+        index[path] = entry
+        return index
+    jsonstore.update(THUMBNAIL_INDEX_PATH, merge, default={})
+    return sha1
+
+
+def _build_thumbnail(source, target, size):
+    """
+    Scale `source` to fit a `size` square and save it next to `target` (a path without an
+    extension): as a JPEG when the logo is opaque, which is a fraction of the size of the
+    same pixels as a PNG, and as a PNG when it has transparency. Returns the saved path.
+    """
+    import pygame  # only needed the first time a logo is seen
+    image = pygame.image.load(source)
+    opaque = not image.get_flags() & pygame.SRCALPHA and image.get_colorkey() is None
+    # smoothscale needs 24 or 32-bit pixels; most logos are 8-bit palette PNGs.
+    pixels = pygame.Surface(image.get_size(), 0, 24) if opaque else pygame.Surface(image.get_size(), pygame.SRCALPHA, 32)
+    pixels.blit(image, (0, 0))
+    scale = min(size / image.get_width(), size / image.get_height(), 1)
+    scaled = pygame.transform.smoothscale(
+        pixels, (max(1, round(image.get_width() * scale)), max(1, round(image.get_height() * scale))))
+    path = target + (".jpg" if opaque else ".png")
+    utils.atomic_save(path, lambda tmp: pygame.image.save(scaled, tmp))
+    return path
+
+
+def display_size():
+    """Thumbnail size the game lists show: the "thumbnail_size" setting, read once."""
+    if _display_size["value"] is None:
+        _display_size["value"] = utils.load_setting("thumbnail_size", DEFAULT_THUMBNAIL_SIZE)
+    return _display_size["value"]
+
+
+def thumbnail(game, size=None):
+    """
+    Path of the thumbnail of a game's logo, fitting a `size` square (display_size() by
+    default), or None without a logo. Thumbnails are stored under cache/ keyed by
+    the logo's hash and size, so they are only made once; after the first call for a game
+    the answer comes from memory.
+    """
+    size = size or display_size()
+    key = (game.get("image"), size)
+    if key in _thumbnails:
+        return _thumbnails[key]
+    with _lock:
+        if key not in _thumbnails:
+            _thumbnails[key] = _find_thumbnail(game.get("image"), size)
+    return _thumbnails[key]
+
+
+def _find_thumbnail(source, size):
+    if not source or not os.path.exists(source):
+        return None
+    try:
+        target = os.path.join(THUMBNAIL_DIR, f"{_source_sha1(source)}_{size}")
+        for path in (target + ".jpg", target + ".png"):
+            if os.path.exists(path):
+                return path
+        path = _build_thumbnail(source, target, size)
+        return path if os.path.exists(path) else source
+    except Exception as e:
+        print(f"Error making thumbnail for {source}: {e}")
+        return source
+
+
+def prepare():
+    """Sync the games table and have every thumbnail ready in memory."""
+    sync_games_table()
+    for game in GAMES:
+        for size in set(THUMBNAIL_SIZES + [display_size()]):
+            thumbnail(game, size)
+
+
+def prepare_in_background():
+    """Run prepare() on its own thread, so the launcher does not wait for it."""
+    threading.Thread(target=prepare, name="catalog", daemon=True).start()
+
+
+# -------------------- Benchmark --------------------
+def benchmark():
+    """Compare the bytes of the logos with the thumbnails, and a cold with a warm lookup."""
+    started = time.perf_counter()
+    for game in GAMES:
+        for size in THUMBNAIL_SIZES:
+            thumbnail(game, size)
+    first_ms = (time.perf_counter() - started) * 1000
+    started = time.perf_counter()
+    paths = [thumbnail(game, DEFAULT_THUMBNAIL_SIZE) for game in GAMES]
+    warm_ms = (time.perf_counter() - started) * 1000
+    logo_bytes = sum(os.path.getsize(game["image"]) for game in GAMES if os.path.exists(game["image"]))
+    print(f"logos:        {logo_bytes / 1024:8.0f} KiB")
+    for size in THUMBNAIL_SIZES:
+        total = sum(os.path.getsize(thumbnail(game, size)) for game in GAMES if thumbnail(game, size))
+        print(f"{size:>3} px thumbnails: {total / 1024:4.0f} KiB")
+    print(f"first lookup: {first_ms:8.1f} ms (builds missing thumbnails)")
+    print(f"from memory:  {warm_ms:8.3f} ms for {len(paths)} games")
+
+
+if __name__ == "__main__":
+    if "--clear" in sys.argv:
+        import shutil
+        shutil.rmtree(THUMBNAIL_DIR, ignore_errors=True)
+    benchmark()
@@ -0,0 +1,73 @@
+import os
+import json
+from services import levels, utils
+
+# -------------------- Configuration --------------------
+# Set by the launcher for the game process: the session context as compact JSON.
+# Pooled workers receive it over their stdin pipe with the rest of the launch request.
+CONTEXT_ENV = "PLAYFUL_MINDS_CONTEXT"
+GUEST = {"id": 0, "firstName": "Guest", "userName": "Guest", "role": "player", "email": ""}
+# User fields a game may show or store; the password hash never leaves the launcher.
+USER_FIELDS = ["id", "firstName", "lastName", "userName", "role", "email"]
+
+# The context this process was started with, read from CONTEXT_ENV on first use.
+_context = None
+
+
+# -------------------- Launcher Side --------------------
+def new_context(user):
+    """
+    Build the session context for a game launch: the logged-in user, their progress in
+    every game and the current settings (camera index, renderer, ...).
+    Returns the environment the game process needs to read it.
+    """
+    user = {key: user[key] for key in USER_FIELDS if key in user} if user else dict(GUEST)
+    context = {
+        "user": user,
+        "progress": levels.get_all_player_progress(user["id"]),
+        "settings": utils.load_settings(),
+    }
+    return {CONTEXT_ENV: json.dumps(context, separators=(",", ":"))}
+
+
+# -------------------- Game Side --------------------
+def _load():
+    """Return this process's context, or an empty one when the game was not started by the launcher."""
+    global _context
+    if _context is None:
+        _context = {}
+        value = os.environ.get(CONTEXT_ENV)
+        if value:
+            try:
+                _context = json.loads(value)
+            except ValueError as e:
+                print(f"Error reading session context: {e}")
+    return _context
+
+
+def current_user():
+    """Return the user who launched the game, or Guest."""
+    user = _load().get("user")
+    if user is None:
+        print("No current user found; defaulting to Guest.")
+        return dict(GUEST)
+    return user
+
+
+def progress(game_id):
+    """
+    Return the player's { "level": int, "points": int } in a game as it was at launch,
+    or None if they have not played it yet. Read from the database when run on its own.
+    """
+    context = _load()
+    if "progress" in context:
+        return context["progress"].get(game_id)
+    return levels.get_player_progress(context.get("user", GUEST)["id"], game_id)
+
+
+def setting(key, default=None):
+    """Return a setting as it was at launch (from config when run on its own)."""
+    context = _load()
+    if "settings" in context:
+        return context["settings"].get(key, default)
+    return utils.load_setting(key, default)
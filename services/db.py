@@ -15,6 +15,48 @@ def _create_connection():
         print(f"Error connecting to database: {e}")
     return conn
 
+def _create_read_connection():
+    """
+    Open the database read-only, for the admin dashboard's background queries: they never
+    take a write lock, so they can run side by side with each other and with the games.
+    """
+    conn = None
+    try:
+        conn = sqlite3.connect(f"file:{DB_FILE}?mode=ro", uri=True)
+        return conn
+    except Exception as e:
+        print(f"Error connecting to database: {e}")
+    return conn
+
+# -------------------- Change Counters --------------------
+# Datasets with a change counter; cached dashboard snapshots compare them to see what changed.
+DATASETS = ["users", "sessions", "progress", "logs"]
+
+def bump_version(cursor, *datasets):
+    """Count a change to `datasets`, in the caller's transaction (commit as usual)."""
+    try:
+        cursor.executemany("""
+            INSERT INTO DataVersion (dataset, version) VALUES (?, 1)
+            ON CONFLICT(dataset) DO UPDATE SET version = version + 1
+        """, [(dataset,) for dataset in datasets])
+    except sqlite3.Error as e:
+        print(f"Error updating change counters: {e}")
+
+def get_data_versions():
+    """Return the change counter of every dataset: {dataset: version}."""
+    versions = dict.fromkeys(DATASETS, 0)
+    conn = _create_read_connection()
+    if conn is not None:
+        try:
+            cursor = conn.cursor()
+            cursor.execute("SELECT dataset, version FROM DataVersion")
+            versions.update(cursor.fetchall())
+        except Exception as e:
+            print(f"Error reading change counters: {e}")
+        finally:
+            conn.close()
+    return versions
+
 def initialize_database():
     """Initialize the database with the necessary tables."""
     conn = _create_connection()
@@ -34,6 +76,8 @@ def initialize_database():
                     creationDate TEXT NOT NULL
                 )
             """)
+            # admin_exists() and the role filters of the dashboard look accounts up by role
+            cursor.execute("CREATE INDEX IF NOT EXISTS idx_users_role ON users (lower(role))")
             # Create highscores table
             cursor.execute("""
                 CREATE TABLE IF NOT EXISTS highscores (
@@ -43,6 +87,11 @@ def initialize_database():
                     FOREIGN KEY (game_id) REFERENCES games(game_id)
                 )
             """)
+            # Top-N reads and the qualification check for a game walk this index (services/highscores.py)
+            cursor.execute("""
+                CREATE INDEX IF NOT EXISTS idx_highscores_game_score
+                ON highscores (game_id, score DESC)
+            """)
             # Create games table
             cursor.execute("""
                 CREATE TABLE IF NOT EXISTS games (
@@ -65,6 +114,34 @@ def initialize_database():
                     FOREIGN KEY (user_id) REFERENCES users(id)
                 )
             """)
+            # Create LaunchTelemetry table (per-launch stage timings, from tile click to the first camera frame)
+            cursor.execute("""
+                CREATE TABLE IF NOT EXISTS LaunchTelemetry (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    launch_id TEXT NOT NULL,
+                    game_id TEXT NOT NULL,
+                    stage TEXT NOT NULL,
+                    offset_ms REAL NOT NULL,
+                    duration_ms REAL NOT NULL,
+                    recorded_at TEXT NOT NULL
+                )
+            """)
+            # Create ScoreHistogram table (per-game final score counts, see services/leaderboard.py)
+            cursor.execute("""
+                CREATE TABLE IF NOT EXISTS ScoreHistogram (
+                    game_id TEXT NOT NULL,
+                    bucket INTEGER NOT NULL,
+                    count INTEGER NOT NULL DEFAULT 0,
+                    PRIMARY KEY (game_id, bucket)
+                )
+            """)
+            # Create DataVersion table (change counters bumped by every write, see services/snapshots.py)
+            cursor.execute("""
+                CREATE TABLE IF NOT EXISTS DataVersion (
+                    dataset TEXT PRIMARY KEY,
+                    version INTEGER NOT NULL DEFAULT 0
+                )
+            """)
             # Create UserSessions table (for login sessions)
             cursor.execute("""
                 CREATE TABLE IF NOT EXISTS UserSessions (
@@ -140,6 +217,10 @@ def load_user_by_username(userName):
         finally:
             conn.close()
 
+def admin_exists():
+    """True if there is at least one admin account; stops at the first one it finds."""
+    return bool(_scalar("SELECT EXISTS (SELECT 1 FROM users WHERE lower(role) = 'admin')"))
+
 def save_user(firstName, lastName, userName, role, password, email, creationDate):
     """Save a new user to the database using the improved data model."""
     conn = _create_connection()
@@ -150,6 +231,7 @@ def save_user(firstName, lastName, userName, role, password, email, creationDate
                 INSERT INTO users (firstName, lastName, userName, role, password, email, creationDate)
                 VALUES (?, ?, ?, ?, ?, ?, ?)
             """, (firstName, lastName, userName, role, password, email, creationDate))
+            bump_version(cursor, "users")
             conn.commit()
             print("User saved successfully.")
         except Exception as e:
@@ -185,37 +267,80 @@ def load_accounts():
             conn.close()
     return accounts
 
+# Columns of an account besides userName, in users-table order, with the value a new account gets
+# (email and creationDate are filled in per account).
+ACCOUNT_FIELDS = ["firstName", "lastName", "role", "password", "email", "creationDate"]
+ACCOUNT_DEFAULTS = {"firstName": "", "lastName": "", "role": "player", "password": ""}
+
+def sync_accounts(accounts, remove_missing=True, roles=None):
+    """
+    Bring the users table in line with `accounts` ({userName: details}, as load_accounts returns).
+    Only the difference is written, in one transaction: new and changed accounts with a single
+    executemany UPSERT keyed on userName, and (with `remove_missing`) accounts not listed deleted
+    by id. Existing accounts keep their id, so their sessions, progress and logs stay attached;
+    fields left out of `details` keep their stored value. With `roles`, a listed account whose
+    stored role is not one of them is left as it is and counted as skipped.
+    Returns {"added", "updated", "deleted", "unchanged", "skipped"} counts, or None on error.
+    """
+    conn = _create_connection()
+    if conn is None:
+        return None
+    try:
+        cursor = conn.cursor()
+        cursor.execute(f"SELECT userName, id, {', '.join(ACCOUNT_FIELDS)} FROM users")
+        existing = {row[0]: row[1:] for row in cursor.fetchall()}
+        now = datetime.datetime.now().isoformat()
+        upserts, counts = [], {"added": 0, "updated": 0, "deleted": 0, "unchanged": 0, "skipped": 0}
+        role_index = ACCOUNT_FIELDS.index("role") + 1
+        for userName, details in accounts.items():
+            stored = existing.get(userName)
+            if stored is not None and roles is not None and (stored[role_index] or "").lower() not in roles:
+                counts["skipped"] += 1
+                continue
+            if stored is None:
+                # Emails are unique; a new account without one gets the address players are made with.
+                defaults = dict(ACCOUNT_DEFAULTS, email=f"{userName}@playfulminds.com", creationDate=now)
+                values = tuple(details.get(field, defaults[field]) for field in ACCOUNT_FIELDS)
+                counts["added"] += 1
+            else:
+                values = tuple(details.get(field, old) for field, old in zip(ACCOUNT_FIELDS, stored[1:]))
+                if values == tuple(stored[1:]):
+                    counts["unchanged"] += 1
+                    continue
+                counts["updated"] += 1
+            upserts.append((userName,) + values)
+        removed = [(stored[0],) for userName, stored in existing.items()
+                   if remove_missing and userName not in accounts]
+        counts["deleted"] = len(removed)
+        # Deletes go first so a listed account may take over the email of one being removed.
+        cursor.executemany("DELETE FROM users WHERE id = ?", removed)
+        cursor.executemany(f"""
+            INSERT INTO users (userName, {', '.join(ACCOUNT_FIELDS)}) VALUES (?, ?, ?, ?, ?, ?, ?)
+            ON CONFLICT(userName) DO UPDATE SET
+                {', '.join(f"{field} = excluded.{field}" for field in ACCOUNT_FIELDS)}
+        """, upserts)
+        if upserts or removed:
+            bump_version(cursor, "users")
+        conn.commit()
+        return counts
+    except Exception as e:
+        conn.rollback()
+        print(f"Error syncing accounts: {e}")
+        return None
+    finally:
+        conn.close()
+
 def save_accounts(accounts):
     """
     Save multiple user accounts to the database.
     Expects 'accounts' to be a dictionary with userName as key and a dictionary containing
     firstName, lastName, role, password, email, and creationDate as value.
+    Accounts not in 'accounts' are deleted; the others keep their ids (see sync_accounts).
     """
-    conn = _create_connection()
-    if conn is not None:
-        try:
-            cursor = conn.cursor()
-            # For simplicity, clear existing accounts (not recommended in production)
-            cursor.execute("DELETE FROM users")
-            for userName, details in accounts.items():
-                cursor.execute("""
-                    INSERT INTO users (firstName, lastName, userName, role, password, email, creationDate)
-                    VALUES (?, ?, ?, ?, ?, ?, ?)
-                """, (
-                    details.get("firstName", ""),
-                    details.get("lastName", ""),
-                    userName,
-                    details.get("role", "player"),
-                    details.get("password", ""),
-                    details.get("email", ""),
-                    details.get("creationDate", datetime.datetime.now().isoformat())
-                ))
-            conn.commit()
-            print("Accounts updated successfully.")
-        except Exception as e:
-            print(f"Error saving accounts: {e}")
-        finally:
-            conn.close()
+    counts = sync_accounts(accounts)
+    if counts is not None:
+        print(f"Accounts updated successfully ({counts['added']} added, {counts['updated']} updated, "
+              f"{counts['deleted']} deleted).")
 
 def delete_user(user_id):
     """Delete a user from the database by their user_id."""
@@ -224,6 +349,7 @@ def delete_user(user_id):
         try:
             cursor = conn.cursor()
             cursor.execute("DELETE FROM users WHERE id = ?", (user_id,))
+            bump_version(cursor, "users")
             conn.commit()
             print(f"User with id {user_id} deleted.")
         except Exception as e:
@@ -242,6 +368,7 @@ def update_user(user_id, firstName, lastName, userName, role, email):
                 SET firstName = ?, lastName = ?, userName = ?, role = ?, email = ?
                 WHERE id = ?
             """, (firstName, lastName, userName, role, email, user_id))
+            bump_version(cursor, "users")
             conn.commit()
             print(f"User with id {user_id} updated.")
         except Exception as e:
@@ -249,6 +376,20 @@ def update_user(user_id, firstName, lastName, userName, role, email):
         finally:
             conn.close()
 
+def update_user_password(user_id, password):
+    """Store a new (already hashed) password for a user."""
+    conn = _create_connection()
+    if conn is not None:
+        try:
+            cursor = conn.cursor()
+            cursor.execute("UPDATE users SET password = ? WHERE id = ?", (password, user_id))
+            bump_version(cursor, "users")
+            conn.commit()
+        except Exception as e:
+            print(f"Error updating password: {e}")
+        finally:
+            conn.close()
+
 def get_user_by_id(user_id):
     """Retrieve a user from the database by their user_id."""
     conn = _create_connection()
@@ -276,40 +417,6 @@ def get_user_by_id(user_id):
         finally:
             conn.close()
 
-def load_highscores(game_id):
-    """Load highscores for a specific game from the database."""
-    conn = _create_connection()
-    if conn is not None:
-        try:
-            cursor = conn.cursor()
-            cursor.execute("SELECT name, score FROM highscores WHERE game_id = ?", (game_id,))
-            rows = cursor.fetchall()
-            highscores = [{"name": row[0], "score": row[1]} for row in rows]
-            return highscores
-        except Exception as e:
-            print(f"Error loading highscores: {e}")
-            return []
-        finally:
-            conn.close()
-    return []
-
-def save_highscores(game_id, highscores):
-    """Save highscores for a specific game to the database."""
-    conn = _create_connection()
-    if conn is not None:
-        try:
-            cursor = conn.cursor()
-            cursor.execute("DELETE FROM highscores WHERE game_id = ?", (game_id,))
-            for entry in highscores:
-                cursor.execute("INSERT INTO highscores (game_id, name, score) VALUES (?, ?, ?)",
-                               (game_id, entry["name"], entry["score"]))
-            conn.commit()
-            print("Highscores updated.")
-        except Exception as e:
-            print(f"Error saving highscores: {e}")
-        finally:
-            conn.close()
-
 def load_games():
     """Load game details from the database."""
     conn = _create_connection()
@@ -477,6 +584,7 @@ def update_player_level(user_id, game_id, additional_levels):
                     INSERT INTO PlayerLevels (user_id, game_id, level_count, updated_at)
                     VALUES (?, ?, ?, ?)
                 """, (user_id, game_id, additional_levels, now))
+            bump_version(cursor, "progress")
             conn.commit()
             print(f"Updated player level for user {user_id} in game {game_id} to {new_level}")
         except Exception as e:
@@ -485,5 +593,236 @@ def update_player_level(user_id, game_id, additional_levels):
             conn.close()
     return
 
+# -------------------- Paged Queries for the Admin Dashboard --------------------
+# The dashboard tables show one page at a time (services/widgets.py), so these only ever
+# read the rows on screen.
+def load_users_page(offset, limit, role=None):
+    """
+    Load one page of accounts ordered by id, optionally only those with `role`.
+    Returns a list of user dictionaries without the password hash.
+    """
+    users = []
+    conn = _create_read_connection()
+    if conn is not None:
+        try:
+            cursor = conn.cursor()
+            where, params = ("WHERE lower(role) = ?", (role.lower(),)) if role else ("", ())
+            cursor.execute(f"""
+                SELECT id, firstName, lastName, userName, role, email, creationDate
+                FROM users {where}
+                ORDER BY id
+                LIMIT ? OFFSET ?
+            """, params + (limit, offset))
+            for row in cursor.fetchall():
+                users.append({
+                    "id": row[0],
+                    "firstName": row[1],
+                    "lastName": row[2],
+                    "userName": row[3],
+                    "role": row[4],
+                    "email": row[5],
+                    "creationDate": row[6],
+                })
+        except Exception as e:
+            print(f"Error loading accounts page: {e}")
+        finally:
+            conn.close()
+    return users
+
+def get_player_levels(user_ids):
+    """
+    Cumulative level counts for several players in one query.
+    Returns a dictionary {(user_id, game_id): level_count}.
+    """
+    levels = {}
+    if not user_ids:
+        return levels
+    conn = _create_read_connection()
+    if conn is not None:
+        try:
+            cursor = conn.cursor()
+            placeholders = ", ".join("?" * len(user_ids))
+            cursor.execute(f"""
+                SELECT user_id, game_id, level_count FROM PlayerLevels
+                WHERE user_id IN ({placeholders})
+            """, list(user_ids))
+            for user_id, game_id, level_count in cursor.fetchall():
+                levels[(user_id, game_id)] = level_count
+        except Exception as e:
+            print(f"Error fetching player levels: {e}")
+        finally:
+            conn.close()
+    return levels
+
+def load_game_sessions_page(offset, limit):
+    """Load one page of game sessions, newest first."""
+    sessions = []
+    conn = _create_read_connection()
+    if conn is not None:
+        try:
+            cursor = conn.cursor()
+            cursor.execute("""
+                SELECT session_id, user_id, game_id, start_time, end_time, session_type, level
+                FROM GameSessions
+                ORDER BY session_id DESC
+                LIMIT ? OFFSET ?
+            """, (limit, offset))
+            for row in cursor.fetchall():
+                sessions.append({
+                    "session_id": row[0],
+                    "user_id": row[1],
+                    "game_id": row[2],
+                    "start_time": row[3],
+                    "end_time": row[4],
+                    "session_type": row[5],
+                    "level": row[6]
+                })
+        except Exception as e:
+            print(f"Error loading game sessions page: {e}")
+        finally:
+            conn.close()
+    return sessions
+
+def get_player_progress_page(offset, limit):
+    """Load one page of PlayerProgress rows, ordered by player and game (the UNIQUE index)."""
+    progress_list = []
+    conn = _create_read_connection()
+    if conn is not None:
+        try:
+            cursor = conn.cursor()
+            cursor.execute("""
+                SELECT user_id, game_id, level, points, updated_at
+                FROM PlayerProgress
+                ORDER BY user_id, game_id
+                LIMIT ? OFFSET ?
+            """, (limit, offset))
+            progress_list = [
+                {"user_id": row[0], "game_id": row[1], "level": row[2], "points": row[3], "updated_at": row[4]}
+                for row in cursor.fetchall()
+            ]
+        except Exception as e:
+            print(f"Error loading player progress page: {e}")
+        finally:
+            conn.close()
+    return progress_list
+
+# -------------------- Dashboard Analytics --------------------
+# KPI cards and the Analytics tab of the admin dashboard; each runs as its own background query.
+def _scalar(query, params=(), default=0):
+    conn = _create_read_connection()
+    if conn is not None:
+        try:
+            cursor = conn.cursor()
+            cursor.execute(query, params)
+            row = cursor.fetchone()
+            return row[0] if row and row[0] is not None else default
+        except Exception as e:
+            print(f"Error running dashboard query: {e}")
+        finally:
+            conn.close()
+    return default
+
+def _days_ago(days):
+    return (datetime.datetime.now() - datetime.timedelta(days=days)).isoformat()
+
+def get_active_users_count(days=7):
+    """Number of users who were active in the last `days` days."""
+    return _scalar("SELECT COUNT(DISTINCT user_id) FROM UserSessions WHERE last_active >= ?", (_days_ago(days),))
+
+def get_total_sessions():
+    """Number of game sessions ever started."""
+    return _scalar("SELECT COUNT(*) FROM GameSessions")
+
+def get_avg_session_duration():
+    """Average length of finished game sessions, in minutes."""
+    minutes = _scalar("""
+        SELECT AVG((julianday(end_time) - julianday(start_time)) * 1440)
+        FROM GameSessions
+        WHERE end_time IS NOT NULL
+    """)
+    return round(minutes, 1)
+
+def get_avg_level_gain():
+    """Average level players have reached in the games they play."""
+    return round(_scalar("SELECT AVG(level) FROM PlayerProgress"), 1)
+
+def get_game_play_counts(limit=3, order="desc"):
+    """
+    The most (order="desc") or least (order="asc") played games by session count.
+    Returns a list of {"title": str, "session_count": int}.
+    """
+    direction = "ASC" if order == "asc" else "DESC"
+    counts = []
+    conn = _create_read_connection()
+    if conn is not None:
+        try:
+            cursor = conn.cursor()
+            cursor.execute(f"""
+                SELECT COALESCE(g.title, s.game_id), COUNT(*) AS session_count
+                FROM GameSessions s LEFT JOIN games g ON g.game_id = s.game_id
+                GROUP BY s.game_id
+                ORDER BY session_count {direction}
+                LIMIT ?
+            """, (limit,))
+            counts = [{"title": row[0], "session_count": row[1]} for row in cursor.fetchall()]
+        except Exception as e:
+            print(f"Error loading game play counts: {e}")
+        finally:
+            conn.close()
+    return counts
+
+def get_top_players_by_level(limit=5, days=7):
+    """
+    Players with the highest total level across the games they progressed in during the last
+    `days` days (PlayerProgress keeps no level history, so this stands in for the gain).
+    Returns a list of {"user_id", "username", "level_gain"}.
+    """
+    players = []
+    conn = _create_read_connection()
+    if conn is not None:
+        try:
+            cursor = conn.cursor()
+            cursor.execute("""
+                SELECT p.user_id, COALESCE(u.userName, 'Unknown'), SUM(p.level) AS level_gain
+                FROM PlayerProgress p LEFT JOIN users u ON u.id = p.user_id
+                WHERE p.updated_at >= ?
+                GROUP BY p.user_id
+                ORDER BY level_gain DESC
+                LIMIT ?
+            """, (_days_ago(days), limit))
+            players = [{"user_id": row[0], "username": row[1], "level_gain": row[2]} for row in cursor.fetchall()]
+        except Exception as e:
+            print(f"Error loading top players: {e}")
+        finally:
+            conn.close()
+    return players
+
+def get_inactive_players(days=3, limit=20):
+    """
+    Up to `limit` players without any progress in the last `days` days, longest inactive first.
+    Returns a list of {"user_id", "username", "last_update"} ("Never" if they have not played).
+    """
+    players = []
+    conn = _create_read_connection()
+    if conn is not None:
+        try:
+            cursor = conn.cursor()
+            cursor.execute("""
+                SELECT u.id, u.userName, MAX(p.updated_at) AS last_update
+                FROM users u LEFT JOIN PlayerProgress p ON p.user_id = u.id
+                WHERE lower(u.role) = 'player'
+                GROUP BY u.id
+                HAVING last_update IS NULL OR last_update < ?
+                ORDER BY last_update
+                LIMIT ?
+            """, (_days_ago(days), limit))
+            players = [{"user_id": row[0], "username": row[1], "last_update": row[2] or "Never"}
+                       for row in cursor.fetchall()]
+        except Exception as e:
+            print(f"Error loading inactive players: {e}")
+        finally:
+            conn.close()
+    return players
+
 if __name__ == "__main__":
     initialize_database()
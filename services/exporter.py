@@ -0,0 +1,173 @@
+import os
+import sys
+import csv
+import gzip
+import json
+import time
+import datetime
+import tempfile
+import threading
+from services import db
+
+# -------------------- Configuration --------------------
+EXPORT_DIR = os.path.join(os.getcwd(), "exports")
+# Rows fetched from the cursor and written per step; memory use depends on this, not on the export size.
+CHUNK_ROWS = 5000
+# zlib's default level; 9 is several times slower for a few percent smaller files.
+GZIP_LEVEL = 6
+FORMATS = ["csv", "jsonl"]
+# Exportable datasets: name -> (table, columns in export order, column the date filters apply to).
+DATASETS = {
+    "sessions": ("GameSessions",
+                 ["session_id", "user_id", "game_id", "start_time", "end_time", "session_type", "level"],
+                 "start_time"),
+    "logs": ("Logs", ["log_id", "user_id", "action", "details", "timestamp"], "timestamp"),
+    "progress": ("PlayerProgress", ["user_id", "game_id", "level", "points", "updated_at"], "updated_at"),
+}
+
+
+# -------------------- Export --------------------
+def _as_date(value):
+    return value if isinstance(value, datetime.date) else datetime.date.fromisoformat(value)
+
+
+def _query(dataset, columns, start, end):
+    """Build the SELECT for an export; `start` and `end` are inclusive dates."""
+    table, allowed, date_column = DATASETS[dataset]
+    unknown = [column for column in columns if column not in allowed]
+    if unknown:
+        raise ValueError(f"Unknown columns for {dataset}: {', '.join(unknown)}")
+    clauses, params = [], []
+    # Timestamps are ISO strings, so date ranges compare as text.
+    if start:
+        clauses.append(f"{date_column} >= ?")
+        params.append(_as_date(start).isoformat())
+    if end:
+        clauses.append(f"{date_column} < ?")
+        params.append((_as_date(end) + datetime.timedelta(days=1)).isoformat())
+    where = f" WHERE {' AND '.join(clauses)}" if clauses else ""
+    return f"SELECT {', '.join(columns)} FROM {table}{where} ORDER BY rowid", \
+        f"SELECT COUNT(*) FROM {table}{where}", params
+
+
+def default_path(dataset, fmt="csv", compress=False):
+    """exports/<dataset>_<timestamp>.<fmt>[.gz]"""
+    stamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
+    return os.path.join(EXPORT_DIR, f"{dataset}_{stamp}.{fmt}" + (".gz" if compress else ""))
+
+
+def export(dataset, path=None, fmt="csv", columns=None, start=None, end=None, compress=False,
+           progress=None, cancel=None):
+    """
+    Stream a dataset ("sessions", "logs" or "progress") from a database cursor into a CSV or JSONL
+    file, CHUNK_ROWS rows at a time, optionally gzip-compressed.
+    `columns` picks and orders the columns (all by default); `start`/`end` are inclusive dates
+    (datetime.date or "YYYY-MM-DD"). `progress(rows_written, total_rows)` is called after every
+    chunk, and setting the `cancel` threading.Event stops the export.
+    The file only appears at `path` once complete. Returns (path, rows written).
+    """
+    if fmt not in FORMATS:
+        raise ValueError(f"Unknown export format: {fmt}")
+    columns = list(columns or DATASETS[dataset][1])
+    select, count, params = _query(dataset, columns, start, end)
+    path = path or default_path(dataset, fmt, compress)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    conn = db._create_read_connection()
+    if conn is None:
+        raise RuntimeError("Database is not available")
+    fd, tmp_path = tempfile.mkstemp(prefix=os.path.basename(path) + ".", suffix=".tmp", dir=os.path.dirname(path))
+    os.close(fd)
+    written = 0
+    try:
+        cursor = conn.cursor()
+        total = cursor.execute(count, params).fetchone()[0]
+        cursor.execute(select, params)
+        if compress:
+            f = gzip.open(tmp_path, "wt", compresslevel=GZIP_LEVEL, newline="", encoding="utf-8")
+        else:
+            f = open(tmp_path, "w", newline="", encoding="utf-8")
+        with f:
+            writer = csv.writer(f) if fmt == "csv" else None
+            if writer:
+                writer.writerow(columns)
+            while True:
+                if cancel is not None and cancel.is_set():
+                    raise InterruptedError("Export cancelled")
+                rows = cursor.fetchmany(CHUNK_ROWS)
+                if not rows:
+                    break
+                if writer:
+                    writer.writerows(rows)
+                else:
+                    f.writelines(json.dumps(dict(zip(columns, row))) + "\n" for row in rows)
+                written += len(rows)
+                if progress:
+                    progress(written, total)
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+    finally:
+        conn.close()
+    return path, written
+
+
+def export_in_background(dataset, done, **options):
+    """
+    Run export() on its own thread. `done(path, rows, error)` is called when it ends (error is
+    None on success). Returns the cancel event; set it to stop the export.
+    """
+    cancel = threading.Event()
+
+    def run():
+        try:
+            path, rows = export(dataset, cancel=cancel, **options)
+            done(path, rows, None)
+        except Exception as e:
+            print(f"Error exporting {dataset}: {e}")
+            done(None, 0, e)
+
+    threading.Thread(target=run, name=f"export-{dataset}", daemon=True).start()
+    return cancel
+
+
+# -------------------- Benchmark --------------------
+def benchmark(sizes=(10000, 200000)):
+    """
+    Export log tables of different sizes to gzipped JSONL and report the time, and the peak
+    Python memory from a second, traced run (tracing slows the export down a lot).
+    """
+    import tracemalloc
+    original = db.DB_FILE
+    with tempfile.TemporaryDirectory() as directory:
+        db.DB_FILE = os.path.join(directory, "benchmark.db")
+        try:
+            conn = db._create_connection()
+            conn.execute("""
+                CREATE TABLE Logs (log_id INTEGER PRIMARY KEY AUTOINCREMENT, user_id INTEGER,
+                                   action TEXT NOT NULL, details TEXT, timestamp TEXT NOT NULL)
+            """)
+            inserted = 0
+            target = os.path.join(directory, "logs.jsonl.gz")
+            for size in sizes:
+                now = datetime.datetime.now().isoformat()
+                conn.executemany("INSERT INTO Logs (user_id, action, details, timestamp) VALUES (?, ?, ?, ?)",
+                                 ((i % 40, "score", f"Score incremented to {i}", now) for i in range(inserted, size)))
+                conn.commit()
+                inserted = size
+                started = time.perf_counter()
+                _, rows = export("logs", target, fmt="jsonl", compress=True)
+                seconds = time.perf_counter() - started
+                tracemalloc.start()
+                export("logs", target, fmt="jsonl", compress=True)
+                peak = tracemalloc.get_traced_memory()[1]
+                tracemalloc.stop()
+                print(f"{rows:>9} rows: {seconds:6.2f} s, peak memory {peak / 1024:6.0f} KiB")
+            conn.close()
+        finally:
+            db.DB_FILE = original
+
+
+if __name__ == "__main__":
+    benchmark([int(n) for n in sys.argv[1:]] or (10000, 200000))
@@ -0,0 +1,172 @@
+import os
+import sys
+import json
+import subprocess
+import pygame
+from services import utils
+
+# -------------------- Configuration --------------------
+FONT_CACHE_PATH = os.path.join(utils.CACHE_DIR, "fonts.json")
+
+# Resolved family -> font file mapping, loaded from disk on first use.
+_resolved = None
+_resolved_key = None
+# Shared pygame.font.Font objects keyed by (family, size, bold).
+_fonts = {}
+
+
+def _font_dirs():
+    """Return the system font directories for this platform."""
+    home = os.path.expanduser("~")
+    if sys.platform.startswith("win"):
+        return [
+            os.path.join(os.environ.get("WINDIR", "C:\\Windows"), "Fonts"),
+            os.path.join(os.environ.get("LOCALAPPDATA", home), "Microsoft", "Windows", "Fonts"),
+        ]
+    if sys.platform == "darwin":
+        return ["/Library/Fonts", "/System/Library/Fonts", "/Network/Library/Fonts",
+                os.path.join(home, "Library", "Fonts")]
+    return ["/usr/share/fonts", "/usr/local/share/fonts", os.path.join(home, ".fonts"),
+            os.path.join(home, ".local", "share", "fonts")]
+
+
+def _font_dirs_key():
+    """Key the cache on the modification times of the font directories that exist."""
+    key = {}
+    for font_dir in _font_dirs():
+        try:
+            key[font_dir] = os.stat(font_dir).st_mtime
+        except OSError:
+            continue
+    return key
+
+
+def _normalize(family):
+    """Normalize a family name the way pygame.sysfont does ("Comic Sans MS" -> "comicsansms")."""
+    if family is None:
+        return ""
+    return "".join(c for c in family.lower() if c.isalnum() or c == ",")
+
+
+def _load_cache():
+    """Load the resolved-font mapping, discarding it if the font directories changed."""
+    global _resolved, _resolved_key
+    _resolved_key = _font_dirs_key()
+    _resolved = {}
+    if os.path.exists(FONT_CACHE_PATH):
+        try:
+            with open(FONT_CACHE_PATH, "r") as f:
+                data = json.load(f)
+            if data.get("key") == _resolved_key:
+                _resolved = data.get("fonts", {})
+        except Exception as e:
+            print(f"Error loading font cache: {e}. Resolving fonts again.")
+
+
+def _save_cache():
+    """Persist the resolved-font mapping next to the other generated caches."""
+    utils.atomic_save(FONT_CACHE_PATH, lambda tmp: _write_json(tmp, {"key": _resolved_key, "fonts": _resolved}))
+
+
+def _write_json(path, data):
+    with open(path, "w") as f:
+        json.dump(data, f, indent=4)
+
+
+def resolve(family, bold=False):
+    """
+    Resolve a family name (or comma separated list of names) to a font file path.
+    Returns (path, synthetic_bold); path is None when only pygame's default font fits.
+    The system font list is only scanned when the name is not in the on-disk cache.
+    """
+    if _resolved is None:
+        _load_cache()
+    name = _normalize(family)
+    cache_key = f"{name}|{'bold' if bold else 'regular'}"
+    entry = _resolved.get(cache_key)
+    if entry is None:
+        path = pygame.font.match_font(name, bold=bold) if name else None
+        # Like SysFont, fall back to emboldening the regular face when no bold face exists.
+        synthetic_bold = bool(bold and (path is None or path == pygame.font.match_font(name)))
+        entry = {"path": path, "synthetic_bold": synthetic_bold}
+        _resolved[cache_key] = entry
+        _save_cache()
+    return entry["path"], entry["synthetic_bold"]
+
+
+def get_font(family, size, bold=False):
+    """
+    Return a shared pygame.font.Font for (family, size, bold).
+    Drop-in replacement for pygame.font.SysFont that never builds the same font twice.
+    """
+    key = (_normalize(family), size, bold)
+    font = _fonts.get(key)
+    if font is None:
+        if not pygame.font.get_init():
+            pygame.font.init()
+        path, synthetic_bold = resolve(family, bold)
+        try:
+            font = pygame.font.Font(path, size)
+        except (OSError, pygame.error) as e:
+            print(f"Error loading font {path}: {e}. Using the default font.")
+            font = pygame.font.Font(None, size)
+            synthetic_bold = bold
+        if synthetic_bold:
+            font.set_bold(True)
+        _fonts[key] = font
+    return font
+
+
+# -------------------- Benchmark --------------------
+# The fonts a game asks for while starting up (the Comic Sans games plus the Arial ones).
+_STARTUP_FONTS = [("Comic Sans MS", 80, False), ("Comic Sans MS", 60, False), ("Comic Sans MS", 40, False),
+                  ("Comic Sans MS", 90, False), ("Arial", 60, False), ("Arial", 40, False), ("Arial", 28, False),
+                  ("Arial", 72, True)]
+
+_SYSFONT_SNIPPET = """
+import time, pygame
+start = time.perf_counter()
+pygame.font.init()
+for family, size, bold in {fonts!r}:
+    pygame.font.SysFont(family, size, bold=bold)
+print(time.perf_counter() - start)
+"""
+
+_REGISTRY_SNIPPET = """
+import time, pygame
+start = time.perf_counter()
+pygame.font.init()
+from services import fonts
+for family, size, bold in {fonts!r}:
+    fonts.get_font(family, size, bold=bold)
+print(time.perf_counter() - start)
+"""
+
+
+def _time_snippet(snippet, runs):
+    """Run a snippet in fresh interpreters and return the fastest reported time in ms."""
+    env = dict(os.environ, PYGAME_HIDE_SUPPORT_PROMPT="1")
+    timings = []
+    for _ in range(runs):
+        output = subprocess.run([sys.executable, "-c", snippet.format(fonts=_STARTUP_FONTS)],
+                                capture_output=True, text=True, env=env, check=True).stdout
+        timings.append(float(output.strip().splitlines()[-1]) * 1000)
+    return min(timings)
+
+
+def benchmark(runs=5):
+    """Compare font setup at game start: SysFont vs. the registry with a cold and a warm cache."""
+    sysfont_ms = _time_snippet(_SYSFONT_SNIPPET, runs)
+    cold = []
+    for _ in range(runs):
+        if os.path.exists(FONT_CACHE_PATH):
+            os.remove(FONT_CACHE_PATH)
+        cold.append(_time_snippet(_REGISTRY_SNIPPET, 1))
+    warm_ms = _time_snippet(_REGISTRY_SNIPPET, runs)
+    print(f"pygame.font.SysFont:       {sysfont_ms:8.1f} ms")
+    print(f"font registry, cold cache: {min(cold):8.1f} ms")
+    print(f"font registry, warm cache: {warm_ms:8.1f} ms")
+
+
+if __name__ == "__main__":
+    benchmark()
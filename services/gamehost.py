@@ -0,0 +1,166 @@
+import os
+import sys
+import json
+import time
+import runpy
+import subprocess
+import importlib.util
+from services import bundle
+
+# -------------------- Configuration --------------------
+# Number of idle, pre-warmed workers kept ready for the next launch.
+POOL_SIZE = 1
+# Modules every game imports; a worker imports them before it is handed a game.
+WARM_MODULES = [
+    "numpy", "cv2", "pygame", "mediapipe", "cvzone",
+    "cvzone.HandTrackingModule", "cvzone.FaceMeshModule",
+    "services.sessions", "services.levels", "services.logs", "services.utils",
+    "services.fonts", "services.glyphs", "services.assets", "services.renderer",
+    "services.telemetry", "services.camera", "services.context", "services.leaderboard",
+    "games.gameloop",
+]
+
+# Idle workers waiting for a game.
+_idle = []
+
+
+# -------------------- Worker --------------------
+def _warm_up():
+    """Import the heavy stacks so a game only pays for its own module code."""
+    os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+    for name in WARM_MODULES:
+        try:
+            __import__(name)
+        except Exception as e:
+            # The game reports a missing module itself when it imports it.
+            print(f"Error pre-loading {name}: {e}")
+
+
+def run_worker():
+    """
+    Worker entry point: warm up, then wait for one launch request on stdin and run
+    that game as __main__. The process exits with the game; the pool starts a new one.
+    """
+    _warm_up()
+    line = sys.stdin.readline()
+    if not line:
+        # The launcher closed without using this worker.
+        return
+    request = json.loads(line)
+    game_path = request["game"]
+    os.environ.update(request.get("env", {}))
+    from services import telemetry
+    telemetry.mark("handoff")
+    # Run the game exactly like `python games/<file>.py` would.
+    sys.argv = [game_path] + request.get("args", [])
+    if bundle.bundle_path():
+        # The game's bytecode is in the bundle; its source need not be on disk.
+        runpy.run_module(_module_name(game_path), run_name="__main__", alter_sys=True)
+        return
+    sys.path.insert(0, os.path.dirname(game_path))
+    runpy.run_path(game_path, run_name="__main__")
+
+
+# -------------------- Pool --------------------
+def _module_name(game_path):
+    return "games." + os.path.splitext(os.path.basename(game_path))[0]
+
+
+def _child_env(env=None):
+    """Environment for workers and games; from a bundle they import the app from it."""
+    child_env = dict(os.environ, **(env or {}))
+    if bundle.bundle_path():
+        child_env["PYTHONPATH"] = os.pathsep.join(filter(None, [bundle.bundle_path(), child_env.get("PYTHONPATH")]))
+    return child_env
+
+
+def game_exists(game_path):
+    """Whether a game can be started, from the source tree or from the running bundle."""
+    if bundle.bundle_path():
+        return importlib.util.find_spec(_module_name(game_path)) is not None
+    return os.path.exists(game_path)
+
+
+def _spawn_worker():
+    try:
+        return subprocess.Popen([sys.executable, "-m", "services.gamehost", "--worker"],
+                                stdin=subprocess.PIPE, cwd=os.getcwd(), env=_child_env(), text=True)
+    except Exception as e:
+        print(f"Error starting game host worker: {e}")
+        return None
+
+
+def start_pool(size=POOL_SIZE):
+    """Start pre-warmed workers until `size` are idle."""
+    _idle[:] = [worker for worker in _idle if worker.poll() is None]
+    while len(_idle) < size:
+        worker = _spawn_worker()
+        if worker is None:
+            break
+        _idle.append(worker)
+
+
+def launch(game_path, args=None, env=None):
+    """
+    Run a game in a pre-warmed worker and start a replacement for it.
+    Falls back to a cold `python <game>` process when no worker is available.
+    env holds extra environment variables for the game (e.g. launch telemetry).
+    Returns the Popen handle of the process running the game.
+    """
+    process = None
+    while _idle and process is None:
+        worker = _idle.pop(0)
+        if worker.poll() is not None:
+            continue
+        try:
+            worker.stdin.write(json.dumps({"game": game_path, "args": args or [], "env": env or {}}) + "\n")
+            worker.stdin.close()
+            process = worker
+        except OSError as e:
+            print(f"Error handing game to worker: {e}")
+    if process is None:
+        target = ["-m", _module_name(game_path)] if bundle.bundle_path() else [game_path]
+        process = subprocess.Popen([sys.executable] + target + (args or []), env=_child_env(env))
+    start_pool()
+    return process
+
+
+# -------------------- Benchmark --------------------
+def _time_to_first_line(run, probe, stamp):
+    """Return the milliseconds from starting `run` until the probe game wrote its stamp."""
+    start = time.time()
+    run(probe).wait()
+    with open(stamp, "r") as f:
+        return (float(f.read()) - start) * 1000
+
+
+def benchmark(warmup_seconds=10):
+    """
+    Time how long a cold process and a warm worker take to get through the imports
+    every game starts with. The probe game imports the worker's modules and records
+    when it got past them.
+    """
+    probe = os.path.join(os.getcwd(), "cache", "gamehost_probe.py")
+    stamp = probe + ".stamp"
+    os.makedirs(os.path.dirname(probe), exist_ok=True)
+    with open(probe, "w") as f:
+        f.write("import time\nfrom services import gamehost\ngamehost._warm_up()\n"
+                f"open({stamp!r}, 'w').write(repr(time.time()))\n")
+    env = dict(os.environ, PYTHONPATH=os.getcwd())
+    cold_ms = _time_to_first_line(lambda path: subprocess.Popen([sys.executable, path], env=env), probe, stamp)
+
+    start_pool()
+    # Let the worker finish warming up, as it does while the menu is shown.
+    time.sleep(warmup_seconds)
+    warm_ms = _time_to_first_line(launch, probe, stamp)
+    for worker in _idle:
+        worker.stdin.close()
+    print(f"cold process: {cold_ms:8.1f} ms")
+    print(f"warm worker:  {warm_ms:8.1f} ms")
+
+
+if __name__ == "__main__":
+    if "--worker" in sys.argv:
+        run_worker()
+    else:
+        benchmark()
@@ -0,0 +1,122 @@
+import os
+import hashlib
+import cv2
+import numpy as np
+import pygame
+from services import utils, fonts
+
+# -------------------- Configuration --------------------
+GLYPH_CACHE_DIR = os.path.join(utils.CACHE_DIR, "glyphs")
+ALPHABET = "ABCDEFGHIJKLMNOPQRSTUVWXYZ"
+# Bump when the way glyphs are drawn changes so old cache files are ignored.
+ATLAS_VERSION = 1
+
+# Atlases already built in this process, keyed by their style.
+_letter_atlases = {}
+_tile_atlases = {}
+
+
+def _cache_path(kind, style, extension):
+    """Return the cache file path for an atlas of the given kind and style."""
+    key = hashlib.sha1(repr((ATLAS_VERSION, kind, style)).encode("utf-8")).hexdigest()[:16]
+    return os.path.join(GLYPH_CACHE_DIR, f"{kind}_{key}.{extension}")
+
+
+def _write_array(path, array):
+    """Save a NumPy array to exactly this path (np.save would append .npy)."""
+    with open(path, "wb") as f:
+        np.save(f, array)
+
+
+# -------------------- OpenCV Letter Atlas (BGRA) --------------------
+def _build_letter_atlas(width_img, height_img, font_scale, thickness, color):
+    """Draw A-Z stacked vertically into one BGRA array with an alpha mask."""
+    atlas = np.zeros((len(ALPHABET) * height_img, width_img, 4), dtype=np.uint8)
+    for i, letter in enumerate(ALPHABET):
+        cell = atlas[i * height_img:(i + 1) * height_img]
+        text_size, _ = cv2.getTextSize(letter, cv2.FONT_HERSHEY_SIMPLEX, font_scale, thickness)
+        text_width, text_height = text_size
+        text_x = (width_img - text_width) // 2
+        text_y = (height_img + text_height) // 2
+        cv2.putText(cell, letter, (text_x, text_y), cv2.FONT_HERSHEY_SIMPLEX, font_scale, color, thickness,
+                    cv2.LINE_AA)
+    mask = (atlas[:, :, 0] > 0) | (atlas[:, :, 1] > 0) | (atlas[:, :, 2] > 0)
+    atlas[:, :, 3] = np.where(mask, 255, 0)
+    return atlas
+
+
+def letter_images(width_img=100, height_img=100, font_scale=2, thickness=3, color=(0, 165, 255)):
+    """
+    Return a dictionary mapping each letter A-Z to a BGRA image (for cvzone.overlayPNG).
+    The images are read-only views into a single atlas that is built once per process
+    and cached on disk, so picking a new letter costs a dictionary lookup.
+    """
+    style = (width_img, height_img, font_scale, thickness, tuple(color))
+    if style in _letter_atlases:
+        return _letter_atlases[style]
+
+    path = _cache_path("letters", style, "npy")
+    atlas = None
+    if os.path.exists(path):
+        try:
+            atlas = np.load(path)
+            if atlas.shape != (len(ALPHABET) * height_img, width_img, 4):
+                atlas = None
+        except Exception as e:
+            print(f"Error loading glyph cache {path}: {e}")
+            atlas = None
+    if atlas is None:
+        atlas = _build_letter_atlas(width_img, height_img, font_scale, thickness, color)
+        utils.atomic_save(path, lambda tmp: _write_array(tmp, atlas))
+    atlas.flags.writeable = False
+
+    images = {letter: atlas[i * height_img:(i + 1) * height_img] for i, letter in enumerate(ALPHABET)}
+    _letter_atlases[style] = images
+    return images
+
+
+# -------------------- Pygame Letter Tile Atlas --------------------
+def _build_tile_atlas(font_name, font_size, tile_size, text_color, bg_color, border_color, border_width):
+    """Draw A-Z letter tiles side by side on one surface."""
+    font = fonts.get_font(font_name, font_size)
+    atlas = pygame.Surface((len(ALPHABET) * tile_size, tile_size))
+    for i, letter in enumerate(ALPHABET):
+        tile_rect = pygame.Rect(i * tile_size, 0, tile_size, tile_size)
+        atlas.fill(bg_color, tile_rect)
+        pygame.draw.rect(atlas, border_color, tile_rect, border_width)
+        text_surface = font.render(letter, True, text_color)
+        atlas.blit(text_surface, text_surface.get_rect(center=tile_rect.center))
+    return atlas
+
+
+def letter_tiles(font_name, font_size, tile_size, text_color, bg_color, border_color, border_width=3):
+    """
+    Return a dictionary mapping each letter A-Z to a square tile surface.
+    Every tile is a subsurface of one atlas that is built once per process and cached
+    on disk as a PNG, so creating a tile needs no font lookup or text rendering.
+    """
+    style = (font_name, font_size, tile_size, tuple(text_color), tuple(bg_color), tuple(border_color),
+             border_width)
+    if style in _tile_atlases:
+        return _tile_atlases[style]
+
+    path = _cache_path("tiles", style, "png")
+    atlas = None
+    if os.path.exists(path):
+        try:
+            atlas = pygame.image.load(path)
+            if atlas.get_size() != (len(ALPHABET) * tile_size, tile_size):
+                atlas = None
+        except pygame.error as e:
+            print(f"Error loading glyph cache {path}: {e}")
+            atlas = None
+    if atlas is None:
+        atlas = _build_tile_atlas(font_name, font_size, tile_size, text_color, bg_color, border_color,
+                                  border_width)
+        utils.atomic_save(path, lambda tmp: pygame.image.save(atlas, tmp))
+    if pygame.display.get_surface() is not None:
+        atlas = atlas.convert()
+
+    tiles = {letter: atlas.subsurface((i * tile_size, 0, tile_size, tile_size)) for i, letter in enumerate(ALPHABET)}
+    _tile_atlases[style] = tiles
+    return tiles
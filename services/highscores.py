@@ -0,0 +1,158 @@
+import os
+import json
+from services.db import _create_connection
+
+# -------------------- Configuration --------------------
+# Entries kept per game.
+TOP_N = 10
+# JSON files highscores were kept in before they moved to the database. highscores.json maps
+# game ids to entry lists; number_dash_highscores.json is a plain list for Number Dash.
+LEGACY_FILES = {
+    os.path.join(os.getcwd(), "config", "highscores.json"): None,
+    os.path.join(os.getcwd(), "config", "number_dash_highscores.json"): "NumberDash",
+}
+# Suffix given to a legacy file once imported, so it is only imported once.
+IMPORTED_SUFFIX = ".imported"
+
+# Game id -> number of changes made to its highscores by this process. A game is only ever
+# running once (see services.supervisor), so its own writes are the only ones it can miss.
+_versions = {}
+
+
+# -------------------- Queries --------------------
+def version(game_id):
+    """Change counter for a game's highscores; cached views compare it instead of re-reading."""
+    return _versions.get(game_id, 0)
+
+
+def top(game_id, limit=TOP_N):
+    """Return the best `limit` entries for a game, highest first: [{"name": str, "score": int}]."""
+    conn = _create_connection()
+    if conn:
+        try:
+            cursor = conn.cursor()
+            # Walks idx_highscores_game_score; earlier entries win ties.
+            cursor.execute("""
+                SELECT name, score FROM highscores
+                WHERE game_id = ?
+                ORDER BY score DESC, rowid
+                LIMIT ?
+            """, (game_id, limit))
+            return [{"name": name, "score": score} for name, score in cursor.fetchall()]
+        except Exception as e:
+            print(f"Error loading highscores for {game_id}: {e}")
+        finally:
+            conn.close()
+    return []
+
+
+def _cutoff(cursor, game_id, limit):
+    """Score of the last entry on a full table, or None while there is still room."""
+    cursor.execute("""
+        SELECT score FROM highscores
+        WHERE game_id = ?
+        ORDER BY score DESC, rowid
+        LIMIT 1 OFFSET ?
+    """, (game_id, limit - 1))
+    row = cursor.fetchone()
+    return row[0] if row else None
+
+
+def qualifies(game_id, score, limit=TOP_N):
+    """Return True if `score` would make the game's table (it has room, or beats the last entry)."""
+    conn = _create_connection()
+    if conn:
+        try:
+            cutoff = _cutoff(conn.cursor(), game_id, limit)
+            return cutoff is None or score > cutoff
+        except Exception as e:
+            print(f"Error checking highscores for {game_id}: {e}")
+        finally:
+            conn.close()
+    return False
+
+
+# -------------------- Updates --------------------
+def add(game_id, name, score, limit=TOP_N):
+    """
+    Insert an entry if it qualifies and drop whatever falls off the end of the table.
+    Returns True if the entry was added.
+    """
+    conn = _create_connection()
+    if conn:
+        try:
+            cursor = conn.cursor()
+            cutoff = _cutoff(cursor, game_id, limit)
+            if cutoff is not None and score <= cutoff:
+                return False
+            cursor.execute("INSERT INTO highscores (game_id, name, score) VALUES (?, ?, ?)",
+                           (game_id, name, score))
+            _trim(cursor, game_id, limit)
+            conn.commit()
+            _versions[game_id] = version(game_id) + 1
+            return True
+        except Exception as e:
+            print(f"Error saving highscore for {game_id}: {e}")
+        finally:
+            conn.close()
+    return False
+
+
+def _trim(cursor, game_id, limit):
+    cursor.execute("""
+        DELETE FROM highscores
+        WHERE game_id = ? AND rowid NOT IN (
+            SELECT rowid FROM highscores
+            WHERE game_id = ?
+            ORDER BY score DESC, rowid
+            LIMIT ?
+        )
+    """, (game_id, game_id, limit))
+
+
+# -------------------- Import --------------------
+def _valid_entries(entries):
+    """Keep the well-formed {"name", "score"} entries of a legacy list (skips e.g. a bare [0])."""
+    if not isinstance(entries, list):
+        return []
+    return [(str(entry["name"]), int(entry["score"])) for entry in entries
+            if isinstance(entry, dict) and "name" in entry and isinstance(entry.get("score"), (int, float))]
+
+
+def import_legacy_highscores(files=None, limit=TOP_N):
+    """
+    Move highscores from the old JSON files into the database, once: each imported file is
+    renamed with IMPORTED_SUFFIX. Returns the number of entries imported.
+    """
+    files = LEGACY_FILES if files is None else files
+    imported = 0
+    for path, game_id in files.items():
+        if not os.path.exists(path):
+            continue
+        try:
+            with open(path, "r") as f:
+                data = json.load(f)
+        except (OSError, json.JSONDecodeError) as e:
+            print(f"Error reading legacy highscores {path}: {e}")
+            continue
+        by_game = {game_id: data} if game_id else (data if isinstance(data, dict) else {})
+        conn = _create_connection()
+        if conn is None:
+            return imported
+        try:
+            cursor = conn.cursor()
+            for game, entries in by_game.items():
+                rows = _valid_entries(entries)
+                cursor.executemany("INSERT INTO highscores (game_id, name, score) VALUES (?, ?, ?)",
+                                   [(game, name, score) for name, score in rows])
+                _trim(cursor, game, limit)
+                _versions[game] = version(game) + 1
+                imported += len(rows)
+            conn.commit()
+            os.replace(path, path + IMPORTED_SUFFIX)
+            print(f"Imported legacy highscores from {path}")
+        except Exception as e:
+            print(f"Error importing legacy highscores {path}: {e}")
+        finally:
+            conn.close()
+    return imported
@@ -0,0 +1,138 @@
+import os
+import sys
+import json
+import time
+import tempfile
+from contextlib import contextmanager
+
+# -------------------- Configuration --------------------
+# Writers hold "<file>.lock" rather than the file itself, which is replaced on every save.
+LOCK_SUFFIX = ".lock"
+
+
+# -------------------- Locking --------------------
+def _lock(f):
+    if os.name == "nt":
+        import msvcrt
+        # LK_LOCK retries for about 10 seconds before giving up.
+        msvcrt.locking(f.fileno(), msvcrt.LK_LOCK, 1)
+    else:
+        import fcntl
+        fcntl.flock(f.fileno(), fcntl.LOCK_EX)
+
+
+@contextmanager
+def locked(path):
+    """Hold the advisory lock for a JSON file (shared by every process using this module)."""
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path + LOCK_SUFFIX, "a+") as f:
+        _lock(f)
+        # Closing the file releases the lock, also when the process dies while holding it.
+        yield
+
+
+# -------------------- Reading and Writing --------------------
+def load(path, default=None):
+    """
+    Return the data in a JSON file, or `default` if it is missing or unreadable.
+    No lock is needed: save() replaces the file in one step, so it is never half-written.
+    """
+    try:
+        with open(path, "r") as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return default
+    except (OSError, ValueError) as e:
+        print(f"Error reading {path}: {e}")
+        return default
+
+
+def _fsync_dir(directory):
+    """Make a rename in `directory` survive a power cut (not possible on Windows)."""
+    if os.name == "nt":
+        return
+    fd = os.open(directory, os.O_RDONLY)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+
+def _write(path, data, indent):
+    directory = os.path.dirname(path)
+    fd, tmp_path = tempfile.mkstemp(prefix=os.path.basename(path) + ".", suffix=".tmp", dir=directory)
+    try:
+        with os.fdopen(fd, "w") as f:
+            json.dump(data, f, indent=indent)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+    _fsync_dir(directory)
+
+
+def save(path, data, indent=4):
+    """Write a JSON file through a synced temporary file and an atomic rename, under its lock."""
+    with locked(path):
+        _write(path, data, indent)
+
+
+def update(path, change, default=None, indent=4):
+    """
+    Read-modify-write a JSON file under its lock, so concurrent writers never lose each
+    other's changes. `change(data)` gets the current data (or `default`) and returns the
+    new data. Returns the data written.
+    """
+    with locked(path):
+        data = change(load(path, default))
+        _write(path, data, indent)
+    return data
+
+
+# -------------------- Stress Test --------------------
+def _stress_writer(path, updates):
+    def increment(data):
+        data["count"] += 1
+        data["writers"][str(os.getpid())] = data["writers"].get(str(os.getpid()), 0) + 1
+        return data
+
+    for _ in range(updates):
+        update(path, increment, default={"count": 0, "writers": {}})
+
+
+def stress_test(writers=8, updates=200):
+    """
+    Run concurrent writers on one file, and kill one more writer part-way through.
+    Every surviving update must be counted and the file must always parse.
+    """
+    import multiprocessing
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "stress.json")
+        start = time.perf_counter()
+        processes = [multiprocessing.Process(target=_stress_writer, args=(path, updates)) for _ in range(writers)]
+        victim = multiprocessing.Process(target=_stress_writer, args=(path, updates))
+        for process in processes + [victim]:
+            process.start()
+        time.sleep(0.2)
+        victim.kill()
+        for process in processes + [victim]:
+            process.join()
+        elapsed = time.perf_counter() - start
+
+        data = load(path)
+        killed = data["writers"].get(str(victim.pid), 0)
+        expected = writers * updates + killed
+        leftovers = [name for name in os.listdir(directory) if name.endswith(".tmp")]
+        print(f"{writers} writers x {updates} updates + 1 killed after {killed}: "
+              f"count {data['count']} (expected {expected}) in {elapsed:.1f} s")
+        if leftovers:
+            # A writer killed between creating and renaming its temporary file leaves it behind.
+            print(f"Temporary files left by the killed writer: {len(leftovers)}")
+        return data["count"] == expected
+
+
+if __name__ == "__main__":
+    sys.exit(0 if stress_test() else 1)
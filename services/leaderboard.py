@@ -0,0 +1,228 @@
+import re
+import sys
+import math
+import time
+import random
+import bisect
+from services import logs
+from services.db import _create_connection
+
+# -------------------- Configuration --------------------
+# Scores below EXACT_LIMIT get a bucket each; above it buckets grow by 2^(1/GROWTH_STEPS)
+# (about 9%), so any score fits in a few hundred buckets.
+EXACT_LIMIT = 128
+GROWTH_STEPS = 8
+# Log action recording each round's final score; the rebuild reads history from it.
+ROUND_ACTION = "round_score"
+ROUND_DETAILS = re.compile(r"score (-?\d+) in (\S+)$")
+# Older "game_over" logs of Edible and Color Smash: "Game session <id> ended with score <n>".
+LEGACY_DETAILS = re.compile(r"Game session (\d+) ended with score (-?\d+)$")
+
+# Game id -> {"buckets": sorted bucket ids, "below": counts before each bucket, "counts", "total"},
+# loaded from ScoreHistogram on first use and kept in step with record().
+_sketches = {}
+
+
+# -------------------- Buckets --------------------
+def bucket(score):
+    """Bucket id of a score (negative scores count as 0)."""
+    score = max(0, score)
+    if score < EXACT_LIMIT:
+        return int(score)
+    return EXACT_LIMIT + int(GROWTH_STEPS * math.log2(score / EXACT_LIMIT))
+
+
+def bucket_bounds(bucket_id):
+    """Lowest score in a bucket and the lowest score of the next one."""
+    if bucket_id < EXACT_LIMIT:
+        return bucket_id, bucket_id + 1
+    step = bucket_id - EXACT_LIMIT
+    return EXACT_LIMIT * 2 ** (step / GROWTH_STEPS), EXACT_LIMIT * 2 ** ((step + 1) / GROWTH_STEPS)
+
+
+# -------------------- Sketch --------------------
+def _index(counts):
+    buckets = sorted(counts)
+    below, running = [], 0
+    for bucket_id in buckets:
+        below.append(running)
+        running += counts[bucket_id]
+    return {"buckets": buckets, "below": below, "counts": counts, "total": running}
+
+
+def _sketch(game_id):
+    sketch = _sketches.get(game_id)
+    if sketch is None:
+        counts = {}
+        conn = _create_connection()
+        if conn:
+            try:
+                cursor = conn.cursor()
+                cursor.execute("SELECT bucket, count FROM ScoreHistogram WHERE game_id = ?", (game_id,))
+                counts = dict(cursor.fetchall())
+            except Exception as e:
+                print(f"Error loading score histogram for {game_id}: {e}")
+            finally:
+                conn.close()
+        sketch = _sketches[game_id] = _index(counts)
+    return sketch
+
+
+def record(game_id, score):
+    """Add one final score to the game's histogram (a single-row upsert)."""
+    bucket_id = bucket(score)
+    conn = _create_connection()
+    if conn:
+        try:
+            conn.execute("""
+                INSERT INTO ScoreHistogram (game_id, bucket, count) VALUES (?, ?, 1)
+                ON CONFLICT(game_id, bucket) DO UPDATE SET count = count + 1
+            """, (game_id, bucket_id))
+            conn.commit()
+        except Exception as e:
+            print(f"Error recording score for {game_id}: {e}")
+            return
+        finally:
+            conn.close()
+    if game_id in _sketches:
+        counts = _sketches[game_id]["counts"]
+        counts[bucket_id] = counts.get(bucket_id, 0) + 1
+        _sketches[game_id] = _index(counts)
+
+
+def count_below(game_id, score):
+    """Estimated number of recorded scores lower than `score` (exact below EXACT_LIMIT)."""
+    sketch = _sketch(game_id)
+    bucket_id = bucket(score)
+    position = bisect.bisect_left(sketch["buckets"], bucket_id)
+    below = sketch["below"][position] if position < len(sketch["buckets"]) else sketch["total"]
+    if bucket_id >= EXACT_LIMIT and position < len(sketch["buckets"]) and sketch["buckets"][position] == bucket_id:
+        # Assume the scores inside a wide bucket are spread evenly.
+        low, high = bucket_bounds(bucket_id)
+        below += sketch["counts"][bucket_id] * (score - low) / (high - low)
+    return below
+
+
+def percentile(game_id, score):
+    """Percentage of recorded scores `score` beats, or None before the game has any."""
+    total = _sketch(game_id)["total"]
+    if total == 0:
+        return None
+    return 100 * count_below(game_id, score) / total
+
+
+def rank(game_id, score):
+    """Estimated position of `score` among the recorded scores (1 = best)."""
+    sketch = _sketch(game_id)
+    bucket_id = bucket(score)
+    position = bisect.bisect_right(sketch["buckets"], bucket_id)
+    at_or_below = sketch["below"][position] if position < len(sketch["buckets"]) else sketch["total"]
+    return sketch["total"] - at_or_below + 1
+
+
+def finish_round(game_id, user_id, score):
+    """
+    Record a round's final score and return the percentage of earlier scores it beats
+    (None for the first round of a game), for the game over screen.
+    """
+    beaten = percentile(game_id, score)
+    record(game_id, score)
+    logs.log_event(user_id, ROUND_ACTION, f"Round ended with score {score} in {game_id}")
+    return beaten
+
+
+def beaten_message(beaten):
+    """Game over line for the result of finish_round() ("" when there is nothing to compare with)."""
+    if beaten is None:
+        return ""
+    return f"You beat {beaten:.0f}% of players!"
+
+
+# -------------------- Rebuild --------------------
+def _history(cursor):
+    """
+    Yield (game_id, score) for every finished round in the logs. Edible and Color Smash still
+    log the legacy line at exit as well, so a legacy log only counts for a session in which no
+    round_score was logged (same user and game, between the session start and the legacy log).
+    """
+    rounds = {}
+    cursor.execute("SELECT user_id, details, timestamp FROM Logs WHERE action = ?", (ROUND_ACTION,))
+    for user_id, details, timestamp in cursor.fetchall():
+        match = ROUND_DETAILS.search(details or "")
+        if match:
+            rounds.setdefault((user_id, match.group(2)), []).append(timestamp)
+            yield match.group(2), int(match.group(1))
+    for timestamps in rounds.values():
+        timestamps.sort()
+    cursor.execute("SELECT session_id, user_id, game_id, start_time FROM GameSessions")
+    session_games = {row[0]: row[1:] for row in cursor.fetchall()}
+    cursor.execute("SELECT details, timestamp FROM Logs WHERE action = 'game_over'")
+    for details, timestamp in cursor.fetchall():
+        match = LEGACY_DETAILS.search(details or "")
+        if not match or int(match.group(1)) not in session_games:
+            continue
+        user_id, game_id, start_time = session_games[int(match.group(1))]
+        timestamps = rounds.get((user_id, game_id), [])
+        first = bisect.bisect_left(timestamps, start_time or "")
+        if first < len(timestamps) and timestamps[first] <= timestamp:
+            continue
+        yield game_id, int(match.group(2))
+
+
+def rebuild():
+    """Recreate every histogram from the logged round scores. Returns the number of scores."""
+    counts = {}
+    conn = _create_connection()
+    if conn is None:
+        return 0
+    try:
+        cursor = conn.cursor()
+        for game_id, score in _history(cursor):
+            key = (game_id, bucket(score))
+            counts[key] = counts.get(key, 0) + 1
+        cursor.execute("DELETE FROM ScoreHistogram")
+        cursor.executemany("INSERT INTO ScoreHistogram (game_id, bucket, count) VALUES (?, ?, ?)",
+                           [(game_id, bucket_id, count) for (game_id, bucket_id), count in counts.items()])
+        conn.commit()
+    except Exception as e:
+        print(f"Error rebuilding score histograms: {e}")
+        return 0
+    finally:
+        conn.close()
+    _sketches.clear()
+    total = sum(counts.values())
+    print(f"Score histograms rebuilt from {total} rounds.")
+    return total
+
+
+# -------------------- Benchmark --------------------
+def benchmark(scores=100000, queries=100000):
+    """Time percentile queries on a histogram of random scores against scanning the raw scores."""
+    samples = [int(random.expovariate(1 / 40)) for _ in range(scores)]
+    counts = {}
+    for score in samples:
+        counts[bucket(score)] = counts.get(bucket(score), 0) + 1
+    _sketches["benchmark"] = _index(counts)
+    probes = [random.randint(0, 400) for _ in range(queries)]
+    start = time.perf_counter()
+    for score in probes:
+        percentile("benchmark", score)
+    sketch_us = (time.perf_counter() - start) * 1e6 / queries
+    start = time.perf_counter()
+    for score in probes[:100]:
+        sum(1 for sample in samples if sample < score)
+    scan_us = (time.perf_counter() - start) * 1e6 / 100
+    worst = max(abs(percentile("benchmark", score) - 100 * sum(1 for s in samples if s < score) / scores)
+                for score in probes[:200])
+    del _sketches["benchmark"]
+    print(f"{len(counts)} buckets for {scores} scores")
+    print(f"histogram percentile: {sketch_us:8.2f} us/query")
+    print(f"scan of every score:  {scan_us:8.2f} us/query")
+    print(f"largest error:        {worst:8.3f} percentage points")
+
+
+if __name__ == "__main__":
+    if "--benchmark" in sys.argv:
+        benchmark()
+    else:
+        rebuild()
@@ -1,9 +1,10 @@
 import os
 import sqlite3
 import datetime
+from services.db import bump_version
 
 # Define the database file – should be the same as used elsewhere.
-DB_FILE = os.path.join(os.getcwd(), "../playful_minds.db")
+DB_FILE = os.path.join(os.getcwd(), "playful_minds.db")
 
 def _create_connection():
     """Create and return a connection to the SQLite database."""
@@ -80,6 +81,28 @@ def get_player_progress(user_id, game_id):
             conn.close()
     return progress
 
+def get_all_player_progress(user_id):
+    """
+    Retrieves the progress for every game the specified user has played.
+    Returns a dictionary: { game_id: { "level": int, "points": int } }.
+    """
+    conn = _create_connection()
+    progress = {}
+    if conn:
+        try:
+            cursor = conn.cursor()
+            cursor.execute("""
+                SELECT game_id, level, points FROM PlayerProgress
+                WHERE user_id = ?
+            """, (user_id,))
+            for game_id, level, points in cursor.fetchall():
+                progress[game_id] = {"level": level, "points": points}
+        except Exception as e:
+            print(f"Error fetching progress for user {user_id}: {e}")
+        finally:
+            conn.close()
+    return progress
+
 def init_player_progress(user_id, game_id):
     """
     Ensures a progress record exists for the user and game.
@@ -95,6 +118,7 @@ def init_player_progress(user_id, game_id):
                     INSERT INTO PlayerProgress (user_id, game_id, level, points, updated_at)
                     VALUES (?, ?, 0, 0, ?)
                 """, (user_id, game_id, now))
+                bump_version(cursor, "progress")
                 conn.commit()
             except Exception as e:
                 print(f"Error initializing progress for user {user_id}, game {game_id}: {e}")
@@ -135,6 +159,7 @@ def update_player_progress(user_id, game_id, additional_points):
                 SET level = ?, points = ?, updated_at = ?
                 WHERE user_id = ? AND game_id = ?
             """, (current_level, new_points, now, user_id, game_id))
+            bump_version(cursor, "progress")
             conn.commit()
         except Exception as e:
             print(f"Error updating progress for user {user_id}, game {game_id}: {e}")
@@ -1,6 +1,7 @@
 import sqlite3
 import os
 import datetime
+from services.db import bump_version, _create_read_connection
 
 DB_FILE = os.path.join(os.getcwd(), "playful_minds.db")
 
@@ -35,6 +36,9 @@ def initialize_logs_table():
                     FOREIGN KEY(user_id) REFERENCES users(id)
                 )
             """)
+            # The live Logs tab filters by action or user and reads forward from a log_id.
+            cursor.execute("CREATE INDEX IF NOT EXISTS idx_logs_action ON Logs (action, log_id)")
+            cursor.execute("CREATE INDEX IF NOT EXISTS idx_logs_user ON Logs (user_id, log_id)")
             conn.commit()
         except Exception as e:
             print(f"Error initializing Logs table: {e}")
@@ -60,6 +64,7 @@ def log_event(user_id, action, details=""):
                 INSERT INTO Logs (user_id, action, details, timestamp)
                 VALUES (?, ?, ?, ?)
             """, (user_id, action, details, now))
+            bump_version(cursor, "logs")
             conn.commit()
         except Exception as e:
             print(f"Error logging event: {e}")
@@ -67,24 +72,45 @@ def log_event(user_id, action, details=""):
             conn.close()
 
 
-def get_logs(limit=50):
+def _filters(action, user_id):
+    clauses, params = [], []
+    if action is not None:
+        clauses.append("action = ?")
+        params.append(action)
+    if user_id is not None:
+        clauses.append("user_id = ?")
+        params.append(user_id)
+    return clauses, params
+
+
+def get_logs(limit=50, action=None, user_id=None, after_id=None):
     """
-    Retrieve the most recent logs (default limit is 50).
+    Retrieve log records, optionally only those with `action` and/or from `user_id`.
+    Without `after_id` these are the most recent `limit` logs, newest first (default limit is 50).
+    With `after_id` they are the logs written after that log_id, oldest first, for following
+    new activity. Both walk the primary key or an (action|user_id, log_id) index.
 
     Returns:
         List of dictionaries, each representing a log record.
     """
     logs = []
-    conn = _create_connection()
+    clauses, params = _filters(action, user_id)
+    if after_id is not None:
+        clauses.append("log_id > ?")
+        params.append(after_id)
+    where = f"WHERE {' AND '.join(clauses)}" if clauses else ""
+    order = "ASC" if after_id is not None else "DESC"
+    conn = _create_read_connection()
     if conn:
         try:
             cursor = conn.cursor()
-            cursor.execute("""
+            cursor.execute(f"""
                 SELECT log_id, user_id, action, details, timestamp
                 FROM Logs
-                ORDER BY timestamp DESC
+                {where}
+                ORDER BY log_id {order}
                 LIMIT ?
-            """, (limit,))
+            """, params + [limit])
             rows = cursor.fetchall()
             for row in rows:
                 logs.append({
@@ -101,5 +127,40 @@ def get_logs(limit=50):
     return logs
 
 
-# Initialize the Logs table on module load
-initialize_logs_table()
+def get_last_log_id():
+    """Return the newest log_id (0 when there are no logs)."""
+    conn = _create_read_connection()
+    if conn:
+        try:
+            cursor = conn.cursor()
+            cursor.execute("SELECT MAX(log_id) FROM Logs")
+            return cursor.fetchone()[0] or 0
+        except Exception as e:
+            print(f"Error retrieving logs: {e}")
+        finally:
+            conn.close()
+    return 0
+
+
+def get_log_actions():
+    """Return the distinct actions in the Logs table, in order, for filtering."""
+    conn = _create_read_connection()
+    if conn:
+        try:
+            cursor = conn.cursor()
+            # Jumps from one action to the next through the index instead of reading every row.
+            cursor.execute("""
+                WITH RECURSIVE actions(action) AS (
+                    SELECT MIN(action) FROM Logs
+                    UNION ALL
+                    SELECT (SELECT MIN(action) FROM Logs WHERE action > actions.action)
+                    FROM actions WHERE actions.action IS NOT NULL
+                )
+                SELECT action FROM actions WHERE action IS NOT NULL
+            """)
+            return [row[0] for row in cursor.fetchall()]
+        except Exception as e:
+            print(f"Error retrieving log actions: {e}")
+        finally:
+            conn.close()
+    return []
@@ -0,0 +1,111 @@
+import threading
+import flet as ft
+from services import logs
+
+# -------------------- Configuration --------------------
+# Seconds between checks for new log records while the Logs tab is shown.
+POLL_SECONDS = 2.0
+# Log records kept on screen; the oldest drop off the bottom as new ones arrive.
+RING_SIZE = 200
+ALL_ACTIONS = "All actions"
+
+# Stop event of the tail that is running; building a new Logs tab stops the previous one.
+_current = {"stop": None}
+
+
+def _row(entry):
+    return ft.DataRow(cells=[
+        ft.DataCell(ft.Text(entry.get("timestamp", ""))),
+        ft.DataCell(ft.Text(str(entry.get("user_id", "")))),
+        ft.DataCell(ft.Text(entry.get("action", ""))),
+        ft.DataCell(ft.Text(entry.get("details", "")))
+    ])
+
+
+def stop():
+    """Stop following the logs (a no-op when no Logs tab is open)."""
+    if _current["stop"] is not None:
+        _current["stop"].set()
+        _current["stop"] = None
+
+
+# -------------------- Live Log View --------------------
+def log_view(page: ft.Page, route):
+    """
+    Build a live view of the Logs table: the newest RING_SIZE records, filterable by action and
+    user. A background thread asks for records after the newest log_id shown every POLL_SECONDS
+    and puts only those rows on top while `route` is the page's current view, until stop().
+    """
+    table = ft.DataTable(
+        columns=[
+            ft.DataColumn(ft.Text("Timestamp")),
+            ft.DataColumn(ft.Text("User ID")),
+            ft.DataColumn(ft.Text("Action")),
+            ft.DataColumn(ft.Text("Details"))
+        ],
+        rows=[]
+    )
+    action_filter = ft.Dropdown(
+        label="Action",
+        options=[ft.dropdown.Option(action) for action in [ALL_ACTIONS] + logs.get_log_actions()],
+        value=ALL_ACTIONS,
+        width=220
+    )
+    user_filter = ft.TextField(label="User ID", width=150)
+    status = ft.Text(f"Showing new activity as it happens (newest {RING_SIZE} records).")
+    state = {"last_id": 0, "action": None, "user_id": None}
+    lock = threading.Lock()
+
+    def reload():
+        with lock:
+            newest = logs.get_last_log_id()
+            entries = logs.get_logs(limit=RING_SIZE, action=state["action"], user_id=state["user_id"])
+            # Follow on from the newest matching record; with none, from the newest record of all.
+            state["last_id"] = entries[0]["log_id"] if entries else newest
+            table.rows = [_row(entry) for entry in entries]
+
+    def apply_filters(e):
+        user_text = (user_filter.value or "").strip()
+        if user_text and not user_text.isdigit():
+            status.value = "User ID must be a number."
+            page.update()
+            return
+        state["action"] = None if action_filter.value == ALL_ACTIONS else action_filter.value
+        state["user_id"] = int(user_text) if user_text else None
+        status.value = f"Showing new activity as it happens (newest {RING_SIZE} records)."
+        reload()
+        page.update()
+
+    def follow(stop_event):
+        while not stop_event.wait(POLL_SECONDS):
+            # The dashboard is cached while other views are shown; it catches up when it is back.
+            if not page.views or page.views[-1].route != route:
+                continue
+            try:
+                with lock:
+                    new_entries = logs.get_logs(limit=RING_SIZE, action=state["action"],
+                                                user_id=state["user_id"], after_id=state["last_id"])
+                    if not new_entries:
+                        continue
+                    state["last_id"] = new_entries[-1]["log_id"]
+                    table.rows[0:0] = [_row(entry) for entry in reversed(new_entries)]
+                    del table.rows[RING_SIZE:]
+                page.update()
+            except Exception as e:
+                print(f"Error following logs: {e}")
+                break
+
+    action_filter.on_change = apply_filters
+    user_filter.on_submit = apply_filters
+    reload()
+    stop()
+    _current["stop"] = threading.Event()
+    threading.Thread(target=follow, args=(_current["stop"],), name="log-tail", daemon=True).start()
+    return ft.Column(
+        controls=[
+            ft.Row(controls=[action_filter, user_filter], spacing=20),
+            status,
+            table
+        ],
+        spacing=10
+    )
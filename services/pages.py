@@ -1,10 +1,7 @@
 import flet as ft
-import os
-import bcrypt  # for checking hashed passwords in admin login
+import time
 import datetime
-from services import db, utils, mail, sessions, logs
-import json
-from services.mail import forgot_password_template
+from services import db, utils, sessions, logs, telemetry, widgets, snapshots, logtail, exporter, roster, auth, catalog
 import string
 import secrets
 
@@ -40,24 +37,6 @@ def exit_application(e):
     e.page.window_close()  # Corrected method to close the Flet app.
 
 
-def save_current_user(user):
-    """Persist the current user data to a JSON file.  """
-    config_dir = os.path.join(os.getcwd(), "config")
-    if not os.path.exists(config_dir):
-        os.makedirs(config_dir)
-    current_user_path = os.path.join(config_dir, "current_user.json")
-    with open(current_user_path, "w") as f:
-        json.dump(user, f)
-
-
-# comment
-def clear_current_user():
-    """Clear the persisted current user data."""
-    current_user_path = os.path.join(os.getcwd(), "config", "current_user.json")
-    if os.path.exists(current_user_path):
-        os.remove(current_user_path)
-
-
 # Global current_user variable for session tracking
 current_user = None
 
@@ -67,10 +46,8 @@ def landing_view(page: ft.Page, games):
     # Clear existing views.
     page.views.clear()
 
-    # Load accounts from database.
-    accounts = db.load_accounts()
     # Check if an admin account exists.
-    admin_exists = any(account["role"].lower() == "admin" for account in accounts.values()) if accounts else False
+    admin_exists = db.admin_exists()
 
     left_panel_controls = []
 
@@ -203,8 +180,6 @@ def player_login_view(page: ft.Page, games):
             return
         global current_user
         current_user = user
-        # Save current user info to file for use by game modules.
-        save_current_user(user)
         go_to_view(page, game_selection_view, games)
 
     username_field = ft.TextField(label="Username")
@@ -237,9 +212,8 @@ def player_logout(page: ft.Page, games):
     global current_user
     # Log the logout event
     logs.log_event(current_user.get("id", 0), "logout", "Player logged out.")
+    drop_cached_views(current_user.get("id"))
     current_user = None
-    # Clear the persisted user data.
-    clear_current_user()
     go_to_view(page, landing_view, games)
 
 
@@ -263,9 +237,20 @@ def admin_login_view(page: ft.Page, games):
             error_text.value = "Admin account not found."
             page.update()
             return
-        if bcrypt.checkpw(pwd.encode('utf-8'), user["password"].encode('utf-8')):
+        # bcrypt runs on an auth worker; the view stays responsive until the result comes back.
+        login_button.disabled = True
+        error_text.value = ""
+        page.update()
+        auth.check_async(pwd, user["password"], lambda matches: admin_checked(user, pwd, matches))
+
+    def admin_checked(user, pwd, matches):
+        login_button.disabled = False
+        if matches:
             global current_user
             current_user = user
+            # Hashes made before the work factor was raised are upgraded while the password is known.
+            if auth.needs_rehash(user["password"]):
+                auth.hash_async(pwd, lambda hashed: hashed and db.update_user_password(user["id"], hashed))
             sessions.start_user_session(user["id"], session_type="admin")
             go_to_view(page, admin_dashboard_view, games)
         else:
@@ -281,6 +266,7 @@ def admin_login_view(page: ft.Page, games):
     )
 
     error_text = ft.Text("", color=ft.Colors.RED)
+    login_button = ft.ElevatedButton("Log In", on_click=do_admin_login)
 
     # "Forgot Password?" button is left-aligned directly below the password field.
     forgot_password_button = ft.TextButton(
@@ -304,7 +290,7 @@ def admin_login_view(page: ft.Page, games):
                         admin_password,
                         ft.Row([forgot_password_button], alignment=ft.MainAxisAlignment.START),  # Left-align the button
                         error_text,
-                        ft.ElevatedButton("Log In", on_click=do_admin_login),
+                        login_button,
                         ft.TextButton("Back", on_click=lambda e: go_to_view(page, landing_view, games)),
                     ],
                     alignment=ft.MainAxisAlignment.CENTER,
@@ -332,24 +318,36 @@ def forgot_password_view(page: ft.Page, games):
             error_text.value = "Account not found or email does not match."
             page.update()
             return
-        # Generate a new strong password.
+        # Generate a new strong password; hashing and mailing it happen on an auth worker.
         new_password = generate_strong_password()
-        # Hash the new password.
-        hashed_password = bcrypt.hashpw(new_password.encode('utf-8'), bcrypt.gensalt()).decode('utf-8')
+        reset_button.disabled = True
+        success_text.value = "Resetting password..."
+        error_text.value = ""
+        page.update()
+        auth.hash_async(new_password, lambda hashed: password_hashed(user, new_password, hashed))
+
+    def password_hashed(user, new_password, hashed_password):
+        reset_button.disabled = False
+        if hashed_password is None:
+            success_text.value = ""
+            error_text.value = "The password could not be reset. Please try again."
+            page.update()
+            return
+        from services import mail  # SMTP and .env loading happen only when a reset is requested
         # Update the admin's password in the database.
-        db.update_user_password(user["id"], hashed_password)  # Ensure this function exists in your db module.
+        db.update_user_password(user["id"], hashed_password)
         # Send an email with the new password.
-        subject, plain_text, html_content = forgot_password_template(new_password)
+        subject, plain_text, html_content = mail.forgot_password_template(new_password)
         mail.send_email(user["email"], subject, plain_text,
                         html_content)  # Ensure send_email exists in your mail module.
         success_text.value = "A new password has been generated and sent to your email."
-        error_text.value = ""
         page.update()
 
     username_field = ft.TextField(label="Username")
     email_field = ft.TextField(label="Email")
     error_text = ft.Text("", color=ft.Colors.RED)
     success_text = ft.Text("", color=ft.Colors.GREEN)
+    reset_button = ft.ElevatedButton("Reset Password", on_click=do_reset_password)
 
     page.views.clear()
     page.views.append(
@@ -362,7 +360,7 @@ def forgot_password_view(page: ft.Page, games):
                         username_field,
                         email_field,
                         error_text,
-                        ft.ElevatedButton("Reset Password", on_click=do_reset_password),
+                        reset_button,
                         success_text,
                         ft.TextButton("Back", on_click=lambda e: go_to_view(page, admin_login_view, games)),
                     ],
@@ -394,8 +392,7 @@ def create_player_account_view(page: ft.Page, games):
             error_text.value = "All fields are required."
             page.update()
             return
-        accounts = db.load_accounts()
-        if uname in accounts:
+        if db.load_user_by_username(uname) is not None:
             error_text.value = "Username already exists."
             page.update()
             return
@@ -467,8 +464,7 @@ def create_admin_account_view(page: ft.Page, games):
             error_text.value = "All fields are required."
             page.update()
             return
-        accounts = db.load_accounts()
-        if uname in accounts:
+        if db.load_user_by_username(uname) is not None:
             error_text.value = "Username already exists."
             page.update()
             return
@@ -476,13 +472,25 @@ def create_admin_account_view(page: ft.Page, games):
             error_text.value = "Password does not meet requirements or does not match."
             page.update()
             return
-        hashed_pwd = bcrypt.hashpw(pwd.encode('utf-8'), bcrypt.gensalt()).decode('utf-8')
+        # The password is hashed on an auth worker; the account is saved when the hash is ready.
+        create_button.disabled = True
+        error_text.value = ""
+        success_text.value = "Creating account..."
+        page.update()
+        auth.hash_async(pwd, lambda hashed: admin_hashed(fname, lname, uname, email, hashed))
+
+    def admin_hashed(fname, lname, uname, email, hashed_pwd):
+        create_button.disabled = False
+        if hashed_pwd is None:
+            success_text.value = ""
+            error_text.value = "The account could not be created. Please try again."
+            page.update()
+            return
         creation_date = datetime.datetime.now().isoformat()
         db.save_user(fname, lname, uname, "admin", hashed_pwd, email, creation_date)
         # Log the admin account creation.
         logs.log_event(0, "create_admin_account", f"Admin account '{uname}' created.")
         success_text.value = f"Admin account '{uname}' created successfully!"
-        error_text.value = ""
         page.update()
 
     first_name_field = ft.TextField(label="First Name")
@@ -495,6 +503,7 @@ def create_admin_account_view(page: ft.Page, games):
     password_error = ft.Text("", color=ft.Colors.RED)
     error_text = ft.Text("", color=ft.Colors.RED)
     success_text = ft.Text("", color=ft.Colors.GREEN)
+    create_button = ft.ElevatedButton("Create Account", on_click=do_create_admin)
 
     page.views.clear()
     page.views.append(
@@ -513,7 +522,7 @@ def create_admin_account_view(page: ft.Page, games):
                         password_error,
                         error_text,
                         success_text,
-                        ft.ElevatedButton("Create Account", on_click=do_create_admin),
+                        create_button,
                         ft.TextButton(
                             "Back",
                             on_click=lambda e: go_to_view(page, back_navigation_view(page, games), games)
@@ -539,8 +548,9 @@ def guest_login(page: ft.Page, games):
 def game_selection_view(page: ft.Page, games):
     game_items = []
     for game in games:
-        if game["image"] and os.path.exists(game["image"]):
-            img = ft.Image(src=game["image"], width=100, height=100, fit=ft.ImageFit.CONTAIN)
+        thumbnail = catalog.thumbnail(game)
+        if thumbnail:
+            img = ft.Image(src=thumbnail, width=100, height=100, fit=ft.ImageFit.CONTAIN)
         else:
             img = ft.Container(
                 content=ft.Text("No Image", size=16, color=ft.Colors.WHITE),
@@ -562,7 +572,7 @@ def game_selection_view(page: ft.Page, games):
             ),
             bgcolor=ft.Colors.GREY_700, border_radius=8, padding=10, margin=5,
             width=page.width - 40, height=150,
-            on_click=lambda e, file=game["file"]: utils.launch_game(file),
+            on_click=lambda e, file=game["file"]: utils.launch_game(file, current_user),
         )
         game_items.append(item)
 
@@ -659,6 +669,8 @@ def admin_logout(page: ft.Page, games):
     global current_user  # Declare global at the beginning
     # Optionally log the logout event.
     logs.log_event(current_user.get("id", 0), "logout", "Admin logged out.")
+    logtail.stop()
+    drop_cached_views(current_user.get("id"))
     current_user = None
     # Navigate back to the landing view.
     go_to_view(page, landing_view, games)
@@ -732,17 +744,7 @@ def update_user_view(page: ft.Page, games, user_id):
     page.update()
 
 
-# Placeholder functions for new analytics DB queries (to be implemented in db.py)
-# --- Dummy Export/Print/Email Functions (to be implemented as needed) ---
-def export_table_to_csv(data, filename):
-    import csv
-    with open(filename, "w", newline="") as f:
-        writer = csv.writer(f)
-        for row in data:
-            writer.writerow(row)
-
-
-# In pages.py replace placeholder functions with:
+# Analytics queries used by the dashboard (implemented in db.py)
 
 def get_active_users_count():
     return db.get_active_users_count()
@@ -753,12 +755,11 @@ def get_total_sessions():
 
 
 def get_avg_session_duration():
-    stats = db.load_overall_session_stats()
-    return round(stats.get("total_play_time", 0) / (stats.get("session_count", 1) or 1), 1)
+    return db.get_avg_session_duration()
 
 
 def get_avg_level_gain():
-    return db.get_avg_level_gain()  # Requires similar DB function
+    return db.get_avg_level_gain()
 
 
 def get_game_play_counts(order="desc", limit=3):
@@ -770,16 +771,64 @@ def get_top_players_by_level_up(limit=5, days=7):
 
 
 def get_inactive_players(days=3):
-    return db.get_inactive_players(days=days)  # Requires similar DB function
+    return db.get_inactive_players(days=days)
 
 
 # Start of Dashboard View
 
 # New Admin Dashboard View
 # --- Navigation Helper Function ---
-def go_to_view(page: ft.Page, view_func, games):
+# -------------------- View Cache --------------------
+# Views kept once built: view function name -> (seconds a view may be reused, change counters
+# its content depends on, see db.bump_version). Going back to one shows the same ft.View again,
+# for the same user, unless it is older than that or one of the counters moved since it was built.
+# Forms are not cached so they always open empty. The dashboard is kept no longer than the
+# shortest-lived snapshot it shows (its Launch Latency and Logs tabs have no counter at all),
+# and its Refresh button always rebuilds it.
+CACHED_VIEWS = {
+    "landing_view": (3600, ["users"]),
+    "game_selection_view": (3600, []),
+    "settings_view": (3600, []),
+    "admin_dashboard_view": (min(ttl for ttl, _ in snapshots.DATASETS.values()), ["users", "sessions", "progress"]),
+}
+
+# (view function name, user id) -> (counter values, time built, ft.View)
+_view_cache = {}
+
+
+def _cached_view(name, user_id, versions):
+    cached = _view_cache.get((name, user_id))
+    if cached and cached[0] == versions and time.monotonic() - cached[1] < CACHED_VIEWS[name][0]:
+        return cached[2]
+    return None
+
+
+def drop_cached_views(user_id=None):
+    """Forget the cached views of one user (or of everybody)."""
+    for key in [key for key in _view_cache if user_id is None or key[1] == user_id]:
+        del _view_cache[key]
+
+
+def go_to_view(page: ft.Page, view_func, games, rebuild=False):
+    """Show a view, reusing its cached ft.View unless `rebuild` is set or it is out of date."""
+    name = view_func.__name__
+    user_id = current_user.get("id") if current_user else None
+    if name in CACHED_VIEWS:
+        versions = db.get_data_versions()
+        versions = tuple(versions[counter] for counter in CACHED_VIEWS[name][1])
+        view = None if rebuild else _cached_view(name, user_id, versions)
+        if view is not None:
+            page.views.clear()
+            page.views.append(view)
+            page.update()
+            return
+    if name == "admin_dashboard_view":
+        logtail.stop()  # The Logs tab of the dashboard being replaced, if open, goes away
     page.views.clear()  # Clear all existing views
     view_func(page, games)  # Call the view function to build the new view
+    if name in CACHED_VIEWS and page.views:
+        # Counters read before building, so a write made meanwhile triggers a rebuild next time.
+        _view_cache[(name, user_id)] = (versions, time.monotonic(), page.views[-1])
     page.update()  # Refresh the page
 
 
@@ -817,7 +866,8 @@ def admin_dashboard_view(page: ft.Page, games):
     )
     nav_bar = ft.Row(
         controls=[
-            ft.ElevatedButton("Refresh", on_click=lambda event: go_to_view(page, admin_dashboard_view, games)),
+            ft.ElevatedButton("Refresh",
+                              on_click=lambda event: go_to_view(page, admin_dashboard_view, games, rebuild=True)),
             ft.ElevatedButton("Log Out", on_click=lambda event: admin_logout(page, games))
         ],
         alignment=ft.MainAxisAlignment.CENTER,
@@ -825,12 +875,17 @@ def admin_dashboard_view(page: ft.Page, games):
     )
 
     # --- KPI Cards Section ---
-    def kpi_card(title, value):
+    # Cards start empty and are filled in by background queries once the view is shown.
+    # Every dataset below goes through services/snapshots.py, so a Refresh or coming back from
+    # another view only re-runs the queries whose data changed or expired.
+    def kpi_card(title, load):
+        value = ft.Text("...", size=24, weight=ft.FontWeight.BOLD, color=ft.Colors.GREEN)
+        widgets.load_async(page, title, load, lambda result: setattr(value, "value", str(result)))
         return ft.Container(
             content=ft.Column(
                 controls=[
                     ft.Text(title, size=16),
-                    ft.Text(str(value), size=24, weight=ft.FontWeight.BOLD, color=ft.Colors.GREEN)
+                    value
                 ],
                 horizontal_alignment=ft.CrossAxisAlignment.CENTER
             ),
@@ -842,308 +897,404 @@ def admin_dashboard_view(page: ft.Page, games):
 
     kpi_cards = ft.Row(
         controls=[
-            kpi_card("Active Users", db.get_active_users_count()),
-            kpi_card("Total Sessions", db.get_total_sessions()),
-            kpi_card("Avg Session (min)", db.get_avg_session_duration()),
-            kpi_card("Avg Levels", db.get_avg_level_gain())
+            kpi_card("Active Users", snapshots.cached("kpis", db.get_active_users_count)),
+            kpi_card("Total Sessions", snapshots.cached("kpis", db.get_total_sessions)),
+            kpi_card("Avg Session (min)", snapshots.cached("kpis", db.get_avg_session_duration)),
+            kpi_card("Avg Levels", snapshots.cached("kpis", db.get_avg_level_gain))
         ],
         spacing=20
     )
 
     # --- Player Accounts Tab ---
-    accounts = db.load_accounts()
-    player_accounts = [acct for acct in accounts.values() if acct["role"].lower() == "player"]
-    player_table = ft.DataTable(
-        columns=[
-            ft.DataColumn(ft.Text("First Name")),
-            ft.DataColumn(ft.Text("Last Name")),
-            ft.DataColumn(ft.Text("Username")),
-            ft.DataColumn(ft.Text("Levels"))
-        ],
-        rows=[
-            ft.DataRow(cells=[
+    def player_accounts_page(offset, limit):
+        players = db.load_users_page(offset, limit, role="player")
+        levels_by_player = db.get_player_levels([p["id"] for p in players])
+        for p in players:
+            p["levels"] = " | ".join([
+                f"{game.get('title', 'Unknown')}: "
+                f"Lvl {levels_by_player.get((p['id'], game.get('game_id', game.get('title', ''))), 0)}"
+                for game in games
+            ])
+        return players
+
+    def build_player_accounts():
+        player_table = widgets.paged_table(
+            page,
+            ["First Name", "Last Name", "Username", "Levels"],
+            fetch=snapshots.cached("accounts", player_accounts_page),
+            to_cells=lambda p: [
                 ft.DataCell(ft.Text(p.get("firstName", ""))),
                 ft.DataCell(ft.Text(p.get("lastName", ""))),
                 ft.DataCell(ft.Text(p.get("userName", ""))),
-                ft.DataCell(ft.Text(" | ".join([
-                    f"{game.get('title', 'Unknown')}: Lvl {db.get_player_level(p.get('id', 0),
-                                                                               game.get('game_id', game.get('title', '')))}"
-                    for game in games
-                ])))
-            ])
-            for p in player_accounts
-        ]
-    )
-    player_accounts_section = ft.Column(
-        controls=[
-            ft.Text("Player Accounts Report", size=24, weight=ft.FontWeight.BOLD),
-            player_table,
-        ],
-        scroll=ft.ScrollMode.AUTO,
-        spacing=10
-    )
+                ft.DataCell(ft.Text(p["levels"]))
+            ],
+            empty_text="No player accounts yet."
+        )
+        return ft.Column(
+            controls=[
+                ft.Text("Player Accounts Report", size=24, weight=ft.FontWeight.BOLD),
+                player_table,
+            ],
+            scroll=ft.ScrollMode.AUTO,
+            spacing=10
+        )
 
     # --- Sessions Stats Tab ---
-    conn = db._create_connection()
-    sessions_table = None
-    if conn is not None:
-        try:
-            cursor = conn.cursor()
-            cursor.execute("""
-                SELECT session_id, user_id, game_id, start_time, end_time, session_type, level
-                FROM GameSessions
-            """)
-            session_rows = cursor.fetchall()
-            sessions_table = ft.DataTable(
-                columns=[
-                    ft.DataColumn(ft.Text("Session ID")),
-                    ft.DataColumn(ft.Text("User ID")),
-                    ft.DataColumn(ft.Text("Game ID")),
-                    ft.DataColumn(ft.Text("Start Time")),
-                    ft.DataColumn(ft.Text("End Time")),
-                    ft.DataColumn(ft.Text("Session Type")),
-                    ft.DataColumn(ft.Text("Level"))
-                ],
-                rows=[
-                    ft.DataRow(cells=[
-                        ft.DataCell(ft.Text(str(row[0]))),
-                        ft.DataCell(ft.Text(str(row[1]))),
-                        ft.DataCell(ft.Text(row[2])),
-                        ft.DataCell(ft.Text(row[3])),
-                        ft.DataCell(ft.Text(row[4] if row[4] is not None else "N/A")),
-                        ft.DataCell(ft.Text(row[5] if row[5] is not None else "N/A")),
-                        ft.DataCell(ft.Text(str(row[6])))
-                    ])
-                    for row in session_rows
-                ]
-            )
-        except Exception as e:
-            print(f"Error fetching session stats: {e}")
-        finally:
-            conn.close()
-    sessions_section = ft.Column(
-        controls=[
-            ft.Text("Game Sessions", size=24, weight=ft.FontWeight.BOLD),
-            sessions_table if sessions_table is not None else ft.Text("No session data available."),
-        ],
-        scroll=ft.ScrollMode.AUTO,
-        spacing=10
-    )
+    def build_sessions():
+        sessions_table = widgets.paged_table(
+            page,
+            ["Session ID", "User ID", "Game ID", "Start Time", "End Time", "Session Type", "Level"],
+            fetch=snapshots.cached("sessions", db.load_game_sessions_page),
+            to_cells=lambda row: [
+                ft.DataCell(ft.Text(str(row["session_id"]))),
+                ft.DataCell(ft.Text(str(row["user_id"]))),
+                ft.DataCell(ft.Text(row["game_id"])),
+                ft.DataCell(ft.Text(row["start_time"])),
+                ft.DataCell(ft.Text(row["end_time"] if row["end_time"] is not None else "N/A")),
+                ft.DataCell(ft.Text(row["session_type"] if row["session_type"] is not None else "N/A")),
+                ft.DataCell(ft.Text(str(row["level"])))
+            ],
+            empty_text="No session data available."
+        )
+        return ft.Column(
+            controls=[
+                ft.Text("Game Sessions", size=24, weight=ft.FontWeight.BOLD),
+                sessions_table,
+            ],
+            scroll=ft.ScrollMode.AUTO,
+            spacing=10
+        )
 
     # --- Player Progress Tab ---
-    progress_records = db.get_all_player_progress()
-    progress_table = ft.DataTable(
-        columns=[
-            ft.DataColumn(ft.Text("User ID")),
-            ft.DataColumn(ft.Text("Game ID")),
-            ft.DataColumn(ft.Text("Level")),
-            ft.DataColumn(ft.Text("Points")),
-            ft.DataColumn(ft.Text("Last Updated"))
-        ],
-        rows=[
-            ft.DataRow(cells=[
+    def build_progress():
+        progress_table = widgets.paged_table(
+            page,
+            ["User ID", "Game ID", "Level", "Points", "Last Updated"],
+            fetch=snapshots.cached("progress", db.get_player_progress_page),
+            to_cells=lambda record: [
                 ft.DataCell(ft.Text(str(record.get("user_id", "")))),
                 ft.DataCell(ft.Text(record.get("game_id", ""))),
                 ft.DataCell(ft.Text(str(record.get("level", "")))),
                 ft.DataCell(ft.Text(str(record.get("points", "")))),
                 ft.DataCell(ft.Text(record.get("updated_at", "")))
-            ])
-            for record in progress_records
-        ]
-    )
-    progress_section = ft.Column(
-        controls=[
-            ft.Text("Player Progress Report", size=24, weight=ft.FontWeight.BOLD),
-            progress_table,
-        ],
-        scroll=ft.ScrollMode.AUTO,
-        spacing=10
-    )
+            ],
+            empty_text="No player progress yet."
+        )
+        return ft.Column(
+            controls=[
+                ft.Text("Player Progress Report", size=24, weight=ft.FontWeight.BOLD),
+                progress_table,
+            ],
+            scroll=ft.ScrollMode.AUTO,
+            spacing=10
+        )
 
     # --- Logs Tab ---
-    log_entries = logs.get_logs(limit=20)
-    logs_table = ft.DataTable(
-        columns=[
-            ft.DataColumn(ft.Text("Timestamp")),
-            ft.DataColumn(ft.Text("User ID")),
-            ft.DataColumn(ft.Text("Action")),
-            ft.DataColumn(ft.Text("Details"))
-        ],
-        rows=[
-            ft.DataRow(cells=[
-                ft.DataCell(ft.Text(entry.get("timestamp", ""))),
-                ft.DataCell(ft.Text(str(entry.get("user_id", "")))),
-                ft.DataCell(ft.Text(entry.get("action", ""))),
-                ft.DataCell(ft.Text(entry.get("details", "")))
-            ])
-            for entry in log_entries
-        ]
-    )
-    logs_section = ft.Column(
-        controls=[
-            ft.Text("Recent Logs", size=24, weight=ft.FontWeight.BOLD),
-            logs_table,
-        ],
-        scroll=ft.ScrollMode.AUTO,
-        spacing=10
-    )
+    def build_logs():
+        logs_section = ft.Column(
+            controls=[
+                ft.Text("Recent Logs", size=24, weight=ft.FontWeight.BOLD),
+                logtail.log_view(page, "/admin_dashboard"),
+            ],
+            scroll=ft.ScrollMode.AUTO,
+            spacing=10
+        )
+        return logs_section
 
     # --- User Management Tab ---
-    user_entries = []
-    for user_key, u in accounts.items():
-        actions = ft.Row(
+    def user_actions(u):
+        return ft.Row(
             controls=[
-                ft.ElevatedButton("Update", on_click=lambda event, uid=u["id"]: go_to_view(page,
-                                                                                           lambda p,
-                                                                                                  g: update_user_view(p,
-                                                                                                                      g,
-                                                                                                                      uid),
-                                                                                           games)),
+                ft.ElevatedButton("Update", on_click=lambda event, uid=u["id"]: go_to_view(
+                    page, lambda p, g: update_user_view(p, g, uid), games)),
                 ft.ElevatedButton("Delete", on_click=lambda event, uid=u["id"]: delete_and_refresh(page, games, uid))
             ],
             spacing=10
         )
-        user_entries.append(
-            ft.DataRow(cells=[
+
+    def build_user_management():
+        users_table = widgets.paged_table(
+            page,
+            ["First Name", "Last Name", "Username", "Role", "Email", "Created On", "Actions"],
+            fetch=snapshots.cached("accounts", db.load_users_page),
+            to_cells=lambda u: [
                 ft.DataCell(ft.Text(u.get("firstName", ""))),
                 ft.DataCell(ft.Text(u.get("lastName", ""))),
                 ft.DataCell(ft.Text(u.get("userName", ""))),
                 ft.DataCell(ft.Text(u.get("role", ""))),
                 ft.DataCell(ft.Text(u.get("email", ""))),
                 ft.DataCell(ft.Text(u.get("creationDate", ""))),
-                ft.DataCell(actions)
-            ])
+                ft.DataCell(user_actions(u))
+            ],
+            empty_text="No accounts yet."
         )
-    users_table = ft.DataTable(
-        columns=[
-            ft.DataColumn(ft.Text("First Name")),
-            ft.DataColumn(ft.Text("Last Name")),
-            ft.DataColumn(ft.Text("Username")),
-            ft.DataColumn(ft.Text("Role")),
-            ft.DataColumn(ft.Text("Email")),
-            ft.DataColumn(ft.Text("Created On")),
-            ft.DataColumn(ft.Text("Actions"))
-        ],
-        rows=user_entries
-    )
-    user_management_section = ft.Column(
-        controls=[
-            ft.Text("User Management", size=24, weight=ft.FontWeight.BOLD),
-            ft.Row(
-                controls=[
-                    ft.ElevatedButton("Create Player Account",
-                                      on_click=lambda e: go_to_view(page, create_player_account_view, games)),
-                    ft.ElevatedButton("Create Admin Account",
-                                      on_click=lambda e: go_to_view(page, create_admin_account_view, games))
-                ],
-                spacing=20,
-                alignment=ft.MainAxisAlignment.CENTER
-            ),
-            ft.Divider(),
-            users_table
-        ],
-        scroll=ft.ScrollMode.AUTO,
-        spacing=10
-    )
+        roster_path = ft.TextField(label="Class roster CSV (First Name, Last Name, Username)", width=420)
+        roster_status = ft.Text()
+        import_button = ft.ElevatedButton("Import Roster")
+
+        def do_import_roster(e):
+            path = (roster_path.value or "").strip()
+            if not path:
+                roster_imported(path, None)
+                return
+            # A class roster can be thousands of rows; import it on a loader thread, not in the handler.
+            import_button.disabled = True
+            roster_status.value = "Importing roster..."
+            page.update()
+            widgets.load_async(page, "roster import", lambda: roster.import_roster(path),
+                               lambda counts: roster_imported(path, counts))
+
+        def roster_imported(path, counts):
+            import_button.disabled = False
+            if counts is None:
+                roster_status.value = "Import failed; check the file path and the roster columns."
+            else:
+                roster_status.value = (f"Roster imported: {counts['added']} added, {counts['updated']} updated, "
+                                       f"{counts['unchanged']} unchanged, "
+                                       f"{counts['skipped']} skipped (usernames of admin accounts).")
+                logs.log_event(current_user.get("id", 0), "import_roster", f"{path}: {roster_status.value}")
+            page.update()
+
+        import_button.on_click = do_import_roster
+        user_management_section = ft.Column(
+            controls=[
+                ft.Text("User Management", size=24, weight=ft.FontWeight.BOLD),
+                ft.Row(
+                    controls=[
+                        ft.ElevatedButton("Create Player Account",
+                                          on_click=lambda e: go_to_view(page, create_player_account_view, games)),
+                        ft.ElevatedButton("Create Admin Account",
+                                          on_click=lambda e: go_to_view(page, create_admin_account_view, games))
+                    ],
+                    spacing=20,
+                    alignment=ft.MainAxisAlignment.CENTER
+                ),
+                ft.Row(
+                    controls=[roster_path, import_button],
+                    spacing=20,
+                    alignment=ft.MainAxisAlignment.CENTER
+                ),
+                roster_status,
+                ft.Divider(),
+                users_table
+            ],
+            scroll=ft.ScrollMode.AUTO,
+            spacing=10
+        )
+        return user_management_section
 
     # --- Analytics Section (Using Dummy Data Functions) ---
-    top_games = get_game_play_counts(order="desc", limit=3)
-    bottom_games = get_game_play_counts(order="asc", limit=3)
-    top_players = get_top_players_by_level_up(limit=5, days=7)
-    inactive_players = get_inactive_players(days=3)
-
-    top_games_rows = [
-        ft.DataRow(cells=[
-            ft.DataCell(ft.Text(game["title"], color=ft.Colors.GREEN)),
-            ft.DataCell(ft.Text(str(game["session_count"]), color=ft.Colors.GREEN))
-        ])
-        for game in top_games
-    ]
-    top_games_table = ft.DataTable(
-        columns=[ft.DataColumn(ft.Text("Game")), ft.DataColumn(ft.Text("Sessions"))],
-        rows=top_games_rows
-    )
-    bottom_games_rows = [
-        ft.DataRow(cells=[
-            ft.DataCell(ft.Text(game["title"], color=ft.Colors.RED)),
-            ft.DataCell(ft.Text(str(game["session_count"]), color=ft.Colors.RED))
-        ])
-        for game in bottom_games
-    ]
-    bottom_games_table = ft.DataTable(
-        columns=[ft.DataColumn(ft.Text("Game")), ft.DataColumn(ft.Text("Sessions"))],
-        rows=bottom_games_rows
-    )
-    top_players_rows = [
-        ft.DataRow(cells=[
-            ft.DataCell(ft.Text(str(player["user_id"]))),
-            ft.DataCell(ft.Text(player["username"])),
-            ft.DataCell(ft.Text(str(player["level_gain"])))
-        ])
-        for player in top_players
-    ]
-    top_players_table = ft.DataTable(
-        columns=[ft.DataColumn(ft.Text("User ID")), ft.DataColumn(ft.Text("Username")),
-                 ft.DataColumn(ft.Text("Level Gain"))],
-        rows=top_players_rows
-    )
-    inactive_players_rows = [
-        ft.DataRow(cells=[
-            ft.DataCell(ft.Text(str(player["user_id"]))),
-            ft.DataCell(ft.Text(player["username"])),
-            ft.DataCell(ft.Text(player["last_update"]))
-        ])
-        for player in inactive_players
-    ]
-    inactive_players_table = ft.DataTable(
-        columns=[ft.DataColumn(ft.Text("User ID")), ft.DataColumn(ft.Text("Username")),
-                 ft.DataColumn(ft.Text("Last Update"))],
-        rows=inactive_players_rows
-    )
-    analytics_section = ft.Column(
-        controls=[
-            ft.Text("Analytics", size=24, weight=ft.FontWeight.BOLD),
-            ft.Row(
-                controls=[
-                    ft.Column(
-                        controls=[
-                            ft.Text("Top 3 Most Played Games", color=ft.Colors.GREEN),
-                            top_games_table,
-                            ft.Text("Bottom 3 Least Played Games", color=ft.Colors.RED),
-                            bottom_games_table
-                        ],
-                        spacing=10
-                    ),
-                    ft.Column(
-                        controls=[
-                            ft.Text("Top 5 Players by Level Gains", color=ft.Colors.GREEN),
-                            top_players_table,
-                            ft.Text("Players Inactive >3 Days", color=ft.Colors.RED),
-                            inactive_players_table
-                        ],
-                        spacing=10
-                    )
-                ],
-                spacing=20
-            )
-        ],
-        spacing=20,
-        scroll=ft.ScrollMode.AUTO,
-        expand=True
-    )
+    def build_analytics():
+        # The four tables are filled by separate background queries.
+        def analytics_table(columns, name, load, to_cells):
+            table = ft.DataTable(columns=[ft.DataColumn(ft.Text(title)) for title in columns], rows=[])
+            widgets.load_async(page, name, load, lambda records: setattr(
+                table, "rows", [ft.DataRow(cells=to_cells(record)) for record in records]))
+            return table
+
+        top_games_table = analytics_table(
+            ["Game", "Sessions"], "Most played games",
+            lambda: snapshots.cached("analytics", get_game_play_counts)(order="desc", limit=3),
+            lambda game: [
+                ft.DataCell(ft.Text(game["title"], color=ft.Colors.GREEN)),
+                ft.DataCell(ft.Text(str(game["session_count"]), color=ft.Colors.GREEN))
+            ]
+        )
+        bottom_games_table = analytics_table(
+            ["Game", "Sessions"], "Least played games",
+            lambda: snapshots.cached("analytics", get_game_play_counts)(order="asc", limit=3),
+            lambda game: [
+                ft.DataCell(ft.Text(game["title"], color=ft.Colors.RED)),
+                ft.DataCell(ft.Text(str(game["session_count"]), color=ft.Colors.RED))
+            ]
+        )
+        top_players_table = analytics_table(
+            ["User ID", "Username", "Level Gain"], "Top players",
+            lambda: snapshots.cached("analytics", get_top_players_by_level_up)(limit=5, days=7),
+            lambda player: [
+                ft.DataCell(ft.Text(str(player["user_id"]))),
+                ft.DataCell(ft.Text(player["username"])),
+                ft.DataCell(ft.Text(str(player["level_gain"])))
+            ]
+        )
+        inactive_players_table = analytics_table(
+            ["User ID", "Username", "Last Update"], "Inactive players",
+            lambda: snapshots.cached("analytics", get_inactive_players)(days=3),
+            lambda player: [
+                ft.DataCell(ft.Text(str(player["user_id"]))),
+                ft.DataCell(ft.Text(player["username"])),
+                ft.DataCell(ft.Text(player["last_update"]))
+            ]
+        )
+        analytics_section = ft.Column(
+            controls=[
+                ft.Text("Analytics", size=24, weight=ft.FontWeight.BOLD),
+                ft.Row(
+                    controls=[
+                        ft.Column(
+                            controls=[
+                                ft.Text("Top 3 Most Played Games", color=ft.Colors.GREEN),
+                                top_games_table,
+                                ft.Text("Bottom 3 Least Played Games", color=ft.Colors.RED),
+                                bottom_games_table
+                            ],
+                            spacing=10
+                        ),
+                        ft.Column(
+                            controls=[
+                                ft.Text("Top 5 Players by Level Gains", color=ft.Colors.GREEN),
+                                top_players_table,
+                                ft.Text("Players Inactive >3 Days", color=ft.Colors.RED),
+                                inactive_players_table
+                            ],
+                            spacing=10
+                        )
+                    ],
+                    spacing=20
+                )
+            ],
+            spacing=20,
+            scroll=ft.ScrollMode.AUTO,
+            expand=True
+        )
+        return ft.Container(analytics_section, padding=10)
+
+    # --- Launch Latency Tab ---
+    def build_launch_latency():
+        launch_summary = telemetry.get_launch_summary()
+        launch_table = ft.DataTable(
+            columns=[
+                ft.DataColumn(ft.Text("Game")),
+                ft.DataColumn(ft.Text("Stage")),
+                ft.DataColumn(ft.Text("Launches"), numeric=True),
+                ft.DataColumn(ft.Text("p50 (ms)"), numeric=True),
+                ft.DataColumn(ft.Text("p95 (ms)"), numeric=True),
+                ft.DataColumn(ft.Text("p50 done at (ms)"), numeric=True),
+                ft.DataColumn(ft.Text("p95 done at (ms)"), numeric=True)
+            ],
+            rows=[
+                ft.DataRow(cells=[
+                    ft.DataCell(ft.Text(row["game_id"])),
+                    ft.DataCell(ft.Text(row["stage"])),
+                    ft.DataCell(ft.Text(str(row["launches"]))),
+                    ft.DataCell(ft.Text(f"{row['p50_ms']:.0f}")),
+                    ft.DataCell(ft.Text(f"{row['p95_ms']:.0f}")),
+                    ft.DataCell(ft.Text(f"{row['p50_offset_ms']:.0f}")),
+                    ft.DataCell(ft.Text(f"{row['p95_offset_ms']:.0f}"))
+                ])
+                for row in launch_summary
+            ]
+        )
+        launch_section = ft.Column(
+            controls=[
+                ft.Text("Game Launch Latency", size=24, weight=ft.FontWeight.BOLD),
+                ft.Text("Time per stage, and when it finished after the game tile was clicked, up to the first "
+                        "camera frame and first drawn frame (games that open the camera per round stop at their menu)."),
+                launch_table if launch_summary else ft.Text("No launch data available."),
+            ],
+            scroll=ft.ScrollMode.AUTO,
+            spacing=10
+        )
+        return launch_section
+
+    # --- Exports Tab ---
+    def build_exports():
+        dataset_choice = ft.Dropdown(label="Data", value="sessions", width=200,
+                                     options=[ft.dropdown.Option(name) for name in exporter.DATASETS])
+        format_choice = ft.Dropdown(label="Format", value="csv", width=150,
+                                    options=[ft.dropdown.Option(fmt) for fmt in exporter.FORMATS])
+        compress_box = ft.Checkbox(label="Compress (gzip)", value=False)
+        start_field = ft.TextField(label="From (YYYY-MM-DD)", width=200)
+        end_field = ft.TextField(label="To (YYYY-MM-DD)", width=200)
+        column_boxes = ft.Row(wrap=True, spacing=10)
+        export_progress = ft.ProgressBar(value=0, width=500, visible=False)
+        export_status = ft.Text()
+        export_button = ft.ElevatedButton("Export")
+        cancel_button = ft.ElevatedButton("Cancel", disabled=True)
+        export_state = {"cancel": None}
+
+        def show_columns(e=None):
+            column_boxes.controls = [ft.Checkbox(label=column, value=True)
+                                     for column in exporter.DATASETS[dataset_choice.value][1]]
+            if e is not None:
+                page.update()
+
+        def export_progressed(rows, total):
+            export_progress.value = rows / total if total else None
+            export_status.value = f"Exported {rows} of {total} rows..."
+            page.update()
+
+        def export_done(path, rows, error):
+            export_progress.visible = False
+            export_button.disabled = False
+            cancel_button.disabled = True
+            if error is None:
+                export_status.value = f"Saved {rows} rows to {path}"
+            elif isinstance(error, InterruptedError):
+                export_status.value = "Export cancelled."
+            else:
+                export_status.value = f"Export failed: {error}"
+            page.update()
+
+        def start_export(e):
+            try:
+                start = datetime.date.fromisoformat(start_field.value) if start_field.value else None
+                end = datetime.date.fromisoformat(end_field.value) if end_field.value else None
+            except ValueError:
+                export_status.value = "Dates must look like 2025-01-31."
+                page.update()
+                return
+            columns = [box.label for box in column_boxes.controls if box.value]
+            if not columns:
+                export_status.value = "Select at least one column."
+                page.update()
+                return
+            export_button.disabled = True
+            cancel_button.disabled = False
+            export_progress.value = 0
+            export_progress.visible = True
+            export_status.value = "Starting export..."
+            page.update()
+            export_state["cancel"] = exporter.export_in_background(
+                dataset_choice.value, export_done, fmt=format_choice.value, columns=columns,
+                start=start, end=end, compress=compress_box.value, progress=export_progressed)
+
+        def cancel_export(e):
+            if export_state["cancel"] is not None:
+                export_state["cancel"].set()
+
+        dataset_choice.on_change = show_columns
+        export_button.on_click = start_export
+        cancel_button.on_click = cancel_export
+        show_columns()
+        return ft.Column(
+            controls=[
+                ft.Text("Export Data", size=24, weight=ft.FontWeight.BOLD),
+                ft.Text(f"Files are written to {exporter.EXPORT_DIR}, streamed from the database."),
+                ft.Row(controls=[dataset_choice, format_choice, compress_box], spacing=20),
+                ft.Row(controls=[start_field, end_field], spacing=20),
+                ft.Text("Columns"),
+                column_boxes,
+                ft.Row(controls=[export_button, cancel_button], spacing=20),
+                export_progress,
+                export_status
+            ],
+            scroll=ft.ScrollMode.AUTO,
+            spacing=10
+        )
 
     # --- Assemble All Tabs ---
-    tabs = ft.Tabs(
-        selected_index=0,
-        tabs=[
-            ft.Tab(text="Player Accounts", content=player_accounts_section),
-            ft.Tab(text="Session Stats", content=sessions_section),
-            ft.Tab(text="Logs", content=logs_section),
-            ft.Tab(text="User Management", content=user_management_section),
-            ft.Tab(text="Player Progress", content=progress_section),
-            ft.Tab(text="Analytics", content=ft.Container(analytics_section, padding=10))
-        ]
-    )
+    # Each tab is built in the background the first time it is selected; Player Accounts starts right away.
+    tabs = widgets.lazy_tabs(page, [
+        ("Player Accounts", build_player_accounts),
+        ("Session Stats", build_sessions),
+        ("Logs", build_logs),
+        ("User Management", build_user_management),
+        ("Player Progress", build_progress),
+        ("Analytics", build_analytics),
+        ("Launch Latency", build_launch_latency),
+        ("Exports", build_exports)
+    ])
 
     # --- Compose the Final Dashboard View ---
     page.views.clear()
@@ -1,7 +1,6 @@
 import os
 import datetime
-import json
-from plyer import notification
+from services import jsonstore
 
 # File to store the last active timestamp.
 LAST_ACTIVE_FILE = os.path.join(os.getcwd(), "config", "last_active.json")
@@ -12,10 +11,7 @@ def update_last_active():
     Call this function whenever the app is opened or a user interacts.
     """
     now = datetime.datetime.now().isoformat()
-    os.makedirs(os.path.dirname(LAST_ACTIVE_FILE), exist_ok=True)
-    data = {"last_active": now}
-    with open(LAST_ACTIVE_FILE, "w") as f:
-        json.dump(data, f)
+    jsonstore.save(LAST_ACTIVE_FILE, {"last_active": now}, indent=None)
 
 def check_inactivity_and_notify():
     """
@@ -23,8 +19,7 @@ def check_inactivity_and_notify():
     If so, sends a push notification with a creative message.
     """
     try:
-        with open(LAST_ACTIVE_FILE, "r") as f:
-            data = json.load(f)
+        data = jsonstore.load(LAST_ACTIVE_FILE, {})
         last_active = datetime.datetime.fromisoformat(data.get("last_active"))
     except Exception:
         # If the file doesn't exist or cannot be read, assume current time.
@@ -43,6 +38,8 @@ def send_push_notification(message):
     Sends a local push notification with the given message.
     Make sure plyer is installed: pip install plyer
     """
+    # Imported here so the launcher does not load plyer's platform backends at startup.
+    from plyer import notification
     notification.notify(
         title="Playful Minds",
         message=message,
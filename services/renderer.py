@@ -0,0 +1,224 @@
+import os
+import sys
+import time
+import weakref
+import cv2
+import numpy as np
+import pygame
+from services import context
+
+# -------------------- Configuration --------------------
+# "software" draws on the pygame.display surface; "texture" uses an SDL renderer.
+# Chosen with the "renderer" key in config/settings.json.
+DEFAULT_BACKEND = "software"
+# Rendered text kept per display before the cache is cleared.
+TEXT_CACHE_LIMIT = 256
+
+
+# -------------------- Software Backend --------------------
+class SoftwareDisplay:
+    """The display surface from pygame.display.set_mode; every draw is a CPU blit."""
+    backend = "software"
+
+    def __init__(self, size, caption):
+        self.size = size
+        self.canvas = pygame.display.set_mode(size)
+        pygame.display.set_caption(caption)
+        self._text_cache = {}
+
+    def frame(self, img):
+        """Draw an OpenCV BGR camera frame over the whole window."""
+        img_rgb = cv2.cvtColor(img, cv2.COLOR_BGR2RGB)
+        surface = pygame.image.frombuffer(img_rgb.tobytes(), (img_rgb.shape[1], img_rgb.shape[0]), "RGB")
+        self.canvas.blit(surface, (0, 0))
+
+    def blit(self, surface, pos, alpha=None):
+        if alpha is None:
+            self.canvas.blit(surface, pos)
+            return
+        # The alpha only applies to this blit, as with the texture backend; the caller's surface keeps its own.
+        previous = surface.get_alpha()
+        surface.set_alpha(alpha)
+        self.canvas.blit(surface, pos)
+        surface.set_alpha(previous)
+
+    def _render_text(self, font, text, color):
+        key = (id(font), text, tuple(color))
+        surface = self._text_cache.get(key)
+        if surface is None:
+            if len(self._text_cache) >= TEXT_CACHE_LIMIT:
+                self._text_cache.clear()
+            surface = font.render(text, True, color)
+            self._text_cache[key] = surface
+        return surface
+
+    def text(self, font, text, color, **position):
+        """Draw text placed like Surface.get_rect(**position) and return its rect."""
+        surface = self._render_text(font, text, color)
+        rect = surface.get_rect(**position)
+        self.canvas.blit(surface, rect)
+        return rect
+
+    def draw_rect(self, color, rect, width=0):
+        pygame.draw.rect(self.canvas, color, rect, width)
+
+    def draw_line(self, color, start, end, width=1):
+        pygame.draw.line(self.canvas, color, start, end, width)
+
+    def flip(self):
+        """Show a frame drawn through frame(), blit(), text() and draw_*()."""
+        pygame.display.update()
+
+    def flip_canvas(self):
+        """Show a frame drawn directly on the canvas surface (menus, loading screens)."""
+        pygame.display.update()
+
+
+# -------------------- Texture Backend --------------------
+class TextureDisplay:
+    """
+    An SDL renderer window. Sprites and text are uploaded to textures once and drawn by
+    the renderer; the camera is streamed into one reused texture every frame. Screens that
+    draw on the canvas surface are uploaded as a single texture when shown.
+    """
+    backend = "texture"
+
+    def __init__(self, size, caption):
+        from pygame._sdl2 import video
+        self._video = video
+        self.size = size
+        self.window = video.Window(caption, size)
+        self.renderer = video.Renderer(self.window)
+        self.canvas = pygame.Surface(size)
+        self._canvas_texture = video.Texture(self.renderer, size, streaming=True)
+        self._frame_texture = None
+        self._frame_size = None
+        # Textures for sprites, dropped together with their surface.
+        self._textures = weakref.WeakKeyDictionary()
+        self._text_cache = {}
+
+    def frame(self, img):
+        """Stream an OpenCV BGR camera frame into the camera texture and draw it."""
+        frame_size = (img.shape[1], img.shape[0])
+        if self._frame_size != frame_size:
+            self._frame_texture = self._video.Texture(self.renderer, frame_size, streaming=True)
+            self._frame_size = frame_size
+        # BGRA bytes match the texture's ARGB8888 layout, so no conversion happens in SDL.
+        img_bgra = cv2.cvtColor(img, cv2.COLOR_BGR2BGRA)
+        self._frame_texture.update(pygame.image.frombuffer(img_bgra, frame_size, "BGRA"))
+        self.renderer.blit(self._frame_texture, pygame.Rect((0, 0), self.size))
+
+    def _texture(self, surface):
+        texture = self._textures.get(surface)
+        if texture is None:
+            texture = self._video.Texture.from_surface(self.renderer, surface)
+            self._textures[surface] = texture
+        return texture
+
+    def blit(self, surface, pos, alpha=None):
+        texture = self._texture(surface)
+        texture.alpha = 255 if alpha is None else alpha
+        texture.draw(dstrect=pygame.Rect(pos, surface.get_size()))
+
+    def text(self, font, text, color, **position):
+        """Draw text placed like Surface.get_rect(**position) and return its rect."""
+        key = (id(font), text, tuple(color))
+        cached = self._text_cache.get(key)
+        if cached is None:
+            if len(self._text_cache) >= TEXT_CACHE_LIMIT:
+                self._text_cache.clear()
+            surface = font.render(text, True, color)
+            cached = (self._video.Texture.from_surface(self.renderer, surface), surface.get_rect())
+            self._text_cache[key] = cached
+        texture, rect = cached
+        rect = rect.copy()
+        for name, value in position.items():
+            setattr(rect, name, value)
+        texture.draw(dstrect=rect)
+        return rect
+
+    def draw_rect(self, color, rect, width=0):
+        self.renderer.draw_color = pygame.Color(color)
+        rect = pygame.Rect(rect)
+        if width == 0:
+            self.renderer.fill_rect(rect)
+            return
+        for _ in range(width):
+            self.renderer.draw_rect(rect)
+            rect = rect.inflate(-2, -2)
+
+    def draw_line(self, color, start, end, width=1):
+        self.renderer.draw_color = pygame.Color(color)
+        for offset in range(-(width // 2), width - width // 2):
+            self.renderer.draw_line((start[0], start[1] + offset), (end[0], end[1] + offset))
+
+    def flip(self):
+        """Show a frame drawn through frame(), blit(), text() and draw_*()."""
+        self.renderer.present()
+        self.renderer.draw_color = (0, 0, 0, 255)
+        self.renderer.clear()
+
+    def flip_canvas(self):
+        """Show a frame drawn directly on the canvas surface (menus, loading screens)."""
+        self._canvas_texture.update(self.canvas)
+        self.renderer.blit(self._canvas_texture, pygame.Rect((0, 0), self.size))
+        self.flip()
+
+
+def create_display(size, caption, backend=None):
+    """
+    Open the game window with the configured backend. The texture backend needs
+    pygame._sdl2 and a working SDL renderer; without them the software display is used.
+    """
+    if backend is None:
+        backend = context.setting("renderer", DEFAULT_BACKEND)
+    if backend == "texture":
+        try:
+            return TextureDisplay(size, caption)
+        except (ImportError, pygame.error) as e:
+            print(f"Error creating texture renderer: {e}. Using the software renderer.")
+    return SoftwareDisplay(size, caption)
+
+
+# -------------------- Benchmark --------------------
+def _bench_frames(display, frames):
+    """Draw a typical playing frame (camera, sprite, outline, score, hearts) and time it."""
+    width, height = display.size
+    camera = np.random.randint(0, 255, (height, width, 3), dtype=np.uint8)
+    sprite = pygame.Surface((100, 100), pygame.SRCALPHA)
+    pygame.draw.circle(sprite, (255, 120, 0, 255), (50, 50), 48)
+    heart = pygame.Surface((40, 40), pygame.SRCALPHA)
+    pygame.draw.circle(heart, (220, 0, 40, 255), (20, 20), 18)
+    font = pygame.font.Font(None, 60)
+    timings = []
+    for i in range(frames):
+        start = time.perf_counter()
+        display.frame(camera)
+        display.blit(sprite, (300, i % 520))
+        display.draw_rect((0, 255, 0), (300, i % 520, 100, 100), 3)
+        display.draw_line((0, 255, 0), (640, 500), (350, i % 520 + 50), 3)
+        display.text(font, f"Score: {i // 30}", (75, 0, 130), topright=(width - 20, 20))
+        for h in range(3):
+            display.blit(heart, (10 + h * 45, 10))
+        display.flip()
+        timings.append((time.perf_counter() - start) * 1000)
+    timings.sort()
+    return sum(timings) / len(timings), timings[int(len(timings) * 0.95)]
+
+
+def benchmark(frames=300):
+    """Compare frame times of both backends under SDL's software renderer."""
+    os.environ.setdefault("SDL_RENDER_DRIVER", "software")
+    pygame.init()
+    for backend in ("software", "texture"):
+        display = create_display((1280, 720), "Renderer benchmark", backend)
+        mean_ms, p95_ms = _bench_frames(display, frames)
+        print(f"{display.backend:>8}: mean {mean_ms:6.2f} ms, p95 {p95_ms:6.2f} ms per frame")
+        if display.backend == "texture":
+            display.window.destroy()
+        pygame.display.quit()
+        pygame.display.init()
+
+
+if __name__ == "__main__":
+    benchmark(int(sys.argv[1]) if len(sys.argv) > 1 else 300)
@@ -0,0 +1,113 @@
+import os
+import sys
+import csv
+import time
+import tempfile
+import datetime
+from services import db
+
+# -------------------- Configuration --------------------
+# Roster CSV header -> account field. Only firstName, lastName and userName are required; players
+# sign in without a password, so a class list exported from a spreadsheet is enough.
+COLUMNS = {
+    "firstname": "firstName", "first name": "firstName",
+    "lastname": "lastName", "last name": "lastName",
+    "username": "userName", "user name": "userName",
+    "role": "role",
+    "email": "email",
+}
+REQUIRED = ["firstName", "lastName", "userName"]
+# Roles a roster may give. Admin accounts need a password, so they are only made by hand.
+ROLES = ["player"]
+
+
+# -------------------- Roster Import --------------------
+def read_roster(path):
+    """
+    Read a class roster CSV into {userName: details} for db.sync_accounts.
+    Headers are matched case-insensitively (see COLUMNS). Empty or missing role and email cells
+    are left out, so existing accounts keep theirs and new ones get the defaults of
+    db.sync_accounts. Raises ValueError naming the first bad line.
+    """
+    accounts = {}
+    with open(path, newline="", encoding="utf-8-sig") as f:
+        reader = csv.DictReader(f)
+        fields = {header: COLUMNS.get(header.strip().lower()) for header in reader.fieldnames or []}
+        missing = [field for field in REQUIRED if field not in fields.values()]
+        if missing:
+            raise ValueError(f"Roster is missing columns: {', '.join(missing)}")
+        for row in reader:
+            details = {fields[header]: (value or "").strip() for header, value in row.items()
+                       if fields.get(header)}
+            if not any(details.values()):
+                continue
+            userName = details.pop("userName")
+            if not all([details["firstName"], details["lastName"], userName]):
+                raise ValueError(f"Line {reader.line_num}: first name, last name and username are required")
+            if userName in accounts:
+                raise ValueError(f"Line {reader.line_num}: username '{userName}' is listed twice")
+            details = {field: value for field, value in details.items() if value}
+            if "role" in details:
+                details["role"] = details["role"].lower()
+                if details["role"] not in ROLES:
+                    raise ValueError(f"Line {reader.line_num}: role '{details['role']}' cannot be imported; "
+                                     f"rosters may only list {', '.join(ROLES)} accounts")
+            accounts[userName] = details
+    return accounts
+
+
+def import_roster(path):
+    """
+    Add the accounts of a roster CSV, and update those already there, in one transaction.
+    Accounts not on the roster are left alone, so one class can be imported after another.
+    A roster row naming an account with a role outside ROLES (an admin) does not change it and
+    is counted as skipped. Returns the counts from db.sync_accounts, or None if the import failed.
+    """
+    try:
+        accounts = read_roster(path)
+    except (OSError, ValueError, csv.Error) as e:
+        print(f"Error reading roster: {e}")
+        return None
+    return db.sync_accounts(accounts, remove_missing=False, roles=ROLES)
+
+
+# -------------------- Benchmark --------------------
+def benchmark(size=10000):
+    """
+    Import a roster of `size` accounts into an empty database, import it again unchanged and
+    with a tenth of the accounts edited, then sync the accounts with a tenth removed.
+    """
+    original = db.DB_FILE
+    with tempfile.TemporaryDirectory() as directory:
+        db.DB_FILE = os.path.join(directory, "benchmark.db")
+        try:
+            db.initialize_database()
+            path = os.path.join(directory, "roster.csv")
+
+            def write_roster(edited):
+                with open(path, "w", newline="", encoding="utf-8") as f:
+                    writer = csv.writer(f)
+                    writer.writerow(["First Name", "Last Name", "Username"])
+                    for i in range(size):
+                        writer.writerow([f"Student{i}", f"Class{i // 30}{'b' if i < edited else ''}", f"student{i}"])
+
+            def timed(label, run):
+                started = time.perf_counter()
+                counts = run()
+                print(f"{label:<22} {time.perf_counter() - started:6.3f} s  {counts}")
+
+            write_roster(0)
+            timed("First import", lambda: import_roster(path))
+            timed("Unchanged import", lambda: import_roster(path))
+            write_roster(size // 10)
+            timed("10% edited import", lambda: import_roster(path))
+            accounts = db.load_accounts()
+            for userName in list(accounts)[:size // 10]:
+                del accounts[userName]
+            timed("Sync with 10% removed", lambda: db.sync_accounts(accounts))
+        finally:
+            db.DB_FILE = original
+
+
+if __name__ == "__main__":
+    benchmark(int(sys.argv[1]) if len(sys.argv) > 1 else 10000)
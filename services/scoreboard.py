@@ -0,0 +1,63 @@
+import sys
+import time
+import pygame
+from services import highscores
+
+# Pre-rendered highscore screens keyed by game id: (highscores version, surface).
+_boards = {}
+
+
+def board(game_id, size, draw):
+    """
+    Return the game's highscore screen as one surface. `draw(surface, entries)` paints it
+    from highscores.top(game_id); it only runs again after the game's highscores change,
+    so showing the screen costs a single blit per frame.
+    """
+    version = highscores.version(game_id)
+    cached = _boards.get(game_id)
+    if cached is None or cached[0] != version or cached[1].get_size() != size:
+        surface = pygame.Surface(size).convert()
+        draw(surface, highscores.top(game_id))
+        _boards[game_id] = (version, surface)
+    return _boards[game_id][1]
+
+
+def invalidate(game_id=None):
+    """Drop the cached screen of one game (or all), e.g. after its layout changed."""
+    if game_id is None:
+        _boards.clear()
+    else:
+        _boards.pop(game_id, None)
+
+
+# -------------------- Benchmark --------------------
+def benchmark(frames=300, game_id="EdibleGame"):
+    """Compare redrawing the highscore screen every frame with blitting the cached board."""
+    pygame.init()
+    size = (1280, 720)
+    screen = pygame.display.set_mode(size)
+    font_large = pygame.font.Font(None, 80)
+    font_small = pygame.font.Font(None, 40)
+
+    def draw(surface, entries):
+        surface.fill((173, 216, 230))
+        title = font_large.render("Highscores", True, (0, 0, 128))
+        surface.blit(title, title.get_rect(center=(size[0] // 2, 80)))
+        for i, entry in enumerate(entries):
+            line = font_small.render(f"{i + 1}. {entry['name']} - {entry['score']}", True, (0, 0, 128))
+            surface.blit(line, (size[0] // 4, 150 + i * 40))
+
+    start = time.perf_counter()
+    for _ in range(frames):
+        draw(screen, highscores.top(game_id))
+    redraw_ms = (time.perf_counter() - start) * 1000 / frames
+    start = time.perf_counter()
+    for _ in range(frames):
+        screen.blit(board(game_id, size, draw), (0, 0))
+    cached_ms = (time.perf_counter() - start) * 1000 / frames
+    print(f"query + redraw every frame: {redraw_ms:6.3f} ms/frame")
+    print(f"cached board:               {cached_ms:6.3f} ms/frame")
+
+
+if __name__ == "__main__":
+    benchmark(int(sys.argv[1]) if len(sys.argv) > 1 else 300)
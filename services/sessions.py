@@ -19,6 +19,7 @@ def start_user_session(user_id, session_type="login"):
                 INSERT INTO UserSessions (user_id, login_time, last_active, session_type)
                 VALUES (?, ?, ?, ?)
             """, (user_id, now, now, session_type))
+            db.bump_version(cursor, "sessions")
             conn.commit()
             session_id = cursor.lastrowid
             return session_id
@@ -35,7 +36,7 @@ def start_game_session(user_id, game_id, session_type, level=1):
     Starts a new game session and returns the session ID.
     The level parameter allows tracking the player's level during the session.
     """
-    conn = sqlite3.connect("../playful_minds.db")
+    conn = _create_connection()
     cursor = conn.cursor()
     try:
         start_time = datetime.datetime.now().isoformat()
@@ -43,6 +44,7 @@ def start_game_session(user_id, game_id, session_type, level=1):
             "INSERT INTO GameSessions (user_id, game_id, start_time, session_type, level) VALUES (?, ?, ?, ?, ?)",
             (user_id, game_id, start_time, session_type, level),
         )
+        db.bump_version(cursor, "sessions")
         conn.commit()
         session_id = cursor.lastrowid
         conn.close()
@@ -61,7 +63,7 @@ def end_game_session(session_id, user_id, game_id, level_increment=0):
     level_increment (an integer > 0) will be added to the player's overall level
     for the specified game.
     """
-    conn = sqlite3.connect("../playful_minds.db")
+    conn = _create_connection()
     cursor = conn.cursor()
     try:
         end_time = datetime.datetime.now().isoformat()
@@ -69,6 +71,7 @@ def end_game_session(session_id, user_id, game_id, level_increment=0):
             "UPDATE GameSessions SET end_time = ? WHERE session_id = ?",
             (end_time, session_id),
         )
+        db.bump_version(cursor, "sessions")
         conn.commit()
         conn.close()
         # Update player's overall level if there is an increment.
@@ -0,0 +1,65 @@
+import time
+import threading
+from services import db
+
+# -------------------- Configuration --------------------
+# Dashboard dataset -> (seconds a snapshot may be reused, change counters it depends on).
+# A snapshot is reloaded when it is older than its TTL or when one of its counters moved
+# (see db.bump_version), so data nobody wrote to comes back without querying it again.
+# The Logs tab follows new records itself (services/logtail.py) and is not cached.
+DATASETS = {
+    "kpis": (60, ["users", "sessions", "progress"]),
+    "accounts": (300, ["users", "progress"]),
+    "sessions": (120, ["sessions"]),
+    "progress": (120, ["progress"]),
+    "analytics": (300, ["users", "sessions", "progress"]),
+}
+# Snapshots kept at most; expired ones are dropped first when it is reached.
+MAX_SNAPSHOTS = 256
+
+# (dataset, key) -> (counter values, time stored, value)
+_snapshots = {}
+_lock = threading.Lock()
+
+
+# -------------------- Snapshots --------------------
+def get(dataset, key, load):
+    """Return the snapshot of `dataset` stored under `key`, calling `load()` if it is stale."""
+    ttl, counters = DATASETS[dataset]
+    versions = db.get_data_versions()
+    versions = tuple(versions[counter] for counter in counters)
+    with _lock:
+        cached = _snapshots.get((dataset, key))
+    if cached and cached[0] == versions and time.monotonic() - cached[1] < ttl:
+        return cached[2]
+    # The counters were read before loading, so a write made meanwhile triggers a reload next time.
+    value = load()
+    with _lock:
+        if len(_snapshots) >= MAX_SNAPSHOTS:
+            _prune()
+        _snapshots[(dataset, key)] = (versions, time.monotonic(), value)
+    return value
+
+
+def cached(dataset, load):
+    """Wrap `load` so every distinct call is kept as its own snapshot of `dataset`."""
+    def call(*args, **kwargs):
+        key = (load.__name__, args, tuple(sorted(kwargs.items())))
+        return get(dataset, key, lambda: load(*args, **kwargs))
+    return call
+
+
+def invalidate(dataset=None):
+    """Drop the snapshots of one dataset (or all of them)."""
+    with _lock:
+        for key in [key for key in _snapshots if dataset is None or key[0] == dataset]:
+            del _snapshots[key]
+
+
+def _prune():
+    now = time.monotonic()
+    for key, (_, stored, _) in list(_snapshots.items()):
+        if now - stored >= DATASETS[key[0]][0]:
+            del _snapshots[key]
+    if len(_snapshots) >= MAX_SNAPSHOTS:
+        _snapshots.clear()
@@ -0,0 +1,77 @@
+import os
+import sys
+import time
+import subprocess
+
+# -------------------- Configuration --------------------
+# What main.py imports before it can draw the landing view.
+LAUNCHER_MODULES = ["flet", "services.db", "services.pages", "services.push", "services.logs", "services.gamehost",
+                    "services.catalog"]
+# Modules only some views need; they must not be loaded at startup.
+DEFERRED_MODULES = ["bcrypt", "plyer", "dotenv", "smtplib", "services.mail"]
+# Budgets for a fresh interpreter importing LAUNCHER_MODULES, and for main.py reaching
+# the first rendered landing view.
+IMPORT_BUDGET_MS = 1500
+LANDING_BUDGET_MS = 3000
+REPORT_TOP = 15
+
+
+# -------------------- Landing Time --------------------
+def elapsed_ms(started):
+    """Milliseconds since `started` (a time.perf_counter value taken when main.py began)."""
+    return (time.perf_counter() - started) * 1000
+
+
+def check_landing(started):
+    """Return the time to the landing view and warn when it is over LANDING_BUDGET_MS."""
+    landing_ms = elapsed_ms(started)
+    if landing_ms > LANDING_BUDGET_MS:
+        print(f"Startup over budget: landing view after {landing_ms:.0f} ms (budget {LANDING_BUDGET_MS} ms)")
+    return landing_ms
+
+
+# -------------------- Import Report --------------------
+def import_report(modules=LAUNCHER_MODULES):
+    """
+    Import `modules` in a fresh interpreter with -X importtime.
+    Returns (total_ms, rows) where rows are (module, self_ms, cumulative_ms) for every import.
+    """
+    code = "".join(f"import {name}\n" for name in modules)
+    result = subprocess.run([sys.executable, "-X", "importtime", "-c", code], cwd=os.getcwd(),
+                            capture_output=True, text=True)
+    if result.returncode != 0:
+        raise RuntimeError(result.stderr.strip().splitlines()[-1])
+    rows = []
+    total_ms = 0.0
+    for line in result.stderr.splitlines():
+        # "import time: self [us] | cumulative | imported package", nested imports indented.
+        if not line.startswith("import time:") or "imported package" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|")
+        rows.append((name.strip(), int(self_us) / 1000, int(cumulative_us) / 1000))
+        if name[1:2] != " ":
+            # Top-level imports add up to the total.
+            total_ms += int(cumulative_us) / 1000
+    return total_ms, rows
+
+
+def check_budget():
+    """Print the slowest launcher imports and return False if the import budget is exceeded."""
+    total_ms, rows = import_report()
+    print(f"{'cumulative ms':>14} {'self ms':>8}  module")
+    for name, self_ms, cumulative_ms in sorted(rows, key=lambda row: row[2], reverse=True)[:REPORT_TOP]:
+        print(f"{cumulative_ms:14.1f} {self_ms:8.1f}  {name}")
+    ok = True
+    loaded = {name for name, _, _ in rows}
+    for name in DEFERRED_MODULES:
+        if name in loaded:
+            print(f"Deferred module imported at startup: {name}")
+            ok = False
+    print(f"launcher imports: {total_ms:.0f} ms (budget {IMPORT_BUDGET_MS} ms)")
+    if total_ms > IMPORT_BUDGET_MS:
+        ok = False
+    return ok
+
+
+if __name__ == "__main__":
+    sys.exit(0 if check_budget() else 1)
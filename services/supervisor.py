@@ -0,0 +1,111 @@
+import os
+import time
+import threading
+from services import gamehost, logs
+
+# -------------------- Configuration --------------------
+# Seconds a game gets to close after being asked to, before it is killed.
+STOP_TIMEOUT = 5.0
+# Exit records kept in memory for diagnostics.
+HISTORY_LIMIT = 50
+
+# Game path -> {"process", "started"} for games that are still running.
+_running = {}
+# Most recent first: {"game", "pid", "exit_code", "seconds", "user_cpu", "system_cpu", "max_rss_kb"}.
+exit_history = []
+_lock = threading.Lock()
+
+
+# -------------------- Reaping --------------------
+def _wait(process):
+    """Wait for a child and return (exit code, resource usage or None)."""
+    if hasattr(os, "wait4"):
+        try:
+            _, status, usage = os.wait4(process.pid, 0)
+            process.returncode = os.waitstatus_to_exitcode(status)
+            return process.returncode, usage
+        except ChildProcessError:
+            # Already reaped elsewhere; Popen still knows the exit code.
+            pass
+    return process.wait(), None
+
+
+def _reap(game_path, process, started):
+    exit_code, usage = _wait(process)
+    record = {
+        "game": os.path.basename(game_path),
+        "pid": process.pid,
+        "exit_code": exit_code,
+        "seconds": round(time.monotonic() - started, 1),
+        "user_cpu": round(usage.ru_utime, 1) if usage else None,
+        "system_cpu": round(usage.ru_stime, 1) if usage else None,
+        # ru_maxrss is in kilobytes on Linux (bytes on macOS).
+        "max_rss_kb": usage.ru_maxrss if usage else None,
+    }
+    with _lock:
+        if _running.get(game_path, {}).get("process") is process:
+            del _running[game_path]
+        exit_history.insert(0, record)
+        del exit_history[HISTORY_LIMIT:]
+    details = (f"{record['game']} (pid {record['pid']}) exited with {exit_code} after {record['seconds']} s")
+    if usage:
+        details += (f", cpu {record['user_cpu']} s user / {record['system_cpu']} s system,"
+                    f" max RSS {record['max_rss_kb']}")
+    print(details)
+    logs.log_event(None, "game_exit", details)
+
+
+# -------------------- Supervision --------------------
+def running_games():
+    """Return the paths of the games that are still running."""
+    with _lock:
+        return list(_running)
+
+
+def stop(game_path, timeout=STOP_TIMEOUT):
+    """
+    Ask a running game to close (SIGTERM, which its game loop turns into a normal quit
+    so it releases the camera) and kill it if it has not exited after `timeout` seconds.
+    """
+    with _lock:
+        entry = _running.get(game_path)
+    if entry is None:
+        return
+    process = entry["process"]
+    try:
+        process.terminate()
+    except OSError as e:
+        print(f"Error stopping {game_path}: {e}")
+        return
+
+    def kill_if_stuck():
+        if process.returncode is None:
+            try:
+                process.kill()
+            except OSError:
+                pass
+
+    timer = threading.Timer(timeout, kill_if_stuck)
+    timer.daemon = True
+    timer.start()
+
+
+def launch(game_path, env=None):
+    """
+    Start a game unless it is already running. Any other running game is asked to
+    close first; the new game waits for it to release the camera (see services.camera).
+    Returns the Popen handle, or None if the game was already running.
+    """
+    with _lock:
+        if game_path in _running:
+            print(f"{os.path.basename(game_path)} is already running.")
+            return None
+        others = list(_running)
+    for other in others:
+        stop(other)
+    process = gamehost.launch(game_path, env=env)
+    started = time.monotonic()
+    with _lock:
+        _running[game_path] = {"process": process, "started": started}
+    threading.Thread(target=_reap, args=(game_path, process, started), daemon=True).start()
+    return process
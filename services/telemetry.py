@@ -0,0 +1,173 @@
+import os
+import time
+import uuid
+import atexit
+import datetime
+from contextlib import contextmanager
+from services.db import _create_connection
+
+# -------------------- Configuration --------------------
+# Set by the launcher for the game process: "<launch id>:<click time>:<game id>".
+LAUNCH_ENV = "PLAYFUL_MINDS_LAUNCH"
+# Order of the stages in the dashboard; stages not listed here are shown after them.
+STAGE_ORDER = ["handoff", "imports", "assets", "camera", "detector", "camera_frame", "first_frame"]
+# A launch is over once both of these were marked (or finish() was called).
+FINAL_STAGES = {"camera_frame", "first_frame"}
+
+# The launch this process belongs to, read from LAUNCH_ENV on first use.
+_launch = None
+# Stages recorded so far: (stage, offset_ms, duration_ms), written when the game exits.
+# offset_ms is when the stage finished, counted from the click.
+_records = []
+
+
+def _now():
+    # time.monotonic is system-wide, so the launcher's click and the game's stages share a clock.
+    return time.monotonic()
+
+
+# -------------------- Launcher Side --------------------
+def new_launch(game_file):
+    """
+    Start timing a launch at the moment its tile is clicked.
+    Returns the environment the game process needs to record its stages.
+    """
+    game_id = os.path.splitext(os.path.basename(game_file))[0]
+    return {LAUNCH_ENV: f"{uuid.uuid4().hex}:{_now()!r}:{game_id}"}
+
+
+# -------------------- Game Side --------------------
+def _current_launch():
+    """Return this process's launch, or None when the game was not started by the launcher."""
+    global _launch
+    if _launch is None:
+        value = os.environ.get(LAUNCH_ENV)
+        if not value:
+            return None
+        try:
+            launch_id, clicked, game_id = value.split(":", 2)
+            _launch = {"id": launch_id, "game_id": game_id, "clicked": float(clicked),
+                       "last": float(clicked), "stages": set(), "finished": False}
+        except ValueError as e:
+            print(f"Error reading launch telemetry: {e}")
+            os.environ.pop(LAUNCH_ENV, None)
+            return None
+        atexit.register(flush)
+    return _launch
+
+
+def _record(stage, start, end, accumulate=False):
+    launch = _current_launch()
+    if launch is None or launch["finished"]:
+        return
+    launch["last"] = end
+    if stage in launch["stages"]:
+        if accumulate:
+            index = next(i for i, record in enumerate(_records) if record[0] == stage)
+            name, offset_ms, duration_ms = _records[index]
+            _records[index] = (name, (end - launch["clicked"]) * 1000, duration_ms + (end - start) * 1000)
+        return
+    launch["stages"].add(stage)
+    _records.append((stage, (end - launch["clicked"]) * 1000, (end - start) * 1000))
+    # The launch is over once the game has drawn its first frame and the camera delivered one.
+    launch["finished"] = FINAL_STAGES <= launch["stages"]
+
+
+def mark(stage):
+    """
+    Record that a stage finished now. Its duration runs from the end of the previous
+    stage (or the click). Only the first mark of a stage counts, so it can be called every
+    frame. Mark "camera_frame" at the first successful camera read during startup.
+    """
+    launch = _current_launch()
+    if launch is not None:
+        _record(stage, launch["last"], _now())
+
+
+def finish():
+    """
+    End the launch; later stages are not recorded. For games that only open the camera once
+    a round starts, so the time a player spends on the menu is not counted as launch time.
+    """
+    launch = _current_launch()
+    if launch is not None:
+        launch["finished"] = True
+
+
+@contextmanager
+def stage(name):
+    """
+    Record the time spent in a block, e.g. opening the camera. Blocks of the same stage
+    add up (every asset load counts towards "assets") until the launch is over.
+    """
+    start = _now()
+    try:
+        yield
+    finally:
+        _record(name, start, _now(), accumulate=True)
+
+
+def flush():
+    """Write the recorded stages to LaunchTelemetry (done automatically at exit)."""
+    if not _records:
+        return
+    conn = _create_connection()
+    if conn:
+        try:
+            now = datetime.datetime.now().isoformat()
+            conn.executemany("""
+                INSERT INTO LaunchTelemetry (launch_id, game_id, stage, offset_ms, duration_ms, recorded_at)
+                VALUES (?, ?, ?, ?, ?, ?)
+            """, [(_launch["id"], _launch["game_id"], name, offset_ms, duration_ms, now)
+                  for name, offset_ms, duration_ms in _records])
+            conn.commit()
+            _records.clear()
+        except Exception as e:
+            print(f"Error saving launch telemetry: {e}")
+        finally:
+            conn.close()
+
+
+# -------------------- Dashboard --------------------
+def _percentile(sorted_values, fraction):
+    index = min(len(sorted_values) - 1, int(round(fraction * (len(sorted_values) - 1))))
+    return sorted_values[index]
+
+
+def get_launch_summary():
+    """
+    Return p50/p95 of each stage's duration and of when it finished after the click, per game:
+    a list of dicts with game_id, stage, launches, p50_ms, p95_ms, p50_offset_ms, p95_offset_ms.
+    """
+    samples = {}
+    conn = _create_connection()
+    if conn:
+        try:
+            cursor = conn.cursor()
+            cursor.execute("SELECT game_id, stage, offset_ms, duration_ms FROM LaunchTelemetry")
+            for game_id, name, offset_ms, duration_ms in cursor.fetchall():
+                durations, offsets = samples.setdefault((game_id, name), ([], []))
+                durations.append(duration_ms)
+                offsets.append(offset_ms)
+        except Exception as e:
+            print(f"Error loading launch telemetry: {e}")
+        finally:
+            conn.close()
+
+    def order(key):
+        game_id, name = key
+        return game_id, STAGE_ORDER.index(name) if name in STAGE_ORDER else len(STAGE_ORDER), name
+
+    summary = []
+    for game_id, name in sorted(samples, key=order):
+        durations, offsets = (sorted(values) for values in samples[(game_id, name)])
+        summary.append({
+            "game_id": game_id,
+            "stage": name,
+            "launches": len(durations),
+            "p50_ms": _percentile(durations, 0.5),
+            "p95_ms": _percentile(durations, 0.95),
+            "p50_offset_ms": _percentile(offsets, 0.5),
+            "p95_offset_ms": _percentile(offsets, 0.95),
+        })
+    return summary
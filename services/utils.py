@@ -1,12 +1,13 @@
 import os
-import subprocess
-import sys
 import re
 import json
+from services import gamehost, supervisor, telemetry, context, jsonstore
 
 # -------------------- Configuration --------------------
 CONFIG_DIR = os.path.join(os.getcwd(), "config")
 CONFIG_PATH = os.path.join(CONFIG_DIR, "settings.json")
+# Generated data (glyph atlases, scaled assets, ...) that can always be rebuilt.
+CACHE_DIR = os.path.join(os.getcwd(), "cache")
 
 def load_camera_index():
     """Load camera index from config."""
@@ -28,20 +29,61 @@ def load_camera_index():
         save_camera_index(0)
         return 0
 
+def load_settings():
+    """Load every setting from config, or an empty dictionary if there are none yet."""
+    return jsonstore.load(CONFIG_PATH, {})
+
+def load_setting(key, default=None):
+    """Load a single setting from config."""
+    return load_settings().get(key, default)
+
+def save_setting(key, value):
+    """Save a single setting to config, keeping the other settings."""
+    def set_value(config):
+        config = config if isinstance(config, dict) else {}
+        config[key] = value
+        return config
+    jsonstore.update(CONFIG_PATH, set_value, indent=None)
+
 def save_camera_index(index):
-    """Save camera index to config."""
-    if not os.path.exists(CONFIG_DIR):
-        os.makedirs(CONFIG_DIR)
-    with open(CONFIG_PATH, "w") as f:
-        json.dump({"camera_index": index}, f)
+    """Save camera index to config, keeping the other settings."""
+    def set_index(config):
+        config = config if isinstance(config, dict) else {}
+        config["camera_index"] = index
+        return config
+    jsonstore.update(CONFIG_PATH, set_index, indent=None)
     print(f"Camera index set to: {index}")
 
-def launch_game(game_file: str):
-    """Launch a game located in the 'games' folder."""
+def atomic_save(path, save_func):
+    """
+    Write a file through a temporary file in the same directory and os.replace it,
+    so readers (possibly in another game process) never see a half-written file.
+    save_func is called with the temporary path, which keeps the target's extension.
+    """
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    root, extension = os.path.splitext(path)
+    tmp_path = f"{root}.{os.getpid()}.tmp{extension}"
+    try:
+        save_func(tmp_path)
+        os.replace(tmp_path, path)
+    except Exception as e:
+        print(f"Error writing {path}: {e}")
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+
+def launch_game(game_file: str, user=None):
+    """
+    Launch a game located in the 'games' folder in a pre-warmed game host worker.
+    The supervisor closes any other running game and ignores a game that is already open.
+    The game gets `user`, their progress and the settings as its session context.
+    """
     game_path = os.path.join(os.getcwd(), "games", game_file)
     try:
-        if os.path.exists(game_path):
-            subprocess.Popen([sys.executable, game_path])
+        # Launch telemetry starts at the click; the game records its own stages against it.
+        launch_env = telemetry.new_launch(game_file)
+        launch_env.update(context.new_context(user))
+        if gamehost.game_exists(game_path):
+            supervisor.launch(game_path, env=launch_env)
         else:
             print(f"Game file {game_path} not found.")
     except Exception as e:
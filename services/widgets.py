@@ -0,0 +1,104 @@
+import time
+from concurrent.futures import ThreadPoolExecutor
+import flet as ft
+
+# -------------------- Configuration --------------------
+# Rows shown per page of a paged table. Only these rows are queried and turned into controls,
+# so a table costs the same to show with 100 records as with 100,000.
+PAGE_SIZE = 50
+# Threads running dashboard queries; each query opens its own read-only connection.
+LOADER_THREADS = 4
+
+_loader = ThreadPoolExecutor(max_workers=LOADER_THREADS, thread_name_prefix="dashboard")
+
+
+# -------------------- Background Loading --------------------
+def loading(text="Loading..."):
+    """Placeholder shown where data is still being loaded."""
+    return ft.Row(controls=[ft.ProgressRing(width=16, height=16, stroke_width=2), ft.Text(text)], spacing=10)
+
+
+def load_async(page: ft.Page, name, load, show):
+    """
+    Run `load()` on a loader thread, pass its result to `show(result)` and push the change
+    to the client. The view is shown first and filled in as each result arrives; the time
+    every load took is printed.
+    """
+    def run():
+        started = time.perf_counter()
+        try:
+            result = load()
+            print(f"Dashboard: {name} loaded in {(time.perf_counter() - started) * 1000:.0f} ms")
+            show(result)
+            page.update()
+        except Exception as e:
+            print(f"Error loading {name}: {e}")
+
+    return _loader.submit(run)
+
+
+# -------------------- Paged Table --------------------
+def paged_table(page: ft.Page, columns, fetch, to_cells, page_size=PAGE_SIZE, empty_text="No data available."):
+    """
+    Build a DataTable that shows one page of records at a time, with Previous/Next buttons.
+    `fetch(offset, limit)` returns one page of records and `to_cells(record)` the DataCells
+    for one record. Nothing is counted: one extra record is fetched to tell if a next page exists.
+    """
+    table = ft.DataTable(columns=[ft.DataColumn(ft.Text(title)) for title in columns], rows=[])
+    position = ft.Text()
+    previous_button = ft.IconButton(icon=ft.icons.CHEVRON_LEFT, tooltip="Previous page")
+    next_button = ft.IconButton(icon=ft.icons.CHEVRON_RIGHT, tooltip="Next page")
+    state = {"offset": 0}
+
+    def show(offset, refresh=True):
+        records = fetch(offset, page_size + 1)
+        # Step back when rows were deleted since the previous page was shown.
+        while offset > 0 and not records:
+            offset = max(0, offset - page_size)
+            records = fetch(offset, page_size + 1)
+        state["offset"] = offset
+        table.rows = [ft.DataRow(cells=to_cells(record)) for record in records[:page_size]]
+        position.value = f"Rows {offset + 1}-{offset + len(table.rows)}" if records else ""
+        previous_button.disabled = offset == 0
+        next_button.disabled = len(records) <= page_size
+        if refresh:
+            page.update()
+        return records
+
+    previous_button.on_click = lambda e: show(state["offset"] - page_size)
+    next_button.on_click = lambda e: show(state["offset"] + page_size)
+    # The first page is filled in before the table is added to the page, so no update yet.
+    if not show(0, refresh=False):
+        return ft.Text(empty_text)
+    return ft.Column(
+        controls=[
+            table,
+            ft.Row(controls=[previous_button, position, next_button], alignment=ft.MainAxisAlignment.CENTER),
+        ],
+        spacing=10
+    )
+
+
+# -------------------- Lazy Tabs --------------------
+def lazy_tabs(page: ft.Page, sections, selected_index=0):
+    """
+    Build Tabs from (title, build) pairs, calling `build()` for a tab's content only the first
+    time the tab is selected. Hidden tabs cost nothing to show the view or to send to the client.
+    `build()` runs on a loader thread while the tab shows a placeholder.
+    """
+    tabs = ft.Tabs(selected_index=selected_index, tabs=[ft.Tab(text=title) for title, _ in sections])
+
+    def fill(index):
+        tab = tabs.tabs[index]
+        if tab.content is None:
+            title, build = sections[index]
+            tab.content = loading()
+            load_async(page, f"{title} tab", build, lambda content: setattr(tab, "content", content))
+
+    def on_change(e):
+        fill(tabs.selected_index)
+        page.update()
+
+    tabs.on_change = on_change
+    fill(selected_index)
+    return tabs